@@ -1,8 +1,26 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import OrderedDict
+from datetime import date, datetime
+from decimal import Decimal
+from hashlib import shake_128
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import F, Field, Func, OrderBy, Q, QuerySet, Value
+from django.db.models.lookups import GreaterThan, LessThan
+
 from rest_framework.exceptions import APIException, NotFound
+from rest_framework.pagination import BasePagination
 from rest_framework.pagination import (
     PageNumberPagination as RestFrameworkPageNumberPagination,
 )
+from rest_framework.response import Response
 from rest_framework.status import HTTP_400_BAD_REQUEST
+from rest_framework.utils.urls import replace_query_param
+
+from baserow.core.db import estimate_queryset_count
 
 
 class PageNumberPagination(RestFrameworkPageNumberPagination):
@@ -39,3 +57,383 @@ class PageNumberPagination(RestFrameworkPageNumberPagination):
             exception = APIException({"error": "ERROR_INVALID_PAGE", "detail": str(e)})
             exception.status_code = HTTP_400_BAD_REQUEST
             raise exception
+
+
+class KeysetPagination(BasePagination):
+    """
+    Paginates a queryset by seeking past the sort key of the last row of the previous
+    page instead of using an offset. The cursor encodes the values of all the
+    expressions that the queryset is ordered by, so the next page can be fetched with
+    a `WHERE` predicate that can use an index on the same expressions. This makes
+    deep pages as fast as the first one. Counting all the rows is skipped unless the
+    `count` query parameter explicitly asks for an exact or estimated count.
+
+    The queryset must be ordered by expressions that form a unique key, which is the
+    case for table models because they're always ordered by `order` and `id` last.
+    """
+
+    page_size = 100
+    page_size_query_param = "size"
+    cursor_query_param = "cursor"
+    count_query_param = "count_mode"
+    COUNT_NONE = "none"
+    COUNT_EXACT = "exact"
+    COUNT_ESTIMATE = "estimate"
+    count_modes = (COUNT_NONE, COUNT_EXACT, COUNT_ESTIMATE)
+
+    def __init__(self, limit_page_size=None):
+        self.limit_page_size = limit_page_size
+        self.next_cursor = None
+        self.count = None
+        self.request = None
+
+    @classmethod
+    def is_requested(cls, request) -> bool:
+        """
+        Indicates whether the request asks for a keyset paginated response. The
+        first page can be requested by providing an empty cursor.
+        """
+
+        return cls.cursor_query_param in request.query_params
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(
+                request.query_params.get(self.page_size_query_param, self.page_size)
+            )
+        except ValueError:
+            page_size = self.page_size
+
+        if page_size <= 0:
+            page_size = self.page_size
+
+        if self.limit_page_size and page_size > self.limit_page_size:
+            raise _get_bad_request_exception(
+                "ERROR_PAGE_SIZE_LIMIT",
+                f"The page size is limited to {self.limit_page_size}.",
+            )
+
+        return page_size
+
+    def get_count_mode(self, request) -> str:
+        count_mode = request.query_params.get(self.count_query_param, self.COUNT_NONE)
+        if count_mode not in self.count_modes:
+            raise _get_bad_request_exception(
+                "ERROR_INVALID_COUNT_MODE",
+                f"The count mode must be one of {', '.join(self.count_modes)}.",
+            )
+        return count_mode
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+        count_mode = self.get_count_mode(request)
+
+        order_bys = self.get_order_bys(queryset)
+        signature = self.get_order_bys_signature(order_bys)
+        values = self.decode_cursor(
+            request.query_params.get(self.cursor_query_param), signature, order_bys
+        )
+
+        if count_mode == self.COUNT_EXACT:
+            self.count = queryset.count()
+        elif count_mode == self.COUNT_ESTIMATE:
+            self.count = estimate_queryset_count(queryset)
+
+        queryset = queryset.annotate(
+            **{
+                self._get_key_name(index): order_by.expression
+                for index, order_by in enumerate(order_bys)
+            }
+        )
+        if values is not None:
+            queryset = queryset.filter(
+                self.get_seek_q(
+                    order_bys, values, self.get_not_nullable(queryset, order_bys)
+                )
+            )
+
+        rows = list(queryset[: page_size + 1])
+        page = rows[:page_size]
+
+        if len(rows) > page_size:
+            last_row = page[-1]
+            self.next_cursor = self.encode_cursor(
+                signature,
+                [
+                    getattr(last_row, self._get_key_name(index))
+                    for index in range(len(order_bys))
+                ],
+            )
+
+        return page
+
+    def get_paginated_response(self, data):
+        response = OrderedDict()
+        if self.count is not None:
+            response["count"] = self.count
+        response["next"] = self.get_next_link()
+        response["next_cursor"] = self.next_cursor
+        response["results"] = data
+        return Response(response)
+
+    def get_next_link(self) -> Optional[str]:
+        if self.next_cursor is None:
+            return None
+
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    @staticmethod
+    def get_order_bys(queryset: QuerySet) -> List[OrderBy]:
+        """
+        Converts the ordering of the queryset to a list of `OrderBy` expressions. The
+        `id` is added as the last expression if it's not already in there, because
+        the ordering must be unique to be able to seek past a row.
+        """
+
+        ordering = list(queryset.query.order_by)
+        if not ordering and queryset.query.default_ordering:
+            ordering = list(queryset.model._meta.ordering)
+
+        order_bys = []
+        for order in ordering:
+            if isinstance(order, str):
+                if order == "?":
+                    raise _get_bad_request_exception(
+                        "ERROR_KEYSET_PAGINATION_NOT_POSSIBLE",
+                        "A randomly ordered result can't be paginated by a cursor.",
+                    )
+                if order.startswith("-"):
+                    order = F(order[1:]).desc()
+                else:
+                    order = F(order).asc()
+            elif not isinstance(order, OrderBy):
+                order = order.asc()
+            order_bys.append(order)
+
+        if not any(
+            isinstance(order_by.expression, F)
+            and order_by.expression.name in ("id", "pk")
+            for order_by in order_bys
+        ):
+            order_bys.append(F("id").asc())
+
+        return order_bys
+
+    @staticmethod
+    def get_order_bys_signature(order_bys: List[OrderBy]) -> str:
+        """
+        Returns a short hash of the ordering so that a cursor can't be used on a
+        differently sorted queryset.
+        """
+
+        key = "-".join(repr(order_by) for order_by in order_bys)
+        return shake_128(key.encode("utf-8")).hexdigest(4)
+
+    @staticmethod
+    def get_not_nullable(queryset: QuerySet, order_bys: List[OrderBy]) -> List[bool]:
+        """
+        Indicates for every ordering expression whether it's a column of the model
+        that can't be null.
+        """
+
+        opts = queryset.model._meta
+        not_nullable = []
+        for order_by in order_bys:
+            expression = order_by.expression
+            field = None
+            if isinstance(expression, F):
+                try:
+                    field = (
+                        opts.pk
+                        if expression.name == "pk"
+                        else opts.get_field(expression.name)
+                    )
+                except FieldDoesNotExist:
+                    pass
+            not_nullable.append(
+                field is not None
+                and field.concrete
+                and not field.is_relation
+                and not field.null
+            )
+        return not_nullable
+
+    @staticmethod
+    def get_seek_q(
+        order_bys: List[OrderBy],
+        values: List[Any],
+        not_nullable: Optional[List[bool]] = None,
+    ) -> Q:
+        """
+        Builds a predicate that only matches the rows that come after the provided
+        sort key values. It's the lexicographic comparison
+        `(k1 > v1) OR (k1 = v1 AND k2 > v2) OR ...` respecting the direction and the
+        position of the nulls of every key. If possible, a range condition on the
+        first key is added so that the database can start an index scan there.
+
+        The last keys that are sorted in the same direction and can't be null are
+        compared with a single row value comparison like `(k2, k3) > (v2, v3)`
+        instead, because PostgreSQL can only use a multi column index, like the one
+        on `(order, id)` of the table models, for that form.
+        """
+
+        if not_nullable is None:
+            not_nullable = [False] * len(order_bys)
+
+        row_start = len(order_bys)
+        while (
+            row_start > 0
+            and not_nullable[row_start - 1]
+            and values[row_start - 1] is not None
+            and order_bys[row_start - 1].descending == order_bys[-1].descending
+        ):
+            row_start -= 1
+
+        if row_start < len(order_bys):
+            q = KeysetPagination._get_row_seek_q(
+                order_bys[-1].descending, row_start, values[row_start:]
+            )
+        else:
+            q = Q(pk__in=[])
+
+        for index in reversed(range(row_start)):
+            key = KeysetPagination._get_key_name(index)
+            after, equal = KeysetPagination._get_seek_conditions(
+                key, order_bys[index], values[index]
+            )
+            q = after | (equal & q)
+
+        first_key = KeysetPagination._get_key_name(0)
+        first_order_by, first_value = order_bys[0], values[0]
+        if (
+            row_start > 0
+            and first_value is not None
+            and KeysetPagination._nulls_first(first_order_by)
+        ):
+            lookup = "lte" if first_order_by.descending else "gte"
+            q = Q(**{f"{first_key}__{lookup}": first_value}) & q
+
+        return q
+
+    @staticmethod
+    def _get_row_seek_q(descending: bool, start: int, values: List[Any]) -> Q:
+        keys = [
+            KeysetPagination._get_key_name(index)
+            for index in range(start, start + len(values))
+        ]
+
+        if len(keys) == 1:
+            lookup = "lt" if descending else "gt"
+            return Q(**{f"{keys[0]}__{lookup}": values[0]})
+
+        lookup_class = LessThan if descending else GreaterThan
+        return Q(
+            lookup_class(
+                Func(*[F(key) for key in keys], function="ROW", output_field=Field()),
+                Func(
+                    *[Value(value) for value in values],
+                    function="ROW",
+                    output_field=Field(),
+                ),
+            )
+        )
+
+    @staticmethod
+    def _get_seek_conditions(key: str, order_by: OrderBy, value: Any) -> Tuple[Q, Q]:
+        nulls_first = KeysetPagination._nulls_first(order_by)
+        is_null = Q(**{f"{key}__isnull": True})
+
+        if value is None:
+            after = ~is_null if nulls_first else Q(pk__in=[])
+            return after, is_null
+
+        lookup = "lt" if order_by.descending else "gt"
+        after = Q(**{f"{key}__{lookup}": value})
+        if not nulls_first:
+            after |= is_null
+        return after, Q(**{key: value})
+
+    @staticmethod
+    def _nulls_first(order_by: OrderBy) -> bool:
+        # PostgreSQL considers null values larger than any other value by default.
+        if order_by.nulls_first:
+            return True
+        if order_by.nulls_last:
+            return False
+        return order_by.descending
+
+    @staticmethod
+    def _get_key_name(index: int) -> str:
+        return f"keyset_{index}"
+
+    @staticmethod
+    def encode_cursor(signature: str, values: List[Any]) -> str:
+        payload = json.dumps([signature, [_encode_cursor_value(v) for v in values]])
+        return urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def decode_cursor(
+        cursor: Optional[str], signature: str, order_bys: List[OrderBy]
+    ) -> Optional[List[Any]]:
+        if not cursor:
+            return None
+
+        try:
+            cursor_signature, values = json.loads(urlsafe_b64decode(cursor.encode()))
+            values = [_decode_cursor_value(v) for v in values]
+        except (TypeError, ValueError, ArithmeticError):
+            raise _get_bad_request_exception(
+                "ERROR_INVALID_CURSOR", "The provided cursor is invalid."
+            )
+
+        if cursor_signature != signature or len(values) != len(order_bys):
+            raise _get_bad_request_exception(
+                "ERROR_INVALID_CURSOR",
+                "The provided cursor doesn't match the ordering of the rows.",
+            )
+
+        return values
+
+
+def _encode_cursor_value(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return {"decimal": str(value)}
+    elif isinstance(value, datetime):
+        return {"datetime": value.isoformat()}
+    elif isinstance(value, date):
+        return {"date": value.isoformat()}
+    elif isinstance(value, UUID):
+        return {"uuid": str(value)}
+    elif isinstance(value, (list, tuple)):
+        return {"list": [_encode_cursor_value(v) for v in value]}
+    elif isinstance(value, dict):
+        return {"dict": value}
+    return value
+
+
+def _decode_cursor_value(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+
+    (value_type, encoded), *_ = value.items()
+    if value_type == "decimal":
+        return Decimal(encoded)
+    elif value_type == "datetime":
+        return datetime.fromisoformat(encoded)
+    elif value_type == "date":
+        return date.fromisoformat(encoded)
+    elif value_type == "uuid":
+        return UUID(encoded)
+    elif value_type == "list":
+        return [_decode_cursor_value(v) for v in encoded]
+    elif value_type == "dict":
+        return encoded
+    raise ValueError(f"Unknown cursor value type {value_type}.")
+
+
+def _get_bad_request_exception(error: str, detail: str) -> APIException:
+    exception = APIException({"error": error, "detail": detail})
+    exception.status_code = HTTP_400_BAD_REQUEST
+    return exception
@@ -341,6 +341,9 @@ CELERY_SINGLETON_BACKEND_CLASS = (
 # This flag enable automatic index creation for table views based on sortings.
 AUTO_INDEX_VIEW_ENABLED = os.getenv("BASEROW_AUTO_INDEX_VIEW_ENABLED", "true") == "true"
 AUTO_INDEX_LOCK_EXPIRY = os.getenv("BASEROW_AUTO_INDEX_LOCK_EXPIRY", 60 * 2)
+# This flag enables the automatic creation of trigram indexes for text fields that
+# are filtered with a contains filter. It requires the pg_trgm Postgres extension.
+TRIGRAM_INDEX_ENABLED = str_to_bool(os.getenv("BASEROW_TRIGRAM_INDEX_ENABLED", "false"))
 
 # Should contain the database connection name of the database where the user tables
 # are stored. This can be different than the default database because there are not
@@ -838,6 +841,13 @@ BASEROW_OPENAI_UPLOADED_FILE_SIZE_LIMIT_MB = int(
 EXPORT_FILES_DIRECTORY = "export_files"
 EXPORT_CLEANUP_INTERVAL_MINUTES = 5
 EXPORT_FILE_EXPIRE_MINUTES = 60
+# The number of rows fetched at once from the server-side cursor of an export.
+BASEROW_EXPORT_CHUNK_SIZE = int(os.getenv("BASEROW_EXPORT_CHUNK_SIZE", "") or 2000)
+# The number of threads serializing the fetched chunks of rows of an export. If 0
+# the chunks are serialized by the thread fetching them.
+BASEROW_EXPORT_SERIALIZATION_WORKERS = int(
+    os.getenv("BASEROW_EXPORT_SERIALIZATION_WORKERS", "") or 1
+)
 
 # The interval in minutes that the mentions cleanup job should run. This job will
 # remove mentions that are no longer used.
@@ -849,6 +859,12 @@ MIDNIGHT_CRONTAB_STR = "0 0 * * *"
 BASEROW_STORAGE_USAGE_JOB_CRONTAB = get_crontab_from_env(
     "BASEROW_STORAGE_USAGE_JOB_CRONTAB", default_crontab=MIDNIGHT_CRONTAB_STR
 )
+# The storage usage job only recalculates the workspaces that have changed, but the
+# workspaces that haven't been recalculated for this many days are recalculated
+# anyway, in case a change wasn't tracked.
+BASEROW_STORAGE_USAGE_FULL_RECALCULATION_DAYS = int(
+    os.getenv("BASEROW_STORAGE_USAGE_FULL_RECALCULATION_DAYS", 7)
+)
 
 ONE_AM_CRONTRAB_STR = "0 1 * * *"
 BASEROW_SEAT_USAGE_JOB_CRONTAB = get_crontab_from_env(
@@ -978,6 +994,17 @@ MAX_FIELD_REFERENCE_DEPTH = 1000
 DONT_UPDATE_FORMULAS_AFTER_MIGRATION = bool(
     os.getenv("DONT_UPDATE_FORMULAS_AFTER_MIGRATION", "")
 )
+# When enabled, the formula updates triggered by changed rows carry the ids of the
+# affected rows from one link row hop to the next, instead of joining every dependent
+# table back to the starting rows.
+ROW_SCOPED_FORMULA_UPDATES = str_to_bool(
+    os.getenv("BASEROW_ROW_SCOPED_FORMULA_UPDATES", "false")
+)
+# Above this number of affected rows in a hop the ids are stored in a temporary table
+# instead of being inlined in the query.
+ROW_SCOPED_FORMULA_UPDATES_TEMP_TABLE_THRESHOLD = int(
+    os.getenv("BASEROW_ROW_SCOPED_FORMULA_UPDATES_TEMP_TABLE_THRESHOLD", 5000)
+)
 EVERY_TEN_MINUTES = "*/10 * * * *"
 PERIODIC_FIELD_UPDATE_TIMEOUT_MINUTES = int(
     os.getenv("BASEROW_PERIODIC_FIELD_UPDATE_TIMEOUT_MINUTES", 9)
@@ -1062,9 +1089,20 @@ BASEROW_ROW_HISTORY_CLEANUP_INTERVAL_MINUTES = int(
 BASEROW_ROW_HISTORY_RETENTION_DAYS = int(
     os.getenv("BASEROW_ROW_HISTORY_RETENTION_DAYS", 180)
 )
+# When set, the row history only stores the removed and added items of the list
+# values, like link row or multiple select values, with more items than this.
+# 0 disables it and always stores the full values.
+BASEROW_ROW_HISTORY_COMPACT_LIST_VALUES_THRESHOLD = int(
+    os.getenv("BASEROW_ROW_HISTORY_COMPACT_LIST_VALUES_THRESHOLD", 0)
+)
 BASEROW_MAX_ROW_REPORT_ERROR_COUNT = int(
     os.getenv("BASEROW_MAX_ROW_REPORT_ERROR_COUNT", 30)
 )
+# Imported rows are inserted with `COPY` instead of `INSERT` if all the fields of
+# the table support it.
+BASEROW_IMPORT_ROWS_WITH_COPY = str_to_bool(
+    os.getenv("BASEROW_IMPORT_ROWS_WITH_COPY", "true")
+)
 BASEROW_MAX_SNAPSHOTS_PER_GROUP = int(os.getenv("BASEROW_MAX_SNAPSHOTS_PER_GROUP", -1))
 BASEROW_SNAPSHOT_EXPIRATION_TIME_DAYS = int(
     os.getenv("BASEROW_SNAPSHOT_EXPIRATION_TIME_DAYS", 360)  # 360 days
@@ -1163,6 +1201,21 @@ BASEROW_SYNC_TEMPLATES_TIME_LIMIT = int(
 APPEND_SLASH = False
 
 BASEROW_DISABLE_MODEL_CACHE = bool(os.getenv("BASEROW_DISABLE_MODEL_CACHE", ""))
+# The maximum number of fully generated table models and the maximum total number of
+# model fields that every worker process keeps in memory. Setting either to 0 disables
+# the in-memory model cache, the redis backed cache is then still used.
+BASEROW_IN_MEMORY_MODEL_CACHE_MAX_MODELS = int(
+    os.getenv("BASEROW_IN_MEMORY_MODEL_CACHE_MAX_MODELS", 128)
+)
+BASEROW_IN_MEMORY_MODEL_CACHE_MAX_FIELDS = int(
+    os.getenv("BASEROW_IN_MEMORY_MODEL_CACHE_MAX_FIELDS", 20000)
+)
+# Serializes the values of the rows in the API responses, web socket messages and
+# webhook payloads with the converter functions of the field types instead of the
+# serializer fields where possible. The output is the same, but it's faster.
+BASEROW_FAST_ROW_SERIALIZATION = str_to_bool(
+    os.getenv("BASEROW_FAST_ROW_SERIALIZATION", "false")
+)
 BASEROW_NOWAIT_FOR_LOCKS = not bool(
     os.getenv("BASEROW_WAIT_INSTEAD_OF_409_CONFLICT_ERROR", False)
 )
@@ -1194,6 +1247,21 @@ USE_PG_FULLTEXT_SEARCH = str_to_bool(
 PG_SEARCH_CONFIG = os.getenv("BASEROW_PG_SEARCH_CONFIG", "simple")
 AUTO_VACUUM_AFTER_SEARCH_UPDATE = str_to_bool(os.getenv("BASEROW_AUTO_VACUUM", "true"))
 TSV_UPDATE_CHUNK_SIZE = int(os.getenv("BASEROW_TSV_UPDATE_CHUNK_SIZE", "2000"))
+# The rows changed in a table within this number of seconds are indexed together in
+# a single update. Set to 0 to schedule an update for every change.
+TSV_UPDATE_DEBOUNCE_SECONDS = float(
+    os.getenv("BASEROW_TSV_UPDATE_DEBOUNCE_SECONDS", "1")
+)
+# The realtime row messages of a table sent within this number of seconds after a
+# previous one are buffered and sent together. Set to 0 to send every message right
+# away. If more rows than REALTIME_ROW_MESSAGES_COALESCE_MAX_ROWS changed in the
+# buffered messages, the clients are asked to refresh the table instead.
+REALTIME_ROW_MESSAGES_COALESCE_SECONDS = float(
+    os.getenv("BASEROW_REALTIME_ROW_MESSAGES_COALESCE_SECONDS", "1")
+)
+REALTIME_ROW_MESSAGES_COALESCE_MAX_ROWS = int(
+    os.getenv("BASEROW_REALTIME_ROW_MESSAGES_COALESCE_MAX_ROWS", "500")
+)
 
 POSTHOG_PROJECT_API_KEY = os.getenv("POSTHOG_PROJECT_API_KEY", "")
 POSTHOG_HOST = os.getenv("POSTHOG_HOST", "")
@@ -1208,6 +1276,27 @@ BASEROW_BUILDER_DOMAINS = os.getenv("BASEROW_BUILDER_DOMAINS", None)
 BASEROW_BUILDER_DOMAINS = (
     BASEROW_BUILDER_DOMAINS.split(",") if BASEROW_BUILDER_DOMAINS is not None else []
 )
+# The maximum number of threads used to concurrently dispatch the independent data
+# sources of a builder page. Each thread uses its own database connection. Setting
+# it to 1 dispatches the data sources one after another.
+BASEROW_BUILDER_DATA_SOURCES_DISPATCH_MAX_WORKERS = int(
+    os.getenv("BASEROW_BUILDER_DATA_SOURCES_DISPATCH_MAX_WORKERS", 4)
+)
+# The number of seconds the dispatch results of the data sources of published
+# applications are cached and shared between the visitors. The results are
+# invalidated when their table changes, unless the TTL only mode is enabled, in
+# which case they're only refreshed once expired. Setting it to 0 disables the cache.
+BASEROW_BUILDER_DATA_SOURCES_CACHE_TIMEOUT = int(
+    os.getenv("BASEROW_BUILDER_DATA_SOURCES_CACHE_TIMEOUT", 600)
+)
+BASEROW_BUILDER_DATA_SOURCES_CACHE_TTL_ONLY = str_to_bool(
+    os.getenv("BASEROW_BUILDER_DATA_SOURCES_CACHE_TTL_ONLY", "false")
+)
+# The number of compiled runtime formulas, used by the application builder and the
+# integrations, which every worker process keeps in memory.
+BASEROW_COMPILED_FORMULAS_CACHE_SIZE = int(
+    os.getenv("BASEROW_COMPILED_FORMULAS_CACHE_SIZE", 4096)
+)
 
 # Indicates whether we are running the tests or not. Set to True in the test.py settings
 # file used by pytest.ini
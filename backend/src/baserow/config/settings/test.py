@@ -50,6 +50,18 @@ CACHES = {
 # Look into tests.baserow.api.test_api_utils.py if you need to test the throttle
 REST_FRAMEWORK["DEFAULT_THROTTLE_CLASSES"] = []
 
+# The coalescing of the realtime row messages uses redis, so every message is sent
+# right away in the tests.
+REALTIME_ROW_MESSAGES_COALESCE_SECONDS = 0
+
+# The tests never commit their transaction, so the audit log entries are written
+# right away instead of after the commit.
+BASEROW_ENTERPRISE_AUDIT_LOG_BUFFERED_WRITES = False
+
+# The tests often change the rows directly, without sending the signals invalidating
+# the cached data source results, so the tests using it must enable it explicitly.
+BASEROW_BUILDER_DATA_SOURCES_CACHE_TIMEOUT = 0
+
 if "cachalot" not in INSTALLED_APPS:
     install_cachalot()
 
@@ -488,7 +488,6 @@ class DispatchDataSourcesView(APIView):
             ),
         },
     )
-    @transaction.atomic
     @map_exceptions(
         {
             PageDoesNotExist: ERROR_PAGE_DOES_NOT_EXIST,
@@ -498,7 +497,9 @@ class DispatchDataSourcesView(APIView):
     )
     def post(self, request, page_id: int):
         """
-        Call the given data_source related service dispatch method.
+        Call the given data_source related service dispatch method. This view isn't
+        atomic because the independent data sources are dispatched concurrently with
+        separate database connections, which wouldn't see the transaction.
         """
 
         page = PageHandler().get_page(page_id)
@@ -61,6 +61,10 @@ class BuilderConfig(AppConfig):
             ImageElementWorkspaceStorageUsageItem()
         )
 
+        from .elements.receivers import connect_to_element_signals_for_storage_usage
+
+        connect_to_element_signals_for_storage_usage()
+
         from baserow.contrib.builder.pages.operations import (
             CreatePageOperationType,
             DeletePageOperationType,
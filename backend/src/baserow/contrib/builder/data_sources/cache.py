@@ -0,0 +1,112 @@
+"""
+Caches the dispatch results of the data sources of the published applications, so
+that the visitors of a page share them instead of all dispatching the same services.
+
+A result is cached per data source and per resolved formulas of its service, which
+covers the page parameters and the user data the formulas use, and per data
+versions of the service, which change when the table of the service changes. This
+includes the changes of the cells of its lookup, formula, rollup and link row fields
+made because a table they depend on changed.
+"""
+
+import hashlib
+import json
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from baserow.contrib.builder.data_sources.builder_dispatch_context import (
+    BuilderDispatchContext,
+)
+from baserow.contrib.builder.data_sources.models import DataSource
+from baserow.core.formula import resolve_formula
+from baserow.core.formula.registries import formula_runtime_function_registry
+from baserow.core.services.types import ServiceSubClass
+
+
+def get_data_source_dispatch_cache_key(
+    data_source: DataSource,
+    service: ServiceSubClass,
+    dispatch_context: BuilderDispatchContext,
+) -> Optional[str]:
+    """
+    Returns the key under which the dispatch result of the data source is cached
+    for this dispatch context, or None if the result can't be cached.
+
+    :param data_source: The data source being dispatched.
+    :param service: The specific service of the data source.
+    :param dispatch_context: The context used for the dispatch.
+    :return: The cache key or None.
+    """
+
+    if (
+        not settings.BASEROW_BUILDER_DATA_SOURCES_CACHE_TIMEOUT
+        or data_source.page.builder.workspace_id is not None
+    ):
+        return None
+
+    service_type = service.get_type()
+    versions = service_type.get_dispatch_cache_versions(service)
+    if versions is None:
+        return None
+
+    # The formulas are resolved again when the service is dispatched, so the calls
+    # made while resolving them here must not be detected as a recursion then.
+    call_stack = set(dispatch_context.call_stack)
+    try:
+        resolved_formulas = [
+            resolve_formula(
+                formula, formula_runtime_function_registry, dispatch_context
+            )
+            for formula in service_type.formula_generator(service)
+        ]
+    except Exception:
+        # The dispatch will fail for the same reason, and errors aren't cached.
+        return None
+    finally:
+        dispatch_context.call_stack = call_stack
+
+    key_parts = [
+        resolved_formulas,
+        dispatch_context.range(service) if service_type.returns_list else None,
+        None if settings.BASEROW_BUILDER_DATA_SOURCES_CACHE_TTL_ONLY else versions,
+    ]
+    digest = hashlib.sha256(
+        json.dumps(key_parts, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    return f"builder_data_source_dispatch_{data_source.id}_{digest}"
+
+
+def get_or_dispatch_data_source(
+    data_source: DataSource,
+    service: ServiceSubClass,
+    dispatch_context: BuilderDispatchContext,
+    dispatch: Callable[[], Any],
+) -> Any:
+    """
+    Returns the cached dispatch result of the data source if there is one, otherwise
+    dispatches it and caches the result if possible.
+
+    :param data_source: The data source being dispatched.
+    :param service: The specific service of the data source.
+    :param dispatch_context: The context used for the dispatch.
+    :param dispatch: Dispatches the service of the data source.
+    :return: The dispatch result.
+    """
+
+    cache_key = get_data_source_dispatch_cache_key(
+        data_source, service, dispatch_context
+    )
+    if cache_key is None:
+        return dispatch()
+
+    result = cache.get(cache_key)
+    if result is None:
+        result = dispatch()
+        cache.set(
+            cache_key,
+            result,
+            timeout=settings.BASEROW_BUILDER_DATA_SOURCES_CACHE_TIMEOUT,
+        )
+    return result
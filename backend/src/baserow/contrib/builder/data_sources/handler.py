@@ -1,12 +1,18 @@
-from typing import Any, Dict, Iterable, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
 from zipfile import ZipFile
 
+from django.conf import settings
 from django.core.files.storage import Storage
+from django.db import close_old_connections, transaction
 from django.db.models import QuerySet
 
+from antlr4 import ParserRuleContext
+
 from baserow.contrib.builder.data_sources.builder_dispatch_context import (
     BuilderDispatchContext,
 )
+from baserow.contrib.builder.data_sources.cache import get_or_dispatch_data_source
 from baserow.contrib.builder.data_sources.exceptions import (
     DataSourceDoesNotExist,
     DataSourceImproperlyConfigured,
@@ -15,15 +21,84 @@ from baserow.contrib.builder.data_sources.models import DataSource
 from baserow.contrib.builder.formula_importer import import_formula
 from baserow.contrib.builder.pages.models import Page
 from baserow.contrib.builder.types import DataSourceDict
+from baserow.core.context import get_context, set_context
+from baserow.core.formula import BaserowFormula, BaserowFormulaException
+from baserow.core.formula.parser.parser import (
+    convert_string_literal_token_to_string,
+    get_parse_tree_for_formula,
+)
+from baserow.core.handler import CoreHandler
 from baserow.core.integrations.models import Integration
 from baserow.core.integrations.registries import integration_type_registry
 from baserow.core.services.handler import ServiceHandler
 from baserow.core.services.models import Service
 from baserow.core.services.registries import ServiceType
-from baserow.core.utils import find_unused_name
+from baserow.core.utils import find_unused_name, to_path
 
 from .types import DataSourceForUpdate
 
+# The data providers through which a formula can read the data of a data source.
+DATA_SOURCE_DATA_PROVIDER_TYPES = ["data_source", "data_source_context"]
+
+# Shared by all the dispatches, so that the worker threads and their database
+# connections are reused instead of being created for every request.
+data_source_dispatch_executor = ThreadPoolExecutor(
+    max_workers=settings.BASEROW_BUILDER_DATA_SOURCES_DISPATCH_MAX_WORKERS,
+    thread_name_prefix="data-source-dispatch",
+)
+
+
+def get_data_source_ids_in_formula(formula: str) -> Set[int]:
+    """
+    Returns the ids of the data sources referenced by the `get()` calls of the
+    formula through one of the data source data providers. Paths which are computed
+    at runtime, and formulas which can't be parsed, are ignored.
+
+    :param formula: The formula to search the data source references in.
+    :return: The referenced data source ids.
+    """
+
+    # Quickly skip the formulas which can't reference a data source, so that most of
+    # them don't have to be parsed.
+    if not formula or "data_source" not in formula:
+        return set()
+
+    try:
+        tree = get_parse_tree_for_formula(formula)
+    except BaserowFormulaException:
+        return set()
+
+    data_source_ids = set()
+    nodes = [tree]
+    while nodes:
+        node = nodes.pop()
+        if not isinstance(node, ParserRuleContext):
+            continue
+        nodes.extend(node.children or [])
+
+        if not isinstance(node, BaserowFormula.FunctionCallContext):
+            continue
+        args = node.expr()
+        if (
+            node.func_name().getText().lower() != "get"
+            or not args
+            or not isinstance(args[0], BaserowFormula.StringLiteralContext)
+        ):
+            continue
+
+        path = to_path(
+            convert_string_literal_token_to_string(
+                args[0].getText(), args[0].SINGLEQ_STRING_LITERAL() is not None
+            )
+        )
+        if len(path) >= 2 and path[0] in DATA_SOURCE_DATA_PROVIDER_TYPES:
+            try:
+                data_source_ids.add(int(path[1]))
+            except ValueError:
+                pass
+
+    return data_source_ids
+
 
 class DataSourceHandler:
     def __init__(self):
@@ -316,11 +391,72 @@ class DataSourceHandler:
 
         data_source.delete()
 
+    def get_data_source_dependencies(
+        self, data_sources: List[DataSource]
+    ) -> Dict[int, Set[int]]:
+        """
+        Returns the ids of the given data sources each data source depends on,
+        because its formulas read the data of these data sources. The services of the
+        data sources must be specific, like the ones returned by `get_data_sources`,
+        so that reading their formulas doesn't need any query.
+
+        :param data_sources: The data sources to compute the dependencies of.
+        :return: The ids of the data source dependencies mapped by data source ID.
+        """
+
+        data_source_ids = {data_source.id for data_source in data_sources}
+
+        dependencies = {}
+        for data_source in data_sources:
+            referenced_ids = set()
+            if data_source.service_id:
+                service = data_source.service
+                for formula in service.get_type().formula_generator(service):
+                    referenced_ids |= get_data_source_ids_in_formula(formula)
+            dependencies[data_source.id] = (referenced_ids & data_source_ids) - {
+                data_source.id
+            }
+
+        return dependencies
+
+    def get_data_source_dispatch_levels(
+        self, data_sources: List[DataSource]
+    ) -> List[List[DataSource]]:
+        """
+        Groups the data sources in levels so that the data sources of a level only
+        depend on the data sources of the previous levels. The data sources of a
+        level can therefore be dispatched concurrently. The data sources which
+        depend on each other in a cycle are all put in the last level, their
+        dispatch then fails with a recursion error.
+
+        :param data_sources: The data sources to be dispatched.
+        :return: The levels of data sources in dispatch order.
+        """
+
+        dependencies = self.get_data_source_dependencies(data_sources)
+
+        levels = []
+        remaining = list(data_sources)
+        dispatched_ids = set()
+        while remaining:
+            level = [d for d in remaining if dependencies[d.id] <= dispatched_ids]
+            if not level:
+                levels.append(remaining)
+                break
+            levels.append(level)
+            dispatched_ids |= {d.id for d in level}
+            remaining = [d for d in remaining if d.id not in dispatched_ids]
+
+        return levels
+
     def dispatch_data_sources(
         self, data_sources, dispatch_context: BuilderDispatchContext
     ):
         """
-        Dispatch the service related to the data_sources.
+        Dispatch the service related to the data_sources. The data sources which
+        don't depend on each other are dispatched concurrently, each with its own
+        database connection, unless we are in a transaction because the other
+        connections wouldn't see its changes.
 
         :param data_sources: The data sources to be dispatched.
         :param dispatch_context: The context used for the dispatch.
@@ -329,21 +465,89 @@ class DataSourceHandler:
             result for this data source.
         """
 
-        data_sources_dispatch = {}
-        for data_source in data_sources:
-            # Add the initial call to the call stack
-            dispatch_context.add_call(data_source.id)
-            try:
-                data_sources_dispatch[data_source.id] = self.dispatch_data_source(
+        data_sources = list(data_sources)
+
+        if (
+            settings.BASEROW_BUILDER_DATA_SOURCES_DISPATCH_MAX_WORKERS <= 1
+            or len(data_sources) <= 1
+            or transaction.get_connection().in_atomic_block
+        ):
+            return {
+                data_source.id: self._dispatch_data_source_isolated(
                     data_source, dispatch_context
                 )
-            except Exception as e:
-                data_sources_dispatch[data_source.id] = e
-            # Reset the stack as we are starting a new dispatch
-            dispatch_context.reset_call_stack()
+                for data_source in data_sources
+            }
+
+        data_sources_dispatch = {}
+        contents = dispatch_context.cache.setdefault("data_source_contents", {})
+        # The threads work for the current request, so they must sign the file URLs
+        # for its workspace and share its permission checks.
+        context = get_context()
+        for level in self.get_data_source_dispatch_levels(data_sources):
+            if len(level) == 1:
+                data_sources_dispatch[
+                    level[0].id
+                ] = self._dispatch_data_source_isolated(level[0], dispatch_context)
+                continue
+
+            # Each thread gets its own context, so that the call stacks and the
+            # caches don't interfere, seeded with the contents of the data sources
+            # dispatched in the previous levels.
+            futures = []
+            for data_source in level:
+                thread_context = dispatch_context.from_context(dispatch_context)
+                thread_context.cache["data_source_contents"] = {**contents}
+                future = data_source_dispatch_executor.submit(
+                    self._dispatch_data_source_in_thread,
+                    data_source,
+                    thread_context,
+                    context,
+                )
+                futures.append((data_source, thread_context, future))
+
+            for data_source, thread_context, future in futures:
+                data_sources_dispatch[data_source.id] = future.result()
+                contents.update(thread_context.cache["data_source_contents"])
 
         return data_sources_dispatch
 
+    def _dispatch_data_source_in_thread(
+        self,
+        data_source: DataSource,
+        dispatch_context: BuilderDispatchContext,
+        context,
+    ) -> Any:
+        # The worker threads aren't handling requests, so the connections which
+        # are broken or older than `CONN_MAX_AGE` must be closed, and the context of
+        # the request cleared, here, like Django and the `ClearContextMiddleware` do
+        # at the start and the end of every request.
+        close_old_connections()
+        set_context(context)
+        try:
+            return self._dispatch_data_source_isolated(data_source, dispatch_context)
+        finally:
+            CoreHandler().clear_context()
+            close_old_connections()
+
+    def _dispatch_data_source_isolated(
+        self, data_source: DataSource, dispatch_context: BuilderDispatchContext
+    ) -> Any:
+        """
+        Dispatches the data source with a fresh call stack and returns the
+        exception raised by the dispatch, if any, as result.
+        """
+
+        # Add the initial call to the call stack
+        dispatch_context.add_call(data_source.id)
+        try:
+            return self.dispatch_data_source(data_source, dispatch_context)
+        except Exception as e:
+            return e
+        finally:
+            # Reset the stack as we are starting a new dispatch
+            dispatch_context.reset_call_stack()
+
     def dispatch_data_source(
         self, data_source: DataSource, dispatch_context: BuilderDispatchContext
     ) -> Any:
@@ -363,8 +567,14 @@ class DataSourceHandler:
         if data_source.id not in dispatch_context.cache.setdefault(
             "data_source_contents", {}
         ):
-            service_dispatch = self.service_handler.dispatch_service(
-                data_source.service.specific, dispatch_context
+            service = data_source.service.specific
+            service_dispatch = get_or_dispatch_data_source(
+                data_source,
+                service,
+                dispatch_context,
+                lambda: self.service_handler.dispatch_service(
+                    service, dispatch_context
+                ),
             )
             # Cache the dispatch in the formula cache if we have formulas that need
             # it later
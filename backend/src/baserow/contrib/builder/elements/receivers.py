@@ -3,8 +3,15 @@ from django.db.models import F, Func, Value
 from baserow.contrib.builder.elements.collection_field_types import (
     LinkCollectionFieldType,
 )
-from baserow.contrib.builder.elements.models import CollectionField
-from baserow.contrib.builder.pages.signals import page_deleted
+from baserow.contrib.builder.elements.models import CollectionField, ImageElement
+from baserow.contrib.builder.elements.signals import (
+    element_created,
+    element_deleted,
+    element_updated,
+    elements_created,
+)
+from baserow.contrib.builder.pages.signals import page_created, page_deleted
+from baserow.core.usage.handler import UsageHandler
 
 
 def page_deleted_update_link_collection_fields(sender, page_id: int, **kwargs):
@@ -42,3 +49,42 @@ def disconnect_link_collection_field_type_from_page_delete_signal():
     """
 
     page_deleted.disconnect(page_deleted_update_link_collection_fields)
+
+
+def mark_workspace_for_storage_usage_update_on_image_element_changed(
+    sender, element, **kwargs
+):
+    """
+    The image elements reference user files which are counted in the storage usage
+    of the workspace, so it must be recalculated when they change.
+    """
+
+    if isinstance(element, ImageElement):
+        UsageHandler.mark_workspace_for_storage_usage_update(
+            element.page.builder.workspace_id
+        )
+
+
+def mark_workspace_for_storage_usage_update_on_page_elements_changed(
+    sender, page, **kwargs
+):
+    """
+    When elements are deleted or duplicated, or when a page is duplicated, the
+    workspace is marked without checking if image elements are involved, because
+    the elements aren't all provided by the signals.
+    """
+
+    UsageHandler.mark_workspace_for_storage_usage_update(page.builder.workspace_id)
+
+
+def connect_to_element_signals_for_storage_usage():
+    """
+    Connects the signals which can change the user files used by the image elements
+    to the receivers marking the workspace for a storage usage update. This is
+    called when the `ImageElementWorkspaceStorageUsageItem` is registered.
+    """
+
+    for signal in [element_created, element_updated]:
+        signal.connect(mark_workspace_for_storage_usage_update_on_image_element_changed)
+    for signal in [element_deleted, elements_created, page_created]:
+        signal.connect(mark_workspace_for_storage_usage_update_on_page_elements_changed)
@@ -19,3 +19,28 @@ SEARCH_MODE_API_PARAM = OpenApiParameter(
         "whitespace on each cell. This is the Baserow legacy search behaviour."
     ),
 )
+KEYSET_PAGINATION_API_PARAMS = [
+    OpenApiParameter(
+        name="cursor",
+        location=OpenApiParameter.QUERY,
+        type=OpenApiTypes.STR,
+        description=(
+            "If provided, the rows are paginated by a cursor instead of a page number "
+            "or offset. Provide an empty value to get the first page and the "
+            "`next_cursor` of the response to get the next one. This is much faster "
+            "than the other pagination styles for pages deep into big tables. The "
+            "`size` parameter defines how many rows are returned."
+        ),
+    ),
+    OpenApiParameter(
+        name="count_mode",
+        location=OpenApiParameter.QUERY,
+        type=OpenApiTypes.STR,
+        description=(
+            "Can only be used in combination with the `cursor` parameter. The "
+            "default `none` doesn't count the rows, `exact` counts all the matching "
+            "rows and `estimate` returns the number of rows estimated by the "
+            "database, which is much faster on big tables."
+        ),
+    ),
+]
@@ -1,11 +1,15 @@
+from collections import OrderedDict
 from copy import deepcopy
-from typing import Dict, List
+from typing import Any, Callable, Dict, List
 
 from django.conf import settings
 from django.db.models.base import ModelBase
+from django.utils.functional import cached_property
 
 from loguru import logger
 from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
 
 from baserow.api.search.serializers import SearchQueryParamSerializer
 from baserow.api.utils import get_serializer_class
@@ -13,6 +17,9 @@ from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.rows.models import RowHistory
 from baserow.contrib.database.rows.registries import row_metadata_registry
 
+# The maximum number of generated row serializer classes that are cached per model.
+ROW_SERIALIZER_CLASSES_CACHE_SIZE = 32
+
 
 class RowSerializer(serializers.ModelSerializer):
     class Meta:
@@ -23,6 +30,56 @@ class RowSerializer(serializers.ModelSerializer):
         extra_kwargs = {"id": {"read_only": True}, "order": {"read_only": True}}
 
 
+class FastRowSerializerMixin(serializers.Serializer):
+    """
+    Serializes the values of the fields that have a converter function, provided by
+    the `get_response_serializer_converter` method of their field type, by calling it
+    directly instead of going through the serializer field. The other fields are
+    serialized exactly like DRF does, so the output is identical.
+    """
+
+    row_value_converters: Dict[str, Callable[[Any], Any]] = {}
+
+    @cached_property
+    def _fast_readable_fields(self):
+        fast_fields = []
+        for field in self._readable_fields:
+            converter = self.row_value_converters.get(field.field_name)
+            if converter is not None and len(field.source_attrs) == 1:
+                fast_fields.append((field, field.source_attrs[0], converter))
+            else:
+                fast_fields.append((field, None, None))
+        return fast_fields
+
+    def to_representation(self, instance):
+        ret = {}
+
+        for field, attribute_name, converter in self._fast_readable_fields:
+            if converter is not None:
+                try:
+                    value = getattr(instance, attribute_name)
+                except AttributeError:
+                    pass
+                else:
+                    ret[field.field_name] = None if value is None else converter(value)
+                    continue
+
+            try:
+                attribute = field.get_attribute(instance)
+            except SkipField:
+                continue
+
+            check_for_none = (
+                attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+            )
+            if check_for_none is None:
+                ret[field.field_name] = None
+            else:
+                ret[field.field_name] = field.to_representation(attribute)
+
+        return ret
+
+
 def serialize_rows_for_response(rows, model, user_field_names=False, many=True):
     return get_row_serializer_class(
         model,
@@ -49,6 +106,12 @@ def get_row_serializer_class(
     a serializer field will be added via the `get_serializer_field` method of the field
     type.
 
+    The generated serializer classes are cached on the model, unless `field_kwargs` are
+    provided. This is safe because a new model is generated when the fields of the
+    table change. If `BASEROW_FAST_ROW_SERIALIZATION` is enabled, the response
+    serializers convert the values of the fields using the converter functions of the
+    field types instead of the serializer fields where possible.
+
     :param model: The model for which to generate a serializer.
     :type model: Model
     :param base_class: The base serializer class that will be extended when
@@ -80,12 +143,38 @@ def get_row_serializer_class(
     :rtype: ModelSerializer
     """
 
+    fast_serialization = (
+        is_response
+        and settings.BASEROW_FAST_ROW_SERIALIZATION
+        and (base_class or serializers.ModelSerializer).to_representation
+        is serializers.Serializer.to_representation
+    )
+
+    cache_key = None
+    if not field_kwargs:
+        cache_key = (
+            base_class,
+            is_response,
+            None if field_ids is None else frozenset(field_ids),
+            None
+            if field_names_to_include is None
+            else frozenset(field_names_to_include),
+            user_field_names,
+            include_id,
+            None if required_fields is None else tuple(required_fields),
+            fast_serialization,
+        )
+        serializer_class = _get_cached_row_serializer_class(model, cache_key)
+        if serializer_class is not None:
+            return serializer_class
+
     if not field_kwargs:
         field_kwargs = {}
 
     field_objects = model._field_objects
     field_names = []
     field_overrides = {}
+    row_value_converters = {}
 
     for field in field_objects.values():
         field_id_matches = field_ids is None or (field["field"].id in field_ids)
@@ -116,17 +205,67 @@ def get_row_serializer_class(
             field_overrides[name] = serializer
             field_names.append(name)
 
+            if fast_serialization and field["name"] not in field_kwargs:
+                converter = field["type"].get_response_serializer_converter(
+                    field["field"]
+                )
+                if converter is not None:
+                    row_value_converters[name] = converter
+
     if include_id:
         field_names.append("id")
         field_overrides["id"] = serializers.IntegerField()
 
-    return get_serializer_class(
+    serializer_class = get_serializer_class(
         model,
         field_names,
         field_overrides,
         base_class,
         required_fields=required_fields,
+        base_mixins=[FastRowSerializerMixin] if fast_serialization else None,
+    )
+    if fast_serialization:
+        serializer_class.row_value_converters = row_value_converters
+
+    if cache_key is not None:
+        _set_cached_row_serializer_class(model, cache_key, serializer_class)
+
+    return serializer_class
+
+
+def _get_cached_row_serializer_class(model, cache_key):
+    # The cache is stored in the `__dict__` of the concrete model, so that it's
+    # shared by the models checked out of the in-memory model cache and discarded
+    # together with the cached model.
+    serializer_classes = model._meta.concrete_model.__dict__.get(
+        "_row_serializer_classes"
     )
+    if serializer_classes is None:
+        return None
+
+    serializer_class = serializer_classes.get(cache_key)
+    if serializer_class is not None:
+        try:
+            serializer_classes.move_to_end(cache_key)
+        except KeyError:
+            # Evicted by another thread in the meantime.
+            pass
+    return serializer_class
+
+
+def _set_cached_row_serializer_class(model, cache_key, serializer_class):
+    concrete_model = model._meta.concrete_model
+    serializer_classes = concrete_model.__dict__.get("_row_serializer_classes")
+    if serializer_classes is None:
+        serializer_classes = OrderedDict()
+        concrete_model._row_serializer_classes = serializer_classes
+
+    serializer_classes[cache_key] = serializer_class
+    while len(serializer_classes) > ROW_SERIALIZER_CLASSES_CACHE_SIZE:
+        try:
+            serializer_classes.popitem(last=False)
+        except KeyError:
+            break
 
 
 def get_batch_row_serializer_class(row_serializer_class):
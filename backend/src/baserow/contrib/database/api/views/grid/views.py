@@ -15,11 +15,14 @@ from baserow.api.decorators import (
     validate_query_parameters,
 )
 from baserow.api.errors import ERROR_USER_NOT_IN_GROUP
-from baserow.api.pagination import PageNumberPagination
+from baserow.api.pagination import KeysetPagination, PageNumberPagination
 from baserow.api.schemas import get_error_schema
 from baserow.api.search.serializers import SearchQueryParamSerializer
 from baserow.api.serializers import get_example_pagination_serializer_class
-from baserow.contrib.database.api.constants import SEARCH_MODE_API_PARAM
+from baserow.contrib.database.api.constants import (
+    KEYSET_PAGINATION_API_PARAMS,
+    SEARCH_MODE_API_PARAM,
+)
 from baserow.contrib.database.api.fields.errors import (
     ERROR_FIELD_DOES_NOT_EXIST,
     ERROR_FIELD_NOT_IN_TABLE,
@@ -251,14 +254,16 @@ class GridViewView(APIView):
                 ),
             ),
             SEARCH_MODE_API_PARAM,
+            *KEYSET_PAGINATION_API_PARAMS,
         ],
         tags=["Database table grid view"],
         operation_id="list_database_table_grid_view_rows",
         description=(
             "Lists the requested rows of the view's table related to the provided "
             "`view_id` if the authorized user has access to the database's workspace. "
-            "The response is paginated either by a limit/offset or page/size style. "
-            "The style depends on the provided GET parameters. The properties of the "
+            "The response is paginated either by a limit/offset, page/size or cursor "
+            "style. The style depends on the provided GET parameters. The properties "
+            "of the "
             "returned rows depends on which fields the table has. For a complete "
             "overview of fields use the **list_database_table_fields** endpoint to "
             "list them all. In the example all field types are listed, but normally "
@@ -293,6 +298,8 @@ class GridViewView(APIView):
                     "ERROR_VIEW_FILTER_TYPE_DOES_NOT_EXIST",
                     "ERROR_VIEW_FILTER_TYPE_UNSUPPORTED_FIELD",
                     "ERROR_FILTERS_PARAM_VALIDATION_ERROR",
+                    "ERROR_INVALID_CURSOR",
+                    "ERROR_INVALID_COUNT_MODE",
                 ]
             ),
             404: get_error_schema(
@@ -316,9 +323,10 @@ class GridViewView(APIView):
     @validate_query_parameters(SearchQueryParamSerializer, return_validated=True)
     def get(self, request, view_id, field_options, row_metadata, query_params):
         """
-        Lists all the rows of a grid view, paginated either by a page or offset/limit.
-        If the limit get parameter is provided the limit/offset pagination will be used
-        else the page number pagination.
+        Lists all the rows of a grid view, paginated either by a cursor, a page or
+        offset/limit. If the cursor get parameter is provided the keyset pagination
+        will be used, if the limit get parameter is provided the limit/offset
+        pagination will be used else the page number pagination.
 
         Optionally the field options can also be included in the response if the
         `field_options` are provided in the include GET parameter.
@@ -370,7 +378,9 @@ class GridViewView(APIView):
         if "count" in request.GET:
             return Response({"count": queryset.count()})
 
-        if LimitOffsetPagination.limit_query_param in request.GET:
+        if KeysetPagination.is_requested(request):
+            paginator = KeysetPagination()
+        elif LimitOffsetPagination.limit_query_param in request.GET:
             paginator = LimitOffsetPagination()
         else:
             paginator = PageNumberPagination()
@@ -1080,14 +1090,16 @@ class PublicGridViewRowsView(APIView):
                 ),
             ),
             SEARCH_MODE_API_PARAM,
+            *KEYSET_PAGINATION_API_PARAMS,
         ],
         tags=["Database table grid view"],
         operation_id="public_list_database_table_grid_view_rows",
         description=(
             "Lists the requested rows of the view's table related to the provided "
             "`slug` if the grid view is public."
-            "The response is paginated either by a limit/offset or page/size style. "
-            "The style depends on the provided GET parameters. The properties of the "
+            "The response is paginated either by a limit/offset, page/size or cursor "
+            "style. The style depends on the provided GET parameters. The properties "
+            "of the "
             "returned rows depends on which fields the table has. For a complete "
             "overview of fields use the **list_database_table_fields** endpoint to "
             "list them all. In the example all field types are listed, but normally "
@@ -1117,6 +1129,8 @@ class PublicGridViewRowsView(APIView):
                     "ERROR_VIEW_FILTER_TYPE_DOES_NOT_EXIST",
                     "ERROR_VIEW_FILTER_TYPE_UNSUPPORTED_FIELD",
                     "ERROR_FILTERS_PARAM_VALIDATION_ERROR",
+                    "ERROR_INVALID_CURSOR",
+                    "ERROR_INVALID_COUNT_MODE",
                 ]
             ),
             401: get_error_schema(["ERROR_NO_AUTHORIZATION_TO_PUBLICLY_SHARED_VIEW"]),
@@ -1144,9 +1158,10 @@ class PublicGridViewRowsView(APIView):
         self, request: Request, slug: str, field_options: bool, query_params
     ) -> Response:
         """
-        Lists all the rows of a grid view, paginated either by a page or offset/limit.
-        If the limit get parameter is provided the limit/offset pagination will be used
-        else the page number pagination.
+        Lists all the rows of a grid view, paginated either by a cursor, a page or
+        offset/limit. If the cursor get parameter is provided the keyset pagination
+        will be used, if the limit get parameter is provided the limit/offset
+        pagination will be used else the page number pagination.
 
         Optionally the field options can also be included in the response if the the
         `field_options` are provided in the include GET parameter.
@@ -1192,7 +1207,9 @@ class PublicGridViewRowsView(APIView):
         if count:
             return Response({"count": queryset.count()})
 
-        if LimitOffsetPagination.limit_query_param in request.GET:
+        if KeysetPagination.is_requested(request):
+            paginator = KeysetPagination()
+        elif LimitOffsetPagination.limit_query_param in request.GET:
             paginator = LimitOffsetPagination()
         else:
             paginator = PageNumberPagination()
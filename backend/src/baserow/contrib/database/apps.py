@@ -430,8 +430,14 @@ class DatabaseConfig(AppConfig):
         page_registry.register(RowPageType())
 
         from .export.table_exporters.csv_table_exporter import CsvTableExporter
+        from .export.table_exporters.parquet_table_exporter import (
+            ArrowTableExporter,
+            ParquetTableExporter,
+        )
 
         table_exporter_registry.register(CsvTableExporter())
+        table_exporter_registry.register(ParquetTableExporter())
+        table_exporter_registry.register(ArrowTableExporter())
 
         from .trash.trash_types import (
             FieldTrashableItemType,
@@ -800,6 +806,8 @@ class DatabaseConfig(AppConfig):
         import baserow.contrib.database.search.tasks  # noqa: F401
         import baserow.contrib.database.table.receivers  # noqa: F401
         import baserow.contrib.database.views.tasks  # noqa: F401
+        import baserow.contrib.database.webhooks.receivers  # noqa: F401
+        import baserow.contrib.database.ws.rows.tasks  # noqa: F401
 
 
 # noinspection PyPep8Naming
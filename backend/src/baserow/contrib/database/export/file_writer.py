@@ -1,13 +1,22 @@
 import abc
 import time
-from typing import Any, Callable
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Iterator, List, Optional
 
-from django.core.paginator import Paginator
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connection, connections, transaction
 from django.db.models import QuerySet
 
 import unicodecsv as csv
+from psycopg2.errors import QueryCanceled
 
 from baserow.contrib.database.export.exceptions import ExportJobCanceledException
+from baserow.contrib.database.export.models import (
+    EXPORT_JOB_CANCELLED_STATUS,
+    EXPORT_JOB_EXPIRED_STATUS,
+)
 from baserow.contrib.database.table.models import FieldObject
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.registries import view_type_registry
@@ -55,23 +64,71 @@ class FileWriter(abc.ABC):
             turn and writes to the file.
         """
 
+    @abc.abstractmethod
+    def write_serialized_rows(
+        self,
+        queryset: QuerySet,
+        serialize_chunk: Callable[[List[Any], bool], Any],
+        write_chunk: Optional[Callable[[Any], None]] = None,
+    ):
+        """
+        A specialized method which knows how to write an entire queryset to the file
+        in an optimal way, where the serialization of the rows can be done by a pool
+        of workers while the next rows are being fetched.
+
+        :param queryset: The queryset to write to the file.
+        :param serialize_chunk: A thread safe callable function which takes a list of
+            rows and whether it's the first chunk of the queryset, and returns the
+            bytes to write to the file for these rows. The returned bytes are written
+            in the order of the queryset.
+        :param write_chunk: An optional callable function which is called, in the
+            order of the queryset, with every value returned by serialize_chunk
+            instead of writing it to the file as bytes.
+        """
+
+    @abc.abstractmethod
+    def write_csv_rows_with_copy(
+        self,
+        queryset: QuerySet,
+        columns: List[str],
+        delimiter: str = ",",
+        encoding: str = "utf-8",
+    ):
+        """
+        Writes the provided columns of the queryset to the file as csv rows which are
+        streamed straight from PostgreSQL using `COPY ... TO STDOUT`. The columns
+        must already contain the text values to write, NULL being written as an
+        empty value.
+
+        :param queryset: The queryset to write to the file.
+        :param columns: The names of the queryset columns to write.
+        :param delimiter: The character used to separate columns.
+        :param encoding: The encoding to convert the rows to before writing.
+        """
+
     def get_csv_dict_writer(self, headers, **kwargs):
         return csv.DictWriter(self._file, headers, **kwargs)
 
 
 class PaginatedExportJobFileWriter(FileWriter):
     """
-    Uses Django's built-in paginator to write querysets to files in a memory efficient
-    manner. Also updates the provided job as it progresses through any queryset writes
-    every EXPORT_JOB_UPDATE_FREQUENCY_SECONDS.
+    Fetches querysets in chunks through a server-side cursor to write them to files in
+    a memory efficient manner. Also updates the provided job as it progresses through
+    any queryset writes every EXPORT_JOB_UPDATE_FREQUENCY_SECONDS.
     """
 
     EXPORT_JOB_UPDATE_FREQUENCY_SECONDS = 1
 
-    def __init__(self, file, job):
+    def __init__(self, file, job, chunk_size=None, workers=None):
         super().__init__(file)
         self.job = job
         self.last_check = None
+        self.chunk_size = chunk_size or settings.BASEROW_EXPORT_CHUNK_SIZE
+        self.workers = (
+            settings.BASEROW_EXPORT_SERIALIZATION_WORKERS
+            if workers is None
+            else workers
+        )
 
     def write_bytes(self, value: bytes):
         self._file.write(value)
@@ -79,6 +136,17 @@ class PaginatedExportJobFileWriter(FileWriter):
     def write(self, value: str, encoding="utf-8"):
         self._file.write(value.encode(encoding))
 
+    def _iterate_chunks(self, queryset: QuerySet) -> Iterator[List[Any]]:
+        """
+        Fetches the rows of the queryset in chunks of `chunk_size` rows through a
+        server-side cursor, so that the rows don't have to be loaded all at once and
+        the query doesn't have to be executed again with an offset for every chunk.
+        """
+
+        rows = queryset.iterator(chunk_size=self.chunk_size)
+        while chunk := list(islice(rows, self.chunk_size)):
+            yield chunk
+
     def write_rows(self, queryset, write_row):
         """
         Writes the queryset to the file using the provided write_row callback.
@@ -94,14 +162,184 @@ class PaginatedExportJobFileWriter(FileWriter):
         """
 
         self.last_check = time.perf_counter()
-        paginator = Paginator(queryset.all(), 2000)
+        total_rows = queryset.count()
         i = 0
-        for page in paginator.page_range:
-            for row in paginator.page(page).object_list:
+        for chunk in self._iterate_chunks(queryset):
+            for row in chunk:
                 i = i + 1
-                is_last_row = i == paginator.count
+                is_last_row = i == total_rows
                 write_row(row, is_last_row)
-                self._check_and_update_job(i, paginator.count)
+                self._check_and_update_job(i, total_rows)
+
+    def write_serialized_rows(self, queryset, serialize_chunk, write_chunk=None):
+        """
+        Writes the queryset to the file by serializing the chunks of rows in a pool of
+        `workers` threads while the next chunks are being fetched. The serialized
+        chunks are written in order and at most `workers + 1` of them are kept in
+        memory, regardless of the size of the queryset. The job is checked and
+        updated like in `write_rows`.
+
+        The rows, and their prefetched relations, are fetched by the connection of
+        the calling thread, so they all come from the same snapshot. A query made by
+        `serialize_chunk` in a worker thread runs over the separate connection of
+        that thread instead. It's outside of the transaction of the caller and sees
+        the data committed at the time it runs.
+
+        :param queryset: The queryset to write to the file.
+        :param serialize_chunk: A thread safe callable function which takes a list of
+            rows and whether it's the first chunk, and returns the bytes to write.
+        :param write_chunk: An optional callable function which is called with every
+            serialized chunk instead of writing it to the file as bytes.
+        """
+
+        if write_chunk is None:
+            write_chunk = self.write_bytes
+
+        self.last_check = time.perf_counter()
+        total_rows = queryset.count()
+        chunks = self._iterate_chunks(queryset)
+
+        if self.workers == 0:
+            rows_written = 0
+            for chunk in chunks:
+                write_chunk(serialize_chunk(chunk, rows_written == 0))
+                rows_written += len(chunk)
+                self._check_and_update_job(rows_written, total_rows)
+            return
+
+        rows_written = 0
+        pending = deque()
+
+        def write_next_pending_chunk():
+            nonlocal rows_written
+            chunk_size, future = pending.popleft()
+            write_chunk(future.result())
+            rows_written += chunk_size
+            self._check_and_update_job(rows_written, total_rows)
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="export"
+        )
+        try:
+            for index, chunk in enumerate(chunks):
+                pending.append(
+                    (
+                        len(chunk),
+                        executor.submit(
+                            self._serialize_chunk_in_thread,
+                            serialize_chunk,
+                            chunk,
+                            index == 0,
+                        ),
+                    )
+                )
+                # Writing as soon as all workers are busy keeps the number of chunks in
+                # memory bounded.
+                if len(pending) > self.workers:
+                    write_next_pending_chunk()
+            while pending:
+                write_next_pending_chunk()
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    @staticmethod
+    def _serialize_chunk_in_thread(
+        serialize_chunk: Callable[[List[Any], bool], Any],
+        chunk: List[Any],
+        is_first_chunk: bool,
+    ) -> Any:
+        try:
+            return serialize_chunk(chunk, is_first_chunk)
+        finally:
+            # The worker threads only live as long as the export, so the connections
+            # they might have opened are closed instead of being left open.
+            connections.close_all()
+
+    def write_csv_rows_with_copy(
+        self, queryset, columns, delimiter=",", encoding="utf-8"
+    ):
+        """
+        Streams the columns of the queryset as csv rows from PostgreSQL using
+        `COPY ... TO STDOUT`, so that no row has to be loaded into a Python object.
+        While the copy is running the connection can't be used for anything else, so
+        the job progress is updated and its state checked every
+        EXPORT_JOB_UPDATE_FREQUENCY_SECONDS using a separate connection. If the job
+        has been cancelled the copy query is cancelled and a
+        ExportJobCanceledException is raised.
+
+        :param queryset: The queryset to write to the file.
+        :param columns: The names of the queryset columns to write.
+        :param delimiter: The character used to separate columns.
+        :param encoding: The encoding to convert the rows to before writing.
+        """
+
+        total_rows = queryset.count()
+        if total_rows == 0:
+            return
+
+        sql, params = queryset.values_list(*columns).query.sql_with_params()
+        copy_sql = f"COPY ({sql}) TO STDOUT WITH (FORMAT csv, DELIMITER %s)"
+
+        self.last_check = time.perf_counter()
+        job_connection = connections.create_connection(DEFAULT_DB_ALIAS)
+        writer = _CopyRowsWriter(self, job_connection, total_rows, encoding)
+        try:
+            # The savepoint makes sure the transaction can still be used if the copy
+            # query is cancelled.
+            with transaction.atomic():
+                with connection.cursor() as cursor:
+                    cursor = cursor.cursor
+                    try:
+                        cursor.copy_expert(
+                            cursor.mogrify(copy_sql, [*params, delimiter]).decode(),
+                            writer,
+                        )
+                    except QueryCanceled:
+                        if not writer.cancelled:
+                            raise
+        finally:
+            job_connection.close()
+
+        if writer.cancelled:
+            raise ExportJobCanceledException()
+
+        # Checks the job a last time and marks it as finished.
+        self._check_and_update_job(writer.rows_written, writer.rows_written)
+
+    def _check_and_update_job_using_connection(
+        self, job_connection, current_row, total_rows
+    ) -> bool:
+        """
+        Updates the job progress percentage using the provided connection if enough
+        time has passed since the last check.
+
+        :param job_connection: The database connection to update the job with.
+        :param current_row: An int indicating the current row this export job has
+            exported upto
+        :param total_rows: An int of the total number of rows this job is exporting.
+        :return: Whether the job has been cancelled or has expired.
+        """
+
+        current_time = time.perf_counter()
+        if current_time - self.last_check <= self.EXPORT_JOB_UPDATE_FREQUENCY_SECONDS:
+            return False
+
+        self.last_check = current_time
+        table_name = connection.ops.quote_name(self.job._meta.db_table)
+        with job_connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {table_name} SET progress_percentage = %s "  # nosec B608
+                "WHERE id = %s RETURNING state",
+                [current_row / total_rows * 100, self.job.id],
+            )
+            result = cursor.fetchone()
+
+        # The job isn't visible for the other connection if it has been created in
+        # the still running transaction.
+        return result is not None and result[0] in [
+            EXPORT_JOB_CANCELLED_STATUS,
+            EXPORT_JOB_EXPIRED_STATUS,
+        ]
 
     def _check_and_update_job(self, current_row, total_rows):
         """
@@ -132,6 +370,52 @@ class PaginatedExportJobFileWriter(FileWriter):
                 self.job.save()
 
 
+class _CopyRowsWriter:
+    """
+    The file like object receiving the rows of a `COPY ... TO STDOUT` query. The
+    rows are written one by one, so they're converted to the line terminator and
+    encoding used by the csv writer, and the job of the file writer is updated as
+    the rows come in.
+    """
+
+    def __init__(
+        self,
+        file_writer: PaginatedExportJobFileWriter,
+        job_connection,
+        total_rows: int,
+        encoding: str,
+    ):
+        self.file_writer = file_writer
+        self.job_connection = job_connection
+        self.total_rows = total_rows
+        self.encoding = encoding
+        self.rows_written = 0
+        self.cancelled = False
+
+    def write(self, data):
+        if self.cancelled:
+            return
+
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        # PostgreSQL terminates the rows with `\n` while the csv writer uses `\r\n`.
+        data = data[:-1] + b"\r\n"
+        if self.encoding != "utf-8":
+            data = data.decode("utf-8").encode(self.encoding, "backslashreplace")
+        self.file_writer.write_bytes(data)
+
+        self.rows_written += 1
+        if self.file_writer._check_and_update_job_using_connection(
+            self.job_connection,
+            min(self.rows_written, self.total_rows),
+            self.total_rows,
+        ):
+            # Raising here would leave the connection in the middle of the copy, so
+            # the query is cancelled instead.
+            self.cancelled = True
+            connection.connection.cancel()
+
+
 class QuerysetSerializer(abc.ABC):
     """
     A class knows how to serialize a given queryset and the fields of said queryset to
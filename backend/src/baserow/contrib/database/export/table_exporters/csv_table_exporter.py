@@ -1,5 +1,12 @@
 from collections import OrderedDict
-from typing import List, Type
+from io import BytesIO
+from typing import Any, Callable, List, Type
+
+from django.db.models import Case, Expression, TextField, Value, When
+from django.db.models.functions import Cast, Concat, NullIf, Replace
+from django.db.models.lookups import Regex
+
+import unicodecsv as csv
 
 from baserow.contrib.database.api.export.serializers import (
     BaseExporterOptionsSerializer,
@@ -7,6 +14,7 @@ from baserow.contrib.database.api.export.serializers import (
 )
 from baserow.contrib.database.export.file_writer import FileWriter, QuerysetSerializer
 from baserow.contrib.database.export.registries import TableExporter
+from baserow.contrib.database.table.models import FieldObject
 from baserow.contrib.database.views.view_types import GridViewType
 from baserow.core.utils import escape_csv_cell
 
@@ -35,8 +43,41 @@ class CsvTableExporter(TableExporter):
         return CsvQuerysetSerializer
 
 
+def escape_csv_cell_expression(expression: Expression) -> Expression:
+    """
+    The database equivalent of `escape_csv_cell`, which also converts empty strings
+    to NULL because `COPY` quotes empty strings, but not NULL values.
+
+    :param expression: The expression computing the text value of the cell.
+    :return: An expression computing the escaped value of the cell.
+    """
+
+    expression = Cast(expression, output_field=TextField())
+    return NullIf(
+        Case(
+            When(Regex(expression, r"^-?[0-9,.]+$"), then=expression),
+            When(
+                Regex(expression, r"^[@+=|%-]"),
+                then=Concat(
+                    Value("'"),
+                    Replace(expression, Value("|"), Value("\\|")),
+                    output_field=TextField(),
+                ),
+            ),
+            default=expression,
+            output_field=TextField(),
+        ),
+        Value(""),
+        output_field=TextField(),
+    )
+
+
 class CsvQuerysetSerializer(QuerysetSerializer):
     def __init__(self, queryset, ordered_field_objects):
+        # The expressions computing the export value of the fields in the database,
+        # keyed by the annotation name.
+        self.export_expressions = {}
+
         super().__init__(queryset, ordered_field_objects)
 
         self.headers = OrderedDict({"id": "id"})
@@ -46,6 +87,32 @@ class CsvQuerysetSerializer(QuerysetSerializer):
             field_display_name = field_object["field"].name
             self.headers[field_database_name] = field_display_name
 
+    def _get_field_serializer(self, field_object: FieldObject) -> Callable[[Any], Any]:
+        """
+        If the field type can compute the export value in the database, the value
+        is annotated on the queryset instead of being converted in Python.
+        """
+
+        model_field = self.queryset.model._meta.get_field(field_object["name"])
+        expression = field_object["type"].get_export_expression(
+            field_object["field"], model_field
+        )
+        if expression is None:
+            return super()._get_field_serializer(field_object)
+
+        annotation_name = f"export_{field_object['name']}"
+        self.export_expressions[annotation_name] = expression
+
+        def serializer_func(row):
+            value = getattr(row, annotation_name)
+            return (
+                field_object["name"],
+                field_object["field"].name,
+                "" if value is None else value,
+            )
+
+        return serializer_func
+
     def write_to_file(
         self,
         file_writer: FileWriter,
@@ -79,12 +146,41 @@ class CsvQuerysetSerializer(QuerysetSerializer):
         if csv_include_header:
             csv_dict_writer.writerow(self.headers)
 
-        def write_row(row, _):
-            data = {}
-            for field_serializer in self.field_serializers:
-                field_database_name, _, field_human_value = field_serializer(row)
-                data[field_database_name] = escape_csv_cell(str(field_human_value))
-
-            csv_dict_writer.writerow(data)
-
-        file_writer.write_rows(self.queryset, write_row)
+        if len(self.export_expressions) == len(self.headers) - 1:
+            # Every value can be computed by the database, so the rows can be streamed
+            # straight from it without being loaded in Python.
+            queryset = self.queryset.annotate(
+                **{
+                    name: escape_csv_cell_expression(expression)
+                    for name, expression in self.export_expressions.items()
+                }
+            )
+            file_writer.write_csv_rows_with_copy(
+                queryset,
+                ["id", *self.export_expressions.keys()],
+                delimiter=csv_column_separator,
+                encoding=export_charset,
+            )
+            return
+
+        def serialize_chunk(rows, _):
+            buffer = BytesIO()
+            chunk_csv_dict_writer = csv.DictWriter(
+                buffer,
+                self.headers.keys(),
+                encoding=export_charset,
+                delimiter=csv_column_separator,
+                errors="backslashreplace",
+            )
+            for row in rows:
+                data = {}
+                for field_serializer in self.field_serializers:
+                    field_database_name, _, field_human_value = field_serializer(row)
+                    data[field_database_name] = escape_csv_cell(str(field_human_value))
+
+                chunk_csv_dict_writer.writerow(data)
+            return buffer.getvalue()
+
+        file_writer.write_serialized_rows(
+            self.queryset.annotate(**self.export_expressions), serialize_chunk
+        )
@@ -0,0 +1,261 @@
+from typing import Any, Callable, List, Tuple, Type
+
+from django.db import models
+
+from baserow.contrib.database.api.export.serializers import (
+    BaseExporterOptionsSerializer,
+)
+from baserow.contrib.database.export.file_writer import FileWriter, QuerysetSerializer
+from baserow.contrib.database.export.registries import TableExporter
+from baserow.contrib.database.fields.field_types import LinkRowFieldType
+from baserow.contrib.database.table.models import FieldObject
+from baserow.contrib.database.views.view_types import GridViewType
+from baserow.core.utils import find_unused_name
+
+# pyarrow is imported where it's used because importing it is slow and it's only
+# needed when a table is exported in one of these formats.
+
+# The biggest precision of a decimal which can be stored in a decimal128 column.
+DECIMAL128_MAX_PRECISION = 38
+
+
+class _FileWriterSink:
+    """
+    A minimal file like object which writes to a FileWriter, used as output stream
+    by the pyarrow writers.
+    """
+
+    closed = False
+
+    def __init__(self, file_writer: FileWriter):
+        self.file_writer = file_writer
+        self.position = 0
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self.file_writer.write_bytes(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class ArrowQuerysetSerializer(QuerysetSerializer):
+    """
+    Writes the queryset as an Arrow IPC file. Every column is typed based on the
+    model field of the field: numbers are decimals, dates are dates or timestamps,
+    booleans are booleans and link rows are lists of the ids of the related rows.
+    The values of the other fields are exported as strings.
+    """
+
+    def __init__(self, queryset, ordered_field_objects):
+        # The name and the arrow type of every column, in the order of the field
+        # serializers.
+        self.columns = []
+
+        super().__init__(queryset, ordered_field_objects)
+
+        import pyarrow as pa
+
+        self.columns.insert(0, ("id", pa.int64()))
+
+    def _get_arrow_type_and_converter(
+        self, field_object: FieldObject
+    ) -> Tuple[Any, Callable[[Any], Any]]:
+        """
+        Returns the arrow type of the column of the field and a function converting
+        the value of the field to a value of that type.
+        """
+
+        import pyarrow as pa
+
+        field_type = field_object["type"]
+        model_field = self.queryset.model._meta.get_field(field_object["name"])
+
+        if isinstance(field_type, LinkRowFieldType):
+            return pa.list_(pa.int64()), lambda value: [
+                related_row.id for related_row in value.all()
+            ]
+        if isinstance(model_field, models.BooleanField):
+            return pa.bool_(), bool
+        if isinstance(model_field, models.IntegerField):
+            return pa.int64(), int
+        if isinstance(model_field, models.DecimalField):
+            precision, scale = model_field.max_digits, model_field.decimal_places
+            if precision is None or scale is None:
+                return pa.float64(), float
+            decimal_type = (
+                pa.decimal128
+                if precision <= DECIMAL128_MAX_PRECISION
+                else pa.decimal256
+            )
+            return decimal_type(precision, scale), lambda value: value
+        if isinstance(model_field, models.DateTimeField):
+            return pa.timestamp("us", tz="UTC"), lambda value: value
+        if isinstance(model_field, models.DateField):
+            return pa.date32(), lambda value: value
+
+        def to_string(value):
+            export_value = field_type.get_export_value(value, field_object)
+            return None if export_value is None else str(export_value)
+
+        return pa.string(), to_string
+
+    def _get_field_serializer(self, field_object: FieldObject) -> Callable[[Any], Any]:
+        arrow_type, converter = self._get_arrow_type_and_converter(field_object)
+        column_name = find_unused_name(
+            [field_object["field"].name], ["id", *[name for name, _ in self.columns]]
+        )
+        self.columns.append((column_name, arrow_type))
+
+        def serializer_func(row):
+            value = getattr(row, field_object["name"])
+            return (
+                field_object["name"],
+                column_name,
+                None if value is None else converter(value),
+            )
+
+        return serializer_func
+
+    def open_writer(self, sink: _FileWriterSink, schema):
+        """
+        Returns the pyarrow writer writing the record batches to the sink.
+        """
+
+        import pyarrow as pa
+
+        return pa.ipc.new_file(sink, schema)
+
+    def write_to_file(self, file_writer: FileWriter, export_charset="utf-8"):
+        """
+        Writes the queryset to the provided file writer. The rows are converted to a
+        record batch per chunk of rows, so only a few chunks are kept in memory
+        regardless of the size of the table. The `export_charset` is ignored because
+        strings are always encoded in UTF-8 in these formats.
+
+        :param file_writer: The file writer to use to do the writing.
+        :param export_charset: Unused.
+        """
+
+        import pyarrow as pa
+
+        schema = pa.schema(
+            [pa.field(name, arrow_type) for name, arrow_type in self.columns]
+        )
+        writer = self.open_writer(_FileWriterSink(file_writer), schema)
+
+        def serialize_chunk(rows, _):
+            values = [[] for _ in self.field_serializers]
+            for row in rows:
+                for column_values, field_serializer in zip(
+                    values, self.field_serializers
+                ):
+                    column_values.append(field_serializer(row)[2])
+
+            return pa.record_batch(
+                [
+                    pa.array(column_values, type=arrow_type)
+                    for column_values, (_, arrow_type) in zip(values, self.columns)
+                ],
+                schema=schema,
+            )
+
+        file_writer.write_serialized_rows(
+            self.queryset, serialize_chunk, writer.write_batch
+        )
+        writer.close()
+
+
+class _ParquetRowGroupWriter:
+    """
+    Buffers the record batches until they contain `row_group_size` rows, because
+    writing every chunk of rows as a separate row group would result in small and
+    inefficient row groups.
+    """
+
+    def __init__(self, parquet_writer, row_group_size: int):
+        self.parquet_writer = parquet_writer
+        self.row_group_size = row_group_size
+        self.batches = []
+        self.buffered_rows = 0
+
+    def write_batch(self, batch):
+        self.batches.append(batch)
+        self.buffered_rows += batch.num_rows
+        if self.buffered_rows >= self.row_group_size:
+            self.flush()
+
+    def flush(self):
+        import pyarrow as pa
+
+        if self.batches:
+            self.parquet_writer.write_table(
+                pa.Table.from_batches(self.batches),
+                row_group_size=self.row_group_size,
+            )
+        self.batches = []
+        self.buffered_rows = 0
+
+    def close(self):
+        self.flush()
+        self.parquet_writer.close()
+
+
+class ParquetQuerysetSerializer(ArrowQuerysetSerializer):
+    """
+    Writes the queryset as an Apache Parquet file with the same columns as the Arrow
+    IPC file.
+    """
+
+    row_group_size = 64 * 1024
+
+    def open_writer(self, sink: _FileWriterSink, schema):
+        import pyarrow.parquet as pq
+
+        return _ParquetRowGroupWriter(
+            pq.ParquetWriter(sink, schema), self.row_group_size
+        )
+
+
+class ParquetTableExporter(TableExporter):
+    type = "parquet"
+
+    @property
+    def queryset_serializer_class(self) -> Type[QuerysetSerializer]:
+        return ParquetQuerysetSerializer
+
+    @property
+    def option_serializer_class(self) -> Type[BaseExporterOptionsSerializer]:
+        return BaseExporterOptionsSerializer
+
+    @property
+    def can_export_table(self) -> bool:
+        return True
+
+    @property
+    def supported_views(self) -> List[str]:
+        return [GridViewType.type]
+
+    @property
+    def file_extension(self) -> str:
+        return ".parquet"
+
+
+class ArrowTableExporter(ParquetTableExporter):
+    type = "arrow"
+
+    @property
+    def queryset_serializer_class(self) -> Type[QuerysetSerializer]:
+        return ArrowQuerysetSerializer
+
+    @property
+    def file_extension(self) -> str:
+        return ".arrow"
@@ -1,20 +1,37 @@
+import contextlib
+import operator
 from collections import defaultdict
+from functools import reduce
 from typing import Dict, List, NamedTuple, Optional, Set, Tuple, cast
 
-from django.db.models import Expression, Q, Value
+from django.conf import settings
+from django.db.models import Expression, Q, QuerySet, Value
+
+from loguru import logger
+from opentelemetry import metrics
 
 from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.models import Field, LinkRowField
 from baserow.contrib.database.fields.signals import field_updated
 from baserow.contrib.database.search.handler import SearchHandler
+from baserow.contrib.database.table.cache import invalidate_table_data_version
 from baserow.contrib.database.table.constants import (
     ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME,
 )
-from baserow.contrib.database.table.models import Table
+from baserow.contrib.database.table.models import GeneratedTableModel, Table
 from baserow.contrib.database.table.signals import table_updated
+from baserow.core.db import temporary_ids_table, update_and_return_ids
 
 StartingRowIdsType = Optional[List[int]]
 
+meter = metrics.get_meter(__name__)
+
+formula_update_rows_per_hop = meter.create_histogram(
+    "baserow.formula_update.rows_per_hop",
+    unit="1",
+    description="The number of rows updated per hop of a row scoped formula update.",
+)
+
 
 class PathBasedUpdateStatementCollector:
     def __init__(
@@ -38,6 +55,10 @@ class PathBasedUpdateStatementCollector:
         self.sub_paths: Dict[str, PathBasedUpdateStatementCollector] = {}
         self.connection_here: Optional[LinkRowField] = connection_here
         self.connection_is_broken = connection_is_broken
+        # Whether a field of this table has changed without an update statement
+        # recalculating it. If not, only the rows which are actually changed by the
+        # update statements can affect the rows in the sub paths.
+        self.has_changed_fields_without_update_statement = False
 
     def add_update_statement(
         self,
@@ -77,6 +98,8 @@ class PathBasedUpdateStatementCollector:
                     self.update_statements[field.db_column] = (
                         update_statement if update_statement != Value(None) else None
                     )
+                else:
+                    self.has_changed_fields_without_update_statement = True
                 if self.table.needs_background_update_column_added:
                     self.update_statements[
                         ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME
@@ -118,90 +141,102 @@ class PathBasedUpdateStatementCollector:
             collector = self.sub_paths[broken_name]
         return collector
 
-    def execute_all(
-        self,
-        field_cache: FieldCache,
-        starting_row_ids: StartingRowIdsType = None,
-        path_to_starting_table: StartingRowIdsType = None,
-        deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]] = None,
-    ) -> int:
-        updated_rows = 0
-        path_to_starting_table = path_to_starting_table or []
-        if self.connection_here is not None:
-            path_to_starting_table = [self.connection_here] + path_to_starting_table
-        updated_rows += self._execute_pending_update_statements(
-            field_cache,
-            path_to_starting_table,
-            starting_row_ids,
-            deleted_m2m_rels_per_link_field,
-        )
+    def get_path_to_starting_table(
+        self, parent_path_to_starting_table: List[LinkRowField]
+    ) -> List[LinkRowField]:
+        """
+        Returns the link row fields leading from the table of this collector back to
+        the starting table.
 
-        for sub_path in self.sub_paths.values():
-            updated_rows += sub_path.execute_all(
-                starting_row_ids=starting_row_ids,
-                path_to_starting_table=path_to_starting_table,
-                field_cache=field_cache,
-                deleted_m2m_rels_per_link_field=deleted_m2m_rels_per_link_field,
-            )
-        return updated_rows
+        :param parent_path_to_starting_table: The path to the starting table of the
+            parent collector.
+        """
 
-    def _execute_pending_update_statements(
+        if self.connection_here is not None:
+            return [self.connection_here] + parent_path_to_starting_table
+        return parent_path_to_starting_table
+
+    def get_connected_rows_filter(
         self,
-        field_cache: FieldCache,
         path_to_starting_table: List[LinkRowField],
         starting_row_ids: StartingRowIdsType,
         deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]],
-    ) -> int:
-        model = field_cache.get_model(self.table)
-        qs = model.objects_and_trash
+    ) -> Optional[Q]:
+        """
+        Returns the filter matching the rows of this collector's table which join
+        back to the starting rows, or None if all the rows must be updated.
+
+        :param path_to_starting_table: The link row fields leading from the table of
+            this collector back to the starting table.
+        :param starting_row_ids: If set, only rows joining back to these rows of the
+            starting table are updated.
+        :param deleted_m2m_rels_per_link_field: The rows which had their link row
+            connections deleted per link row field, which must be updated as well.
+        """
+
         # If the connection is broken back to the starting table then there is no
         # way to join back to these starting rows. So we just update all cells.
-        if starting_row_ids is not None and not self.connection_is_broken:
-            if len(path_to_starting_table) == 0:
-                path_to_starting_table_id_column = "id"
-            else:
-                path_to_starting_table_id_column = (
-                    "__".join([p.db_column for p in path_to_starting_table]) + "__id"
-                )
-            path_to_starting_table_id_column += "__in"
+        if starting_row_ids is None or self.connection_is_broken:
+            return None
 
-            filter_for_rows_connected_to_starting_row = Q(
-                **{path_to_starting_table_id_column: starting_row_ids}
-            ) | self._include_rows_connected_to_deleted_m2m_relationships(
-                deleted_m2m_rels_per_link_field,
-                path_to_starting_table,
+        if len(path_to_starting_table) == 0:
+            path_to_starting_table_id_column = "id"
+        else:
+            path_to_starting_table_id_column = (
+                "__".join([p.db_column for p in path_to_starting_table]) + "__id"
             )
+        path_to_starting_table_id_column += "__in"
 
-            qs = qs.filter(filter_for_rows_connected_to_starting_row)
-        if starting_row_ids is None:
-            # We aren't updating individual rows but instead entire columns, so don't
-            # set this per row attribute.
-            self.update_statements.pop(ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME, None)
+        return Q(
+            **{path_to_starting_table_id_column: starting_row_ids}
+        ) | self._include_rows_connected_to_deleted_m2m_relationships(
+            deleted_m2m_rels_per_link_field,
+            path_to_starting_table,
+        )
 
-        updated_rows = 0
-        if self.update_statements:
-            annotations, filters = {}, Q()
-            for field, expr in self.update_statements.items():
-                if expr is None or not field.startswith("field_"):
-                    continue
-
-                annotated_field = f"{field}_expr"
-                annotations[annotated_field] = expr
-                # Because the expression can evaluate to null and because of how the
-                # comparison with null should be handle in SQL
-                # (https://www.postgresql.org/docs/15/functions-comparison.html), we
-                # need to properly filter rows to correctly update only the ones that
-                # need to be updated.
-                filters |= Q(
-                    **{f"{field}__isnull": False, f"{annotated_field}__isnull": True}
-                ) | ~Q(**{field: expr})
-
-            updated_rows = (
-                qs.annotate(**annotations)
-                .filter(filters)
-                .update(**self.update_statements)
+    def get_rows_to_update_filter(
+        self, connected_rows_filter: Optional[Q], annotations: Dict[str, Expression]
+    ) -> Optional[Q]:
+        """
+        Returns the filter matching the rows which must be updated by the pending
+        update statements of this collector, or None if all the rows must be updated.
+        The annotations needed by the filter are added to the provided dict.
+
+        :param connected_rows_filter: The filter matching the rows connected to the
+            starting rows, or None if all the rows are connected.
+        :param annotations: The dict the required annotations are added to.
+        """
+
+        filters = []
+        if connected_rows_filter is not None:
+            filters.append(connected_rows_filter)
+
+        changed_values_filter = None
+        for field, expr in self.update_statements.items():
+            if expr is None or not field.startswith("field_"):
+                continue
+
+            annotated_field = f"{field}_expr"
+            annotations[annotated_field] = expr
+            # Because the expression can evaluate to null and because of how the
+            # comparison with null should be handle in SQL
+            # (https://www.postgresql.org/docs/15/functions-comparison.html), we
+            # need to properly filter rows to correctly update only the ones that
+            # need to be updated.
+            field_changed_filter = Q(
+                **{f"{field}__isnull": False, f"{annotated_field}__isnull": True}
+            ) | ~Q(**{field: expr})
+            changed_values_filter = (
+                field_changed_filter
+                if changed_values_filter is None
+                else changed_values_filter | field_changed_filter
             )
-        return updated_rows
+        if changed_values_filter is not None:
+            filters.append(changed_values_filter)
+
+        if not filters:
+            return None
+        return reduce(operator.and_, filters)
 
     def _include_rows_connected_to_deleted_m2m_relationships(
         self,
@@ -247,6 +282,362 @@ class PathBasedUpdateStatementCollector:
         return filters
 
 
+class FusedTableUpdate:
+    """
+    The update statements of all the collectors of one table in the same level of an
+    `UpdatePlanner`, which are executed together in a single UPDATE query.
+    """
+
+    def __init__(self, table: Table):
+        self.table = table
+        self.collectors: List[
+            Tuple[
+                PathBasedUpdateStatementCollector,
+                List[LinkRowField],
+                Optional[PathBasedUpdateStatementCollector],
+            ]
+        ] = []
+
+    def add(
+        self,
+        collector: PathBasedUpdateStatementCollector,
+        path_to_starting_table: List[LinkRowField],
+        parent: Optional[PathBasedUpdateStatementCollector] = None,
+    ):
+        self.collectors.append((collector, path_to_starting_table, parent))
+
+    def get_update_queryset(
+        self,
+        field_cache: FieldCache,
+        connected_rows_filters: List[Optional[Q]],
+        update_all_rows: bool,
+    ) -> Tuple[QuerySet, Dict[str, Expression]]:
+        """
+        Returns the queryset matching the union of the rows each collector must
+        update and the update statements of all the collectors.
+
+        Every update statement recalculates the entire cell value from the values it
+        depends on, so it's fine that a statement of one collector is also executed
+        for the rows of another collector of the same table: if the values it depends
+        on didn't change, the cell keeps the same value.
+
+        :param field_cache: The field cache used to get the model of the table.
+        :param connected_rows_filters: The filter matching the rows connected to the
+            starting rows per collector, in the same order as `self.collectors`.
+        :param update_all_rows: Whether entire columns are updated instead of the
+            rows connected to specific starting rows.
+        """
+
+        update_statements = {}
+        annotations = {}
+        row_filters = []
+        for (collector, _, _), connected_rows_filter in zip(
+            self.collectors, connected_rows_filters
+        ):
+            statements = dict(collector.update_statements)
+            if update_all_rows:
+                # We aren't updating individual rows but instead entire columns, so
+                # don't set this per row attribute.
+                statements.pop(ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME, None)
+            if not statements:
+                continue
+
+            update_statements.update(statements)
+            row_filters.append(
+                collector.get_rows_to_update_filter(connected_rows_filter, annotations)
+            )
+
+        model = field_cache.get_model(self.table)
+        qs = model.objects_and_trash.annotate(**annotations)
+        # If one of the collectors needs to update all rows, the other filters
+        # don't matter.
+        if row_filters and all(row_filter is not None for row_filter in row_filters):
+            qs = qs.filter(reduce(operator.or_, row_filters))
+        return qs, update_statements
+
+    def execute(
+        self,
+        field_cache: FieldCache,
+        starting_row_ids: StartingRowIdsType,
+        deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]],
+    ) -> int:
+        """
+        Executes the update statements of all the collectors in one UPDATE query.
+
+        :return: The number of updated rows.
+        """
+
+        qs, update_statements = self.get_update_queryset(
+            field_cache,
+            [
+                collector.get_connected_rows_filter(
+                    path_to_starting_table,
+                    starting_row_ids,
+                    deleted_m2m_rels_per_link_field,
+                )
+                for collector, path_to_starting_table, _ in self.collectors
+            ],
+            update_all_rows=starting_row_ids is None,
+        )
+        if not update_statements:
+            return 0
+        return qs.update(**update_statements)
+
+
+class UpdatePlanner:
+    """
+    Plans the execution of the update statements of a tree of
+    `PathBasedUpdateStatementCollector`. The collectors are ordered topologically in
+    levels: a collector only depends on the values updated by the collectors on the
+    path back to the starting table, which are all in lower levels. Within a level,
+    the collectors of the same table don't depend on each other, so they're fused
+    into one multi-column UPDATE query. This way every level updates every table at
+    most once, instead of executing an UPDATE per collector.
+    """
+
+    def __init__(self, root_collector: PathBasedUpdateStatementCollector):
+        self.root_collector = root_collector
+
+    def get_levels(self) -> List[List[FusedTableUpdate]]:
+        """
+        Returns the fused updates per level, in the order they must be executed.
+        """
+
+        levels = []
+        current_level = [(self.root_collector, [], None)]
+        while current_level:
+            fused_updates: Dict[int, FusedTableUpdate] = {}
+            next_level = []
+            for collector, parent_path_to_starting_table, parent in current_level:
+                path_to_starting_table = collector.get_path_to_starting_table(
+                    parent_path_to_starting_table
+                )
+                if collector.table.id not in fused_updates:
+                    fused_updates[collector.table.id] = FusedTableUpdate(
+                        collector.table
+                    )
+                fused_updates[collector.table.id].add(
+                    collector, path_to_starting_table, parent
+                )
+                next_level.extend(
+                    (sub_path, path_to_starting_table, collector)
+                    for sub_path in collector.sub_paths.values()
+                )
+            levels.append(list(fused_updates.values()))
+            current_level = next_level
+        return levels
+
+    def execute(
+        self,
+        field_cache: FieldCache,
+        starting_row_ids: StartingRowIdsType = None,
+        deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]] = None,
+    ) -> int:
+        """
+        Executes all the update statements level by level and returns the number of
+        updated rows.
+        """
+
+        updated_rows = 0
+        for level in self.get_levels():
+            for fused_update in level:
+                updated_rows += fused_update.execute(
+                    field_cache, starting_row_ids, deleted_m2m_rels_per_link_field
+                )
+        return updated_rows
+
+
+class HopReport(NamedTuple):
+    """
+    How many rows a hop of the `RowScopedUpdatePlanner` touched.
+    """
+
+    depth: int
+    table_id: int
+    # The number of rows connected to the affected rows of the previous hop, or None
+    # if all the rows of the table were considered.
+    connected_rows: Optional[int]
+    updated_rows: int
+
+
+class RowScopedUpdatePlanner(UpdatePlanner):
+    """
+    An `UpdatePlanner` which, instead of joining every dependent table back to the
+    starting rows via the entire path, carries the ids of the affected rows from one
+    hop of the path to the next. The rows of a table connected to the affected rows
+    of the previous table are selected with a single join on the link row field, and
+    the UPDATE is restricted to those ids with `id IN (...)`, or with a temporary
+    table if there are many of them.
+
+    Because the ids of the updated rows are returned by the UPDATE queries, only the
+    rows which actually changed are carried to the next hop. Rows which are only
+    connected to rows of which the values didn't change are skipped.
+    """
+
+    def __init__(self, root_collector: PathBasedUpdateStatementCollector):
+        super().__init__(root_collector)
+        self.hop_reports: List[HopReport] = []
+        # The affected row ids per collector, None if all rows are affected.
+        self._affected_row_ids: Dict[
+            PathBasedUpdateStatementCollector, Optional[Set[int]]
+        ] = {}
+
+    def execute(
+        self,
+        field_cache: FieldCache,
+        starting_row_ids: StartingRowIdsType = None,
+        deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]] = None,
+    ) -> int:
+        if starting_row_ids is None:
+            # Entire columns are updated, so there aren't any rows to carry.
+            return super().execute(
+                field_cache, starting_row_ids, deleted_m2m_rels_per_link_field
+            )
+
+        with contextlib.ExitStack() as stack:
+            updated_rows = 0
+            for depth, level in enumerate(self.get_levels()):
+                for fused_update in level:
+                    updated_rows += self._execute_fused_update(
+                        stack,
+                        depth,
+                        fused_update,
+                        field_cache,
+                        starting_row_ids,
+                        deleted_m2m_rels_per_link_field or {},
+                    )
+        return updated_rows
+
+    def _execute_fused_update(
+        self,
+        stack: contextlib.ExitStack,
+        depth: int,
+        fused_update: FusedTableUpdate,
+        field_cache: FieldCache,
+        starting_row_ids: List[int],
+        deleted_m2m_rels_per_link_field: Dict[int, Set[int]],
+    ) -> int:
+        model = field_cache.get_model(fused_update.table)
+        connected_row_ids = [
+            self._get_connected_row_ids(
+                stack,
+                model,
+                collector,
+                parent,
+                starting_row_ids,
+                deleted_m2m_rels_per_link_field,
+            )
+            for collector, _, parent in fused_update.collectors
+        ]
+
+        qs, update_statements = fused_update.get_update_queryset(
+            field_cache,
+            [
+                None
+                if row_ids is None
+                else Q(id__in=self._get_ids_filter(stack, row_ids))
+                for row_ids in connected_row_ids
+            ],
+            update_all_rows=False,
+        )
+        updated_row_ids = None
+        if update_statements:
+            updated_row_ids = set(update_and_return_ids(qs, **update_statements))
+
+        for (collector, _, _), row_ids in zip(
+            fused_update.collectors, connected_row_ids
+        ):
+            if (
+                row_ids is not None
+                and updated_row_ids is not None
+                and collector.update_statements
+                and not collector.has_changed_fields_without_update_statement
+                and collector is not self.root_collector
+            ):
+                # All the changes of this collector are made by its update statements,
+                # so rows which weren't updated can't affect the next hops.
+                row_ids = row_ids & updated_row_ids
+            self._affected_row_ids[collector] = row_ids
+
+        connected_rows = (
+            None
+            if any(row_ids is None for row_ids in connected_row_ids)
+            else len(set().union(*connected_row_ids))
+        )
+        updated_rows = len(updated_row_ids or [])
+        self._report_hop(
+            HopReport(depth, fused_update.table.id, connected_rows, updated_rows)
+        )
+        return updated_rows
+
+    def _get_connected_row_ids(
+        self,
+        stack: contextlib.ExitStack,
+        model: GeneratedTableModel,
+        collector: PathBasedUpdateStatementCollector,
+        parent: Optional[PathBasedUpdateStatementCollector],
+        starting_row_ids: List[int],
+        deleted_m2m_rels_per_link_field: Dict[int, Set[int]],
+    ) -> Optional[Set[int]]:
+        """
+        Returns the ids of the rows of the collector's table which are connected to
+        the affected rows of the parent collector, or None if all the rows must be
+        updated.
+        """
+
+        if collector.connection_is_broken:
+            return None
+        if parent is None:
+            return set(starting_row_ids)
+
+        parent_row_ids = self._affected_row_ids[parent]
+        if parent_row_ids is None:
+            return None
+
+        row_ids = set()
+        if parent_row_ids:
+            row_ids.update(
+                model.objects_and_trash.filter(
+                    **{
+                        f"{collector.connection_here.db_column}__in": (
+                            self._get_ids_filter(stack, parent_row_ids)
+                        )
+                    }
+                ).values_list("id", flat=True)
+            )
+        if parent is self.root_collector:
+            # The rows which aren't connected to the starting rows anymore, but were
+            # before the update, are affected as well.
+            row_ids.update(
+                deleted_m2m_rels_per_link_field.get(
+                    collector.connection_here.link_row_related_field_id, set()
+                )
+            )
+        return row_ids
+
+    def _get_ids_filter(self, stack: contextlib.ExitStack, row_ids: Set[int]):
+        """
+        Returns the value to filter on the provided ids with an `__in` lookup. Big
+        sets of ids are stored in a temporary table that lives until all the updates
+        are executed.
+        """
+
+        if len(row_ids) > settings.ROW_SCOPED_FORMULA_UPDATES_TEMP_TABLE_THRESHOLD:
+            return stack.enter_context(temporary_ids_table(row_ids))
+        return list(row_ids)
+
+    def _report_hop(self, hop_report: HopReport):
+        self.hop_reports.append(hop_report)
+        formula_update_rows_per_hop.record(
+            hop_report.updated_rows, {"depth": hop_report.depth}
+        )
+        logger.debug(
+            "Row scoped formula update of table {table_id} at depth {depth}: "
+            "{connected_rows} connected rows, {updated_rows} updated rows.",
+            **hop_report._asdict(),
+        )
+
+
 class UpdatedField(NamedTuple):
     field: Field
     send_field_update_signal: bool = True
@@ -353,12 +744,24 @@ class FieldUpdateCollector:
         update queries as possible and return the number of updated rows.
         """
 
-        return self._update_statement_collector.execute_all(
+        if settings.ROW_SCOPED_FORMULA_UPDATES and self._starting_row_ids is not None:
+            planner = RowScopedUpdatePlanner(self._update_statement_collector)
+        else:
+            planner = UpdatePlanner(self._update_statement_collector)
+        updated_rows = planner.execute(
             field_cache,
             self._starting_row_ids,
             deleted_m2m_rels_per_link_field=self._deleted_m2m_rels_per_link_field,
         )
 
+        # The cells of the dependant tables can change without any row or field
+        # signal being sent for these tables, so the values cached for their data
+        # must be invalidated here.
+        for table_id in self._updated_tables:
+            invalidate_table_data_version(table_id)
+
+        return updated_rows
+
     def apply_updates_and_get_updated_fields(
         self, field_cache: FieldCache, skip_search_updates=False
     ) -> List[Field]:
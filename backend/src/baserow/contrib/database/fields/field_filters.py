@@ -2,9 +2,10 @@ import re
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
-from django.db.models import BooleanField, Q
+from django.db.models import BooleanField, Field, Q
 from django.db.models.expressions import F, Value
 from django.db.models.functions import Mod
+from django.db.models.lookups import IContains, Lookup
 
 from opentelemetry import trace
 
@@ -23,6 +24,24 @@ FILTER_TYPE_OR = "OR"
 tracer = trace.get_tracer(__name__)
 
 
+@Field.register_lookup
+class ILikeContains(IContains):
+    """
+    A case-insensitive contains lookup which compiles to `column::text ILIKE
+    '%value%'` instead of `UPPER(column::text) LIKE UPPER('%value%')` like the
+    `icontains` lookup does. Contrary to the latter, it can use a `gin_trgm_ops`
+    index of the column.
+    """
+
+    lookup_name = "ilike_contains"
+
+    def as_sql(self, compiler, connection):
+        # The `process_lhs` of the `BuiltinLookup` would wrap the column in `UPPER`.
+        lhs_sql, lhs_params = Lookup.process_lhs(self, compiler, connection)
+        rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs_sql}::text ILIKE {rhs_sql}", (*lhs_params, *rhs_params)
+
+
 class AnnotatedQ:
     """
     A simple wrapper class combining a params for a Queryset.annotate call with a
@@ -146,7 +165,7 @@ def contains_filter(
         return Q()
     if validate:
         model_field.get_prep_value(value)
-    return Q(**{f"{field_name}__icontains": value})
+    return Q(**{f"{field_name}__ilike_contains": value})
 
 
 def contains_word_filter(field_name, value, model_field, _) -> OptionallyAnnotatedQ:
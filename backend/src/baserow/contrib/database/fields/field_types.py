@@ -35,7 +35,7 @@ from django.db.models import (
     Window,
 )
 from django.db.models.fields.related import ManyToManyField
-from django.db.models.functions import Coalesce, RowNumber
+from django.db.models.functions import Cast, Coalesce, RowNumber
 
 from dateutil import parser
 from dateutil.parser import ParserError
@@ -250,6 +250,9 @@ class TextFieldMatchingRegexFieldType(FieldType, ABC):
           altering a column to being an email type.
     """
 
+    _can_have_trigram_index = True
+    can_be_inserted_with_copy = True
+
     @property
     @abstractmethod
     def regex(self):
@@ -280,6 +283,9 @@ class TextFieldMatchingRegexFieldType(FieldType, ABC):
             }
         )
 
+    def get_response_serializer_converter(self, instance):
+        return str
+
     def get_model_field(self, instance, **kwargs):
         return models.TextField(
             default="",
@@ -309,6 +315,9 @@ class TextFieldMatchingRegexFieldType(FieldType, ABC):
     def contains_word_query(self, *args):
         return contains_word_filter(*args)
 
+    def get_export_expression(self, field, model_field):
+        return F(field.db_column)
+
     def to_baserow_formula_type(self, field) -> BaserowFormulaType:
         return BaserowFormulaTextType(nullable=True)
 
@@ -364,12 +373,65 @@ class ManyToManyFieldTypeSerializeToInputValueMixin:
         return value
 
 
+class CompactRowHistoryListValuesMixin:
+    """
+    Compacts the row history values of the field types having a list of items as
+    value, by only keeping the removed items in the before value and the added items
+    in the after value. The items in the metadata that aren't referenced by the
+    compacted values anymore are removed as well.
+    """
+
+    # The key of the metadata containing the items referenced by the value, if any.
+    row_history_metadata_items_key: Optional[str] = None
+
+    def get_row_history_item_key(self, item: Any) -> Any:
+        return item
+
+    def compact_row_history_values(
+        self,
+        before_value: List[Any],
+        after_value: List[Any],
+        metadata: SerializedRowHistoryFieldMetadata,
+    ) -> Tuple[List[Any], List[Any], SerializedRowHistoryFieldMetadata]:
+        before_keys = {self.get_row_history_item_key(item) for item in before_value}
+        after_keys = {self.get_row_history_item_key(item) for item in after_value}
+        removed = [
+            item
+            for item in before_value
+            if self.get_row_history_item_key(item) not in after_keys
+        ]
+        added = [
+            item
+            for item in after_value
+            if self.get_row_history_item_key(item) not in before_keys
+        ]
+
+        items_key = self.row_history_metadata_items_key
+        if items_key and items_key in metadata:
+            # The keys of the metadata items are strings once stored as JSON.
+            changed_keys = {
+                str(self.get_row_history_item_key(item)) for item in removed + added
+            }
+            metadata = {
+                **metadata,
+                items_key: {
+                    key: value
+                    for key, value in metadata[items_key].items()
+                    if str(key) in changed_keys
+                },
+            }
+
+        return removed, added, metadata
+
+
 class TextFieldType(CollationSortMixin, FieldType):
     type = "text"
     model_class = TextField
+    can_be_inserted_with_copy = True
     allowed_fields = ["text_default"]
     serializer_field_names = ["text_default"]
     _can_group_by = True
+    _can_have_trigram_index = True
 
     def get_serializer_field(self, instance, **kwargs):
         required = kwargs.get("required", False)
@@ -383,6 +445,9 @@ class TextFieldType(CollationSortMixin, FieldType):
             }
         )
 
+    def get_response_serializer_converter(self, instance):
+        return str
+
     def get_model_field(self, instance, **kwargs):
         return models.TextField(
             default=instance.text_default or None, blank=True, null=True, **kwargs
@@ -397,6 +462,9 @@ class TextFieldType(CollationSortMixin, FieldType):
     def contains_word_query(self, *args):
         return contains_word_filter(*args)
 
+    def get_export_expression(self, field, model_field):
+        return F(field.db_column)
+
     def to_baserow_formula_type(self, field) -> BaserowFormulaType:
         return BaserowFormulaTextType(nullable=True)
 
@@ -413,8 +481,10 @@ class TextFieldType(CollationSortMixin, FieldType):
 class LongTextFieldType(CollationSortMixin, FieldType):
     type = "long_text"
     model_class = LongTextField
+    can_be_inserted_with_copy = True
     allowed_fields = ["long_text_enable_rich_text"]
     serializer_field_names = ["long_text_enable_rich_text"]
+    _can_have_trigram_index = True
 
     def check_can_group_by(self, field: Field) -> bool:
         return not field.long_text_enable_rich_text
@@ -449,6 +519,9 @@ class LongTextFieldType(CollationSortMixin, FieldType):
             }
         )
 
+    def get_response_serializer_converter(self, instance):
+        return str
+
     def serialize_metadata_for_row_history(
         self,
         field: Field,
@@ -467,6 +540,9 @@ class LongTextFieldType(CollationSortMixin, FieldType):
     def random_value(self, instance, fake, cache):
         return fake.text()
 
+    def get_export_expression(self, field, model_field):
+        return F(field.db_column)
+
     def contains_query(self, *args):
         return contains_filter(*args)
 
@@ -511,6 +587,7 @@ class NumberFieldType(FieldType):
 
     type = "number"
     model_class = NumberField
+    can_be_inserted_with_copy = True
     allowed_fields = ["number_decimal_places", "number_negative"]
     serializer_field_names = ["number_decimal_places", "number_negative", "number_type"]
     serializer_field_overrides = {
@@ -566,6 +643,10 @@ class NumberFieldType(FieldType):
         # correctly so lets use it instead of trying to do it ourselves.
         return self.get_serializer_field(instance).to_representation(value)
 
+    def get_export_expression(self, field, model_field):
+        # The numeric column already has the right number of decimal places.
+        return Cast(field.db_column, output_field=models.TextField())
+
     def get_model_field(self, instance, **kwargs):
         kwargs["decimal_places"] = instance.number_decimal_places
 
@@ -661,6 +742,7 @@ class NumberFieldType(FieldType):
 class RatingFieldType(FieldType):
     type = "rating"
     model_class = RatingField
+    can_be_inserted_with_copy = True
     allowed_fields = ["max_value", "color", "style"]
     serializer_field_names = ["max_value", "color", "style"]
     _can_group_by = True
@@ -696,6 +778,9 @@ class RatingFieldType(FieldType):
             }
         )
 
+    def get_response_serializer_converter(self, instance):
+        return int
+
     def force_same_type_alter_column(self, from_field, to_field):
         """
         Force field alter column hook to be called when changing max_value.
@@ -758,6 +843,9 @@ class RatingFieldType(FieldType):
     def random_value(self, instance, fake, cache):
         return fake.random_int(0, instance.max_value)
 
+    def get_export_expression(self, field, model_field):
+        return Cast(field.db_column, output_field=models.TextField())
+
     def contains_query(self, *args):
         return contains_filter(*args)
 
@@ -782,6 +870,7 @@ class RatingFieldType(FieldType):
 class BooleanFieldType(FieldType):
     type = "boolean"
     model_class = BooleanField
+    can_be_inserted_with_copy = True
     _can_group_by = True
 
     def get_alter_column_prepare_new_value(self, connection, from_field, to_field):
@@ -803,9 +892,19 @@ class BooleanFieldType(FieldType):
     def get_serializer_field(self, instance, **kwargs):
         return BaserowBooleanField(**{"required": False, "default": False, **kwargs})
 
+    def get_response_serializer_converter(self, instance):
+        return bool
+
     def get_model_field(self, instance, **kwargs):
         return models.BooleanField(default=False, **kwargs)
 
+    def get_export_expression(self, field, model_field):
+        return Case(
+            When(**{field.db_column: True}, then=Value("True")),
+            default=Value("False"),
+            output_field=models.TextField(),
+        )
+
     def random_value(self, instance, fake, cache):
         return fake.pybool()
 
@@ -830,6 +929,7 @@ class BooleanFieldType(FieldType):
 class DateFieldType(FieldType):
     type = "date"
     model_class = DateField
+    can_be_inserted_with_copy = True
     allowed_fields = [
         "date_format",
         "date_include_time",
@@ -1013,6 +1113,23 @@ class DateFieldType(FieldType):
 
         return value.strftime(field.get_python_format())
 
+    def get_export_expression(self, field, model_field):
+        value = F(field.db_column)
+        if isinstance(model_field, DateTimeField):
+            value = Func(
+                Value(field.date_force_timezone or "UTC"),
+                value,
+                function="timezone",
+                output_field=DateTimeField(),
+            )
+
+        return Func(
+            value,
+            Value(field.get_psql_format()),
+            function="to_char",
+            output_field=models.TextField(),
+        )
+
     def get_serializer_field(self, instance, **kwargs):
         required = kwargs.get("required", False)
 
@@ -1328,6 +1445,7 @@ class CreatedOnFieldType(CreatedOnLastModifiedBaseFieldType):
 class LastModifiedByFieldType(ReadOnlyFieldType):
     type = "last_modified_by"
     model_class = LastModifiedByField
+    can_be_inserted_with_copy = True
     can_be_in_form_view = False
     keep_data_on_duplication = True
     update_always = True
@@ -1534,6 +1652,7 @@ class LastModifiedByFieldType(ReadOnlyFieldType):
 class CreatedByFieldType(ReadOnlyFieldType):
     type = "created_by"
     model_class = CreatedByField
+    can_be_inserted_with_copy = True
     can_be_in_form_view = False
     keep_data_on_duplication = True
 
@@ -1889,7 +2008,11 @@ class DurationFieldType(FieldType):
         setattr(row, field_name, value)
 
 
-class LinkRowFieldType(ManyToManyFieldTypeSerializeToInputValueMixin, FieldType):
+class LinkRowFieldType(
+    ManyToManyFieldTypeSerializeToInputValueMixin,
+    CompactRowHistoryListValuesMixin,
+    FieldType,
+):
     """
     The link row field can be used to link a field to a row of another table. Because
     the user should also be able to see which rows are linked to the related table,
@@ -1898,6 +2021,7 @@ class LinkRowFieldType(ManyToManyFieldTypeSerializeToInputValueMixin, FieldType)
 
     type = "link_row"
     model_class = LinkRowField
+    row_history_metadata_items_key = "linked_rows"
     allowed_fields = [
         "link_row_table_id",
         "link_row_related_field",
@@ -3122,12 +3246,15 @@ class EmailFieldType(CollationSortMixin, CharFieldMatchingRegexFieldType):
         return collate_expression(Value(value))
 
 
-class FileFieldType(FieldType):
+class FileFieldType(CompactRowHistoryListValuesMixin, FieldType):
     type = "file"
     model_class = FileField
     can_be_in_form_view = True
     can_get_unique_values = False
 
+    def get_row_history_item_key(self, item: Any) -> Any:
+        return item["name"]
+
     def to_baserow_formula_type(self, field) -> BaserowFormulaType:
         return BaserowFormulaArrayType(BaserowFormulaSingleFileType(nullable=True))
 
@@ -3496,6 +3623,7 @@ class SelectOptionBaseFieldType(FieldType):
 class SingleSelectFieldType(SelectOptionBaseFieldType):
     type = "single_select"
     model_class = SingleSelectField
+    can_be_inserted_with_copy = True
 
     def get_serializer_field(self, instance, **kwargs):
         required = kwargs.get("required", False)
@@ -3541,6 +3669,9 @@ class SingleSelectFieldType(SelectOptionBaseFieldType):
             queryset.filter(pk=OuterRef("pk")).values(f"{field.db_column}__value")[:1]
         )
 
+    def get_export_expression(self, field, model_field):
+        return F(f"{field.db_column}__value")
+
     def prepare_value_for_db(self, instance, value):
         return self.prepare_value_for_db_in_bulk(
             instance, {0: value}, continue_on_error=False
@@ -3829,6 +3960,7 @@ class SingleSelectFieldType(SelectOptionBaseFieldType):
 
 class MultipleSelectFieldType(
     ManyToManyFieldTypeSerializeToInputValueMixin,
+    CompactRowHistoryListValuesMixin,
     ManyToManyGroupByMixin,
     SelectOptionBaseFieldType,
 ):
@@ -3836,6 +3968,7 @@ class MultipleSelectFieldType(
     model_class = MultipleSelectField
     can_get_unique_values = False
     is_many_to_many_field = True
+    row_history_metadata_items_key = "select_options"
     _can_group_by = True
 
     def to_baserow_formula_type(self, field) -> BaserowFormulaType:
@@ -4540,6 +4673,16 @@ class FormulaFieldType(ReadOnlyFieldType):
             table__database__workspace__trashed=False,
         )
 
+    def can_skip_periodic_update(
+        self, field: FormulaField, previous_now: datetime, now: datetime
+    ) -> bool:
+        if (
+            previous_now.astimezone(timezone.utc).date()
+            != now.astimezone(timezone.utc).date()
+        ):
+            return False
+        return FormulaHandler.needs_periodic_update_only_when_date_changes(field)
+
     def run_periodic_update(
         self,
         field: Field,
@@ -4796,6 +4939,12 @@ class FormulaFieldType(ReadOnlyFieldType):
     def check_can_group_by(self, field):
         return self.to_baserow_formula_type(field.specific).can_group_by
 
+    def check_can_have_trigram_index(self, field):
+        return self.to_baserow_formula_type(field.specific).type in [
+            BaserowFormulaTextType.type,
+            BaserowFormulaCharType.type,
+        ]
+
     def get_order(
         self, field, field_name, order_direction
     ) -> OptionallyAnnotatedOrderBy:
@@ -5342,7 +5491,9 @@ class LookupFieldType(FormulaFieldType):
 
 
 class MultipleCollaboratorsFieldType(
-    ManyToManyFieldTypeSerializeToInputValueMixin, FieldType
+    ManyToManyFieldTypeSerializeToInputValueMixin,
+    CompactRowHistoryListValuesMixin,
+    FieldType,
 ):
     type = "multiple_collaborators"
     model_class = MultipleCollaboratorsField
@@ -5355,6 +5506,9 @@ class MultipleCollaboratorsFieldType(
     }
     is_many_to_many_field = True
 
+    def get_row_history_item_key(self, item: Any) -> Any:
+        return item["id"]
+
     def get_serializer_field(self, instance, **kwargs):
         required = kwargs.pop("required", False)
         field_serializer = CollaboratorSerializer(
@@ -5687,6 +5841,7 @@ class UUIDFieldType(ReadOnlyFieldType):
 
     type = "uuid"
     model_class = UUIDField
+    can_be_inserted_with_copy = True
     can_get_unique_values = False
     can_be_in_form_view = False
     keep_data_on_duplication = True
@@ -5694,12 +5849,22 @@ class UUIDFieldType(ReadOnlyFieldType):
     def get_serializer_field(self, instance, **kwargs):
         return serializers.UUIDField(required=False, **kwargs)
 
+    def get_response_serializer_converter(self, instance):
+        return str
+
     def get_serializer_help_text(self, instance):
         return "Contains a unique and persistent UUID for every row."
 
+    @staticmethod
+    def _generate_uuid():
+        # `uuid.uuid4` is resolved on every call, like it is when the model field is
+        # unpickled from the field attrs cache, because the generated model can be
+        # reused from the in-memory model cache.
+        return uuid.uuid4()
+
     def get_model_field(self, instance, **kwargs):
         return models.UUIDField(
-            default=uuid.uuid4,
+            default=self._generate_uuid,
             null=True,
             **kwargs,
         )
@@ -5744,6 +5909,9 @@ class UUIDFieldType(ReadOnlyFieldType):
     def get_export_value(self, value, field_object, rich_value=False) -> str:
         return "" if value is None else str(value)
 
+    def get_export_expression(self, field, model_field):
+        return Cast(field.db_column, output_field=models.TextField())
+
     def contains_query(self, *args):
         return contains_filter(*args, validate=False)
 
@@ -5785,6 +5953,9 @@ class AutonumberFieldType(ReadOnlyFieldType):
     def get_serializer_field(self, instance, **kwargs):
         return serializers.IntegerField(required=False, **kwargs)
 
+    def get_response_serializer_converter(self, instance):
+        return int
+
     def get_serializer_help_text(self, instance):
         return (
             "Contains a unique and persistent incremental integer number for every row."
@@ -5793,6 +5964,9 @@ class AutonumberFieldType(ReadOnlyFieldType):
     def get_model_field(self, instance, **kwargs):
         return IntegerFieldWithSequence(null=True, **kwargs)
 
+    def get_export_expression(self, field, model_field):
+        return Cast(field.db_column, output_field=models.TextField())
+
     def after_rows_imported(
         self,
         field: FormulaField,
@@ -6042,6 +6216,17 @@ class PasswordFieldType(FieldType):
         # `False` as string depending on whether the value is set.
         return bool(value)
 
+    def get_export_expression(self, field, model_field):
+        return Case(
+            When(
+                Q(**{f"{field.db_column}__isnull": False})
+                & ~Q(**{field.db_column: ""}),
+                then=Value("True"),
+            ),
+            default=Value("False"),
+            output_field=models.TextField(),
+        )
+
     def prepare_row_history_value_from_action_meta_data(self, value):
         # We don't want to expose the hash of the password, so we just show `True` or
         # `False` as string depending on whether the value is set.
@@ -1,4 +1,15 @@
-from typing import TYPE_CHECKING, Any, Dict, List, NoReturn, Optional, Tuple, Union
+from datetime import datetime
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    NoReturn,
+    Optional,
+    Tuple,
+    Union,
+)
 from zipfile import ZipFile
 
 from django.contrib.auth.models import AbstractUser
@@ -123,10 +134,23 @@ class FieldType(
     _can_group_by = False
     """Indicates whether it is possible to group by by this field type."""
 
+    _can_have_trigram_index = False
+    """
+    Indicates whether the contains filters of this field type filter the text of the
+    column itself, so that they can be sped up with a trigram index.
+    """
+
     read_only = False
     """Indicates whether the field allows inserting/updating row values or if it is
     read only."""
 
+    can_be_inserted_with_copy = False
+    """
+    Indicates whether the model field of this field type is a single column with a
+    plain value which can be inserted with PostgreSQL's `COPY`. This is used to
+    import rows faster when all the fields of a table support it.
+    """
+
     keep_data_on_duplication = True
     """
     Indicates whether the data must be kept when duplicating the field. We typically
@@ -218,6 +242,27 @@ class FieldType(
 
         return value
 
+    def compact_row_history_values(
+        self,
+        before_value: Any,
+        after_value: Any,
+        metadata: SerializedRowHistoryFieldMetadata,
+    ) -> Tuple[Any, Any, SerializedRowHistoryFieldMetadata]:
+        """
+        Reduces the before and after values of a row history entry to the items that
+        were actually removed and added. It's called for the list values with more
+        items than `BASEROW_ROW_HISTORY_COMPACT_LIST_VALUES_THRESHOLD`, so that
+        adding one item to a long list doesn't store the entire list twice. The
+        removed and added items can still be derived from the compacted values.
+
+        :param before_value: The value before the change.
+        :param after_value: The value after the change.
+        :param metadata: The row history metadata of the field.
+        :return: The compacted before value, after value and metadata.
+        """
+
+        return before_value, after_value, metadata
+
     def prepare_value_for_db_in_bulk(
         self,
         instance: Field,
@@ -426,6 +471,23 @@ class FieldType(
 
         return self.get_serializer_field(instance, **kwargs)
 
+    def get_response_serializer_converter(
+        self, instance
+    ) -> Optional[Callable[[Any], Any]]:
+        """
+        Optionally returns a function that converts a value of the field, which is
+        never None, to exactly the same representation as the `to_representation` of
+        the response serializer field without any additional kwargs. It's used by the
+        fast row serialization path to skip the overhead of the serializer fields. If
+        None is returned, the response serializer field is used instead.
+
+        :param instance: The field instance for which to get the converter.
+        :type instance: Field
+        :return: The converter function or None.
+        """
+
+        return None
+
     def get_serializer_help_text(self, instance):
         """
         If some additional information in the documentation related to the field's type
@@ -1092,6 +1154,23 @@ class FieldType(
 
         return value
 
+    def get_export_expression(
+        self, field: Field, model_field: django_models.Field
+    ) -> Optional[Expression]:
+        """
+        Can return a django expression computing in the database exactly the same
+        text as the non rich value returned by `get_export_value`, NULL being
+        exported as an empty string. This allows exporters to let PostgreSQL
+        serialize the value instead of converting it in Python, for example to
+        stream a whole export with `COPY ... TO STDOUT`.
+
+        :param field: The field instance to export.
+        :param model_field: The field extracted from the model.
+        :return: The expression or None if the value must be converted in Python.
+        """
+
+        return None
+
     def get_human_readable_value(self, value: Any, field_object: "FieldObject") -> str:
         """
         Should convert the value of the provided field to a human readable string for
@@ -1202,6 +1281,25 @@ class FieldType(
 
         return None
 
+    def can_skip_periodic_update(
+        self, field: Field, previous_now: datetime, now: datetime
+    ) -> bool:
+        """
+        Indicates if the periodic update of the field can be skipped, because its
+        values can't have changed since the last complete periodic update of the
+        workspace. For example, values that only depend on the current date don't
+        have to be updated if the date didn't change.
+
+        :param field: The field that needs to be periodically updated.
+        :param previous_now: The `now` value of the workspace during the last
+            complete periodic update.
+        :param now: The `now` value of the workspace that will be used to update
+            the field.
+        :return: True if the field doesn't have to be updated.
+        """
+
+        return False
+
     def run_periodic_update(
         self,
         field: Field,
@@ -1503,6 +1601,19 @@ class FieldType(
 
         return self._can_order_by
 
+    def check_can_have_trigram_index(self, field: Field) -> bool:
+        """
+        Override this method if the contains filters of this field type can sometimes
+        use a trigram index of the column depending on the individual field state. By
+        default will just return the bool property _can_have_trigram_index.
+
+        :param field: The field to check.
+        :return: True if a trigram index can speed up the contains filters of the
+            field, False otherwise.
+        """
+
+        return self._can_have_trigram_index
+
     def check_can_group_by(self, field: Field) -> bool:
         """
         Override this method if this field type can sometimes be grouped or sometimes
@@ -1,15 +1,19 @@
+import time
 import traceback
+import uuid
 from collections import defaultdict
-from datetime import timedelta
-from typing import Optional
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from typing import List, Optional, Tuple
 
 from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
 from django.db.models import QuerySet
 from django.utils import timezone
 
 from loguru import logger
-from opentelemetry import trace
+from opentelemetry import metrics, trace
 
 from baserow.config.celery import app
 from baserow.contrib.database.fields.registries import field_type_registry
@@ -19,6 +23,45 @@ from baserow.core.models import Workspace
 from baserow.core.telemetry.utils import add_baserow_trace_attrs, baserow_trace
 
 tracer = trace.get_tracer(__name__)
+meter = metrics.get_meter(__name__)
+
+periodic_field_update_cycle_duration = meter.create_histogram(
+    "baserow.periodic_field_updates.cycle_duration",
+    unit="s",
+    description="The time between the start of a periodic field update cycle and "
+    "the end of its last shard.",
+)
+periodic_field_update_shard_duration = meter.create_histogram(
+    "baserow.periodic_field_updates.shard_duration",
+    unit="s",
+    description="The time it took to periodically update the fields of a workspace.",
+)
+periodic_field_update_shards_dispatched = meter.create_counter(
+    "baserow.periodic_field_updates.shards_dispatched",
+    unit="1",
+    description="The number of workspaces which periodic field updates were "
+    "dispatched.",
+)
+periodic_field_update_shards_skipped = meter.create_counter(
+    "baserow.periodic_field_updates.shards_skipped",
+    unit="1",
+    description="The number of periodic field updates of a workspace which were "
+    "skipped because the previous one was still running, or which were stopped "
+    "because of the deadline.",
+)
+periodic_field_update_fields_skipped = meter.create_counter(
+    "baserow.periodic_field_updates.fields_skipped",
+    unit="1",
+    description="The number of fields which periodic update was skipped because "
+    "their values couldn't have changed.",
+)
+
+# How long after the deadline the remaining shards of a cycle are counted, so that
+# the key doesn't stay forever if some shards never run.
+REMAINING_SHARDS_KEY_GRACE_SECONDS = 60
+# The `now` of the last complete update is only needed until the next update, but
+# it's kept a bit longer in case some cycles are skipped.
+COMPLETED_NOW_CACHE_TIMEOUT = 60 * 60 * 24
 
 
 def filter_distinct_workspace_ids_per_fields(
@@ -41,6 +84,43 @@ def filter_distinct_workspace_ids_per_fields(
     return queryset.distinct().order_by("now")
 
 
+def get_periodic_update_lock_key(field_type: str, workspace_id: int) -> str:
+    return f"periodic_field_update_lock_{field_type}_{workspace_id}"
+
+
+def get_periodic_update_completed_now_key(field_type: str, workspace_id: int) -> str:
+    return f"periodic_field_update_completed_now_{field_type}_{workspace_id}"
+
+
+def get_periodic_update_remaining_shards_key(cycle_id: str) -> str:
+    return f"periodic_field_update_remaining_shards_{cycle_id}"
+
+
+def get_periodic_update_shards(
+    workspace_id: Optional[int] = None,
+) -> List[Tuple[str, int]]:
+    """
+    Returns the field type and workspace id pairs which fields need to be updated
+    periodically, ordered by the workspaces that have been updated the longest ago.
+
+    :param workspace_id: The id of the workspace that should be filtered on.
+    :return: The list of field types and workspace ids.
+    """
+
+    shards = []
+    for field_type_instance in field_type_registry.get_all():
+        field_qs = field_type_instance.get_fields_needing_periodic_update()
+        if field_qs is None:
+            continue
+
+        workspace_qs = filter_distinct_workspace_ids_per_fields(field_qs, workspace_id)
+        shards.extend(
+            (field_type_instance.type, shard_workspace_id)
+            for shard_workspace_id in workspace_qs.values_list("id", flat=True)
+        )
+    return shards
+
+
 @app.task(
     bind=True,
     queue=settings.PERIODIC_FIELD_UPDATE_QUEUE_NAME,
@@ -51,47 +131,174 @@ def run_periodic_fields_updates(
 ):
     """
     Refreshes all the fields that need to be updated periodically for all
-    workspaces.
+    workspaces. The work is split in one shard per field type and workspace, which
+    are dispatched to the periodic field update queue, so that they can run in
+    parallel. The shards that didn't start before the next cycle are discarded.
     """
 
-    for field_type_instance in field_type_registry.get_all():
-        field_qs = field_type_instance.get_fields_needing_periodic_update()
-        if field_qs is None:
-            continue
+    cycle_started_at = time.time()
+    deadline = cycle_started_at + settings.PERIODIC_FIELD_UPDATE_TIMEOUT_MINUTES * 60
 
-        workspace_qs = filter_distinct_workspace_ids_per_fields(field_qs, workspace_id)
+    shards = get_periodic_update_shards(workspace_id)
+    if not shards:
+        return
+
+    cycle_id = str(uuid.uuid4())
+    cache.set(
+        get_periodic_update_remaining_shards_key(cycle_id),
+        len(shards),
+        timeout=settings.PERIODIC_FIELD_UPDATE_TIMEOUT_MINUTES * 60
+        + REMAINING_SHARDS_KEY_GRACE_SECONDS,
+    )
+    periodic_field_update_shards_dispatched.add(len(shards))
 
-        for workspace in workspace_qs.all():
+    for field_type, shard_workspace_id in shards:
+        run_periodic_field_type_update_per_workspace.apply_async(
+            (field_type, shard_workspace_id, update_now, deadline),
+            kwargs={"cycle_id": cycle_id, "cycle_started_at": cycle_started_at},
+            expires=datetime.fromtimestamp(deadline, tz=dt_timezone.utc),
+        )
+
+
+@app.task(
+    bind=True,
+    queue=settings.PERIODIC_FIELD_UPDATE_QUEUE_NAME,
+    soft_time_limit=settings.PERIODIC_FIELD_UPDATE_TIMEOUT_MINUTES * 60,
+)
+def run_periodic_field_type_update_per_workspace(
+    self,
+    field_type: str,
+    workspace_id: int,
+    update_now: bool = True,
+    deadline: Optional[float] = None,
+    cycle_id: Optional[str] = None,
+    cycle_started_at: Optional[float] = None,
+):
+    """
+    Refreshes the fields of the field type that need to be updated periodically in
+    the workspace. The shard is skipped if the previous shard of the same field type
+    and workspace is still running, and it stops updating the fields once the
+    deadline has passed.
+
+    :param field_type: The type of the fields that must be updated.
+    :param workspace_id: The id of the workspace in which the fields must be
+        updated.
+    :param update_now: Indicates if the `now` value of the workspace must be
+        refreshed before updating the fields.
+    :param deadline: The timestamp after which no other field must be updated.
+    :param cycle_id: The id of the cycle that dispatched the shard, used to measure
+        the duration of the cycle.
+    :param cycle_started_at: The timestamp when the cycle started.
+    """
+
+    started_at = time.time()
+    lock_key = get_periodic_update_lock_key(field_type, workspace_id)
+    lock_timeout = settings.PERIODIC_FIELD_UPDATE_TIMEOUT_MINUTES * 60
+    try:
+        if not cache.add(lock_key, 1, timeout=lock_timeout):
+            periodic_field_update_shards_skipped.add(1, {"reason": "locked"})
+            logger.warning(
+                "Skipping the periodic update of the {field_type} fields of "
+                "workspace {workspace_id} because the previous one is still running.",
+                field_type=field_type,
+                workspace_id=workspace_id,
+            )
+            return
+
+        try:
+            workspace = Workspace.objects.get(id=workspace_id)
             _run_periodic_field_type_update_per_workspace(
-                field_type_instance, workspace, update_now
+                field_type_registry.get(field_type), workspace, update_now, deadline
+            )
+        except Workspace.DoesNotExist:
+            pass
+        finally:
+            cache.delete(lock_key)
+            periodic_field_update_shard_duration.record(
+                time.time() - started_at, {"field_type": field_type}
             )
+    finally:
+        _record_periodic_update_cycle_progress(cycle_id, cycle_started_at)
+
+
+def _record_periodic_update_cycle_progress(
+    cycle_id: Optional[str], cycle_started_at: Optional[float]
+):
+    """
+    Records the duration of the cycle once the last of its shards has finished.
+    """
+
+    if cycle_id is None or cycle_started_at is None:
+        return
+
+    try:
+        remaining_shards = cache.decr(
+            get_periodic_update_remaining_shards_key(cycle_id)
+        )
+    except ValueError:
+        # The key expired, so the cycle took longer than the deadline.
+        return
+
+    if remaining_shards <= 0:
+        cache.delete(get_periodic_update_remaining_shards_key(cycle_id))
+        periodic_field_update_cycle_duration.record(time.time() - cycle_started_at)
 
 
 @baserow_trace(tracer)
 def _run_periodic_field_type_update_per_workspace(
-    field_type_instance, workspace: Workspace, update_now=True
+    field_type_instance,
+    workspace: Workspace,
+    update_now: bool = True,
+    deadline: Optional[float] = None,
 ):
     qs = field_type_instance.get_fields_needing_periodic_update()
     if qs is None:
         return
 
+    completed_now_key = get_periodic_update_completed_now_key(
+        field_type_instance.type, workspace.id
+    )
+    # Without a new `now`, the fields are updated again with the same value, which
+    # can be used to recalculate them all.
+    previous_now = cache.get(completed_now_key) if update_now else None
+
     if update_now:
         workspace.refresh_now()
     add_baserow_trace_attrs(update_now=update_now, workspace_id=workspace.id)
 
+    now = workspace.get_now_or_set_if_null()
     all_updated_fields = []
+    completed = True
 
     for field in qs.filter(
         table__database__workspace_id=workspace.id,
         table__trashed=False,
         table__database__trashed=False,
     ):
+        if deadline is not None and time.time() >= deadline:
+            completed = False
+            periodic_field_update_shards_skipped.add(1, {"reason": "deadline"})
+            logger.warning(
+                "The periodic update of the {field_type} fields of workspace "
+                "{workspace_id} didn't finish before the deadline.",
+                field_type=field_type_instance.type,
+                workspace_id=workspace.id,
+            )
+            break
+
         # noinspection PyBroadException
         try:
+            if previous_now is not None and (
+                field_type_instance.can_skip_periodic_update(field, previous_now, now)
+            ):
+                periodic_field_update_fields_skipped.add(1)
+                continue
+
             all_updated_fields = _run_periodic_field_update(
                 field, field_type_instance, all_updated_fields
             )
         except Exception:
+            completed = False
             tb = traceback.format_exc()
             logger.error(
                 "Failed to periodically update {field_id} because of: \n{tb}",
@@ -100,6 +307,14 @@ def _run_periodic_field_type_update_per_workspace(
             )
             continue
 
+    # The fields are only skipped if all of them were updated for the previous
+    # `now`, otherwise a field which failed or didn't make it before the deadline
+    # could keep an outdated value.
+    if completed:
+        cache.set(completed_now_key, now, timeout=COMPLETED_NOW_CACHE_TIMEOUT)
+    else:
+        cache.delete(completed_now_key)
+
     # After a successful periodic update of all fields, we would need to update the
     # search index for all of them in one function per table to avoid ending up in a
     # deadlock because rows are updated simultaneously.
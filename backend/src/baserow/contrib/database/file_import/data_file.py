@@ -0,0 +1,80 @@
+import json
+from tempfile import TemporaryFile
+from typing import Any, Iterator, List, Optional
+
+from django.core.files import File
+from django.db.models.fields.files import FieldFile
+
+# The first line of a data file in the NDJSON format is a JSON object describing the
+# file, every following line contains the JSON encoded values of one row. Data files
+# created before this format existed contain a single JSON array of all the rows.
+NDJSON_FORMAT = "ndjson"
+
+
+def write_data_file(data: List[List[Any]]) -> File:
+    """
+    Writes the rows to a temporary NDJSON data file, one row per line, so that the
+    rows can be read back one by one without loading the entire file in memory.
+
+    :param data: The rows that must be written to the file.
+    :return: The temporary file which can be saved in the `data_file` of a job. It's
+        removed when closed.
+    """
+
+    file = TemporaryFile()
+    header = {"format": NDJSON_FORMAT, "row_count": len(data)}
+    file.write(json.dumps(header).encode("utf8") + b"\n")
+    for row in data:
+        file.write(json.dumps(row, ensure_ascii=False).encode("utf8") + b"\n")
+    file.seek(0)
+    return File(file)
+
+
+class ImportDataFile:
+    """
+    A sized iterable over the rows of the data file of a file import job. The rows
+    are read from the storage line by line every time it's iterated over, so the
+    memory usage doesn't depend on the size of the file.
+    """
+
+    def __init__(self, data_file: FieldFile):
+        self.data_file = data_file
+        self._row_count: Optional[int] = None
+
+    def _open(self):
+        return self.data_file.storage.open(self.data_file.name, "rb")
+
+    def _read_header(self, file) -> Optional[dict]:
+        """
+        Reads the header line of the file, or returns None if the file is in the
+        legacy format, in which case the file is rewound.
+        """
+
+        first_line = file.readline()
+        if first_line.lstrip().startswith(b"{"):
+            return json.loads(first_line)
+        file.seek(0)
+        return None
+
+    def __len__(self) -> int:
+        if self._row_count is None:
+            with self._open() as file:
+                header = self._read_header(file)
+                if header is None:
+                    self._row_count = len(json.load(file))
+                else:
+                    self._row_count = header["row_count"]
+        return self._row_count
+
+    def __iter__(self) -> Iterator[List[Any]]:
+        with self._open() as file:
+            if self._read_header(file) is None:
+                # Files in the legacy format can only be loaded at once.
+                yield from json.load(file)
+                return
+
+            # Iterating over the Django file object itself would restart from the
+            # beginning of the file, so the lines are read one by one instead.
+            for line in iter(file.readline, b""):
+                if line.strip():
+                    yield json.loads(line)
@@ -1,6 +1,3 @@
-import json
-
-from django.core.files.base import ContentFile
 from django.db import transaction
 
 from rest_framework import serializers
@@ -34,6 +31,7 @@ from baserow.contrib.database.table.exceptions import (
 from baserow.core.action.registries import action_type_registry
 from baserow.core.jobs.registries import JobType
 
+from .data_file import ImportDataFile, write_data_file
 from .models import FileImportJob
 from .serializers import ReportSerializer
 
@@ -94,13 +92,16 @@ class FileImportJobType(JobType):
 
     def after_job_creation(self, job, values):
         """
-        Save the data file for the newly created job.
+        Save the data file for the newly created job. The rows are stored one per
+        line, so that they can be read back one by one when the job runs.
         """
 
-        data_file = ContentFile(
-            json.dumps(values["data"], ensure_ascii=False).encode("utf8")
-        )
-        job.data_file.save(None, data_file)
+        if values["data"] is None:
+            # The table is created without data, so there is nothing to store.
+            return
+
+        with write_data_file(values["data"]) as data_file:
+            job.data_file.save(None, data_file)
 
     def before_delete(self, job):
         """
@@ -130,11 +131,11 @@ class FileImportJobType(JobType):
     def run(self, job, progress):
         """
         Fills the provided table with the normalized data that needs to be created upon
-        creation of the table.
+        creation of the table. The rows are streamed from the data file and imported
+        batch by batch, so the whole dataset is never loaded in memory.
         """
 
-        with job.data_file.open("r") as fin:
-            data = json.load(fin)
+        data = ImportDataFile(job.data_file) if job.data_file else None
 
         if job.table is None:
             new_table, error_report = action_type_registry.get_by_type(
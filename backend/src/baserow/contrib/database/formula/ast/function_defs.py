@@ -1607,6 +1607,9 @@ class BaserowNow(ZeroArgumentBaserowFunction):
 class BaserowToday(ZeroArgumentBaserowFunction):
     type = "today"
     needs_periodic_update = True
+    # The value is the current date in UTC, so it doesn't have to be updated again
+    # until the date changes.
+    needs_periodic_update_only_when_date_changes = True
 
     def type_function(
         self, func_call: BaserowFunctionCall[UnTyped]
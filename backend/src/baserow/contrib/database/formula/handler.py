@@ -57,6 +57,17 @@ def _needs_periodic_update(expression: BaserowExpression):
     return any(getattr(f, "needs_periodic_update", False) for f in functions_used)
 
 
+def _needs_periodic_update_only_when_date_changes(expression: BaserowExpression):
+    functions_used: Set[BaserowFunctionDefinition] = expression.accept(
+        FunctionsUsedVisitor()
+    )
+    return all(
+        getattr(f, "needs_periodic_update_only_when_date_changes", False)
+        for f in functions_used
+        if getattr(f, "needs_periodic_update", False)
+    )
+
+
 def _expression_requires_refresh_after_insert(expression: BaserowExpression):
     """
     WARNING: This function is directly used by migration code. Please ensure
@@ -319,6 +330,20 @@ class FormulaHandler(metaclass=baserow_trace_methods(tracer)):
         )
         return untyped_internal_expr.with_type(formula_field.cached_formula_type)
 
+    @classmethod
+    def needs_periodic_update_only_when_date_changes(cls, formula_field) -> bool:
+        """
+        Checks if all the functions which make the formula field need a periodic
+        update, like `today()`, only return a different value when the date changes.
+
+        :param formula_field: The formula field instance to check.
+        :return: True if the formula field only changes when the date changes.
+        """
+
+        return _needs_periodic_update_only_when_date_changes(
+            formula_field.cached_typed_internal_expression
+        )
+
     @classmethod
     def recalculate_formula_field_cached_properties(cls, formula_field, field_cache):
         """
@@ -0,0 +1,151 @@
+import sys
+import time
+from tempfile import TemporaryFile
+
+from django.core.management.base import BaseCommand
+
+from baserow.contrib.database.export.file_writer import PaginatedExportJobFileWriter
+from baserow.contrib.database.export.registries import table_exporter_registry
+from baserow.contrib.database.table.models import Table
+from baserow.contrib.database.views.models import View
+
+
+class BenchmarkFileWriter(PaginatedExportJobFileWriter):
+    """
+    A file writer that doesn't need an export job, so that the exporters can be
+    benchmarked without creating one.
+    """
+
+    def __init__(self, file, chunk_size=None, workers=None):
+        super().__init__(file, None, chunk_size=chunk_size, workers=workers)
+
+    def _check_and_update_job(self, current_row, total_rows):
+        pass
+
+    def _check_and_update_job_using_connection(
+        self, job_connection, current_row, total_rows
+    ):
+        return False
+
+
+class Command(BaseCommand):
+    help = (
+        "Exports a table or a view with every table exporter and reports the number "
+        "of rows exported per second."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "table_id", type=int, help="The table that needs to be exported."
+        )
+        parser.add_argument(
+            "--view-id",
+            type=int,
+            help="Optional, export this view of the table instead of the table.",
+        )
+        parser.add_argument(
+            "--exporter-types",
+            type=str,
+            nargs="*",
+            help="Optional, only benchmark these exporter types.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            help="The number of rows fetched at once, BASEROW_EXPORT_CHUNK_SIZE "
+            "by default.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="The number of threads serializing the rows, "
+            "BASEROW_EXPORT_SERIALIZATION_WORKERS by default.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=1,
+            help="How many times every exporter must export the rows. The fastest "
+            "run is reported.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            table = Table.objects.get(pk=options["table_id"])
+        except Table.DoesNotExist:
+            self.stdout.write(
+                self.style.ERROR(
+                    f"The table with id {options['table_id']} was not found."
+                )
+            )
+            sys.exit(1)
+
+        view = None
+        if options["view_id"] is not None:
+            try:
+                view = View.objects.get(pk=options["view_id"], table=table).specific
+            except View.DoesNotExist:
+                self.stdout.write(
+                    self.style.ERROR(
+                        f"The view with id {options['view_id']} was not found in "
+                        f"table {table.id}."
+                    )
+                )
+                sys.exit(1)
+
+        exporter_types = options["exporter_types"]
+        for exporter in table_exporter_registry.get_all():
+            if exporter_types and exporter.type not in exporter_types:
+                continue
+
+            if view is None and not exporter.can_export_table:
+                self.stdout.write(f"{exporter.type}: can't export a table, skipped.")
+                continue
+            if (
+                view is not None
+                and view.get_type().type not in exporter.supported_views
+            ):
+                self.stdout.write(f"{exporter.type}: can't export the view, skipped.")
+                continue
+
+            best_duration, rows, size = None, 0, 0
+            for _ in range(max(options["repeat"], 1)):
+                duration, rows, size = self.export(
+                    exporter, table, view, options["chunk_size"], options["workers"]
+                )
+                if best_duration is None or duration < best_duration:
+                    best_duration = duration
+
+            rows_per_second = rows / best_duration if best_duration else 0
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{exporter.type}: {rows} rows exported in {best_duration:.2f} "
+                    f"seconds, {rows_per_second:.0f} rows/sec, {size} bytes."
+                )
+            )
+
+    def export(self, exporter, table, view, chunk_size, workers):
+        """
+        Exports the table or the view with the exporter to a temporary file.
+
+        :return: The duration of the export in seconds, the number of exported rows
+            and the size of the exported file.
+        """
+
+        serializer_class = exporter.queryset_serializer_class
+        if view is None:
+            serializer = serializer_class.for_table(table)
+        else:
+            serializer = serializer_class.for_view(view)
+
+        rows = serializer.queryset.count()
+        with TemporaryFile() as file:
+            file_writer = BenchmarkFileWriter(
+                file, chunk_size=chunk_size, workers=workers
+            )
+            tick = time.perf_counter()
+            serializer.write_to_file(file_writer)
+            duration = time.perf_counter() - tick
+            size = file.tell()
+
+        return duration, rows, size
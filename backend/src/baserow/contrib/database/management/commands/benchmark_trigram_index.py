@@ -0,0 +1,165 @@
+import statistics
+import sys
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from psycopg2 import sql
+
+from baserow.contrib.database.fields.exceptions import FieldDoesNotExist
+from baserow.contrib.database.fields.field_filters import FILTER_TYPE_AND, FilterBuilder
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.views.handler import TrigramIndexingHandler
+from baserow.contrib.database.views.registries import view_filter_type_registry
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares the latency of the contains filters and the compat search of a text "
+        "field with and without a trigram index. Everything, including the optionally "
+        "generated rows, is rolled back at the end."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "field_id", type=int, help="The text field that must be filtered."
+        )
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=2_000_000,
+            help="The number of rows with random text that are temporarily added to "
+            "the table before the benchmark.",
+        )
+        parser.add_argument(
+            "--search",
+            type=str,
+            nargs="*",
+            default=["a1b", "ffee", "0c9d2"],
+            help="The values to filter by.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="How many times every query must run. The median is reported.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            field = FieldHandler().get_field(options["field_id"]).specific
+        except FieldDoesNotExist:
+            self.stdout.write(
+                self.style.ERROR(f"The field {options['field_id']} was not found.")
+            )
+            sys.exit(1)
+
+        if not TrigramIndexingHandler.pg_trgm_extension_available():
+            self.stdout.write(self.style.ERROR("The pg_trgm extension is missing."))
+            sys.exit(1)
+
+        with transaction.atomic():
+            model = field.table.get_model()
+            if options["rows"] > 0:
+                self.stdout.write(f"Inserting {options['rows']} rows...")
+                self.insert_random_rows(model, field, options["rows"])
+
+            TrigramIndexingHandler.remove_index_if_exists(field)
+            self.analyze(model)
+            without_index = self.run_queries(model, field, options)
+
+            self.stdout.write("Creating the trigram index...")
+            TrigramIndexingHandler.add_index_if_not_exists(field)
+            self.analyze(model)
+            with_index = self.run_queries(model, field, options)
+
+            transaction.set_rollback(True)
+
+        for name, duration in without_index.items():
+            self.stdout.write(
+                f"{name}: {duration * 1000:.1f}ms without index, "
+                f"{with_index[name] * 1000:.1f}ms with index."
+            )
+
+    def insert_random_rows(self, model, field, count):
+        """
+        Inserts rows with random hexadecimal words in the field. The other columns
+        get their default value.
+        """
+
+        columns, values, params = [], [], []
+        for model_field in model._meta.concrete_fields:
+            if model_field.primary_key:
+                continue
+            if model_field.attname == field.db_column:
+                value = sql.SQL("md5(random()::text) || ' ' || md5(i::text)")
+            elif model_field.attname == "order":
+                value = sql.SQL("i")
+            elif model_field.has_default() or not model_field.null:
+                value = sql.Placeholder()
+                params.append(
+                    model_field.get_db_prep_save(model_field.get_default(), connection)
+                )
+            else:
+                continue
+            columns.append(sql.Identifier(model_field.column))
+            values.append(value)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL(
+                    "INSERT INTO {table_name} ({columns}) SELECT {values} "
+                    "FROM generate_series(1, {count}) AS i"
+                ).format(
+                    table_name=sql.Identifier(model._meta.db_table),
+                    columns=sql.SQL(", ").join(columns),
+                    values=sql.SQL(", ").join(values),
+                    count=sql.Literal(count),
+                ),
+                params,
+            )
+
+    def analyze(self, model):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL("ANALYZE {table_name}").format(
+                    table_name=sql.Identifier(model._meta.db_table)
+                )
+            )
+
+    def run_queries(self, model, field, options):
+        """
+        Runs a count and fetches the first page of rows for every filter type that
+        can use the index and for the compat search.
+
+        :return: A dict containing the median duration per query.
+        """
+
+        field_name = field.db_column
+        model_field = model._meta.get_field(field_name)
+        querysets = {}
+        for search in options["search"]:
+            for filter_type_name in TrigramIndexingHandler.get_indexable_filter_types():
+                filter_type = view_filter_type_registry.get(filter_type_name)
+                filter_builder = FilterBuilder(filter_type=FILTER_TYPE_AND)
+                filter_builder.filter(
+                    filter_type.get_filter(field_name, search, model_field, field)
+                )
+                querysets[
+                    f"{filter_type_name} '{search}'"
+                ] = filter_builder.apply_to_queryset(model.objects.all())
+            querysets[f"compat search '{search}'"] = model.objects.compat_search(
+                search, only_search_by_field_ids=[field.id]
+            )
+
+        durations = {}
+        for name, queryset in querysets.items():
+            runs = []
+            for _ in range(max(options["repeat"], 1)):
+                tick = time.perf_counter()
+                queryset.count()
+                list(queryset.order_by("order", "id")[:100])
+                runs.append(time.perf_counter() - tick)
+            durations[name] = statistics.median(runs)
+        return durations
@@ -1,7 +1,10 @@
 from django.core.management.base import BaseCommand
 from django.db import transaction
 
-from baserow.contrib.database.fields.tasks import run_periodic_fields_updates
+from baserow.contrib.database.fields.tasks import (
+    get_periodic_update_shards,
+    run_periodic_field_type_update_per_workspace,
+)
 
 
 class Command(BaseCommand):
@@ -23,6 +26,11 @@ class Command(BaseCommand):
 
     @transaction.atomic
     def handle(self, *args, **options):
-        run_periodic_fields_updates(
-            options["workspace_id"], not options["dont_update_now"]
-        )
+        # The workspaces are updated one after another in this process instead of
+        # being dispatched to the workers.
+        for field_type, workspace_id in get_periodic_update_shards(
+            options["workspace_id"]
+        ):
+            run_periodic_field_type_update_per_workspace(
+                field_type, workspace_id, not options["dont_update_now"]
+            )
@@ -0,0 +1,186 @@
+from django.db import migrations
+
+# Converts the row history table into a table which is range partitioned by month on
+# the `action_timestamp`, so that the entries older than the retention period can be
+# removed by dropping entire partitions. To avoid copying all the existing entries,
+# the existing table becomes the partition containing everything up to the end of
+# its last month, and is named after that month so that it's dropped once all of
+# its entries are expired. A partitioned table can't have an identity column, so the
+# `id` gets its default from a regular sequence, and the primary key must contain
+# the partition key, which is the only index of the existing table that must be
+# rebuilt. The installations created before Django 4.1 have a `serial` instead of an
+# identity `id`, of which the sequence is kept.
+partition_row_history_sql = """
+DO $$
+DECLARE
+    legacy_end timestamp;
+    legacy_name text;
+    next_id integer;
+    id_sequence text;
+    partition_start timestamp;
+BEGIN
+    SELECT
+        GREATEST(
+            date_trunc('month', now() AT TIME ZONE 'UTC'),
+            date_trunc('month', max(action_timestamp) AT TIME ZONE 'UTC')
+        ) + interval '1 month',
+        COALESCE(max(id), 0) + 1
+    INTO legacy_end, next_id
+    FROM database_rowhistory;
+    legacy_name := 'database_rowhistory_'
+        || to_char(legacy_end - interval '1 month', '"y"YYYY"m"MM');
+
+    IF EXISTS (
+        SELECT 1 FROM pg_attribute
+        WHERE attrelid = 'database_rowhistory'::regclass
+        AND attname = 'id'
+        AND attidentity != ''
+    ) THEN
+        ALTER TABLE database_rowhistory ALTER COLUMN id DROP IDENTITY;
+    ELSE
+        id_sequence := pg_get_serial_sequence('database_rowhistory', 'id');
+        ALTER TABLE database_rowhistory ALTER COLUMN id DROP DEFAULT;
+    END IF;
+    EXECUTE format('ALTER TABLE database_rowhistory RENAME TO %I', legacy_name);
+    EXECUTE format(
+        'ALTER TABLE %I DROP CONSTRAINT database_rowhistory_pkey, '
+        'ADD CONSTRAINT %I PRIMARY KEY (id, action_timestamp)',
+        legacy_name,
+        legacy_name || '_pkey'
+    );
+    EXECUTE format(
+        'ALTER INDEX database_rowhistory_table_id_8e564277 RENAME TO %I',
+        legacy_name || '_table_id_idx'
+    );
+    EXECUTE format(
+        'ALTER INDEX database_ro_table_i_5044cd_idx RENAME TO %I',
+        legacy_name || '_table_id_row_id_idx'
+    );
+
+    EXECUTE format(
+        'CREATE TABLE database_rowhistory (LIKE %I INCLUDING CONSTRAINTS) '
+        'PARTITION BY RANGE (action_timestamp)',
+        legacy_name
+    );
+    IF id_sequence IS NULL THEN
+        CREATE SEQUENCE database_rowhistory_id_seq AS integer;
+        PERFORM setval('database_rowhistory_id_seq', next_id, false);
+    ELSIF id_sequence::regclass::text != 'database_rowhistory_id_seq' THEN
+        EXECUTE format(
+            'ALTER SEQUENCE %s RENAME TO database_rowhistory_id_seq', id_sequence
+        );
+    END IF;
+    ALTER SEQUENCE database_rowhistory_id_seq OWNED BY database_rowhistory.id;
+    ALTER TABLE database_rowhistory ALTER COLUMN id
+        SET DEFAULT nextval('database_rowhistory_id_seq');
+    ALTER TABLE database_rowhistory
+        ADD CONSTRAINT database_rowhistory_pkey PRIMARY KEY (id, action_timestamp);
+    ALTER TABLE database_rowhistory
+        ADD CONSTRAINT database_rowhistory_table_id_8e564277_fk_database_table_id
+        FOREIGN KEY (table_id) REFERENCES database_table (id)
+        DEFERRABLE INITIALLY DEFERRED;
+    CREATE INDEX database_rowhistory_table_id_8e564277
+        ON database_rowhistory (table_id);
+    CREATE INDEX database_ro_table_i_5044cd_idx
+        ON database_rowhistory (table_id, row_id, action_timestamp DESC, id DESC);
+
+    EXECUTE format(
+        'ALTER TABLE database_rowhistory ATTACH PARTITION %I '
+        'FOR VALUES FROM (MINVALUE) TO (%L)',
+        legacy_name,
+        legacy_end AT TIME ZONE 'UTC'
+    );
+    CREATE TABLE database_rowhistory_default
+        PARTITION OF database_rowhistory DEFAULT;
+    FOR partition_start IN
+        SELECT generate_series(
+            legacy_end, legacy_end + interval '1 month', interval '1 month'
+        )
+    LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF database_rowhistory '
+            'FOR VALUES FROM (%L) TO (%L)',
+            'database_rowhistory_' || to_char(partition_start, '"y"YYYY"m"MM'),
+            partition_start AT TIME ZONE 'UTC',
+            (partition_start + interval '1 month') AT TIME ZONE 'UTC'
+        );
+    END LOOP;
+END $$;
+"""
+
+# Converts the partitioned table back into a regular table. The partition made from
+# the original table is detached and becomes the table again, so only the entries of
+# the other partitions are copied into it. If it has already been dropped because
+# all of its entries expired, an empty table is created instead, which also needs
+# the foreign key that the detached partition keeps. The `id` becomes an identity
+# column, like Django creates it.
+unpartition_row_history_sql = """
+DO $$
+DECLARE
+    legacy_name text;
+    next_id integer;
+BEGIN
+    SELECT COALESCE(max(id), 0) + 1 INTO next_id FROM database_rowhistory;
+    SELECT child.relname INTO legacy_name FROM pg_inherits
+    JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+    WHERE pg_inherits.inhparent = 'database_rowhistory'::regclass
+    AND pg_get_expr(child.relpartbound, child.oid) LIKE 'FOR VALUES FROM (MINVALUE)%';
+
+    IF legacy_name IS NULL THEN
+        legacy_name := 'database_rowhistory_legacy';
+        EXECUTE format(
+            'CREATE TABLE %I (LIKE database_rowhistory INCLUDING CONSTRAINTS)',
+            legacy_name
+        );
+        EXECUTE format(
+            'ALTER TABLE %I ADD CONSTRAINT '
+            'database_rowhistory_table_id_8e564277_fk_database_table_id '
+            'FOREIGN KEY (table_id) REFERENCES database_table (id) '
+            'DEFERRABLE INITIALLY DEFERRED',
+            legacy_name
+        );
+    ELSE
+        EXECUTE format(
+            'ALTER TABLE database_rowhistory DETACH PARTITION %I', legacy_name
+        );
+        EXECUTE format(
+            'ALTER TABLE %I DROP CONSTRAINT %I',
+            legacy_name,
+            legacy_name || '_pkey'
+        );
+        EXECUTE format('DROP INDEX IF EXISTS %I', legacy_name || '_table_id_idx');
+        EXECUTE format(
+            'DROP INDEX IF EXISTS %I', legacy_name || '_table_id_row_id_idx'
+        );
+    END IF;
+    EXECUTE format(
+        'INSERT INTO %I SELECT * FROM database_rowhistory', legacy_name
+    );
+    DROP TABLE database_rowhistory;
+    EXECUTE format('ALTER TABLE %I RENAME TO database_rowhistory', legacy_name);
+
+    ALTER TABLE database_rowhistory
+        ADD CONSTRAINT database_rowhistory_pkey PRIMARY KEY (id);
+    ALTER TABLE database_rowhistory ALTER COLUMN id
+        ADD GENERATED BY DEFAULT AS IDENTITY;
+    PERFORM setval(
+        pg_get_serial_sequence('database_rowhistory', 'id'), next_id, false
+    );
+    CREATE INDEX database_rowhistory_table_id_8e564277
+        ON database_rowhistory (table_id);
+    CREATE INDEX database_ro_table_i_5044cd_idx
+        ON database_rowhistory (table_id, row_id, action_timestamp DESC, id DESC);
+END $$;
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0159_linkrowfield_link_row_limit_selection_view"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            partition_row_history_sql, reverse_sql=unpartition_row_history_sql
+        ),
+    ]
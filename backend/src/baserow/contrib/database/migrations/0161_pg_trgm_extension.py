@@ -0,0 +1,30 @@
+from django.db import migrations
+
+# The pg_trgm extension is needed by the trigram indexes of fields filtered with a
+# contains filter. It's a trusted extension, so the owner of the database can create
+# it, but if that's not possible the migration must not fail, the trigram indexes are
+# then just not created.
+create_pg_trgm_extension_sql = r"""
+DO $$
+BEGIN
+    CREATE EXTENSION IF NOT EXISTS pg_trgm;
+EXCEPTION WHEN OTHERS THEN
+    RAISE WARNING 'The pg_trgm extension could not be created: %', SQLERRM;
+END
+$$;
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0160_partition_row_history"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            create_pg_trgm_extension_sql,
+            # The extension is not dropped because trigram indexes created in the
+            # meantime depend on it.
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -1,7 +1,7 @@
 import dataclasses
 from copy import deepcopy
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple, Type
+from typing import Any, Collection, Dict, List, Optional, Tuple, Type
 
 from django.contrib.auth.models import AbstractUser
 from django.utils.translation import gettext_lazy as _
@@ -10,12 +10,14 @@ from baserow.contrib.database.action.scopes import (
     TABLE_ACTION_CONTEXT,
     TableActionScopeType,
 )
+from baserow.contrib.database.rows.error_report import RowErrorReport
 from baserow.contrib.database.rows.handler import (
     GeneratedTableModelForUpdate,
     RowHandler,
 )
 from baserow.contrib.database.table.handler import TableHandler
 from baserow.contrib.database.table.models import GeneratedTableModel, Table
+from baserow.contrib.database.table.signals import table_updated
 from baserow.core.action.models import Action
 from baserow.core.action.registries import (
     ActionScopeStr,
@@ -218,9 +220,9 @@ class ImportRowsActionType(UndoableActionType):
         cls,
         user: AbstractUser,
         table: Table,
-        data=List[List[Any]],
+        data: Collection[List[Any]],
         progress: Optional[Progress] = None,
-    ) -> Tuple[List[GeneratedTableModel], Dict[str, Any]]:
+    ) -> Tuple[List[int], Dict[str, Any]]:
         """
         Creates rows for a given table with the provided values if the user
         belongs to the related workspace. It also calls the table_updated signal.
@@ -233,13 +235,26 @@ class ImportRowsActionType(UndoableActionType):
 
         :param user: The user of whose behalf the rows are created.
         :param table: The table for which the rows should be imported.
-        :param data: List of rows values for rows that need to be created.
+        :param data: List, or any sized iterable, of rows values for rows that need
+            to be created.
         :param progress: An optional progress object to track the task progress.
-        :return: The created list of rows instances and the error report.
+        :return: The ids of the created rows and the error report.
         """
 
-        created_rows, error_report = RowHandler().import_rows(
-            user, table, data, progress=progress
+        row_handler = RowHandler()
+        error_report = RowErrorReport()
+        # Only the ids of the created rows are kept, so that the memory usage
+        # doesn't depend on the amount of imported rows.
+        created_row_ids = []
+        for created_rows in row_handler.import_rows_in_batches(
+            user, table, data, error_report, progress=progress
+        ):
+            created_row_ids += [row.id for row in created_rows]
+
+        # Just send a single table_updated here as realtime update instead of
+        # rows_created because we might import a lot of rows.
+        table_updated.send(
+            row_handler, table=table, user=user, force_table_refresh=True
         )
 
         workspace = table.database.workspace
@@ -248,13 +263,13 @@ class ImportRowsActionType(UndoableActionType):
             table.name,
             table.database.id,
             table.database.name,
-            [row.id for row in created_rows],
+            created_row_ids,
         )
         cls.register_action(
             user, params, scope=cls.scope(table.id), workspace=workspace
         )
 
-        return created_rows, error_report
+        return created_row_ids, error_report.to_dict()
 
     @classmethod
     def scope(cls, table_id) -> ActionScopeStr:
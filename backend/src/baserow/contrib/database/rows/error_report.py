@@ -10,24 +10,29 @@ RowIndex = TypeVar("RowIndex", bound=int)
 class RowErrorReport:
     def __init__(
         self,
-        rows: List[Dict[str, Any]],
         error_limit: int = settings.BASEROW_MAX_ROW_REPORT_ERROR_COUNT,
     ):
         """
         The RowErrorReport is a helper to track rows errors and generate a report at
-        the end.
+        the end. The rows are imported batch by batch, and only the rows of the
+        current batch are kept, so that the memory usage doesn't depend on the total
+        amount of imported rows.
 
-        :param rows: the rows list.
         :param error_limit: if the error limit is exceeded, an exception is raised.
         """
 
-        self._indexed_rows = {
-            index: {"row": row, "error": None} for index, row in enumerate(rows)
-        }
-        self._rows = rows
+        self._errors: Dict[RowIndex, Dict[str, Any]] = {}
+        self._batch_rows: Dict[RowIndex, Dict[str, Any]] = {}
         self.error_count = 0
         self.error_limit = error_limit
 
+    def start_batch(self):
+        """
+        Forgets the rows of the previous batch. The errors are kept.
+        """
+
+        self._batch_rows = {}
+
     def add_error(self, row_index: RowIndex, error: Dict[str, Any]):
         """
         Adds an error to the report if the error is truthy.
@@ -42,25 +47,25 @@ class RowErrorReport:
         if self.error_count > self.error_limit:
             raise ReportMaxErrorCountExceeded(self.to_dict())
 
-        self._indexed_rows[row_index]["error"] = error
+        self._errors[row_index] = error
 
     def update_row(self, row_index: RowIndex, new_row: Dict[str, Any]):
-        self._indexed_rows[row_index]["row"] = new_row
+        self._batch_rows[row_index] = new_row
 
     def get_valid_rows_and_mapping(
         self,
     ) -> Tuple[List[Dict[str, Any]], Dict[RowIndex, RowIndex]]:
         """
-        Returns rows without error and the corresponding mapping for
-        new original -> original index
+        Returns the rows of the current batch without error and the corresponding
+        mapping for new index -> original index
         """
 
         valid_rows = []
         mapping = {}
-        for index, _ in enumerate(self._rows):
-            if not self._indexed_rows[index]["error"]:
+        for index in sorted(self._batch_rows.keys()):
+            if index not in self._errors:
                 mapping[len(valid_rows)] = index
-                valid_rows.append(self._indexed_rows[index]["row"])
+                valid_rows.append(self._batch_rows[index])
         return valid_rows, mapping
 
     def to_dict(self) -> Dict[RowIndex, Dict[str, Any]]:
@@ -68,8 +73,4 @@ class RowErrorReport:
         Generates the report as a dict.
         """
 
-        report = {}
-        for index, _ in enumerate(self._rows):
-            if self._indexed_rows[index]["error"]:
-                report[index] = self._indexed_rows[index]["error"]
-        return report
+        return {index: self._errors[index] for index in sorted(self._errors.keys())}
@@ -4,7 +4,9 @@ from decimal import Decimal
 from typing import (
     TYPE_CHECKING,
     Any,
+    Collection,
     Dict,
+    Generator,
     Iterable,
     List,
     NamedTuple,
@@ -17,6 +19,7 @@ from typing import (
     cast,
 )
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import ValidationError
 from django.db import connection, transaction
@@ -43,6 +46,7 @@ from baserow.contrib.database.table.operations import (
 from baserow.contrib.database.table.signals import table_updated
 from baserow.contrib.database.trash.models import TrashedRows
 from baserow.core.db import (
+    bulk_create_with_copy,
     get_highest_order_of_queryset,
     get_unique_orders_before_item,
     recalculate_full_orders,
@@ -1058,6 +1062,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         send_webhook_events: bool = True,
         generate_error_report: bool = False,
         skip_search_update: bool = False,
+        insert_with_copy: bool = False,
     ) -> List[GeneratedTableModel]:
         """
         Creates new rows for a given table if the user
@@ -1076,6 +1081,9 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         :param skip_search_update: If you want to to instead
             trigger the search handler cells update later on after many create_rows
             calls then set this to True but make sure you trigger it eventually.
+        :param insert_with_copy: If True, the rows are inserted with PostgreSQL's
+            `COPY` instead of an `INSERT` query, which is faster for many rows. Only
+            allowed if `can_insert_rows_with_copy` returns True for the model.
         :return: The created row instances.
         """
 
@@ -1130,9 +1138,11 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             # saved.
             instance._m2m_values = relations
 
-        inserted_rows = model.objects.bulk_create(
-            [row for (row, _) in rows_relationships]
-        )
+        instances = [row for (row, _) in rows_relationships]
+        if insert_with_copy:
+            inserted_rows = bulk_create_with_copy(model, instances)
+        else:
+            inserted_rows = model.objects.bulk_create(instances)
         rows_created_counter.add(len(rows_relationships))
 
         many_to_many = defaultdict(list)
@@ -1286,6 +1296,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         table: Table,
         rows: List[Dict[str, Any]],
         progress: Optional[Progress] = None,
+        model: Optional[Type[GeneratedTableModel]] = None,
     ) -> Dict[str, Dict[str, Any]]:
         """
         Validates rows by batch and generates an error report.
@@ -1294,6 +1305,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         :param table: The table for which the rows should be created.
         :param rows: List of rows values for rows that need to be created.
         :param progress: Give a progress instance to track the progress of the import.
+        :param model: Optional model to prevent recomputing table model.
         :return: The error report.
         """
 
@@ -1309,7 +1321,8 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         if progress:
             progress.increment(state=ROW_IMPORT_VALIDATION)
 
-        model = table.get_model()
+        if model is None:
+            model = table.get_model()
         # Use serializer to validate incoming data
         validation_serializer = get_row_serializer_class(model)
         report = {}
@@ -1326,93 +1339,90 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         return report
 
-    def create_rows_by_batch(
+    def import_rows(
         self,
         user: AbstractUser,
         table: Table,
-        rows: List[Dict[str, Any]],
+        data: Collection[List[Any]],
+        validate: bool = True,
         progress: Optional[Progress] = None,
-        model: Optional[Type[GeneratedTableModel]] = None,
+        send_realtime_update: bool = True,
     ) -> Tuple[List[GeneratedTableModel], Dict[str, Dict[str, Any]]]:
         """
-        Creates rows by batch and generates an error report instead of failing on first
-        error.
+        Creates new rows for a given table if the user belongs to the related
+        workspace. It also calls the rows_created passing the
+        send_realtime_update parameter. The data are validated before the
+        creation if validate is True. when a row fails to import, it doesn't
+        stop the import. Instead an error report is created with the raised
+        error for each field of each failing rows.
 
         :param user: The user of whose behalf the rows are created.
         :param table: The table for which the rows should be created.
-        :param rows: List of rows values for rows that need to be created.
-        :param progress: Give a progress instance to track the progress of the import.
-        :param model: Optional model to prevent recomputing table model.
-        :return: The created rows and the error report.
-        """
-
-        if not rows:
-            return [], {}
-
-        if progress:
-            progress.increment(state=ROW_IMPORT_CREATION)
+        :param data: List of rows values for rows that need to be created.
+        :param validate: If True the data are validated before the import.
+        :param progress: Give a progress instance to track the progress of the
+            import.
+        :param send_realtime_update: The parameter passed to the rows_created
+            signal indicating if a realtime update should be send.
 
-        if model is None:
-            model = table.get_model()
+        :return: The created row instances and the error report.
+        """
 
-        report = {}
-        all_created_rows = []
-        for count, chunk in enumerate(grouper(BATCH_SIZE, rows)):
-            row_start_index = count * BATCH_SIZE
-            created_rows, creation_report = self.create_rows(
-                user=user,
-                table=table,
-                model=model,
-                rows_values=chunk,
-                generate_error_report=True,
-                send_realtime_update=False,
-                send_webhook_events=False,
-                # Don't trigger loads of search updates for every batch of rows we
-                # create but instead a single one for this entire table at the end.
-                skip_search_update=True,
-            )
+        error_report = RowErrorReport()
+        created_rows = []
+        for batch_created_rows in self.import_rows_in_batches(
+            user, table, data, error_report, validate=validate, progress=progress
+        ):
+            created_rows += batch_created_rows
 
-            for valid_index, field_errors in creation_report.items():
-                report[int(valid_index) + row_start_index] = prepare_field_errors(
-                    field_errors
-                )
+        if send_realtime_update:
+            # Just send a single table_updated here as realtime update instead
+            # of rows_created because we might import a lot of rows.
+            table_updated.send(self, table=table, user=user, force_table_refresh=True)
 
-            if progress:
-                progress.increment(len(chunk))
+        return created_rows, error_report.to_dict()
 
-            all_created_rows += created_rows
+    def can_insert_rows_with_copy(self, model: Type[GeneratedTableModel]) -> bool:
+        """
+        Checks if the rows of the model can be inserted with PostgreSQL's `COPY`,
+        which is only the case if every field stores a plain value in its own
+        column. Values of formulas are computed by the insert query and many to many
+        relations are stored in other tables, so they're not supported.
 
-        SearchHandler.field_value_updated_or_created(table)
+        :param model: The generated model of the table.
+        :return: True if `create_rows` can be called with `insert_with_copy`.
+        """
 
-        return all_created_rows, report
+        return all(
+            field_object["type"].can_be_inserted_with_copy
+            for field_object in model._field_objects.values()
+        )
 
-    def import_rows(
+    def import_rows_in_batches(
         self,
         user: AbstractUser,
         table: Table,
-        data: List[List[Any]],
+        data: Collection[List[Any]],
+        error_report: RowErrorReport,
         validate: bool = True,
         progress: Optional[Progress] = None,
-        send_realtime_update: bool = True,
-    ) -> Tuple[List[GeneratedTableModel], Dict[str, Dict[str, Any]]]:
+    ) -> Generator[List[GeneratedTableModel], None, None]:
         """
-        Creates new rows for a given table if the user belongs to the related
-        workspace. It also calls the rows_created passing the
-        send_realtime_update parameter. The data are validated before the
-        creation if validate is True. when a row fails to import, it doesn't
-        stop the import. Instead an error report is created with the raised
-        error for each field of each failing rows.
+        Imports the rows batch by batch: every batch of `BATCH_SIZE` rows is
+        reshaped, validated and created before the next one is read from `data`. The
+        data can therefore be any sized iterable streaming the rows, like a file,
+        and the memory usage stays proportional to the batch size as long as the
+        caller doesn't keep the yielded rows.
 
         :param user: The user of whose behalf the rows are created.
         :param table: The table for which the rows should be created.
-        :param data: List of rows values for rows that need to be created.
+        :param data: The sized iterable of the rows values that need to be created.
+        :param error_report: The report the errors of the failing rows are added
+            to.
         :param validate: If True the data are validated before the import.
         :param progress: Give a progress instance to track the progress of the
             import.
-        :param send_realtime_update: The parameter passed to the rows_created
-            signal indicating if a realtime update should be send.
-
-        :return: The created row instances and the error report.
+        :return: A generator yielding the created row instances of every batch.
         """
 
         workspace = table.database.workspace
@@ -1423,8 +1433,6 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             context=table,
         )
 
-        error_report = RowErrorReport(data)
-
         model = table.get_model()
 
         fields = [
@@ -1436,74 +1444,96 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         # Sort by order then by id
         fields.sort(key=lambda f: (f.order, f.id))
 
-        for index, row in enumerate(data):
-            # Check row length
-            if len(row) > len(fields):
-                error_report.add_error(
-                    index,
-                    {"non_field_errors": ["Too many values in this line."]},
-                )
-            else:
-                new_row = list(row)
-                # Fill incomplete rows with empty values
-                new_row.extend([None] * (len(fields) - len(row)))
-
-                # Reshape data by field as expected by the import
-                error_report.update_row(
-                    index,
-                    {
-                        f"field_{fields[index].id}": value
-                        for index, value in enumerate(new_row)
-                    },
-                )
+        insert_with_copy = (
+            settings.BASEROW_IMPORT_ROWS_WITH_COPY
+            and self.can_insert_rows_with_copy(model)
+        )
+
+        validation_sub_progress = (
+            progress.create_child(50, len(data)) if progress and validate else None
+        )
+        creation_sub_progress = (
+            progress.create_child(50 if validate else 100, len(data))
+            if progress
+            else None
+        )
+
+        for batch_index, batch in enumerate(grouper(BATCH_SIZE, data)):
+            error_report.start_batch()
+            for index, row in enumerate(batch, start=batch_index * BATCH_SIZE):
+                # Check row length
+                if len(row) > len(fields):
+                    error_report.add_error(
+                        index,
+                        {"non_field_errors": ["Too many values in this line."]},
+                    )
+                else:
+                    new_row = list(row)
+                    # Fill incomplete rows with empty values
+                    new_row.extend([None] * (len(fields) - len(row)))
+
+                    # Reshape data by field as expected by the import
+                    error_report.update_row(
+                        index,
+                        {
+                            f"field_{field.id}": value
+                            for field, value in zip(fields, new_row)
+                        },
+                    )
+
+            # STEP 1: pre-validate data with serializer
+            if validate:
+                (
+                    valid_rows,
+                    original_row_index_mapping,
+                ) = error_report.get_valid_rows_and_mapping()
+                validation_report = self.validate_rows(table, valid_rows, model=model)
+                for index, error in validation_report.items():
+                    error_report.add_error(
+                        original_row_index_mapping[int(index)], error
+                    )
+
+                if validation_sub_progress:
+                    validation_sub_progress.increment(
+                        len(batch), state=ROW_IMPORT_VALIDATION
+                    )
 
-        # STEP 1: pre-validate data with serializer
-        if validate:
             (
                 valid_rows,
                 original_row_index_mapping,
             ) = error_report.get_valid_rows_and_mapping()
 
-            validation_sub_progress = (
-                progress.create_child(50, len(valid_rows)) if progress else None
-            )
-
-            validation_report = self.validate_rows(
-                table, valid_rows, progress=validation_sub_progress
-            )
-
-            for index, error in validation_report.items():
-                error_report.add_error(original_row_index_mapping[int(index)], error)
-
-        (
-            valid_rows,
-            original_row_index_mapping,
-        ) = error_report.get_valid_rows_and_mapping()
-
-        # STEP 2: create rows in DB
-        creation_sub_progress = (
-            progress.create_child(50 if validate else 100, len(valid_rows))
-            if progress
-            else None
-        )
+            # STEP 2: create rows in DB
+            created_rows, creation_report = [], {}
+            if valid_rows:
+                created_rows, creation_report = self.create_rows(
+                    user=user,
+                    table=table,
+                    model=model,
+                    rows_values=valid_rows,
+                    generate_error_report=True,
+                    send_realtime_update=False,
+                    send_webhook_events=False,
+                    # Don't trigger loads of search updates for every batch of rows
+                    # we create but instead a single one for this entire table at
+                    # the end.
+                    skip_search_update=True,
+                    insert_with_copy=insert_with_copy,
+                )
 
-        created_rows, creation_report = self.create_rows_by_batch(
-            user, table, valid_rows, progress=creation_sub_progress, model=model
-        )
+            # Add errors to global report
+            for index, field_errors in creation_report.items():
+                error_report.add_error(
+                    original_row_index_mapping[int(index)],
+                    prepare_field_errors(field_errors),
+                )
 
-        # Add errors to global report
-        for index, error in creation_report.items():
-            error_report.add_error(
-                original_row_index_mapping[int(index)],
-                error,
-            )
+            if creation_sub_progress:
+                creation_sub_progress.increment(len(batch), state=ROW_IMPORT_CREATION)
 
-        if send_realtime_update:
-            # Just send a single table_updated here as realtime update instead
-            # of rows_created because we might import a lot of rows.
-            table_updated.send(self, table=table, user=user, force_table_refresh=True)
+            yield created_rows
 
-        return created_rows, error_report.to_dict()
+        SearchHandler.field_value_updated_or_created(table)
 
     def get_fields_metadata_for_row_history(
         self,
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, Dict, List, NamedTuple, NewType, Optional
+from typing import Any, Dict, List, NamedTuple, NewType, Optional, Tuple
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractBaseUser
@@ -14,6 +14,10 @@ from baserow.contrib.database.rows.models import RowHistory
 from baserow.contrib.database.rows.registries import change_row_history_registry
 from baserow.contrib.database.rows.signals import rows_history_updated
 from baserow.core.action.signals import ActionCommandType, action_done
+from baserow.core.db import (
+    create_upcoming_monthly_partitions,
+    drop_monthly_partitions_before,
+)
 from baserow.core.models import Workspace
 from baserow.core.telemetry.utils import baserow_trace
 
@@ -107,6 +111,36 @@ class RowHistoryHandler:
         }
         return RowChangeDiff(list(changed_fields), before_fields, after_fields)
 
+    @classmethod
+    def _compact_list_values(
+        cls, diff: RowChangeDiff, fields_metadata: Dict[FieldName, Any]
+    ):
+        """
+        Replaces, in place, the before and after values of the list values with more
+        items than `BASEROW_ROW_HISTORY_COMPACT_LIST_VALUES_THRESHOLD` by the removed
+        and added items only.
+        """
+
+        threshold = settings.BASEROW_ROW_HISTORY_COMPACT_LIST_VALUES_THRESHOLD
+        for field_name in diff.changed_field_names:
+            before_value = diff.before_values[field_name]
+            after_value = diff.after_values[field_name]
+            if (
+                not isinstance(before_value, list)
+                or not isinstance(after_value, list)
+                or len(before_value) + len(after_value) <= threshold
+            ):
+                continue
+
+            field_type = field_type_registry.get(fields_metadata[field_name]["type"])
+            (
+                diff.before_values[field_name],
+                diff.after_values[field_name],
+                fields_metadata[field_name],
+            ) = field_type.compact_row_history_values(
+                before_value, after_value, fields_metadata[field_name]
+            )
+
     @classmethod
     def _raise_if_ids_mismatch(cls, before_values, after_values, fields_metadata):
         if (
@@ -154,6 +188,8 @@ class RowHistoryHandler:
                 for k, v in fields_metadata.items()
                 if k in diff.changed_field_names
             }
+            if settings.BASEROW_ROW_HISTORY_COMPACT_LIST_VALUES_THRESHOLD:
+                cls._compact_list_values(diff, changed_fields_metadata)
             row_id = after["id"]
             entry = cls._construct_entry_from_action_and_diff(
                 user,
@@ -198,14 +234,65 @@ class RowHistoryHandler:
 
         return queryset
 
+    @classmethod
+    def get_row_history_page(
+        cls, page_keys: List[Tuple[int, datetime]]
+    ) -> List[RowHistory]:
+        """
+        Fetches the row history entries of a page of the timeline of a row. The
+        timeline is paginated on the `id` and the `action_timestamp` only, which are
+        both part of the index of the timeline, so that the entries can be counted
+        and skipped with an index only scan, and only the entries of the page are
+        read from the table.
+
+        :param page_keys: The ids and action timestamps of the entries of the page,
+            like returned by `list_row_history(...).values_list("id",
+            "action_timestamp")`.
+        :return: The entries of the page, in the same order.
+        """
+
+        if not page_keys:
+            return []
+
+        timestamps = [action_timestamp for _, action_timestamp in page_keys]
+        # Filtering on the timestamps as well makes sure that only the partitions
+        # of the months of the page are searched.
+        entries_by_id = RowHistory.objects.filter(
+            id__in=[entry_id for entry_id, _ in page_keys],
+            action_timestamp__gte=min(timestamps),
+            action_timestamp__lte=max(timestamps),
+        ).in_bulk()
+        return [
+            entries_by_id[entry_id]
+            for entry_id, _ in page_keys
+            if entry_id in entries_by_id
+        ]
+
+    @classmethod
+    def create_upcoming_partitions(cls, months_ahead: int = 2):
+        """
+        Makes sure that the partitions of the row history table exist for the
+        current month and the given number of months after it.
+
+        :param months_ahead: The number of months after the current one for which
+            the partitions must be created.
+        """
+
+        create_upcoming_monthly_partitions(
+            RowHistory._meta.db_table, "action_timestamp", months_ahead
+        )
+
     @classmethod
     def delete_entries_older_than(cls, cutoff: datetime):
         """
         Deletes all row history entries that are older than the given cutoff date.
+        The monthly partitions which only contain older entries are dropped at once,
+        so only the remaining entries have to be deleted.
 
         :param cutoff: The date and time before which all entries will be deleted.
         """
 
+        drop_monthly_partitions_before(RowHistory._meta.db_table, cutoff)
         delete_qs = RowHistory.objects.filter(action_timestamp__lt=cutoff)
         delete_qs._raw_delete(delete_qs.db)
 
@@ -9,7 +9,8 @@ from baserow.config.celery import app
 @app.task(bind=True, queue="export")
 def clean_up_row_history_entries(self):
     """
-    Execute job cleanup for row history entries.
+    Execute job cleanup for row history entries, and creates the partitions of the
+    upcoming months.
     """
 
     from .history import RowHistoryHandler
@@ -18,6 +19,7 @@ def clean_up_row_history_entries(self):
 
     cutoff_datetime = datetime.combine(timezone.now() - older_than_days, time.min)
     RowHistoryHandler.delete_entries_older_than(cutoff_datetime)
+    RowHistoryHandler.create_upcoming_partitions()
 
 
 @app.on_after_finalize.connect
@@ -1,4 +1,5 @@
 import math
+import time
 import traceback
 from enum import Enum
 from typing import TYPE_CHECKING, List, NamedTuple, Optional, Type
@@ -12,7 +13,7 @@ from django.db.models import Expression, Func, Q, QuerySet, TextField, Value
 from django.utils.encoding import force_str
 
 from loguru import logger
-from opentelemetry import trace
+from opentelemetry import metrics, trace
 from psycopg2 import sql
 from redis.exceptions import LockNotOwnedError
 
@@ -39,6 +40,28 @@ if TYPE_CHECKING:
     from baserow.contrib.database.table.models import GeneratedTableModel, Table
 
 tracer = trace.get_tracer(__name__)
+meter = metrics.get_meter(__name__)
+
+tsvector_update_tables_pending = meter.create_up_down_counter(
+    "baserow.search.tsvector_update.tables_pending",
+    unit="1",
+    description="The number of tables waiting for a debounced tsvector update.",
+)
+tsvector_update_coalesced_changes = meter.create_histogram(
+    "baserow.search.tsvector_update.coalesced_changes",
+    unit="1",
+    description="The number of row changes covered by a single tsvector update.",
+)
+tsvector_update_lag = meter.create_histogram(
+    "baserow.search.tsvector_update.lag",
+    unit="s",
+    description="The time between the first change of a row and the update of its "
+    "tsvectors.",
+)
+
+# How long after the debounce window another update of the table can be scheduled if
+# the scheduled one never ran.
+DEBOUNCED_UPDATE_SCHEDULED_KEY_GRACE_SECONDS = 60
 
 
 class SearchModes(str, Enum):
@@ -770,6 +793,16 @@ class SearchHandler(
                 enqueue_task_on_commit_swallowing_any_exceptions,
             )
 
+            if (
+                update_tsvs_for_changed_rows_only
+                and settings.TSV_UPDATE_DEBOUNCE_SECONDS > 0
+            ):
+                table_id = table.id
+                enqueue_task_on_commit_swallowing_any_exceptions(
+                    lambda: cls.schedule_debounced_tsvector_update(table_id)
+                )
+                return
+
             searchable_updated_fields_ids = (
                 [field.id for field in updated_fields]
                 if updated_fields is not None
@@ -784,6 +817,97 @@ class SearchHandler(
                 )
             )
 
+    @classmethod
+    def get_debounced_update_scheduled_key(cls, table_id: int) -> str:
+        return f"tsvector_update_scheduled_{table_id}"
+
+    @classmethod
+    def get_debounced_update_changes_key(cls, table_id: int) -> str:
+        return f"tsvector_update_changes_{table_id}"
+
+    @classmethod
+    def schedule_debounced_tsvector_update(cls, table_id: int):
+        """
+        Schedules an update of the tsvectors of the rows of the table which need a
+        background update, unless one is already scheduled. Because the rows that must
+        be updated are flagged with `needs_background_update`, the scheduled update
+        covers all the rows that changed until it runs in a single batched UPDATE.
+        This means that every table is updated at most once per
+        `TSV_UPDATE_DEBOUNCE_SECONDS`, no matter how many changes are made.
+
+        :param table_id: The id of the table which rows have changed.
+        """
+
+        from baserow.contrib.database.search.tasks import (
+            flush_debounced_tsvector_update,
+        )
+
+        debounce_seconds = settings.TSV_UPDATE_DEBOUNCE_SECONDS
+        # The keys expire in case the task never runs, so that they don't stay in the
+        # cache forever and a new update can be scheduled.
+        keys_timeout = debounce_seconds + DEBOUNCED_UPDATE_SCHEDULED_KEY_GRACE_SECONDS
+        changes_key = cls.get_debounced_update_changes_key(table_id)
+        if not cache.add(changes_key, 1, timeout=keys_timeout):
+            try:
+                cache.incr(changes_key)
+            except ValueError:
+                # The key was deleted by a flush in the meantime.
+                cache.add(changes_key, 1, timeout=keys_timeout)
+
+        # The value is the time when the first change was buffered, so that the lag
+        # can be measured when the update runs.
+        if cache.add(
+            cls.get_debounced_update_scheduled_key(table_id),
+            time.time(),
+            timeout=keys_timeout,
+        ):
+            tsvector_update_tables_pending.add(1)
+            flush_debounced_tsvector_update.apply_async(
+                (table_id,), countdown=debounce_seconds
+            )
+
+    @classmethod
+    def flush_debounced_tsvector_update(cls, table: "Table"):
+        """
+        Updates the tsvectors of all the rows of the table which changed since the
+        last update. Called by the task that `schedule_debounced_tsvector_update`
+        schedules.
+
+        All the tsvector columns of the changed rows are updated, because the
+        `needs_background_update` flag, which is cleared by the update, doesn't
+        tell which fields of the row changed.
+
+        :param table: The table which tsvectors must be updated.
+        """
+
+        # Clearing the scheduled update before the update makes sure that changes
+        # made while the rows are being updated schedule a new update.
+        cls.clear_debounced_tsvector_update(table.id)
+        cls.update_tsvector_columns_locked(
+            table, update_tsvectors_for_changed_rows_only=True
+        )
+
+    @classmethod
+    def clear_debounced_tsvector_update(cls, table_id: int):
+        """
+        Removes the scheduled debounced update of the table and records its metrics.
+        Must be called once by the task that `schedule_debounced_tsvector_update`
+        schedules, also if the table doesn't exist anymore.
+
+        :param table_id: The id of the table which scheduled update must be cleared.
+        """
+
+        scheduled_key = cls.get_debounced_update_scheduled_key(table_id)
+        changes_key = cls.get_debounced_update_changes_key(table_id)
+        scheduled_at = cache.get(scheduled_key)
+        changes = cache.get(changes_key) or 0
+
+        cache.delete_many([scheduled_key, changes_key])
+        tsvector_update_tables_pending.add(-1)
+        tsvector_update_coalesced_changes.record(changes)
+        if scheduled_at is not None:
+            tsvector_update_lag.record(time.time() - scheduled_at)
+
     @classmethod
     def _search_error_handler(cls, e):
         if settings.TESTS:
@@ -40,3 +40,33 @@ def async_update_tsvector_columns(
         )
     except PostgresFullTextSearchDisabledException:
         logger.debug(f"Postgres full-text search is disabled.")
+
+
+@app.task(
+    queue="export",
+    time_limit=settings.CELERY_SEARCH_UPDATE_HARD_TIME_LIMIT,
+)
+def flush_debounced_tsvector_update(table_id: int):
+    """
+    Updates the `tsvector` columns of all the rows of the table which changed since
+    the debounced update was scheduled by
+    `SearchHandler.schedule_debounced_tsvector_update`.
+
+    :param table_id: The ID of the table we'd like to update the tsvectors for.
+    """
+
+    from baserow.contrib.database.search.handler import SearchHandler
+    from baserow.contrib.database.table.exceptions import TableDoesNotExist
+    from baserow.contrib.database.table.handler import TableHandler
+
+    try:
+        table = TableHandler().get_table(table_id)
+    except TableDoesNotExist:
+        logger.debug(f"Table {table_id} was deleted before its tsvectors were updated.")
+        SearchHandler.clear_debounced_tsvector_update(table_id)
+        return
+
+    try:
+        SearchHandler.flush_debounced_tsvector_update(table)
+    except PostgresFullTextSearchDisabledException:
+        logger.debug(f"Postgres full-text search is disabled.")
@@ -1,5 +1,5 @@
 import dataclasses
-from typing import Any, List, Optional
+from typing import Any, Collection, List, Optional
 
 from django.contrib.auth.models import AbstractUser
 from django.utils.translation import gettext_lazy as _
@@ -45,7 +45,7 @@ class CreateTableActionType(UndoableActionType):
         user: AbstractUser,
         database: Database,
         name: str,
-        data: Optional[List[List[Any]]] = None,
+        data: Optional[Collection[List[Any]]] = None,
         first_row_header: bool = True,
         progress: Optional[Progress] = None,
     ) -> Table:
@@ -56,8 +56,9 @@ class CreateTableActionType(UndoableActionType):
         :param user: The user on whose behalf the table is created.
         :param database: The database that the table instance belongs to.
         :param name: The name of the table is created.
-        :param data: A list containing all the rows that need to be inserted is
-            expected. All the values will be inserted in the database.
+        :param data: A list, or any sized iterable which can be iterated multiple
+            times, containing all the rows that need to be inserted is expected. All
+            the values will be inserted in the database.
         :param first_row_header: Indicates if the first row are the fields. The names
             of these rows are going to be used as fields. If `fields` is provided,
             this options is ignored.
@@ -12,22 +12,47 @@ When we construct a model we:
 3. Check if the version in the cache matches the latest table version in the db.
 4. If they differ, re-query for all the fields and save them in the cache.
 5. If they are the same use the cached field attrs.
+
+In front of the Redis backed cache every worker process also keeps a size bounded
+in-memory LRU of fully generated model classes. An entry is only used if the
+versions of the table and all the tables related to it via link row fields are still
+the same as when the model was generated. This means that a single query is enough
+to reuse a model instead of rebuilding it from the cached field attrs. Every caller
+gets a checked out proxy subclass of the cached model, holding its own table instance
+and copies of the field instances, so that nothing it caches on them while handling a
+request is shared with the other callers.
+
+Finally, a data version is kept per table in the default cache. It changes every
+time the rows, fields or views of the table change, so that values computed from the
+data of the table can be cached until the table changes.
 """
+import copy
+import threading
 import typing
 import uuid
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional, Tuple, Type
 
 from django.conf import settings
 from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured
 
+from opentelemetry import metrics
+
+from baserow.core.cache import get_cache_version, increment_cache_version
 from baserow.version import VERSION as BASEROW_VERSION
 
 if typing.TYPE_CHECKING:
-    from baserow.contrib.database.table.models import Table
+    from baserow.contrib.database.table.models import GeneratedTableModel, Table
 
 generated_models_cache = caches[settings.GENERATED_MODEL_CACHE_NAME]
 
+# The attributes of a generated model containing the field instances of the table.
+GENERATED_MODEL_FIELD_OBJECTS_ATTRIBUTES = ("_field_objects", "_trashed_field_objects")
+
+meter = metrics.get_meter(__name__)
+
 
 def table_model_cache_entry_key(table_id: int) -> str:
     return f"full_table_model_{table_id}_{BASEROW_VERSION}"
@@ -52,8 +77,269 @@ def set_cached_model_field_attrs(table: "Table", field_attrs: Dict[str, Any]):
     )
 
 
+class CheckedOutModelApps:
+    """
+    The apps registry of a checked out model. It resolves the models like the
+    registry of the cached model, but the checked out model isn't registered in it,
+    so that it doesn't replace the cached model in the models related to it.
+    """
+
+    def __init__(self, apps):
+        self._apps = apps
+
+    def register_model(self, app_label, model):
+        pass
+
+    def __getattr__(self, name):
+        return getattr(self._apps, name)
+
+
+@dataclass
+class GeneratedModelCacheEntry:
+    model: Type["GeneratedTableModel"]
+    table_versions: Dict[int, str]
+    size: int
+    # Copies of the field objects of the model, as they were when the model was
+    # generated.
+    field_objects: Dict[str, Dict[int, Dict[str, Any]]]
+
+
+class GeneratedModelLRUCache:
+    """
+    A per process, thread safe, least recently used cache of fully generated table
+    models. The cache is bounded by both the number of models and the total size of
+    the models, where the size of a model is the number of Django model fields of the
+    model and all the related models that were generated with it. The number of fields
+    is what dominates the memory footprint of a generated model.
+    """
+
+    def __init__(self, max_models: int, max_size: int):
+        self.max_models = max_models
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+        self._entries: typing.OrderedDict[
+            Tuple[int, Hashable], GeneratedModelCacheEntry
+        ] = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits_counter = meter.create_counter(
+            "baserow.generated_model_lru_cache.hits",
+            description="Number of generated table models reused from memory.",
+        )
+        self._misses_counter = meter.create_counter(
+            "baserow.generated_model_lru_cache.misses",
+            description="Number of generated table models that had to be rebuilt.",
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_models > 0 and self.max_size > 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(
+        self, table: "Table", variant: Hashable
+    ) -> Optional[Type["GeneratedTableModel"]]:
+        """
+        Returns the cached model of the provided table if it's still up-to-date. The
+        version of the table instance is always refreshed from the database, using the
+        same query that checks the versions of all related tables.
+
+        :param table: The table for which the model must be returned.
+        :param variant: A hashable describing the options that the model was
+            generated with. Only an entry generated with the same options is returned.
+        :return: The cached model or None if there was no up-to-date model.
+        """
+
+        from baserow.contrib.database.table.models import Table
+
+        key = (table.id, variant)
+        entry = self._entries.get(key) if self.enabled else None
+        if entry is None:
+            table.refresh_from_db(fields=["version"])
+            self._record_miss()
+            return None
+
+        current_versions = dict(
+            Table.objects_and_trash.filter(
+                id__in=list(entry.table_versions.keys())
+            ).values_list("id", "version")
+        )
+        if table.id in current_versions:
+            table.version = current_versions[table.id]
+        else:
+            table.refresh_from_db(fields=["version"])
+
+        if current_versions != entry.table_versions:
+            with self._lock:
+                self._pop(key)
+            self._record_miss()
+            return None
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self.hits += 1
+        self._hits_counter.add(1)
+
+        return self._check_out(entry, table)
+
+    def set(
+        self,
+        table: "Table",
+        variant: Hashable,
+        model: Type["GeneratedTableModel"],
+    ):
+        """
+        Stores the fully generated model of the table in the cache. The versions of
+        all the generated table models related to it are stored alongside, so that the
+        entry is discarded as soon as one of these tables changes.
+        """
+
+        if not self.enabled:
+            return
+
+        table_versions = {}
+        size = 0
+        related_models = {*model.baserow_models.values(), model}
+        for related_model in related_models:
+            meta = related_model._meta
+            size += len(meta.local_fields) + len(meta.local_many_to_many)
+            related_table = getattr(related_model, "baserow_table", None)
+            if related_table is not None:
+                table_versions[related_table.id] = related_table.version
+
+        # A single model that's bigger than the cache can never be stored.
+        if size > self.max_size:
+            return
+
+        key = (table.id, variant)
+        entry = GeneratedModelCacheEntry(
+            model=model,
+            table_versions=table_versions,
+            size=size,
+            field_objects=self._copy_field_objects(model.__dict__),
+        )
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = entry
+            self.size += size
+            while len(self._entries) > self.max_models or self.size > self.max_size:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= evicted.size
+                self.evictions += 1
+
+    def invalidate(self, table_id: int):
+        """
+        Removes the entry of the table and every entry that contains a model of the
+        table because it's related to it.
+        """
+
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if table_id in entry.table_versions:
+                    self._pop(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "models": len(self._entries),
+            "size": self.size,
+        }
+
+    def _copy_field_objects(
+        self, field_objects: Dict[str, Any]
+    ) -> Dict[str, Dict[int, Dict[str, Any]]]:
+        return {
+            name: {
+                field_id: {**field_object, "field": copy.copy(field_object["field"])}
+                for field_id, field_object in field_objects[name].items()
+            }
+            for name in GENERATED_MODEL_FIELD_OBJECTS_ATTRIBUTES
+        }
+
+    def _check_out(
+        self, entry: GeneratedModelCacheEntry, table: "Table"
+    ) -> Type["GeneratedTableModel"]:
+        """
+        Returns a proxy subclass of the cached model that references the table
+        instance of the caller and its own copies of the field instances. Data
+        cached on them while handling a request, like the workspace of the table, is
+        then not carried over to the next caller, in the same way as the field
+        instances unpickled from the field attrs cache never were. Creating the
+        subclass and copying the field instances is cheap compared to generating the
+        model, because the Django fields of the model are inherited.
+
+        The models related to the cached model via link row fields are still shared,
+        but they're only used to query the related rows.
+        """
+
+        model = entry.model
+        meta = type(
+            "Meta",
+            (),
+            {
+                "proxy": True,
+                "apps": CheckedOutModelApps(model._meta.apps),
+                "app_label": model._meta.app_label,
+                "managed": model._meta.managed,
+            },
+        )
+        return type(
+            model.__name__,
+            (model,),
+            {
+                "Meta": meta,
+                "__module__": model.__module__,
+                # Prevents Django from building a docstring out of all the fields.
+                "__doc__": model.__doc__,
+                "baserow_table": table,
+                **self._copy_field_objects(entry.field_objects),
+            },
+        )
+
+    def _pop(self, key: Tuple[int, Hashable]):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
+
+    def _record_miss(self):
+        with self._lock:
+            self.misses += 1
+        self._misses_counter.add(1)
+
+
+generated_model_lru_cache = GeneratedModelLRUCache(
+    max_models=settings.BASEROW_IN_MEMORY_MODEL_CACHE_MAX_MODELS,
+    max_size=settings.BASEROW_IN_MEMORY_MODEL_CACHE_MAX_FIELDS,
+)
+
+
+def get_cached_generated_model(
+    table: "Table", variant: Hashable
+) -> Optional[Type["GeneratedTableModel"]]:
+    return generated_model_lru_cache.get(table, variant)
+
+
+def set_cached_generated_model(
+    table: "Table", variant: Hashable, model: Type["GeneratedTableModel"]
+):
+    generated_model_lru_cache.set(table, variant, model)
+
+
 def clear_generated_model_cache():
     print("Clearing Baserow's internal generated model cache...")
+    generated_model_lru_cache.clear()
     if hasattr(generated_models_cache, "delete_pattern"):
         generated_models_cache.delete_pattern("full_table_model_*")
     elif settings.TESTS:
@@ -70,8 +356,38 @@ def invalidate_table_in_model_cache(table_id: int):
     if settings.BASEROW_DISABLE_MODEL_CACHE:
         return None
 
+    generated_model_lru_cache.invalidate(table_id)
+
     new_version = str(uuid.uuid4())
     # Make sure to invalidate ourselves and any directly connected tables.
     from baserow.contrib.database.table.models import Table
 
     Table.objects_and_trash.filter(id=table_id).update(version=new_version)
+
+
+def table_data_version_cache_key(table_id: int) -> str:
+    return f"table_data_version_{table_id}"
+
+
+def get_table_data_version(table_id: int) -> int:
+    """
+    Returns the current version of the data of the table. Values computed from the
+    rows, fields or views of the table, and cached for this version, are only valid
+    as long as the version doesn't change.
+
+    :param table_id: The id of the table.
+    :return: The current data version.
+    """
+
+    return get_cache_version(table_data_version_cache_key(table_id))
+
+
+def invalidate_table_data_version(table_id: int):
+    """
+    Increments the data version of the table, which must happen when the rows,
+    fields or views of the table change.
+
+    :param table_id: The id of the table that changed.
+    """
+
+    increment_cache_version(table_data_version_cache_key(table_id))
@@ -1,5 +1,5 @@
 import traceback
-from typing import Any, Dict, List, NewType, Optional, Tuple, cast
+from typing import Any, Collection, Dict, Iterator, List, NewType, Optional, Tuple, cast
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
@@ -29,6 +29,7 @@ from baserow.contrib.database.operations import (
     ListTablesDatabaseTableOperationType,
     OrderTablesDatabaseTableOperationType,
 )
+from baserow.contrib.database.rows.error_report import RowErrorReport
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.table.expressions import (
     BaserowTableFileUniques,
@@ -74,6 +75,29 @@ from .signals import table_created, table_deleted, table_updated, tables_reorder
 
 BATCH_SIZE = 1024
 
+
+class _StringRows:
+    """
+    A sized iterable converting the values of the rows of the provided data to
+    strings while iterating, optionally skipping the first row. This prevents
+    copying all the rows of big imports in memory.
+    """
+
+    def __init__(self, data: Collection[List[Any]], skip_first_row: bool):
+        self.data = data
+        self.skip_first_row = skip_first_row
+
+    def __len__(self) -> int:
+        return len(self.data) - (1 if self.skip_first_row else 0)
+
+    def __iter__(self) -> Iterator[List[str]]:
+        rows = iter(self.data)
+        if self.skip_first_row:
+            next(rows, None)
+        for row in rows:
+            yield [str(value) for value in row]
+
+
 TableForUpdate = NewType("TableForUpdate", Table)
 
 tracer = trace.get_tracer(__name__)
@@ -135,6 +159,7 @@ class TableUsageHandler:
         cls,
         chunk_size: int = 250,
         progress_builder: Optional[ChildProgressBuilder] = None,
+        workspace_id: Optional[int] = None,
     ) -> int:
         """
         Updates all the tables usage for the existing entries that have received updates
@@ -144,6 +169,8 @@ class TableUsageHandler:
             `max_locks_per_transaction` error in Postgres.
         :param progress_builder: an optional child progress builder to keep track of the
             progress of this (potentially very long) function.
+        :param workspace_id: if provided, only the tables of this workspace are
+            updated.
         """
 
         table_usage_updates = TableUsageUpdate.objects.all()
@@ -153,6 +180,13 @@ class TableUsageHandler:
             .filter(Q(usage=None), database__workspace__template__isnull=True)
             .order_by("id")
         )
+        if workspace_id is not None:
+            table_usage_updates = table_usage_updates.filter(
+                table__database__workspace_id=workspace_id
+            )
+            tables_without_usage = tables_without_usage.filter(
+                database__workspace_id=workspace_id
+            )
         progress = ChildProgressBuilder.build(
             progress_builder,
             child_total=len(table_usage_updates) + len(tables_without_usage),
@@ -259,25 +293,27 @@ class TableUsageHandler:
                         storage_usage_updated_at=Now(),
                     )
                 )
-                return TableUsage.objects.bulk_create(
-                    entries,
-                    update_conflicts=True,
-                    update_fields=[
-                        "row_count",
-                        "row_count_updated_at",
-                        "storage_usage",
-                        "storage_usage_updated_at",
-                    ],
-                    unique_fields=["table_id"],
-                )
+            return TableUsage.objects.bulk_create(
+                entries,
+                update_conflicts=True,
+                update_fields=[
+                    "row_count",
+                    "row_count_updated_at",
+                    "storage_usage",
+                    "storage_usage_updated_at",
+                ],
+                unique_fields=["table_id"],
+            )
 
         while True:
             # Postgres needs a lock for every table in the loop, so this limits
             # the number updated per transaction.
             with transaction.atomic():
-                table_ids = table_usage_updates.select_for_update(of=("self",))[
-                    :chunk_size
-                ].values_list("table_id", flat=True)
+                table_ids = list(
+                    table_usage_updates.select_for_update(of=("self",))[
+                        :chunk_size
+                    ].values_list("table_id", flat=True)
+                )
 
                 _bulk_update_or_create(table_ids)
 
@@ -414,7 +450,7 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         user: AbstractUser,
         database: Database,
         name: str,
-        data: Optional[List[List[Any]]] = None,
+        data: Optional[Collection[List[Any]]] = None,
         first_row_header: bool = True,
         fill_example: bool = False,
         progress: Optional[Progress] = None,
@@ -428,8 +464,9 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         :param user: The user on whose behalf the table is created.
         :param database: The database that the table instance belongs to.
         :param name: The name of the table is created.
-        :param data: A list containing all the rows that need to be inserted is
-            expected. All the values will be inserted in the database.
+        :param data: A list, or any sized iterable which can be iterated multiple
+            times, containing all the rows that need to be inserted is expected. All
+            the values will be inserted in the database.
         :param first_row_header: Indicates if the first row are the fields. The names
             of these rows are going to be used as fields. If `fields` is provided,
             this options is ignored.
@@ -465,13 +502,17 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
 
         table = self.create_table_and_fields(user, database, name, fields)
 
-        _, error_report = RowHandler().import_rows(
-            user, table, data, progress=progress, send_realtime_update=False
-        )
+        error_report = RowErrorReport()
+        # The created rows are not kept, so that the memory usage doesn't grow with
+        # the amount of imported rows.
+        for _created_rows in RowHandler().import_rows_in_batches(
+            user, table, data, error_report, progress=progress
+        ):
+            pass
 
         table_created.send(self, table=table, user=user)
 
-        return table, error_report
+        return table, error_report.to_dict()
 
     def create_table_and_fields(
         self,
@@ -546,13 +587,16 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         return table
 
     def normalize_initial_table_data(
-        self, data: List[List[Any]], first_row_header: bool
-    ) -> Tuple[List, List]:
+        self, data: Collection[List[Any]], first_row_header: bool
+    ) -> Tuple[List, Collection[List[str]]]:
         """
         Normalizes the provided initial table data. The amount of columns will be made
-        equal for each row. The header and the rows will also be separated.
+        equal for each row. The header and the rows will also be separated. The data
+        is only iterated over, so it can be streamed from a file, and the rows are
+        converted lazily.
 
-        :param data: A list containing all the provided rows.
+        :param data: A list, or any sized iterable which can be iterated multiple
+            times, containing all the provided rows.
         :param first_row_header: Indicates if the first row is the header. For each
             of these header columns a field is going to be created.
         :raises InvalidInitialTableData: When the data doesn't contain a column or row.
@@ -575,12 +619,12 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
                 f"{settings.INITIAL_TABLE_DATA_LIMIT} rows when creating a table."
             )
 
-        largest_column_count = len(max(data, key=len))
+        largest_column_count = max(len(row) for row in data)
 
         if largest_column_count == 0:
             raise InvalidInitialTableData("At least one column should be provided.")
 
-        fields = data.pop(0) if first_row_header else []
+        fields = list(next(iter(data))) if first_row_header else []
 
         for i in range(len(fields), largest_column_count):
             fields.append(_("Field %d") % (i + 1,))
@@ -611,7 +655,7 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
             raise InvalidBaserowFieldName()
 
         fields_with_type = [(field_name, "text", {}) for field_name in fields]
-        result = [[str(value) for value in row] for row in data]
+        result = _StringRows(data, skip_first_row=first_row_header)
 
         return fields_with_type, result
 
@@ -39,7 +39,9 @@ from baserow.contrib.database.fields.registries import FieldType, field_type_reg
 from baserow.contrib.database.fields.utils import get_field_id_from_field_key
 from baserow.contrib.database.search.handler import SearchHandler, SearchModes
 from baserow.contrib.database.table.cache import (
+    get_cached_generated_model,
     get_cached_model_field_attrs,
+    set_cached_generated_model,
     set_cached_model_field_attrs,
 )
 from baserow.contrib.database.table.constants import (
@@ -972,6 +974,10 @@ class Table(
         :rtype: Model
         """
 
+        # Only a model that isn't generated as part of another one can be reused
+        # from the in-memory model cache.
+        is_root_model = app_label is None and not manytomany_models
+
         if app_label is None:
             # Generate a unique app_label to make the generation of the model thread
             # safe. Related fields generate pending operations in the `apps`
@@ -1050,8 +1056,25 @@ class Table(
             and not settings.BASEROW_DISABLE_MODEL_CACHE
         )
 
+        model_cache_variant = None
+        if use_cache and is_root_model and field_names is None:
+            model_cache_variant = (
+                managed,
+                force_add_tsvectors,
+                self.needs_background_update_column_added,
+                self.created_by_column_added,
+                self.last_modified_by_column_added,
+            )
+
+        if model_cache_variant is not None:
+            # This also refreshes the version of the table.
+            model = get_cached_generated_model(self, model_cache_variant)
+            if model is not None:
+                return model
+
         if use_cache:
-            self.refresh_from_db(fields=["version"])
+            if model_cache_variant is None:
+                self.refresh_from_db(fields=["version"])
             field_attrs = get_cached_model_field_attrs(self)
         else:
             field_attrs = None
@@ -1131,6 +1154,9 @@ class Table(
         if not manytomany_models:
             self._after_model_generation(attrs, model)
 
+        if model_cache_variant is not None:
+            set_cached_generated_model(self, model_cache_variant, model)
+
         return model
 
     def _add_search_tsvector_fields_to_model(self, field_attrs, indexes, force_add):
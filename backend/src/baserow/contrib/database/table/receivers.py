@@ -3,16 +3,44 @@ from django.dispatch import receiver
 
 from baserow.contrib.database.application_types import DatabaseApplicationType
 from baserow.contrib.database.fields.models import FileField
-from baserow.contrib.database.fields.signals import field_deleted, field_restored
+from baserow.contrib.database.fields.signals import (
+    field_created,
+    field_deleted,
+    field_restored,
+    field_updated,
+)
 from baserow.contrib.database.rows.signals import (
+    row_orders_recalculated,
     rows_created,
     rows_deleted,
     rows_updated,
 )
-from baserow.contrib.database.table.signals import table_created, table_deleted
+from baserow.contrib.database.table.cache import invalidate_table_data_version
+from baserow.contrib.database.table.signals import (
+    table_created,
+    table_deleted,
+    table_updated,
+)
+from baserow.contrib.database.views.models import FormView
+from baserow.contrib.database.views.signals import (
+    view_created,
+    view_deleted,
+    view_filter_created,
+    view_filter_deleted,
+    view_filter_group_created,
+    view_filter_group_deleted,
+    view_filter_group_updated,
+    view_filter_updated,
+    view_sort_created,
+    view_sort_deleted,
+    view_sort_updated,
+    view_updated,
+)
 from baserow.core.registries import application_type_registry
-from baserow.core.signals import application_created
+from baserow.core.signals import application_created, application_deleted
+from baserow.core.usage.handler import UsageHandler
 
+from .models import Table
 from .tasks import create_tables_usage_for_new_database, update_table_usage
 
 
@@ -77,3 +105,82 @@ def on_application_created(sender, application, **kwargs):
 def on_field_restored(sender, field, **kwargs):
     if isinstance(field, FileField):
         transaction.on_commit(lambda: update_table_usage.delay(field.table_id))
+
+
+# Form view signals for storage usage, because the cover and logo images are user
+# files which are counted in the storage usage of the workspace.
+def _mark_form_view_workspace_for_storage_usage_update(view):
+    UsageHandler.mark_workspace_for_storage_usage_update(
+        view.table.database.workspace_id
+    )
+
+
+@receiver([view_created, view_deleted])
+def on_form_view_created_or_deleted(sender, view, **kwargs):
+    if isinstance(view, FormView):
+        _mark_form_view_workspace_for_storage_usage_update(view)
+
+
+@receiver(view_updated)
+def on_form_view_updated(sender, view, old_view, **kwargs):
+    if isinstance(view, FormView) and (
+        view.cover_image_id != old_view.cover_image_id
+        or view.logo_image_id != old_view.logo_image_id
+    ):
+        _mark_form_view_workspace_for_storage_usage_update(view)
+
+
+# Signals changing the data of a table, so that the values cached for the previous
+# data version of the table are invalidated.
+@receiver(
+    [
+        rows_created,
+        rows_updated,
+        rows_deleted,
+        row_orders_recalculated,
+        table_updated,
+        table_deleted,
+    ]
+)
+def on_table_data_changed(sender, table, **kwargs):
+    invalidate_table_data_version(table.id)
+
+
+@receiver([field_created, field_updated, field_deleted, field_restored])
+def on_field_changed(sender, field, related_fields=None, **kwargs):
+    for table_id in {f.table_id for f in [field, *(related_fields or [])]}:
+        invalidate_table_data_version(table_id)
+
+
+@receiver([view_updated, view_deleted])
+def on_view_changed(sender, view, **kwargs):
+    invalidate_table_data_version(view.table_id)
+
+
+@receiver([view_filter_created, view_filter_updated, view_filter_deleted])
+def on_view_filter_changed(sender, view_filter, **kwargs):
+    invalidate_table_data_version(view_filter.view.table_id)
+
+
+@receiver(
+    [view_filter_group_created, view_filter_group_updated, view_filter_group_deleted]
+)
+def on_view_filter_group_changed(sender, view_filter_group, **kwargs):
+    invalidate_table_data_version(view_filter_group.view.table_id)
+
+
+@receiver([view_sort_created, view_sort_updated, view_sort_deleted])
+def on_view_sort_changed(sender, view_sort, **kwargs):
+    invalidate_table_data_version(view_sort.view.table_id)
+
+
+@receiver(application_deleted)
+def on_database_deleted(sender, application, **kwargs):
+    application_type = application_type_registry.get_by_model(
+        application.specific_class
+    )
+    if isinstance(application_type, DatabaseApplicationType):
+        for table_id in Table.objects_and_trash.filter(
+            database_id=application.id
+        ).values_list("id", flat=True):
+            invalidate_table_data_version(table_id)
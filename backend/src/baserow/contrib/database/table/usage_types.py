@@ -1,17 +1,20 @@
-from django.db.models import Sum
+from typing import Optional
+
+from django.db.models import Q, QuerySet, Sum
 from django.db.models.functions import Coalesce
 
 from baserow.core.usage.registries import UsageInMB, WorkspaceStorageUsageItemType
 
 from .handler import TableHandler, TableUsageHandler
+from .models import Table
 
 
 class TableWorkspaceStorageUsageItemType(WorkspaceStorageUsageItemType):
     type = "table"
 
     def calculate_storage_usage(self, workspace_id: int) -> UsageInMB:
-        # ensure all pending updates are applied first
-        TableUsageHandler.update_tables_usage()
+        # ensure all pending updates of the workspace are applied first
+        TableUsageHandler.update_tables_usage(workspace_id=workspace_id)
 
         # Aggregate all the tables storage usage in the workspace
         return (
@@ -19,3 +22,11 @@ class TableWorkspaceStorageUsageItemType(WorkspaceStorageUsageItemType):
             .filter(database__workspace_id=workspace_id)
             .aggregate(sum=Coalesce(Sum("usage__storage_usage"), 0))["sum"]
         )
+
+    def get_workspace_ids_with_pending_changes(self) -> Optional[QuerySet]:
+        # The tables that changed, also the trashed ones, have a pending usage
+        # update, and the new tables don't have any usage yet.
+        tables_without_usage = TableHandler.get_tables().filter(usage__isnull=True)
+        return Table.objects_and_trash.filter(
+            Q(usage_update__isnull=False) | Q(id__in=tables_without_usage.values("id"))
+        ).values("database__workspace_id")
@@ -20,7 +20,11 @@ from baserow.contrib.database.table.models import (
     Table,
 )
 from baserow.contrib.database.table.signals import table_created, table_updated
-from baserow.contrib.database.views.handler import ViewHandler, ViewIndexingHandler
+from baserow.contrib.database.views.handler import (
+    TrigramIndexingHandler,
+    ViewHandler,
+    ViewIndexingHandler,
+)
 from baserow.contrib.database.views.models import View
 from baserow.contrib.database.views.registries import (
     view_ownership_type_registry,
@@ -516,6 +520,9 @@ class ViewTrashableItemType(TrashableItemType):
         self, trashed_item: View, trash_item_lookup_cache: Dict[str, View] = None
     ):
         ViewIndexingHandler.before_view_permanently_deleted(trashed_item)
+        TrigramIndexingHandler.after_filters_changed(
+            list(trashed_item.viewfilter_set.values_list("field_id", flat=True))
+        )
         trashed_item.delete()
 
     def get_owner(self, trashed_item: View) -> Optional[AbstractUser]:
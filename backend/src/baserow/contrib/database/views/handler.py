@@ -14,6 +14,7 @@ from django.core.cache import cache
 from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.db import connection
 from django.db import models as django_models
+from django.db import transaction
 from django.db.models import Count, Q
 from django.db.models.expressions import F, OrderBy
 from django.db.models.query import QuerySet
@@ -21,17 +22,19 @@ from django.db.models.query import QuerySet
 import jwt
 from loguru import logger
 from opentelemetry import trace
+from psycopg2 import sql
 from redis.exceptions import LockNotOwnedError
 
 from baserow.contrib.database.api.utils import get_include_exclude_field_ids
 from baserow.contrib.database.db.schema import safe_django_schema_editor
+from baserow.contrib.database.fields.dependencies.models import FieldDependency
 from baserow.contrib.database.fields.exceptions import FieldNotInTable
 from baserow.contrib.database.fields.field_filters import (
     AdvancedFilterBuilder,
     FilterBuilder,
 )
 from baserow.contrib.database.fields.field_sortings import OptionallyAnnotatedOrderBy
-from baserow.contrib.database.fields.models import Field
+from baserow.contrib.database.fields.models import Field, LinkRowField
 from baserow.contrib.database.fields.operations import ReadFieldOperationType
 from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.rows.handler import RowHandler
@@ -127,6 +130,7 @@ from .exceptions import (
 )
 from .models import (
     OWNERSHIP_TYPE_COLLABORATIVE,
+    GridViewFieldOptions,
     View,
     ViewDecoration,
     ViewFilter,
@@ -135,6 +139,7 @@ from .models import (
     ViewSort,
 )
 from .registries import (
+    ViewAggregationType,
     decorator_type_registry,
     decorator_value_provider_type_registry,
     view_aggregation_type_registry,
@@ -169,6 +174,10 @@ from .validators import value_is_empty_for_required_form_field
 
 FieldOptionsDict = Dict[int, Dict[str, Any]]
 
+# The key under which the states of the incrementally maintainable aggregations are
+# returned by `ViewHandler.get_field_aggregations`.
+INCREMENTAL_STATES_KEY = "__incremental_states"
+
 
 ending_number_regex = re.compile(r"(.+) (\d+)$")
 
@@ -187,6 +196,32 @@ class UpdatedViewWithChangedAttributes:
     new_view_attributes: Dict[str, Any]
 
 
+@dataclasses.dataclass
+class IncrementalAggregation:
+    """
+    A cached aggregation of a view that can be updated incrementally. The
+    `expected_version` is the aggregation version after the rows change, the new
+    value is only cached if nothing else invalidated the aggregation in the meantime.
+    """
+
+    field: Field
+    aggregation_type: ViewAggregationType
+    state: Dict[str, Any]
+    expected_version: int
+
+
+@dataclasses.dataclass
+class IncrementalViewAggregations:
+    """
+    The aggregations of a view that can be updated incrementally, with the states of
+    the changed rows before the change, keyed by field name.
+    """
+
+    view: View
+    aggregations: Dict[str, IncrementalAggregation]
+    removed_states: Optional[Dict[str, Dict[str, Any]]]
+
+
 class ViewIndexingHandler(metaclass=baserow_trace_methods(tracer)):
     @classmethod
     def does_index_exist(cls, index_name: str) -> bool:
@@ -474,6 +509,186 @@ class ViewIndexingHandler(metaclass=baserow_trace_methods(tracer)):
             view.save(update_fields=["db_index_name"])
 
 
+class TrigramIndexingHandler(metaclass=baserow_trace_methods(tracer)):
+    """
+    Manages the `gin_trgm_ops` indexes that speed up the contains filters of text
+    fields. A field gets an index as soon as one of the views of the table filters
+    it with a filter type that can use the index, and the index is dropped again
+    when no view filters it like that anymore.
+    """
+
+    @classmethod
+    def get_index_name(cls, field: Field) -> str:
+        """
+        Returns the name of the trigram index of the provided field.
+
+        :param field: The field to get the index name for.
+        :return: The index name.
+        """
+
+        return f"field_{field.id}_trgm"
+
+    @classmethod
+    def get_indexable_filter_types(cls) -> List[str]:
+        """
+        Returns the types of the view filters that can use a trigram index.
+        """
+
+        return [
+            view_filter_type.type
+            for view_filter_type in view_filter_type_registry.get_all()
+            if view_filter_type.can_use_trigram_index
+        ]
+
+    @classmethod
+    def field_needs_index(cls, field: Field) -> bool:
+        """
+        Returns whether the provided field needs a trigram index because a view of
+        the table filters it with a filter type that can use the index.
+
+        :param field: The field to check.
+        :return: Whether the field needs a trigram index.
+        """
+
+        field = field.specific
+        field_type = field_type_registry.get_by_model(field)
+        if field.trashed or not field_type.check_can_have_trigram_index(field):
+            return False
+
+        return ViewFilter.objects.filter(
+            field=field, type__in=cls.get_indexable_filter_types()
+        ).exists()
+
+    @classmethod
+    def pg_trgm_extension_available(cls) -> bool:
+        """
+        Returns whether the `pg_trgm` extension is installed in the database. It's
+        created by a migration, but that can fail if the database user isn't allowed
+        to create it.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            return cursor.fetchone() is not None
+
+    @classmethod
+    def schedule_index_update(cls, field_id: int):
+        """
+        Schedules a celery task that creates or removes the trigram index of the
+        field, depending on whether it's still needed.
+
+        :param field_id: The id of the field for which the index must be updated.
+        """
+
+        if not settings.TRIGRAM_INDEX_ENABLED:
+            return
+
+        from baserow.contrib.database.views.tasks import update_field_trigram_index
+
+        transaction.on_commit(lambda: update_field_trigram_index.delay(field_id))
+
+    @classmethod
+    def update_index(cls, field: Field):
+        """
+        Creates the trigram index of the provided field if it's needed and doesn't
+        exist yet, or removes it if it's not needed anymore.
+
+        :param field: The field for which the index must be updated.
+        """
+
+        if cls.field_needs_index(field):
+            cls.add_index_if_not_exists(field)
+        else:
+            cls.remove_index_if_exists(field)
+
+    @classmethod
+    def add_index_if_not_exists(cls, field: Field):
+        """
+        Creates the trigram index of the provided field if the `pg_trgm` extension is
+        available. Just like the view indexes, it only contains the rows that are not
+        trashed.
+
+        :param field: The field to create the index for.
+        """
+
+        index_name = cls.get_index_name(field)
+        if (
+            ViewIndexingHandler.does_index_exist(index_name)
+            or not cls.pg_trgm_extension_available()
+        ):
+            return
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL(
+                    "CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} "
+                    "USING gin ({column} gin_trgm_ops) WHERE NOT trashed"
+                ).format(
+                    index_name=sql.Identifier(index_name),
+                    table_name=sql.Identifier(field.table.get_database_table_name()),
+                    column=sql.Identifier(field.db_column),
+                )
+            )
+        logger.info(
+            "Created trigram index {index_name} for field {field_id} of table "
+            "{table_id}",
+            index_name=index_name,
+            field_id=field.id,
+            table_id=field.table_id,
+        )
+
+    @classmethod
+    def remove_index_if_exists(cls, field: Field):
+        """
+        Removes the trigram index of the provided field if it exists.
+
+        :param field: The field to remove the index of.
+        """
+
+        index_name = cls.get_index_name(field)
+        if not ViewIndexingHandler.does_index_exist(index_name):
+            return
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL("DROP INDEX IF EXISTS {index_name}").format(
+                    index_name=sql.Identifier(index_name)
+                )
+            )
+        logger.info(
+            "Removed trigram index {index_name} for field {field_id} of table "
+            "{table_id}",
+            index_name=index_name,
+            field_id=field.id,
+            table_id=field.table_id,
+        )
+
+    @classmethod
+    def before_field_type_changed(cls, field: Field):
+        """
+        Called before the column of a field is altered because its type changed. The
+        index is removed right away because it can't be kept if the column isn't text
+        anymore, and it's recreated afterwards if it's still needed.
+
+        :param field: The field of which the type changed.
+        """
+
+        cls.remove_index_if_exists(field)
+        cls.schedule_index_update(field.id)
+
+    @classmethod
+    def after_filters_changed(cls, field_ids: Iterable[int]):
+        """
+        Called when view filters of the provided fields have been created, updated or
+        deleted, so that their indexes are created or removed if needed.
+
+        :param field_ids: The ids of the fields of which the filters changed.
+        """
+
+        for field_id in set(field_ids):
+            cls.schedule_index_update(field_id)
+
+
 class ViewHandler(metaclass=baserow_trace_methods(tracer)):
     PUBLIC_VIEW_TOKEN_ALGORITHM = "HS256"  # nosec
 
@@ -1254,6 +1469,8 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         :param field: The new field object.
         """
 
+        TrigramIndexingHandler.before_field_type_changed(field)
+
         field_type = field_type_registry.get_by_model(field.specific_class)
 
         # If the new field type does not support sorting then all sortings will be
@@ -1503,6 +1720,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         view_type.after_filter_update(view)
 
         view_filter_created.send(self, view_filter=view_filter, user=user)
+        TrigramIndexingHandler.after_filters_changed([view_filter.field_id])
 
         return view_filter
 
@@ -1558,6 +1776,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                 f"{view_filter.view.table.id}."
             )
 
+        previous_field_id = view_filter.field_id
         view_filter.field = field
         view_filter.value = value
         view_filter.type = type_name
@@ -1568,6 +1787,9 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         view_type.after_filter_update(view_filter.view)
 
         view_filter_updated.send(self, view_filter=view_filter, user=user)
+        TrigramIndexingHandler.after_filters_changed(
+            [previous_field_id, view_filter.field_id]
+        )
 
         return view_filter
 
@@ -1597,6 +1819,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         view_filter_deleted.send(
             self, view_filter_id=view_filter_id, view_filter=view_filter, user=user
         )
+        TrigramIndexingHandler.after_filters_changed([view_filter.field_id])
 
     def get_filter_group(
         self,
@@ -2704,6 +2927,301 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
         return (valid_cached_values, need_computation)
 
+    def _get_incremental_aggregations_table_cache_key(self, table_id: int) -> str:
+        """
+        Returns the cache key indicating that at least one view of the table has
+        cached aggregations states that can be maintained incrementally.
+        """
+
+        return f"aggregation_incremental_table__{table_id}"
+
+    def _get_incremental_aggregations_view_cache_key(self, view_id: int) -> str:
+        """
+        Returns the cache key indicating that the view has cached aggregations
+        states that can be maintained incrementally.
+        """
+
+        return f"aggregation_incremental_view__{view_id}"
+
+    def _register_incremental_aggregations_view(self, view: View):
+        """
+        Remembers that the view has cached aggregation states, so that they're
+        updated incrementally when rows of the table change. A key per view is
+        added instead of updating a set of view ids, so that concurrent
+        registrations can't overwrite each other.
+        """
+
+        cache.add(self._get_incremental_aggregations_view_cache_key(view.id), True)
+        cache.add(
+            self._get_incremental_aggregations_table_cache_key(view.table_id), True
+        )
+
+    def _get_field_ids_not_incrementally_aggregatable(
+        self, table: Table, model: GeneratedTableModel
+    ) -> Set[int]:
+        """
+        Returns the ids of the fields of the table whose values can change for other
+        rows than the ones being created, updated or deleted. These are the link row
+        fields to the same table and the fields depending on a field via a link row
+        field, directly or not. Their aggregations can't be maintained incrementally.
+        """
+
+        field_ids = {
+            field_id
+            for field_id, field_object in model._field_objects.items()
+            if isinstance(field_object["field"], LinkRowField)
+            and field_object["field"].link_row_table_id == table.id
+        }
+
+        dependencies = list(
+            FieldDependency.objects.filter(dependant__table_id=table.id).values_list(
+                "dependant_id", "dependency_id", "via_id"
+            )
+        )
+        field_ids.update(
+            dependant_id
+            for dependant_id, _, via_id in dependencies
+            if via_id is not None
+        )
+
+        changed = True
+        while changed:
+            changed = False
+            for dependant_id, dependency_id, _ in dependencies:
+                if dependency_id in field_ids and dependant_id not in field_ids:
+                    field_ids.add(dependant_id)
+                    changed = True
+
+        return field_ids
+
+    def _get_incremental_aggregation_states(
+        self,
+        view: View,
+        model: GeneratedTableModel,
+        aggregations: Dict[str, IncrementalAggregation],
+        row_ids: List[int],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Computes the states of the aggregations over the provided rows, taking the
+        filters of the view into account.
+        """
+
+        queryset = self.apply_filters(view, model.objects.filter(id__in=row_ids))
+        return self._aggregate(
+            queryset,
+            model,
+            [(a.field, a.aggregation_type.type) for a in aggregations.values()],
+            only_incremental_states=True,
+        )[INCREMENTAL_STATES_KEY]
+
+    def get_incremental_aggregations(
+        self,
+        table: Table,
+        model: GeneratedTableModel,
+        rows: Optional[List[GeneratedTableModel]] = None,
+        updated_field_ids: Optional[Iterable[int]] = None,
+    ) -> List[IncrementalViewAggregations]:
+        """
+        Collects the cached aggregations of the views of the table that can be
+        updated incrementally when the provided rows change, instead of being
+        recomputed over the whole table the next time they're requested.
+
+        It must be called before the rows are updated or deleted, so that the state
+        of the rows before the change can be computed. When rows are created, it
+        must be called without rows after the creation. The result must be passed
+        to `apply_incremental_aggregations` once the change has been made.
+
+        :param table: The table of the rows.
+        :param model: The model of the table.
+        :param rows: The rows that are going to be updated or deleted. None if the
+            rows have just been created.
+        :param updated_field_ids: The ids of the fields that are going to be
+            updated. All the fields are considered if not provided.
+        :return: The aggregations that can be updated incrementally per view.
+        """
+
+        if not cache.get(self._get_incremental_aggregations_table_cache_key(table.id)):
+            return []
+
+        if updated_field_ids is not None:
+            updated_field_ids = set(updated_field_ids)
+
+        field_options = list(
+            GridViewFieldOptions.objects.filter(grid_view__table_id=table.id)
+            .exclude(aggregation_raw_type="")
+            .select_related("grid_view")
+        )
+        registered_view_cache_keys = cache.get_many(
+            {
+                self._get_incremental_aggregations_view_cache_key(options.grid_view_id)
+                for options in field_options
+            }
+        )
+        candidates = []
+        for options in field_options:
+            if (
+                self._get_incremental_aggregations_view_cache_key(options.grid_view_id)
+                not in registered_view_cache_keys
+            ):
+                continue
+            field_object = model._field_objects.get(options.field_id)
+            if field_object is None or (
+                updated_field_ids is not None
+                and options.field_id not in updated_field_ids
+            ):
+                continue
+            candidates.append((options.grid_view, field_object["field"], options))
+
+        cached = cache.get_many(
+            [
+                key
+                for view, field, _ in candidates
+                for key in [
+                    self._get_aggregation_value_cache_key(view, field.db_column),
+                    self._get_aggregation_version_cache_key(view, field.db_column),
+                ]
+            ]
+        )
+
+        # The version has already been incremented when the rows are created.
+        version_offset = 0 if rows is not None else 1
+        views = {}
+        aggregations_per_view = defaultdict(dict)
+        for view, field, options in candidates:
+            cached_value = cached.get(
+                self._get_aggregation_value_cache_key(view, field.db_column)
+            )
+            cached_version = cached.get(
+                self._get_aggregation_version_cache_key(view, field.db_column), 1
+            )
+            if (
+                cached_value is None
+                or "state" not in cached_value
+                or cached_value["version"] != cached_version - version_offset
+            ):
+                continue
+
+            views[view.id] = view
+            aggregations_per_view[view.id][field.db_column] = IncrementalAggregation(
+                field=field,
+                aggregation_type=view_aggregation_type_registry.get(
+                    options.aggregation_raw_type
+                ),
+                state=cached_value["state"],
+                expected_version=cached_value["version"] + 1,
+            )
+
+        if not aggregations_per_view:
+            return []
+
+        excluded_field_ids = self._get_field_ids_not_incrementally_aggregatable(
+            table, model
+        )
+        excluded_view_ids = set()
+        if excluded_field_ids:
+            # If the view is filtered by a field whose value can change for other rows,
+            # then other rows can enter or leave the view.
+            excluded_view_ids = set(
+                ViewFilter.objects.filter(
+                    view_id__in=views.keys(), field_id__in=excluded_field_ids
+                ).values_list("view_id", flat=True)
+            )
+
+        incremental_aggregations = []
+        for view_id, aggregations in aggregations_per_view.items():
+            aggregations = {
+                name: aggregation
+                for name, aggregation in aggregations.items()
+                if aggregation.field.id not in excluded_field_ids
+            }
+            if view_id in excluded_view_ids or not aggregations:
+                continue
+
+            removed_states = None
+            if rows is not None:
+                removed_states = self._get_incremental_aggregation_states(
+                    views[view_id], model, aggregations, [row.id for row in rows]
+                )
+
+            incremental_aggregations.append(
+                IncrementalViewAggregations(
+                    view=views[view_id],
+                    aggregations=aggregations,
+                    removed_states=removed_states,
+                )
+            )
+
+        return incremental_aggregations
+
+    def apply_incremental_aggregations(
+        self,
+        model: GeneratedTableModel,
+        incremental_aggregations: List[IncrementalViewAggregations],
+        rows: List[GeneratedTableModel],
+    ):
+        """
+        Updates the cached aggregations collected by `get_incremental_aggregations`
+        with the new state of the changed rows. This must be called after the
+        aggregations cache has been invalidated for the change. An aggregation is
+        only updated if its version has been incremented exactly once since it was
+        collected, otherwise it's left to be recomputed. The cache is updated when
+        the transaction commits.
+
+        :param model: The model of the table.
+        :param incremental_aggregations: The aggregations returned by
+            `get_incremental_aggregations`.
+        :param rows: The rows that have been created, updated or deleted.
+        """
+
+        if not incremental_aggregations:
+            return
+
+        current_versions = cache.get_many(
+            [
+                self._get_aggregation_version_cache_key(view_aggregations.view, name)
+                for view_aggregations in incremental_aggregations
+                for name in view_aggregations.aggregations.keys()
+            ]
+        )
+
+        to_cache = {}
+        for view_aggregations in incremental_aggregations:
+            view = view_aggregations.view
+            aggregations = {
+                name: aggregation
+                for name, aggregation in view_aggregations.aggregations.items()
+                if current_versions.get(
+                    self._get_aggregation_version_cache_key(view, name), 1
+                )
+                == aggregation.expected_version
+            }
+            if not aggregations:
+                continue
+
+            added_states = self._get_incremental_aggregation_states(
+                view, model, aggregations, [row.id for row in rows]
+            )
+            removed_states = view_aggregations.removed_states or {}
+
+            for name, aggregation in aggregations.items():
+                aggregation_type = aggregation.aggregation_type
+                state = aggregation_type.merge_incremental_state(
+                    aggregation.state, removed_states.get(name), added_states[name]
+                )
+                if state is None:
+                    continue
+
+                to_cache[self._get_aggregation_value_cache_key(view, name)] = {
+                    "value": aggregation_type.get_value_from_incremental_state(
+                        state, model._meta.get_field(name)
+                    ),
+                    "version": aggregation.expected_version,
+                    "state": state,
+                }
+
+        if to_cache:
+            transaction.on_commit(lambda: cache.set_many(to_cache))
+
     def get_view_field_aggregations(
         self,
         user: AbstractUser,
@@ -2804,6 +3322,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
         # Do we need to compute some aggregations?
         if need_computation or with_total:
+            use_cache = not search and not adhoc_filters.has_any_filters
             db_result = self.get_field_aggregations(
                 user,
                 view,
@@ -2818,21 +3337,31 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                 search_mode=search_mode,
                 skip_perm_check=skip_perm_check,
                 restrict_to_field_ids=visible_field_ids,
+                with_incremental_states=use_cache,
             )
+            states = db_result.pop(INCREMENTAL_STATES_KEY, {})
 
-            if not search and not adhoc_filters.has_any_filters:
+            if use_cache:
                 to_cache = {}
                 for key, value in db_result.items():
                     # We don't cache total value
                     if key != "total":
-                        to_cache[self._get_aggregation_value_cache_key(view, key)] = {
+                        cached_value = {
                             "value": value,
                             "version": need_computation[key]["version"],
                         }
+                        if key in states:
+                            cached_value["state"] = states[key]
+                        to_cache[
+                            self._get_aggregation_value_cache_key(view, key)
+                        ] = cached_value
 
                 # Let's cache the newly computed values
                 cache.set_many(to_cache)
 
+                if states:
+                    self._register_incremental_aggregations_view(view)
+
             # Merged cached values and computed one
             values.update(db_result)
 
@@ -2858,6 +3387,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         search_mode: Optional[SearchModes] = None,
         skip_perm_check: bool = False,
         restrict_to_field_ids: Optional[Set[int]] = None,
+        with_incremental_states: bool = False,
     ) -> Dict[str, Any]:
         """
         Returns a dict of aggregation for given (field, aggregation_type) couple list.
@@ -2879,6 +3409,9 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         :param skip_perm_check: Skips the permission check if not necessary.
         :param restrict_to_field_ids: Restrict the aggregations only to certain
             fields, for example if the aggregation is requested for public views.
+        :param with_incremental_states: Whether the states of the aggregations that
+            can be maintained incrementally should also be computed. They're returned
+            in a dict keyed by field name under the `INCREMENTAL_STATES_KEY` key.
         :raises FieldAggregationNotSupported: When the view type doesn't support
             field aggregation.
         :raises FieldNotInTable: When one of the field doesn't belong to the specified
@@ -2923,11 +3456,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                 search, restrict_to_field_ids, search_mode=search_mode
             )
 
-        aggregation_dict = {}
-
-        for field_instance, aggregation_type_name in aggregations:
-            field_name = field_instance.db_column
-
+        for field_instance, _ in aggregations:
             # Check whether the field belongs to the table.
             if field_instance.table_id != view.table_id:
                 raise FieldNotInTable(
@@ -2935,29 +3464,94 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                     f"{view.table.id}."
                 )
 
+        return self._aggregate(
+            queryset,
+            model,
+            aggregations,
+            with_total=with_total,
+            with_incremental_states=with_incremental_states,
+        )
+
+    def _aggregate(
+        self,
+        queryset: QuerySet,
+        model: GeneratedTableModel,
+        aggregations: Iterable[Tuple[django_models.Field, str]],
+        with_total: bool = False,
+        with_incremental_states: bool = False,
+        only_incremental_states: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Computes the provided aggregations over the queryset in a single query.
+
+        :param queryset: The queryset containing the rows to aggregate.
+        :param model: The model of the table the rows belong to.
+        :param aggregations: A list of (field_instance, aggregation_type).
+        :param with_total: Whether the total row count should be returned in the
+            result.
+        :param with_incremental_states: Whether the states of the aggregations that
+            can be maintained incrementally should be returned in the result under
+            the `INCREMENTAL_STATES_KEY` key.
+        :param only_incremental_states: Whether only the states must be computed.
+        :return: A dict of aggregation values.
+        """
+
+        aggregation_dict = {}
+        state_aggregation_dict = {}
+        state_aliases = {}
+
+        for field_instance, aggregation_type_name in aggregations:
+            field_name = field_instance.db_column
             field = model._field_objects[field_instance.id]["field"]
             model_field = model._meta.get_field(field_name)
 
             aggregation_type = view_aggregation_type_registry.get(aggregation_type_name)
 
-            aggregation_dict[field_name] = aggregation_type.get_aggregation(
-                field_name, model_field, field
-            )
+            if not only_incremental_states:
+                aggregation_dict[field_name] = aggregation_type.get_aggregation(
+                    field_name, model_field, field
+                )
+
+            if with_incremental_states or only_incremental_states:
+                state_aggregations = (
+                    aggregation_type.get_incremental_state_aggregations(
+                        field_name, model_field, field
+                    )
+                )
+                for state_name, aggregation in (state_aggregations or {}).items():
+                    alias = f"incremental_state_{field_name}_{state_name}"
+                    state_aliases[alias] = (field_name, state_name)
+                    state_aggregation_dict[alias] = aggregation
+
+        # The states must be aggregated first because the field names can't be
+        # referenced anymore once they're used as aggregation aliases.
+        aggregation_dict = {**state_aggregation_dict, **aggregation_dict}
 
         # Check if the returned aggregations contain a `AnnotatedAggregation`,
         # and if so, apply the annotations and only keep the actual aggregation in
         # the dict. This is needed because some aggregations require annotated values
         # before they work.
+        annotations = {}
         for key, value in aggregation_dict.items():
             if isinstance(value, AnnotatedAggregation):
-                queryset = queryset.annotate(**value.annotations)
+                annotations.update(value.annotations)
                 aggregation_dict[key] = value.aggregation
+        if annotations:
+            queryset = queryset.annotate(**annotations)
 
         # Add total to allow further calculation on the client if required
         if with_total:
             aggregation_dict["total"] = Count("id", distinct=True)
 
-        return queryset.aggregate(**aggregation_dict)
+        result = queryset.aggregate(**aggregation_dict)
+
+        if with_incremental_states or only_incremental_states:
+            states = defaultdict(dict)
+            for alias, (field_name, state_name) in state_aliases.items():
+                states[field_name][state_name] = result.pop(alias)
+            result[INCREMENTAL_STATES_KEY] = dict(states)
+
+        return result
 
     def rotate_view_slug(self, user: AbstractUser, view: View) -> View:
         """
@@ -876,6 +876,12 @@ class ViewFilterType(Instance):
     checked and returns True if compatible or False if not.
     """
 
+    can_use_trigram_index = False
+    """
+    Indicates whether the filter can be sped up by a trigram index of the column of
+    the field, if the field type supports it.
+    """
+
     def default_filter_on_exception(self):
         """The default Q to use when the filter value is of an incompatible type."""
 
@@ -1010,6 +1016,69 @@ class ViewAggregationType(Instance):
             "Each aggregation type must have his own get_aggregation method."
         )
 
+    def get_incremental_state_aggregations(
+        self,
+        field_name: str,
+        model_field: django_models.Field,
+        field: "Field",
+    ) -> Optional[Dict[str, django_models.Aggregate]]:
+        """
+        Aggregations that can be decomposed, like a count or a sum, can be maintained
+        incrementally when rows are created, updated or deleted instead of being
+        recomputed over the whole table. This method should return the django
+        aggregations that compute the state of such an aggregation, keyed by the name
+        of the state value. The values can also be an `AnnotatedAggregation`.
+        Returns None if the aggregation must always be fully recomputed.
+
+        :param field_name: The name of the field that needs to be aggregated.
+        :param model_field: The field extracted from the model.
+        :param field: The instance of the underlying baserow field.
+        :return: A dict of django aggregations computing the state or None.
+        """
+
+        return None
+
+    def merge_incremental_state(
+        self,
+        state: Dict[str, Any],
+        removed_state: Optional[Dict[str, Any]],
+        added_state: Dict[str, Any],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Computes the new state of the aggregation after the rows described by
+        `removed_state` have been replaced by the rows described by `added_state`.
+
+        :param state: The current state of the aggregation over all the rows.
+        :param removed_state: The state of the rows before they were changed or None
+            if the rows have been created.
+        :param added_state: The state of the rows after they have been changed.
+        :return: The new state or None if it can't be computed incrementally, in
+            which case the aggregation is recomputed over all the rows.
+        """
+
+        raise NotImplementedError(
+            "Each incremental aggregation type must have his own "
+            "merge_incremental_state method."
+        )
+
+    def get_value_from_incremental_state(
+        self, state: Dict[str, Any], model_field: django_models.Field
+    ) -> Any:
+        """
+        Returns the aggregation value matching the provided state. The returned value
+        must be equal to the one computed by the aggregation returned by the
+        `get_aggregation` method.
+
+        :param state: The state of the aggregation.
+        :param model_field: The field extracted from the model.
+        :return: The aggregation value.
+        """
+
+        raise NotImplementedError(
+            "Each incremental aggregation type must have his own "
+            "get_value_from_incremental_state method."
+        )
+
     def field_is_compatible(self, field: "Field") -> bool:
         """
         Given a particular instance of a field returns whether the field is supported
@@ -2,6 +2,7 @@ from django.dispatch import Signal, receiver
 
 from baserow.contrib.database.fields import signals as field_signals
 from baserow.contrib.database.fields.models import FileField
+from baserow.contrib.database.rows import signals as row_signals
 
 from .models import GalleryView
 
@@ -89,3 +90,46 @@ def view_loaded_create_indexes_and_columns(sender, view, table_model, **kwargs):
     table = view.table
     if not table.last_modified_by_column_added or not table.created_by_column_added:
         setup_created_by_and_last_modified_by_column.delay(table_id=view.table.id)
+
+
+@receiver(row_signals.before_rows_update)
+def before_rows_update_get_incremental_aggregations(
+    sender, rows, table, model, updated_field_ids, **kwargs
+):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    return ViewHandler().get_incremental_aggregations(
+        table, model, rows, updated_field_ids
+    )
+
+
+@receiver(row_signals.before_rows_delete)
+def before_rows_delete_get_incremental_aggregations(
+    sender, rows, table, model, **kwargs
+):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    return ViewHandler().get_incremental_aggregations(table, model, rows)
+
+
+@receiver(row_signals.rows_created)
+def rows_created_update_incremental_aggregations(sender, rows, table, model, **kwargs):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    view_handler = ViewHandler()
+    view_handler.apply_incremental_aggregations(
+        model, view_handler.get_incremental_aggregations(table, model), rows
+    )
+
+
+@receiver([row_signals.rows_updated, row_signals.rows_deleted])
+def rows_changed_update_incremental_aggregations(
+    sender, rows, model, before_return, **kwargs
+):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    before_return = dict(before_return)
+    incremental_aggregations = before_return.get(
+        before_rows_update_get_incremental_aggregations
+    ) or before_return.get(before_rows_delete_get_incremental_aggregations)
+    ViewHandler().apply_incremental_aggregations(model, incremental_aggregations, rows)
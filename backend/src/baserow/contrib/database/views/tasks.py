@@ -9,7 +9,11 @@ from loguru import logger
 
 from baserow.config.celery import app
 from baserow.contrib.database.views.exceptions import ViewDoesNotExist
-from baserow.contrib.database.views.handler import ViewHandler, ViewIndexingHandler
+from baserow.contrib.database.views.handler import (
+    TrigramIndexingHandler,
+    ViewHandler,
+    ViewIndexingHandler,
+)
 from baserow.contrib.database.views.models import View
 
 AUTO_INDEX_CACHE_KEY = "auto_index_view_cache_key"
@@ -97,3 +101,24 @@ def schedule_view_index_update(view_id: int):
         return
 
     transaction.on_commit(lambda: _schedule_view_index_update(view_id))
+
+
+@app.task(queue="export")
+@transaction.atomic()
+def update_field_trigram_index(field_id: int):
+    """
+    Creates or removes the trigram index of the provided field if needed.
+
+    :param field_id: The id of the field for which the index should be updated.
+    """
+
+    from baserow.contrib.database.fields.exceptions import FieldDoesNotExist
+    from baserow.contrib.database.fields.handler import FieldHandler
+
+    try:
+        field = FieldHandler().get_field(field_id)
+    except FieldDoesNotExist:
+        # can be ignored, the field and its index don't exist anymore
+        return
+
+    TrigramIndexingHandler.update_index(field)
@@ -1,4 +1,5 @@
-from typing import Dict
+from decimal import ROUND_DOWN, ROUND_HALF_UP, Decimal, localcontext
+from typing import Any, Dict, Optional, Tuple
 
 from django.db.models import (
     Avg,
@@ -71,7 +72,162 @@ def get_has_relations_annotation(field_name: str, model_field: Field) -> Dict:
     return {f"has_relations_{field_name}": Exists(subquery)}
 
 
-class EmptyCountViewAggregationType(ViewAggregationType):
+# The precision used when incrementally adding and subtracting decimals. It must be
+# high enough to never round, so that the result is the same as the exact numeric
+# arithmetic of PostgreSQL.
+INCREMENTAL_DECIMAL_PRECISION = 1000
+
+# The constants of the numeric type of PostgreSQL used to select the scale of the
+# result of a division.
+NUMERIC_DEC_DIGITS = 4
+NUMERIC_MIN_SIG_DIGITS = 16
+NUMERIC_MAX_DISPLAY_SCALE = 1000
+
+
+def _add_optional(a: Any, b: Any) -> Any:
+    """
+    Adds two values where None, the result of an aggregation over no values, is
+    considered to be the neutral element.
+    """
+
+    if a is None:
+        return b
+    if b is None:
+        return a
+    with localcontext() as context:
+        context.prec = INCREMENTAL_DECIMAL_PRECISION
+        return a + b
+
+
+def _subtract_optional(a: Any, b: Any) -> Any:
+    """
+    Subtracts two values where None, the result of an aggregation over no values, is
+    considered to be the neutral element.
+    """
+
+    if b is None:
+        return a
+    if a is None:
+        return -b
+    with localcontext() as context:
+        context.prec = INCREMENTAL_DECIMAL_PRECISION
+        return a - b
+
+
+def _get_numeric_weight_and_first_digit(value: Decimal) -> Tuple[int, int]:
+    """
+    Returns the weight and the value of the first non zero digit of the value in
+    the base 10000 representation used by the numeric type of PostgreSQL.
+    """
+
+    value = abs(value)
+    if not value:
+        return 0, 0
+    weight = value.adjusted() // NUMERIC_DEC_DIGITS
+    return weight, int(value.scaleb(-weight * NUMERIC_DEC_DIGITS))
+
+
+def _divide_numeric(dividend: Any, divisor: Any) -> Decimal:
+    """
+    Divides two numbers exactly like the numeric division of PostgreSQL, which is
+    also used by the `avg` aggregate. The result is rounded half away from zero to
+    the scale PostgreSQL selects, which is enough for at least 16 significant
+    digits and at least the scale of both operands.
+    """
+
+    dividend, divisor = Decimal(dividend), Decimal(divisor)
+    weight_1, first_digit_1 = _get_numeric_weight_and_first_digit(dividend)
+    weight_2, first_digit_2 = _get_numeric_weight_and_first_digit(divisor)
+    quotient_weight = weight_1 - weight_2
+    if first_digit_1 <= first_digit_2:
+        quotient_weight -= 1
+
+    scale = max(
+        NUMERIC_MIN_SIG_DIGITS - quotient_weight * NUMERIC_DEC_DIGITS,
+        -dividend.as_tuple().exponent,
+        -divisor.as_tuple().exponent,
+        0,
+    )
+    scale = min(scale, NUMERIC_MAX_DISPLAY_SCALE)
+
+    with localcontext() as context:
+        # Truncate with a few more digits than needed, so that the final rounding
+        # is the only one that can round up.
+        context.prec = max(dividend.adjusted() - divisor.adjusted(), 0) + scale + 4
+        context.rounding = ROUND_DOWN
+        quotient = dividend / divisor
+        context.rounding = ROUND_HALF_UP
+        return quotient.quantize(Decimal(1).scaleb(-scale))
+
+
+def _merge_sum_state(
+    state: Dict[str, Any],
+    removed_state: Optional[Dict[str, Any]],
+    added_state: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Merges a state made of the sum and the count of the summed values.
+    """
+
+    removed_state = removed_state or {"sum": None, "count": 0}
+    count = state["count"] - removed_state["count"] + added_state["count"]
+    total = _add_optional(
+        _subtract_optional(state["sum"], removed_state["sum"]),
+        added_state["sum"],
+    )
+    return {"sum": total if count else None, "count": count}
+
+
+class IncrementalCountViewAggregationMixin:
+    """
+    Maintains an aggregation counting rows incrementally by subtracting the count of
+    the changed rows before the change and adding their count after it.
+    """
+
+    def get_incremental_state_aggregations(self, field_name, model_field, field):
+        return {"count": self.get_aggregation(field_name, model_field, field)}
+
+    def merge_incremental_state(self, state, removed_state, added_state):
+        removed_count = removed_state["count"] if removed_state else 0
+        return {"count": state["count"] - removed_count + added_state["count"]}
+
+    def get_value_from_incremental_state(self, state, model_field):
+        return state["count"]
+
+
+class IncrementalExtremumViewAggregationMixin:
+    """
+    Maintains a min or max aggregation incrementally. A new extremum can always be
+    merged, but if a changed row held the current extremum, the next one is
+    unknown and the aggregation must be recomputed.
+    """
+
+    state_name: str
+    extremum_function = None
+
+    def get_incremental_state_aggregations(self, field_name, model_field, field):
+        return {self.state_name: self.get_aggregation(field_name, model_field, field)}
+
+    def merge_incremental_state(self, state, removed_state, added_state):
+        current = state[self.state_name]
+        removed = removed_state[self.state_name] if removed_state else None
+        added = added_state[self.state_name]
+
+        if removed is not None and (
+            current is None or self.extremum_function(current, removed) == removed
+        ):
+            return None
+
+        values = [value for value in (current, added) if value is not None]
+        return {self.state_name: self.extremum_function(values) if values else None}
+
+    def get_value_from_incremental_state(self, state, model_field):
+        return state[self.state_name]
+
+
+class EmptyCountViewAggregationType(
+    IncrementalCountViewAggregationMixin, ViewAggregationType
+):
     """
     The empty count aggregation counts how many values are considered empty for
     the given field.
@@ -196,12 +352,16 @@ class UniqueCountViewAggregationType(ViewAggregationType):
         )
 
 
-class MinViewAggregationType(ViewAggregationType):
+class MinViewAggregationType(
+    IncrementalExtremumViewAggregationMixin, ViewAggregationType
+):
     """
     Compute the minimum value for the given field.
     """
 
     type = "min"
+    state_name = "min"
+    extremum_function = staticmethod(min)
 
     compatible_field_types = [
         DateFieldType.type,
@@ -221,12 +381,16 @@ class MinViewAggregationType(ViewAggregationType):
         return Min(field_name)
 
 
-class MaxViewAggregationType(ViewAggregationType):
+class MaxViewAggregationType(
+    IncrementalExtremumViewAggregationMixin, ViewAggregationType
+):
     """
     Compute the maximum value for the given field.
     """
 
     type = "max"
+    state_name = "max"
+    extremum_function = staticmethod(max)
 
     compatible_field_types = [
         DateFieldType.type,
@@ -266,6 +430,15 @@ class SumViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Sum(field_name)
 
+    def get_incremental_state_aggregations(self, field_name, model_field, field):
+        return {"sum": Sum(field_name), "count": Count(field_name)}
+
+    def merge_incremental_state(self, state, removed_state, added_state):
+        return _merge_sum_state(state, removed_state, added_state)
+
+    def get_value_from_incremental_state(self, state, model_field):
+        return state["sum"]
+
 
 class AverageViewAggregationType(ViewAggregationType):
     """
@@ -290,6 +463,27 @@ class AverageViewAggregationType(ViewAggregationType):
             filter=~field_type.empty_query(field_name, model_field, field),
         )
 
+    def get_incremental_state_aggregations(self, field_name, model_field, field):
+        field_type = field_type_registry.get_by_model(field)
+        not_empty = ~field_type.empty_query(field_name, model_field, field)
+
+        return {
+            "sum": Sum(field_name, filter=not_empty),
+            "count": Count("id", filter=not_empty),
+        }
+
+    def merge_incremental_state(self, state, removed_state, added_state):
+        return _merge_sum_state(state, removed_state, added_state)
+
+    def get_value_from_incremental_state(self, state, model_field):
+        if not state["count"]:
+            return None
+
+        value = _divide_numeric(state["sum"], state["count"])
+
+        # The average of integers is returned as a float by Django.
+        return value if isinstance(state["sum"], Decimal) else float(value)
+
 
 class StdDevViewAggregationType(ViewAggregationType):
     """
@@ -221,6 +221,7 @@ class ContainsViewFilterType(ViewFilterType):
     """
 
     type = "contains"
+    can_use_trigram_index = True
     compatible_field_types = [
         TextFieldType.type,
         LongTextFieldType.type,
@@ -259,6 +260,7 @@ class ContainsWordViewFilterType(ViewFilterType):
     """
 
     type = "contains_word"
+    can_use_trigram_index = True
     compatible_field_types = [
         TextFieldType.type,
         LongTextFieldType.type,
@@ -4,6 +4,8 @@ from typing import List
 
 from django.conf import settings
 from django.contrib.auth.models import User as DjangoUser
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models import Q
 from django.db.models.query import QuerySet
 
@@ -32,6 +34,19 @@ from .registries import webhook_event_type_registry
 from .validators import get_webhook_request_function
 
 
+# The marker of the webhooks called for all the event types in the cached event
+# types of the webhooks of a table.
+ALL_EVENT_TYPES = "*"
+
+# The cached event types of the webhooks of a table are invalidated when the webhooks
+# change, but a dispatch racing with the change can cache outdated event types.
+TABLE_WEBHOOK_EVENT_TYPES_CACHE_TIMEOUT = 600
+
+
+def table_webhook_event_types_cache_key(table_id: int) -> str:
+    return f"table_webhook_event_types_{table_id}"
+
+
 class WebhookHandler:
     def find_webhooks_to_call(self, table_id: int, event_type: str) -> QuerySet:
         """
@@ -56,6 +71,55 @@ class WebhookHandler:
             .select_related("table__database")
         )
 
+    def table_has_webhooks_to_call(self, table_id: int, event_type: str) -> bool:
+        """
+        Checks whether `find_webhooks_to_call` can return a webhook for the event
+        type. The event types of the active webhooks of the table are cached, so that
+        the tables without webhooks don't need a query for every event.
+
+        :param table_id: The id of the table that the event happened in.
+        :param event_type: The type of the event.
+        :return: Whether the table has an active webhook for the event type.
+        """
+
+        cache_key = table_webhook_event_types_cache_key(table_id)
+        event_types = cache.get(cache_key)
+        if event_types is None:
+            event_types = set()
+            for include_all_events, webhook_event_type in TableWebhook.objects.filter(
+                table_id=table_id, active=True
+            ).values_list("include_all_events", "events__event_type"):
+                if include_all_events:
+                    event_types.add(ALL_EVENT_TYPES)
+                if webhook_event_type is not None:
+                    event_types.add(webhook_event_type)
+            cache.set(
+                cache_key, event_types, timeout=TABLE_WEBHOOK_EVENT_TYPES_CACHE_TIMEOUT
+            )
+
+        if event_type in event_types:
+            return True
+
+        event_type_object = webhook_event_type_registry.get(event_type)
+        return (
+            ALL_EVENT_TYPES in event_types
+            and event_type_object.should_trigger_when_all_event_types_selected
+        )
+
+    def invalidate_table_webhook_event_types(self, table_id: int):
+        """
+        Forgets the cached event types of the webhooks of the table. Must be called
+        when a webhook of the table or its events change. It's done again when the
+        transaction commits, because the event types could have been cached by a
+        concurrent transaction which didn't see the change.
+
+        :param table_id: The id of the table of which the webhooks changed.
+        """
+
+        cache_key = table_webhook_event_types_cache_key(table_id)
+        cache.delete(cache_key)
+        transaction.on_commit(lambda: cache.delete(cache_key))
+
     def get_table_webhook(
         self, user: DjangoUser, webhook_id: int, base_queryset: QuerySet = None
     ) -> TableWebhook:
@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .handler import WebhookHandler
+from .models import TableWebhook
+
+
+# The events of a webhook are only changed together with the webhook itself, which
+# is always saved, so the cached event types are also invalidated for them.
+@receiver([post_save, post_delete], sender=TableWebhook)
+def invalidate_table_webhook_event_types(sender, instance, **kwargs):
+    WebhookHandler().invalidate_table_webhook_event_types(instance.table_id)
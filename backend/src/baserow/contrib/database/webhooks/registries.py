@@ -122,6 +122,9 @@ class WebhookEventType(Instance):
 
         table = self.get_table_object(**kwargs)
         webhook_handler = WebhookHandler()
+        if not webhook_handler.table_has_webhooks_to_call(table.id, self.type):
+            return
+
         webhooks = webhook_handler.find_webhooks_to_call(table.id, self.type)
         event_id = uuid.uuid4()
         for webhook in webhooks:
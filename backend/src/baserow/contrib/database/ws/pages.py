@@ -13,6 +13,7 @@ from baserow.contrib.database.views.exceptions import (
 )
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.registries import view_type_registry
+from baserow.contrib.database.ws.rows.signals import RealtimeRowMessages
 from baserow.core.exceptions import PermissionDenied, UserNotInWorkspace
 from baserow.core.handler import CoreHandler
 from baserow.ws.registries import PageType
@@ -20,7 +21,7 @@ from baserow.ws.registries import PageType
 
 class TablePageType(PageType):
     type = "table"
-    parameters = ["table_id"]
+    parameters = ["table_id", "row_deltas"]
 
     def can_add(self, user, web_socket_id, table_id, **kwargs):
         """
@@ -51,6 +52,20 @@ class TablePageType(PageType):
     def get_permission_channel_group_name(self, table_id, **kwargs):
         return f"permissions-table-{table_id}"
 
+    def get_payload_for_subscriber(self, payload, table_id, row_deltas=None, **kwargs):
+        """
+        The connections that subscribed with `row_deltas` receive the changed values
+        of the updated rows only, instead of the full rows.
+        """
+
+        if (
+            row_deltas
+            and payload.get("type") == "rows_updated"
+            and str(payload.get("table_id")) == str(table_id)
+        ):
+            return RealtimeRowMessages.rows_fields_updated(payload)
+        return payload
+
 
 class PublicViewPageType(PageType):
     type = "view"
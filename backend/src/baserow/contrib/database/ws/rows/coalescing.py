@@ -0,0 +1,267 @@
+import json
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+
+from django_redis import get_redis_connection
+from opentelemetry import metrics
+
+from baserow.ws.registries import page_registry
+from baserow.ws.tasks import (
+    broadcast_batch_to_channel_group,
+    broadcast_to_channel_group,
+)
+
+meter = metrics.get_meter(__name__)
+
+realtime_row_messages_coalesced = meter.create_histogram(
+    "baserow.realtime.row_messages.coalesced",
+    unit="1",
+    description="The number of row messages of a table which were buffered and sent "
+    "together.",
+)
+realtime_row_messages_refreshes = meter.create_counter(
+    "baserow.realtime.row_messages.refreshes",
+    unit="1",
+    description="The number of times the buffered row messages of a table were "
+    "replaced by a message forcing the clients to refresh the table.",
+)
+
+# How long after the coalescing window the keys of a table expire if the scheduled
+# flush never ran, so that the messages are not buffered forever.
+COALESCING_KEYS_GRACE_SECONDS = 60
+
+
+class CoalescingRowMessagesBroadcaster:
+    """
+    Broadcasts the realtime row messages of a table to its table page. The first
+    message is sent right away, but the messages that follow within
+    `REALTIME_ROW_MESSAGES_COALESCE_SECONDS` are buffered in Redis and sent together
+    at the end of the window. Consecutive updates of the same row are collapsed, and
+    if too many rows changed, the clients are asked to refresh the table instead.
+    This keeps the number of messages per table bounded during bulk edits made with
+    many separate requests.
+    """
+
+    @classmethod
+    def get_window_key(cls, table_id: int) -> str:
+        return f"realtime_row_messages_window_{table_id}"
+
+    @classmethod
+    def get_buffer_key(cls, table_id: int) -> str:
+        return f"realtime_row_messages_buffer_{table_id}"
+
+    @classmethod
+    def get_scheduled_key(cls, table_id: int) -> str:
+        return f"realtime_row_messages_scheduled_{table_id}"
+
+    @classmethod
+    def broadcast(
+        cls,
+        table_id: int,
+        payload: Dict[str, Any],
+        ignore_web_socket_id: Optional[str] = None,
+    ):
+        """
+        Broadcasts the payload to the table page, or buffers it if another message
+        was sent to the page within the coalescing window.
+
+        :param table_id: The id of the table the payload is about.
+        :param payload: The realtime row message.
+        :param ignore_web_socket_id: The web socket id that must not receive the
+            payload. This is normally the web socket that made the change.
+        """
+
+        from .tasks import flush_coalesced_row_messages
+
+        window_seconds = settings.REALTIME_ROW_MESSAGES_COALESCE_SECONDS
+        if window_seconds <= 0:
+            cls._broadcast_now(table_id, payload, ignore_web_socket_id)
+            return
+
+        redis = get_redis_connection("default")
+        keys_timeout = int(window_seconds) + COALESCING_KEYS_GRACE_SECONDS
+
+        # Nothing was sent in the window, so the message can be sent right away.
+        if redis.set(
+            cls.get_window_key(table_id), 1, nx=True, px=int(window_seconds * 1000)
+        ):
+            cls._broadcast_now(table_id, payload, ignore_web_socket_id)
+            return
+
+        buffer_key = cls.get_buffer_key(table_id)
+        message = {"payload": payload, "ignore_web_socket_id": ignore_web_socket_id}
+        pipeline = redis.pipeline()
+        pipeline.rpush(buffer_key, json.dumps(message))
+        pipeline.expire(buffer_key, keys_timeout)
+        # The window is kept open until the buffer is flushed, otherwise a new
+        # message could be sent before the buffered ones.
+        pipeline.set(cls.get_window_key(table_id), 1, ex=keys_timeout)
+        pipeline.set(cls.get_scheduled_key(table_id), 1, nx=True, ex=keys_timeout)
+        *_, scheduled = pipeline.execute()
+
+        if scheduled:
+            flush_coalesced_row_messages.apply_async(
+                (table_id,), countdown=window_seconds
+            )
+
+    @classmethod
+    def _broadcast_now(
+        cls,
+        table_id: int,
+        payload: Dict[str, Any],
+        ignore_web_socket_id: Optional[str],
+    ):
+        page_registry.get("table").broadcast(
+            payload, ignore_web_socket_id, table_id=table_id
+        )
+
+    @classmethod
+    def flush(cls, table_id: int):
+        """
+        Sends the buffered messages of the table to the table page. Called by the
+        task that `broadcast` schedules.
+
+        The messages are sent to the channel layer by this task itself, and the
+        window is only closed afterwards, so that a message broadcast in the meantime
+        is buffered instead of being sent before them by another task. If messages
+        were buffered while sending, the window stays open until their own flush.
+
+        :param table_id: The id of the table which buffered messages must be sent.
+        """
+
+        redis = get_redis_connection("default")
+        buffer_key = cls.get_buffer_key(table_id)
+        pipeline = redis.pipeline()
+        pipeline.lrange(buffer_key, 0, -1)
+        pipeline.delete(buffer_key, cls.get_scheduled_key(table_id))
+        raw_messages, _ = pipeline.execute()
+
+        try:
+            messages = [json.loads(raw_message) for raw_message in raw_messages]
+            if messages:
+                cls._send_buffered_messages(table_id, messages)
+        finally:
+            cls._close_window_if_nothing_buffered(redis, table_id)
+
+    @classmethod
+    def _send_buffered_messages(cls, table_id: int, messages: List[Dict[str, Any]]):
+        from baserow.contrib.database.api.tables.serializers import TableSerializer
+        from baserow.contrib.database.table.exceptions import TableDoesNotExist
+        from baserow.contrib.database.table.handler import TableHandler
+
+        realtime_row_messages_coalesced.record(len(messages))
+        messages = coalesce_row_messages(messages)
+        changed_rows = sum(
+            len(message["payload"].get("rows", [])) for message in messages
+        )
+        group_name = page_registry.get("table").get_group_name(table_id=table_id)
+
+        if changed_rows > settings.REALTIME_ROW_MESSAGES_COALESCE_MAX_ROWS:
+            try:
+                table = TableHandler().get_table(table_id)
+            except TableDoesNotExist:
+                return
+            realtime_row_messages_refreshes.add(1)
+            messages = [
+                {
+                    "payload": {
+                        "type": "table_updated",
+                        "table_id": table_id,
+                        "table": TableSerializer(table).data,
+                        "force_table_refresh": True,
+                    },
+                    "ignore_web_socket_id": None,
+                }
+            ]
+
+        if len(messages) == 1:
+            broadcast_to_channel_group(
+                group_name, messages[0]["payload"], messages[0]["ignore_web_socket_id"]
+            )
+        else:
+            broadcast_batch_to_channel_group(group_name, messages)
+
+    @classmethod
+    def _close_window_if_nothing_buffered(cls, redis, table_id: int):
+        buffer_key = cls.get_buffer_key(table_id)
+
+        def close_window(pipeline):
+            if not pipeline.exists(buffer_key):
+                pipeline.multi()
+                pipeline.delete(cls.get_window_key(table_id))
+
+        redis.transaction(close_window, buffer_key)
+
+
+def _can_be_merged(message: Dict[str, Any], previous: Dict[str, Any]) -> bool:
+    payload, previous_payload = message["payload"], previous["payload"]
+    return (
+        payload["type"] == previous_payload["type"]
+        and message["ignore_web_socket_id"] == previous["ignore_web_socket_id"]
+        and (
+            payload["type"] != "rows_created"
+            or payload["before_row_id"] == previous_payload["before_row_id"]
+        )
+    )
+
+
+def _merge_updated_rows(previous_payload: Dict[str, Any], payload: Dict[str, Any]):
+    """
+    Merges the rows of an update message into the previous update message. The
+    values before the update are the ones of the first update, and the values after
+    the update are the ones of the last update.
+    """
+
+    rows_by_id = {row["id"]: row for row in previous_payload["rows"]}
+    rows_before_update_by_id = {
+        row["id"]: row for row in previous_payload["rows_before_update"]
+    }
+    for row, row_before_update in zip(payload["rows"], payload["rows_before_update"]):
+        if row["id"] in rows_by_id:
+            rows_by_id[row["id"]].update(row)
+            existing_row_before_update = rows_before_update_by_id[row["id"]]
+            for key, value in row_before_update.items():
+                existing_row_before_update.setdefault(key, value)
+        else:
+            previous_payload["rows"].append(row)
+            previous_payload["rows_before_update"].append(row_before_update)
+            rows_by_id[row["id"]] = row
+            rows_before_update_by_id[row["id"]] = row_before_update
+
+
+def coalesce_row_messages(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Merges consecutive row messages of the same type that must be ignored for the
+    same web socket, so that for example the updates of the same row are collapsed
+    into a single update. Messages are never reordered, so a row which is created,
+    updated and deleted still results in the same end state for the clients.
+
+    :param messages: The buffered messages, each containing the `payload` and the
+        `ignore_web_socket_id`.
+    :return: The merged messages.
+    """
+
+    coalesced = []
+    for message in messages:
+        previous = coalesced[-1] if coalesced else None
+        if previous is None or not _can_be_merged(message, previous):
+            coalesced.append(message)
+            continue
+
+        payload, previous_payload = message["payload"], previous["payload"]
+        if payload["type"] == "rows_updated":
+            _merge_updated_rows(previous_payload, payload)
+        elif payload["type"] == "rows_deleted":
+            previous_payload["row_ids"].extend(payload["row_ids"])
+            previous_payload["rows"].extend(payload["rows"])
+        elif payload["type"] == "rows_created":
+            previous_payload["rows"].extend(payload["rows"])
+        else:
+            coalesced.append(message)
+            continue
+
+        if "metadata" in payload:
+            previous_payload["metadata"].update(payload["metadata"])
+
+    return coalesced
@@ -14,6 +14,8 @@ from baserow.contrib.database.rows.registries import row_metadata_registry
 from baserow.contrib.database.table.models import GeneratedTableModel
 from baserow.ws.registries import page_registry
 
+from .coalescing import CoalescingRowMessagesBroadcaster
+
 
 @receiver(row_signals.before_rows_update)
 def serialize_rows_values(
@@ -37,9 +39,9 @@ def rows_created(
     if not send_realtime_update:
         return
 
-    table_page_type = page_registry.get("table")
     transaction.on_commit(
-        lambda: table_page_type.broadcast(
+        lambda: CoalescingRowMessagesBroadcaster.broadcast(
+            table.id,
             RealtimeRowMessages.rows_created(
                 table_id=table.id,
                 serialized_rows=get_row_serializer_class(
@@ -51,7 +53,6 @@ def rows_created(
                 before=before,
             ),
             getattr(user, "web_socket_id", None),
-            table_id=table.id,
         )
     )
 
@@ -67,10 +68,10 @@ def rows_updated(
     updated_field_ids,
     **kwargs,
 ):
-    table_page_type = page_registry.get("table")
     before_rows_values = dict(before_return)[serialize_rows_values]
     transaction.on_commit(
-        lambda: table_page_type.broadcast(
+        lambda: CoalescingRowMessagesBroadcaster.broadcast(
+            table.id,
             RealtimeRowMessages.rows_updated(
                 table_id=table.id,
                 serialized_rows_before_update=before_rows_values,
@@ -82,7 +83,6 @@ def rows_updated(
                 ),
             ),
             getattr(user, "web_socket_id", None),
-            table_id=table.id,
         )
     )
 
@@ -116,15 +116,14 @@ def before_rows_delete(sender, rows, user, table, model, **kwargs):
 
 @receiver(row_signals.rows_deleted)
 def rows_deleted(sender, rows, user, table, model, before_return, **kwargs):
-    table_page_type = page_registry.get("table")
     transaction.on_commit(
-        lambda: table_page_type.broadcast(
+        lambda: CoalescingRowMessagesBroadcaster.broadcast(
+            table.id,
             RealtimeRowMessages.rows_deleted(
                 table_id=table.id,
                 serialized_rows=dict(before_return)[before_rows_delete],
             ),
             getattr(user, "web_socket_id", None),
-            table_id=table.id,
         )
     )
 
@@ -216,6 +215,35 @@ class RealtimeRowMessages:
             "metadata": metadata,
         }
 
+    @staticmethod
+    def rows_fields_updated(rows_updated_payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Converts a `rows_updated` message into a message of which the rows only
+        contain the id, the order and the values that changed, including the values
+        of the formula fields that were recomputed. This message is sent instead of
+        `rows_updated` to the clients that subscribed to the table page with
+        `row_deltas`, and which already have the rows.
+        """
+
+        rows_before_update, rows = [], []
+        for row_before_update, row in zip(
+            rows_updated_payload["rows_before_update"], rows_updated_payload["rows"]
+        ):
+            keys = ["id", "order"] + [
+                key
+                for key, value in row.items()
+                if key not in ("id", "order") and row_before_update.get(key) != value
+            ]
+            rows_before_update.append({key: row_before_update.get(key) for key in keys})
+            rows.append({key: row[key] for key in keys})
+
+        return {
+            **rows_updated_payload,
+            "type": "rows_fields_updated",
+            "rows_before_update": rows_before_update,
+            "rows": rows,
+        }
+
     @staticmethod
     def row_orders_recalculated(table_id: int) -> Dict[str, Any]:
         return {
@@ -0,0 +1,15 @@
+from baserow.config.celery import app
+
+
+@app.task(bind=True)
+def flush_coalesced_row_messages(self, table_id: int):
+    """
+    Sends the realtime row messages of the table which were buffered by the
+    `CoalescingRowMessagesBroadcaster`.
+
+    :param table_id: The id of the table which buffered messages must be sent.
+    """
+
+    from .coalescing import CoalescingRowMessagesBroadcaster
+
+    CoalescingRowMessagesBroadcaster.flush(table_id)
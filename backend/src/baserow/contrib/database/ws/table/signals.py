@@ -12,20 +12,19 @@ from baserow.contrib.database.table.tasks import (
 )
 from baserow.core import signals as core_signals
 from baserow.core.utils import generate_hash
-from baserow.ws.tasks import broadcast_to_group, broadcast_to_permitted_users
+from baserow.ws.tasks import broadcast_to_group
+from baserow.ws.utils import broadcast_to_permitted_users_on_commit
 
 
 @receiver(table_signals.table_created)
 def table_created(sender, table, user, **kwargs):
-    transaction.on_commit(
-        lambda: broadcast_to_permitted_users.delay(
-            table.database.workspace_id,
-            ReadDatabaseTableOperationType.type,
-            DatabaseTableObjectScopeType.type,
-            table.id,
-            {"type": "table_created", "table": TableSerializer(table).data},
-            getattr(user, "web_socket_id", None),
-        )
+    broadcast_to_permitted_users_on_commit(
+        table.database.workspace_id,
+        ReadDatabaseTableOperationType.type,
+        DatabaseTableObjectScopeType.type,
+        table.id,
+        lambda: {"type": "table_created", "table": TableSerializer(table).data},
+        getattr(user, "web_socket_id", None),
     )
 
 
@@ -37,38 +36,34 @@ def table_updated(
     force_table_refresh: bool = False,
     **kwargs,
 ):
-    transaction.on_commit(
-        lambda: broadcast_to_permitted_users.delay(
-            table.database.workspace_id,
-            ReadDatabaseTableOperationType.type,
-            DatabaseTableObjectScopeType.type,
-            table.id,
-            {
-                "type": "table_updated",
-                "table_id": table.id,
-                "table": TableSerializer(table).data,
-                "force_table_refresh": force_table_refresh,
-            },
-            getattr(user, "web_socket_id", None),
-        )
+    broadcast_to_permitted_users_on_commit(
+        table.database.workspace_id,
+        ReadDatabaseTableOperationType.type,
+        DatabaseTableObjectScopeType.type,
+        table.id,
+        lambda: {
+            "type": "table_updated",
+            "table_id": table.id,
+            "table": TableSerializer(table).data,
+            "force_table_refresh": force_table_refresh,
+        },
+        getattr(user, "web_socket_id", None),
     )
 
 
 @receiver(table_signals.table_deleted)
 def table_deleted(sender, table_id, table, user, **kwargs):
-    transaction.on_commit(
-        lambda: broadcast_to_permitted_users.delay(
-            table.database.workspace_id,
-            ReadDatabaseTableOperationType.type,
-            DatabaseTableObjectScopeType.type,
-            table.id,
-            {
-                "type": "table_deleted",
-                "database_id": table.database_id,
-                "table_id": table_id,
-            },
-            getattr(user, "web_socket_id", None),
-        )
+    broadcast_to_permitted_users_on_commit(
+        table.database.workspace_id,
+        ReadDatabaseTableOperationType.type,
+        DatabaseTableObjectScopeType.type,
+        table.id,
+        lambda: {
+            "type": "table_deleted",
+            "database_id": table.database_id,
+            "table_id": table_id,
+        },
+        getattr(user, "web_socket_id", None),
     )
 
 
@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
 
 from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import ValidationError
@@ -40,6 +40,7 @@ from baserow.contrib.database.rows.exceptions import RowDoesNotExist
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.rows.operations import ReadDatabaseRowOperationType
 from baserow.contrib.database.search.handler import SearchHandler
+from baserow.contrib.database.table.cache import get_table_data_version
 from baserow.contrib.database.table.exceptions import TableDoesNotExist
 from baserow.contrib.database.table.handler import TableHandler
 from baserow.contrib.database.table.operations import ListRowsDatabaseTableOperationType
@@ -220,6 +221,19 @@ class LocalBaserowTableServiceType(LocalBaserowServiceType):
 
         return resolved_values
 
+    def get_dispatch_cache_versions(
+        self, service: ServiceSubClass
+    ) -> Optional[List[Any]]:
+        """
+        The dispatch result only depends on the data of the table, including the
+        filters and sorts of the view.
+        """
+
+        if service.table_id is None:
+            return None
+
+        return [get_table_data_version(service.table_id)]
+
     def serialize_property(
         self,
         service: ServiceSubClass,
@@ -709,8 +723,23 @@ class LocalBaserowListRowsUserServiceType(
             "view__viewsort_set",
             "table__field_set",
             "view__viewgroupby_set",
+            "service_filters",
         )
 
+    def formula_generator(
+        self, service: LocalBaserowListRows
+    ) -> Generator[str, None, None]:
+        """
+        Yields the search query formula and the formulas of the service filters.
+        """
+
+        yield from super().formula_generator(service)
+
+        yield service.search_query
+        for service_filter in service.service_filters.all():
+            if service_filter.value_is_formula:
+                yield service_filter.value
+
     def import_path(self, path, id_mapping):
         """
         Updates the field ids in the path.
@@ -975,7 +1004,23 @@ class LocalBaserowGetRowUserServiceType(
     def enhance_queryset(self, queryset):
         return queryset.select_related(
             "table", "table__database", "table__database__workspace", "view"
-        )
+        ).prefetch_related("service_filters")
+
+    def formula_generator(
+        self, service: LocalBaserowGetRow
+    ) -> Generator[str, None, None]:
+        """
+        Yields the row id and search query formulas and the formulas of the service
+        filters.
+        """
+
+        yield from super().formula_generator(service)
+
+        yield service.row_id
+        yield service.search_query
+        for service_filter in service.service_filters.all():
+            if service_filter.value_is_formula:
+                yield service_filter.value
 
     def import_path(self, path, id_mapping):
         """
@@ -0,0 +1,45 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+def get_cache_version(version_cache_key: str) -> int:
+    """
+    Returns the current version stored in the version cache key. The cached values
+    depending on the version must be stored with the version they were computed for,
+    and they are only valid as long as the version doesn't change.
+
+    A new version key starts at an unpredictable value, so that the values cached
+    before the version key was evicted can't be considered valid again.
+
+    :param version_cache_key: The cache key containing the version.
+    :return: The current version.
+    """
+
+    version = cache.get(version_cache_key)
+    if version is None:
+        cache.add(version_cache_key, time.time_ns(), timeout=None)
+        version = cache.get(version_cache_key)
+    return version
+
+
+def increment_cache_version(version_cache_key: str):
+    """
+    Increments the version stored in the version cache key, which invalidates all the
+    values cached for the previous version. The version is incremented again when
+    the current transaction commits, because the values computed by concurrent
+    requests or tasks before that are based on the old state of the database.
+
+    :param version_cache_key: The cache key containing the version.
+    """
+
+    def increment_version():
+        try:
+            cache.incr(version_cache_key, 1)
+        except ValueError:
+            # No cache key, we create one
+            cache.set(version_cache_key, time.time_ns(), timeout=None)
+
+    increment_version()
+    transaction.on_commit(increment_version)
@@ -4,8 +4,13 @@ This module handles the storage of request-specific variables, particularly:
 * workspace_id: Represents the ID of the current workspace related to the request.
     This ID can be utilized by storage backends to generate URLs specific to the
     workspace.
+* permission_checks_cache: The results of the permission checks already done during
+    the request or the Celery task, so that identical checks don't have to go through
+    all the permission managers again.
 """
 
+from typing import Any, Dict, Optional, Tuple
+
 from asgiref.local import Local
 
 _thread_locals = Local()
@@ -23,3 +28,101 @@ def set_current_workspace_id(workspace_id):
 
 def clear_current_workspace_id():
     _thread_locals.workspace_id = None
+
+
+class PermissionChecksCache:
+    """
+    Holds the results of the permission checks done in the current scope, keyed by
+    the check, the workspace and whether trashed objects are included.
+    """
+
+    def __init__(self):
+        self.results: Dict[Any, Any] = {}
+        self.hits = 0
+
+
+def get_permission_checks_cache() -> Optional[PermissionChecksCache]:
+    """
+    Returns the permission checks cache of the current request or task, or None if
+    the permission checks are not cached in the current scope.
+    """
+
+    return getattr(_thread_locals, "permission_checks_cache", None)
+
+
+def start_permission_checks_cache():
+    """
+    Starts caching the permission checks in the current scope. Scopes can be nested,
+    for example when a Celery task runs eagerly during a request, in which case the
+    cache of the outer scope is reused.
+    """
+
+    depth = getattr(_thread_locals, "permission_checks_cache_depth", 0)
+    if depth == 0:
+        _thread_locals.permission_checks_cache = PermissionChecksCache()
+    _thread_locals.permission_checks_cache_depth = depth + 1
+
+
+def stop_permission_checks_cache() -> Optional[PermissionChecksCache]:
+    """
+    Ends the current permission checks cache scope. The cache is dropped when the
+    outermost scope ends.
+
+    :return: The cache that was dropped, if any.
+    """
+
+    depth = getattr(_thread_locals, "permission_checks_cache_depth", 0)
+    if depth > 1:
+        _thread_locals.permission_checks_cache_depth = depth - 1
+        return None
+
+    cache = get_permission_checks_cache()
+    _thread_locals.permission_checks_cache_depth = 0
+    _thread_locals.permission_checks_cache = None
+    return cache
+
+
+def invalidate_permission_checks_cache():
+    """
+    Forgets the cached permission check results of the current scope. Must be called
+    when something that affects the permissions, like the workspace membership or a
+    role, changes.
+    """
+
+    cache = get_permission_checks_cache()
+    if cache is not None:
+        cache.results = {}
+
+
+def clear_permission_checks_cache():
+    """
+    Drops the permission checks cache of the current scope, regardless of how many
+    scopes were started.
+    """
+
+    _thread_locals.permission_checks_cache_depth = 0
+    _thread_locals.permission_checks_cache = None
+
+
+def get_context() -> Tuple[Optional[int], Optional[PermissionChecksCache]]:
+    """
+    Returns the request-specific variables of the current scope, so that they can be
+    restored with `set_context` in another thread working for the same request.
+    """
+
+    return get_current_workspace_id(), get_permission_checks_cache()
+
+
+def set_context(context: Tuple[Optional[int], Optional[PermissionChecksCache]]):
+    """
+    Restores the request-specific variables returned by `get_context`. They must be
+    cleared with `CoreHandler().clear_context()` when the work is done, because the
+    thread can be reused for another request.
+    """
+
+    workspace_id, permission_checks_cache = context
+    set_current_workspace_id(workspace_id)
+    _thread_locals.permission_checks_cache = permission_checks_cache
+    _thread_locals.permission_checks_cache_depth = (
+        0 if permission_checks_cache is None else 1
+    )
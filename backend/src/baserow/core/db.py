@@ -1,7 +1,13 @@
 import contextlib
+import datetime
+import io
+import json
+import re
+import uuid
 from collections import defaultdict
 from decimal import Decimal
 from functools import cache
+from itertools import islice
 from math import ceil
 from typing import (
     Any,
@@ -13,18 +19,24 @@ from typing import (
     Optional,
     Set,
     Tuple,
+    Type,
     TypeVar,
     Union,
 )
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
-from django.db import DEFAULT_DB_ALIAS, connection, transaction
+from django.core.exceptions import EmptyResultSet
+from django.db import DEFAULT_DB_ALIAS, connection, connections, transaction
 from django.db.models import ForeignKey, ManyToManyField, Max, Model, QuerySet
+from django.db.models.expressions import RawSQL
 from django.db.models.functions import Collate
+from django.db.models.sql import UpdateQuery
 from django.db.models.sql.query import LOOKUP_SEP
 from django.db.transaction import Atomic, get_connection
+from django.utils import timezone
 
+from dateutil.relativedelta import relativedelta
 from loguru import logger
 from psycopg2 import sql
 
@@ -341,6 +353,359 @@ def get_highest_order_of_queryset(
     return [last_order + (step * i) for i in range(1, amount + 1)]
 
 
+def estimate_queryset_count(queryset: QuerySet) -> int:
+    """
+    Returns the number of rows that the PostgreSQL query planner expects the
+    queryset to return. This is much cheaper than a `COUNT(*)` on big tables because
+    it only relies on the table statistics, but it can be off, especially if the
+    statistics are outdated or if complex filters are applied.
+
+    :param queryset: The queryset of which the count must be estimated.
+    :return: The estimated number of rows.
+    """
+
+    sql_query, params = queryset.order_by().query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql_query}", params)  # nosec B608
+        plan = cursor.fetchone()[0]
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _to_copy_text(value: Any) -> str:
+    """
+    Converts a value prepared for the database to its representation in the text
+    format of PostgreSQL's `COPY`.
+    """
+
+    if hasattr(value, "resolve_expression"):
+        raise ValueError("Expressions can't be inserted with COPY.")
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (datetime.date, datetime.time)):
+        value = value.isoformat()
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def bulk_create_with_copy(
+    model: Type[Model], instances: List[Model], using: str = DEFAULT_DB_ALIAS
+) -> List[Model]:
+    """
+    Inserts the instances like `model.objects.bulk_create(instances)`, but with a
+    `COPY ... FROM STDIN` query, which is a lot faster when many rows are inserted.
+    The values of all the concrete fields must be plain values that can be
+    converted to text, so fields with expressions, JSON or arrays as value are not
+    supported. Because `COPY` can't return the ids of the inserted rows, they're
+    reserved from the sequence of the primary key first.
+
+    :param model: The model of the instances.
+    :param instances: The unsaved instances that must be inserted.
+    :param using: The database connection to insert the instances with.
+    :return: The inserted instances, with their primary key set.
+    """
+
+    if not instances:
+        return instances
+
+    db_connection = connections[using]
+    meta = model._meta
+    pk_field = meta.pk
+    fields = [field for field in meta.concrete_fields if field != pk_field]
+
+    with db_connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT nextval(pg_get_serial_sequence(%s, %s)) "
+            "FROM generate_series(1, %s)",
+            [
+                db_connection.ops.quote_name(meta.db_table),
+                pk_field.column,
+                len(instances),
+            ],
+        )
+        ids = [row[0] for row in cursor.fetchall()]
+
+        buffer = io.StringIO()
+        for instance, pk_value in zip(instances, ids):
+            setattr(instance, pk_field.attname, pk_value)
+            values = [pk_value] + [
+                field.get_db_prep_save(field.pre_save(instance, True), db_connection)
+                for field in fields
+            ]
+            buffer.write("\t".join(_to_copy_text(value) for value in values))
+            buffer.write("\n")
+        buffer.seek(0)
+
+        cursor.cursor.copy_expert(
+            sql.SQL("COPY {table_name} ({columns}) FROM STDIN")
+            .format(
+                table_name=sql.Identifier(meta.db_table),
+                columns=sql.SQL(", ").join(
+                    sql.Identifier(field.column) for field in [pk_field, *fields]
+                ),
+            )
+            .as_string(cursor.cursor),
+            buffer,
+        )
+
+    for instance in instances:
+        instance._state.adding = False
+        instance._state.db = using
+    return instances
+
+
+def update_and_return_ids(queryset: QuerySet, **kwargs) -> List[int]:
+    """
+    Same as `queryset.update(**kwargs)`, but returns the ids of the updated rows
+    using `UPDATE ... RETURNING` instead of the number of updated rows, so that no
+    additional query is needed to find out which rows were updated.
+
+    :param queryset: The queryset matching the rows that must be updated.
+    :param kwargs: The values or expressions to update, like `queryset.update`.
+    :return: The ids of the updated rows.
+    """
+
+    query = queryset.query.chain(UpdateQuery)
+    query.add_update_values(kwargs)
+    # Clear any annotations so that they won't be present in subqueries, just like
+    # Django does in `QuerySet.update`.
+    query.annotations = {}
+    try:
+        sql_query, params = query.get_compiler(queryset.db).as_sql()
+    except EmptyResultSet:
+        return []
+    if not sql_query:
+        return []
+
+    pk_column = connections[queryset.db].ops.quote_name(queryset.model._meta.pk.column)
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f"{sql_query} RETURNING {pk_column}", params)  # nosec B608
+        return [row[0] for row in cursor.fetchall()]
+
+
+@contextlib.contextmanager
+def temporary_ids_table(ids: Iterable[int], using: str = DEFAULT_DB_ALIAS):
+    """
+    Stores the provided ids in a temporary table for the duration of the context.
+    Filtering on a big list of ids with `id__in` results in a huge query that must
+    be parsed and planned every time, while joining with an analyzed temporary table
+    is a lot faster.
+
+    :param ids: The ids that must be stored in the temporary table.
+    :param using: The database connection where the table must be created.
+    :return: A `RawSQL` subquery selecting the ids which can be used in an `__in`
+        filter, like `queryset.filter(id__in=subquery)`.
+    """
+
+    table_name = f"tmp_ids_{uuid.uuid4().hex}"
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            sql.SQL(
+                "CREATE TEMPORARY TABLE {table_name} (id integer PRIMARY KEY)"
+            ).format(table_name=sql.Identifier(table_name))
+        )
+        cursor.execute(
+            sql.SQL(
+                "INSERT INTO {table_name} SELECT DISTINCT unnest(%s::integer[])"
+            ).format(table_name=sql.Identifier(table_name)),
+            [list(ids)],
+        )
+        cursor.execute(
+            sql.SQL("ANALYZE {table_name}").format(
+                table_name=sql.Identifier(table_name)
+            )
+        )
+
+    yield RawSQL(f'SELECT id FROM "{table_name}"', ())  # nosec B611
+
+    # Not dropped if an exception is raised, because the transaction can't execute
+    # queries anymore at that point. Rolling back the transaction removes the table
+    # anyway, otherwise it's removed when the session ends.
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            sql.SQL("DROP TABLE IF EXISTS {table_name}").format(
+                table_name=sql.Identifier(table_name)
+            )
+        )
+
+
+# The tables partitioned by month have a partition per month named after the month,
+# and a default partition containing the rows for which the partition of the month
+# doesn't exist yet.
+MONTHLY_PARTITION_NAME_REGEX = re.compile(r"_y(?P<year>\d{4})m(?P<month>\d{2})$")
+
+
+def get_monthly_partition_name(table_name: str, month: datetime.datetime) -> str:
+    """
+    Returns the name of the partition of the table containing the rows of the month.
+
+    :param table_name: The name of the table partitioned by month.
+    :param month: Any date and time in the month.
+    :return: The name of the partition table.
+    """
+
+    return f"{table_name}_y{month.year:04d}m{month.month:02d}"
+
+
+def get_monthly_partitions(
+    table_name: str, using: str = DEFAULT_DB_ALIAS
+) -> Dict[datetime.datetime, str]:
+    """
+    Returns the monthly partitions of a table partitioned by month.
+
+    :param table_name: The name of the table partitioned by month.
+    :param using: The database connection to use.
+    :return: The names of the partition tables, keyed by the start of their month
+        in UTC.
+    """
+
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = %s::regclass
+            """,
+            [table_name],
+        )
+        partition_names = [row[0] for row in cursor.fetchall()]
+
+    partitions = {}
+    for partition_name in partition_names:
+        match = MONTHLY_PARTITION_NAME_REGEX.search(partition_name)
+        if match is not None:
+            month = datetime.datetime(
+                int(match["year"]), int(match["month"]), 1, tzinfo=datetime.timezone.utc
+            )
+            partitions[month] = partition_name
+    return partitions
+
+
+def create_monthly_partition(
+    table_name: str,
+    partition_column: str,
+    month: datetime.datetime,
+    using: str = DEFAULT_DB_ALIAS,
+):
+    """
+    Creates the partition of the table containing the rows of the given month. The
+    rows of the month which were already written to the default partition are
+    moved to the new partition, otherwise it couldn't be attached.
+
+    :param table_name: The name of the table partitioned by month.
+    :param partition_column: The timestamp column the table is partitioned on.
+    :param month: The start of the month in UTC.
+    :param using: The database connection to use.
+    """
+
+    identifiers = {
+        "table": sql.Identifier(table_name),
+        "partition": sql.Identifier(get_monthly_partition_name(table_name, month)),
+        "default_partition": sql.Identifier(f"{table_name}_default"),
+        "partition_column": sql.Identifier(partition_column),
+    }
+    params = {"start": month, "end": month + relativedelta(months=1)}
+
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        cursor.execute(
+            sql.SQL(
+                "CREATE TABLE {partition} "
+                "(LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            ).format(**identifiers)
+        )
+        cursor.execute(
+            sql.SQL(
+                """
+                WITH moved_rows AS (
+                    DELETE FROM {default_partition}
+                    WHERE {partition_column} >= %(start)s
+                    AND {partition_column} < %(end)s
+                    RETURNING *
+                )
+                INSERT INTO {partition} SELECT * FROM moved_rows
+                """
+            ).format(**identifiers),
+            params,
+        )
+        cursor.execute(
+            sql.SQL(
+                "ALTER TABLE {table} ATTACH PARTITION {partition} "
+                "FOR VALUES FROM (%(start)s) TO (%(end)s)"
+            ).format(**identifiers),
+            params,
+        )
+
+
+def create_upcoming_monthly_partitions(
+    table_name: str,
+    partition_column: str,
+    months_ahead: int = 2,
+    using: str = DEFAULT_DB_ALIAS,
+):
+    """
+    Makes sure that the partitions of the current month and the given number of
+    months after it exist, so that the new rows don't end up in the default
+    partition.
+
+    :param table_name: The name of the table partitioned by month.
+    :param partition_column: The timestamp column the table is partitioned on.
+    :param months_ahead: The number of months after the current one for which the
+        partitions must be created.
+    :param using: The database connection to use.
+    """
+
+    existing_partitions = get_monthly_partitions(table_name, using=using)
+    now = timezone.now().astimezone(datetime.timezone.utc)
+    current_month = datetime.datetime(
+        now.year, now.month, 1, tzinfo=datetime.timezone.utc
+    )
+    for months in range(months_ahead + 1):
+        month = current_month + relativedelta(months=months)
+        if month not in existing_partitions:
+            create_monthly_partition(table_name, partition_column, month, using=using)
+
+
+def drop_monthly_partitions_before(
+    table_name: str, cutoff: datetime.datetime, using: str = DEFAULT_DB_ALIAS
+) -> int:
+    """
+    Drops the monthly partitions of the table which only contain rows before the
+    cutoff. This is a lot faster than deleting the rows, and it immediately frees
+    the disk space. The rows before the cutoff in the remaining partitions must
+    still be deleted.
+
+    :param table_name: The name of the table partitioned by month.
+    :param cutoff: The date and time before which the rows can be removed.
+    :param using: The database connection to use.
+    :return: The number of dropped partitions.
+    """
+
+    if timezone.is_naive(cutoff):
+        cutoff = timezone.make_aware(cutoff)
+
+    dropped = 0
+    for month, partition_name in get_monthly_partitions(table_name, using).items():
+        if month + relativedelta(months=1) <= cutoff:
+            with connections[using].cursor() as cursor:
+                cursor.execute(
+                    sql.SQL("DROP TABLE {partition}").format(
+                        partition=sql.Identifier(partition_name)
+                    )
+                )
+            dropped += 1
+    return dropped
+
+
 def recalculate_full_orders(
     model: Optional[Model] = None,
     field="order",
@@ -472,6 +837,20 @@ class MultiFieldPrefetchQuerysetMixin(Generic[ModelInstance]):
                 f(self, self._result_cache)
             self._multi_field_prefetch_done = True
 
+    def _iterator(self, use_chunked_fetch, chunk_size):
+        # Like the regular `prefetch_related`, the multi field prefetches are applied
+        # to every chunk of rows when iterating over the queryset with a chunk size.
+        iterable = super()._iterator(use_chunked_fetch, chunk_size)
+        if not self._multi_field_prefetch_related_funcs or chunk_size is None:
+            yield from iterable
+            return
+
+        iterator = iter(iterable)
+        while results := list(islice(iterator, chunk_size)):
+            for f in self._multi_field_prefetch_related_funcs:
+                f(self, results)
+            yield from results
+
     def _clone(self, *args, **kwargs):
         c = super()._clone(*args, **kwargs)
         c._multi_field_prefetch_related_funcs = (
@@ -1,5 +1,8 @@
+from functools import lru_cache
 from typing import Any
 
+from django.conf import settings
+
 from baserow.core.formula.parser.exceptions import (
     BaserowFormulaException,
     BaserowFormulaSyntaxError,
@@ -20,7 +23,27 @@ __all__ = [
 ]
 
 from baserow.core.formula.parser.parser import get_parse_tree_for_formula
-from baserow.core.formula.parser.python_executor import BaserowPythonExecutor
+from baserow.core.formula.parser.python_compiler import (
+    BaserowPythonCompiler,
+    CompiledFormula,
+)
+
+
+@lru_cache(maxsize=settings.BASEROW_COMPILED_FORMULAS_CACHE_SIZE)
+def compile_formula(formula: str, functions: FunctionCollection) -> CompiledFormula:
+    """
+    Parses the formula and compiles it into a function which evaluates it for a
+    given formula context. The most recently used compiled formulas are kept in
+    memory, so that a formula is only parsed once no matter how many times it's
+    resolved.
+
+    :param formula: the formula itself.
+    :param functions: The functions which can be used in the formula.
+    :return: A function resolving the formula for the formula context given to it.
+    """
+
+    tree = get_parse_tree_for_formula(formula)
+    return BaserowPythonCompiler(functions).visit(tree)
 
 
 def resolve_formula(
@@ -39,5 +62,4 @@ def resolve_formula(
     if not formula:
         return ""
 
-    tree = get_parse_tree_for_formula(formula)
-    return BaserowPythonExecutor(functions, formula_context).visit(tree)
+    return compile_formula(formula, functions)(formula_context)
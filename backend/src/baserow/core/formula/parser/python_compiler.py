@@ -0,0 +1,139 @@
+from decimal import Decimal
+from typing import Any, Callable, List, Type
+
+from baserow.core.formula import BaserowFormula, BaserowFormulaVisitor
+from baserow.core.formula.parser.exceptions import (
+    BaserowFormulaSyntaxError,
+    FieldByIdReferencesAreDeprecated,
+    FormulaFunctionTypeDoesNotExist,
+    UnknownOperator,
+)
+from baserow.core.formula.types import FormulaContext, FunctionCollection
+
+CompiledFormula = Callable[[FormulaContext], Any]
+
+
+def _constant(value: Any) -> CompiledFormula:
+    return lambda context: value
+
+
+def _raising(exception_class: Type[Exception], *args) -> CompiledFormula:
+    def raise_exception(context):
+        raise exception_class(*args)
+
+    return raise_exception
+
+
+class BaserowPythonCompiler(BaserowFormulaVisitor):
+    """
+    Compiles a parse tree into a tree of closures which evaluate the formula for a
+    given context, so that it can be evaluated many times without having to parse
+    and walk the formula again. The evaluation is the same as the one of the
+    `BaserowPythonExecutor`, including the errors which are raised and their order.
+    """
+
+    def __init__(self, functions: FunctionCollection):
+        self.functions = functions
+
+    def visitRoot(self, ctx: BaserowFormula.RootContext):
+        return ctx.expr().accept(self)
+
+    def visitStringLiteral(self, ctx: BaserowFormula.StringLiteralContext):
+        return _constant(self.process_string(ctx))
+
+    def visitDecimalLiteral(self, ctx: BaserowFormula.DecimalLiteralContext):
+        return _constant(Decimal(ctx.getText()))
+
+    def visitBooleanLiteral(self, ctx: BaserowFormula.BooleanLiteralContext):
+        return _constant(ctx.TRUE() is not None)
+
+    def visitBrackets(self, ctx: BaserowFormula.BracketsContext):
+        return ctx.expr().accept(self)
+
+    def process_string(self, ctx):
+        literal_without_outer_quotes = ctx.getText()[1:-1]
+        if ctx.SINGLEQ_STRING_LITERAL() is not None:
+            literal = literal_without_outer_quotes.replace("\\'", "'")
+        else:
+            literal = literal_without_outer_quotes.replace('\\"', '"')
+        return literal
+
+    def visitFunctionCall(self, ctx: BaserowFormula.FunctionCallContext):
+        function_name = ctx.func_name().accept(self).lower()
+        function_argument_expressions = ctx.expr()
+
+        return self._do_func(function_argument_expressions, function_name)
+
+    def _do_func(self, function_argument_expressions, function_name: str):
+        compiled_args: List[CompiledFormula] = [
+            expr.accept(self) for expr in function_argument_expressions
+        ]
+        functions = self.functions
+
+        def execute_function(context):
+            args = [compiled_arg(context) for compiled_arg in compiled_args]
+
+            # The function is only looked up once the arguments are evaluated, like
+            # the executor does, so that the same error is raised first.
+            try:
+                formula_function_type = functions.get(function_name)
+            except FormulaFunctionTypeDoesNotExist:
+                raise BaserowFormulaSyntaxError(
+                    f"{function_name} is not a valid function"
+                )
+
+            formula_function_type.validate_args(args)
+
+            args_parsed = formula_function_type.parse_args(args)
+
+            return formula_function_type.execute(context, args_parsed)
+
+        return execute_function
+
+    def visitBinaryOp(self, ctx: BaserowFormula.BinaryOpContext):
+        if ctx.PLUS():
+            op = "add"
+        elif ctx.MINUS():
+            op = "minus"
+        elif ctx.SLASH():
+            op = "divide"
+        elif ctx.EQUAL():
+            op = "equal"
+        elif ctx.BANG_EQUAL():
+            op = "not_equal"
+        elif ctx.STAR():
+            op = "multiply"
+        elif ctx.GT():
+            op = "greater_than"
+        elif ctx.LT():
+            op = "less_than"
+        elif ctx.GTE():
+            op = "greater_than_or_equal"
+        elif ctx.LTE():
+            op = "less_than_or_equal"
+        else:
+            return _raising(UnknownOperator, ctx.getText())
+
+        return self._do_func(ctx.expr(), op)
+
+    def visitFunc_name(self, ctx: BaserowFormula.Func_nameContext):
+        return ctx.getText()
+
+    def visitIdentifier(self, ctx: BaserowFormula.IdentifierContext):
+        return _constant(ctx.getText())
+
+    def visitIntegerLiteral(self, ctx: BaserowFormula.IntegerLiteralContext):
+        return _constant(int(ctx.getText()))
+
+    def visitFieldByIdReference(self, ctx: BaserowFormula.FieldByIdReferenceContext):
+        return _raising(FieldByIdReferencesAreDeprecated)
+
+    def visitLeftWhitespaceOrComments(
+        self, ctx: BaserowFormula.LeftWhitespaceOrCommentsContext
+    ):
+        return ctx.expr().accept(self)
+
+    def visitRightWhitespaceOrComments(
+        self, ctx: BaserowFormula.RightWhitespaceOrCommentsContext
+    ):
+        return ctx.expr().accept(self)
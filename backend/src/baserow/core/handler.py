@@ -13,19 +13,24 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser, AnonymousUser
 from django.core.files.storage import Storage, default_storage
 from django.db import OperationalError, transaction
-from django.db.models import Count, Prefetch, Q, QuerySet
+from django.db.models import Count, Model, Prefetch, Q, QuerySet
 from django.utils import translation
 from django.utils.translation import gettext as _
 
 from itsdangerous import URLSafeSerializer
 from loguru import logger
-from opentelemetry import trace
+from opentelemetry import metrics, trace
 from tqdm import tqdm
 
 from baserow.core.registries import plugin_registry
 from baserow.core.user.utils import normalize_email_address
 
-from .context import clear_current_workspace_id, set_current_workspace_id
+from .context import (
+    clear_current_workspace_id,
+    clear_permission_checks_cache,
+    get_permission_checks_cache,
+    set_current_workspace_id,
+)
 from .emails import WorkspaceInvitationEmail
 from .exceptions import (
     ApplicationDoesNotExist,
@@ -126,6 +131,14 @@ User = get_user_model()
 WorkspaceForUpdate = NewType("WorkspaceForUpdate", Workspace)
 
 tracer = trace.get_tracer(__name__)
+meter = metrics.get_meter(__name__)
+
+permission_checks_cache_hits = meter.create_counter(
+    "baserow.permission_checks.cache_hits",
+    unit="1",
+    description="The number of permission checks answered by the permission checks "
+    "cache of the request or task instead of the permission managers.",
+)
 
 
 class CoreHandler(metaclass=baserow_trace_methods(tracer)):
@@ -140,6 +153,7 @@ class CoreHandler(metaclass=baserow_trace_methods(tracer)):
         """
 
         clear_current_workspace_id()
+        clear_permission_checks_cache()
 
     def get_settings(self):
         """
@@ -229,6 +243,21 @@ class CoreHandler(metaclass=baserow_trace_methods(tracer)):
         result = {}
         undetermined_checks = set(checks)
 
+        cache = get_permission_checks_cache()
+        if cache is not None:
+            for check in list(undetermined_checks):
+                cache_key = self._get_permission_check_cache_key(
+                    check, workspace, include_trash
+                )
+                if cache_key is not None and cache_key in cache.results:
+                    result[check] = cache.results[cache_key]
+                    undetermined_checks.remove(check)
+            if result:
+                cache.hits += len(result)
+                permission_checks_cache_hits.add(len(result))
+
+        checks_to_cache = set(undetermined_checks)
+
         for permission_manager_name in settings.PERMISSION_MANAGERS:
             if not undetermined_checks:
                 break
@@ -250,26 +279,51 @@ class CoreHandler(metaclass=baserow_trace_methods(tracer)):
 
             for check, check_result in manager_result.items():
                 if check_result is not None:
-                    if (
-                        isinstance(check_result, PermissionException)
-                        and not return_permissions_exceptions
-                    ):
-                        result[check] = False
-                    else:
-                        result[check] = check_result
-
+                    result[check] = check_result
                     undetermined_checks.remove(check)
 
         # Permission denied by default to all non handled check
         for undetermined_check in undetermined_checks:
-            result[undetermined_check] = (
-                PermissionDenied(undetermined_check.actor)
-                if return_permissions_exceptions
-                else False
-            )
+            result[undetermined_check] = PermissionDenied(undetermined_check.actor)
+
+        if cache is not None:
+            for check in checks_to_cache:
+                cache_key = self._get_permission_check_cache_key(
+                    check, workspace, include_trash
+                )
+                if cache_key is not None:
+                    cache.results[cache_key] = result[check]
+
+        if not return_permissions_exceptions:
+            result = {
+                check: False
+                if isinstance(check_result, PermissionException)
+                else check_result
+                for check, check_result in result.items()
+            }
 
         return result
 
+    def _get_permission_check_cache_key(
+        self,
+        check: PermissionCheck,
+        workspace: Optional[Workspace],
+        include_trash: bool,
+    ) -> Optional[Tuple]:
+        """
+        Returns the key of the check in the permission checks cache, or None if the
+        result of the check can't be cached because its actor isn't identified by a
+        database record, like a user source user.
+        """
+
+        # The anonymous user is either passed as instance or as the class itself.
+        is_anonymous = check.actor is AnonymousUser or isinstance(
+            check.actor, AnonymousUser
+        )
+        if not is_anonymous and not isinstance(check.actor, Model):
+            return None
+        return check, workspace, include_trash
+
     def check_permission_for_multiple_actors(
         self,
         actors: List[Actor],
@@ -0,0 +1,80 @@
+import json
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from baserow.core.formula import compile_formula, resolve_formula
+from baserow.core.formula.parser.parser import get_parse_tree_for_formula
+from baserow.core.formula.parser.python_executor import BaserowPythonExecutor
+from baserow.core.formula.registries import formula_runtime_function_registry
+
+DEFAULT_CASES_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "../../../../../../tests/cases/formula_runtime_cases.json",
+)
+# The test cases are only available in a checkout of the repository.
+HAS_DEFAULT_CASES = os.path.exists(DEFAULT_CASES_PATH)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares the time it takes to resolve the valid runtime formulas of the test "
+        "cases by parsing and walking them every time, and by using the cached "
+        "compiled formulas."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--cases",
+            type=str,
+            default=DEFAULT_CASES_PATH if HAS_DEFAULT_CASES else None,
+            required=not HAS_DEFAULT_CASES,
+            help="The JSON file containing the runtime formula test cases.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=10_000,
+            help="How many times every formula must be resolved.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with open(options["cases"], "r") as file:
+                cases = json.load(file)["VALID_FORMULA_TESTS"]
+        except (OSError, KeyError, ValueError) as e:
+            raise CommandError(f"The cases can't be loaded: {e}")
+
+        repeat = options["repeat"]
+        functions = formula_runtime_function_registry
+        compile_formula.cache_clear()
+
+        total_parsed, total_compiled = 0.0, 0.0
+        for case in cases:
+            formula, context = case["formula"], case["context"]
+
+            start = time.perf_counter()
+            for _ in range(repeat):
+                tree = get_parse_tree_for_formula(formula)
+                BaserowPythonExecutor(functions, context).visit(tree)
+            parsed = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for _ in range(repeat):
+                resolve_formula(formula, functions, context)
+            compiled = time.perf_counter() - start
+
+            total_parsed += parsed
+            total_compiled += compiled
+            self.stdout.write(
+                f"{formula}: {parsed / repeat * 1e6:.1f}µs parsed, "
+                f"{compiled / repeat * 1e6:.1f}µs compiled"
+            )
+
+        speedup = total_parsed / total_compiled if total_compiled else 0
+        self.stdout.write(
+            f"Total for {len(cases)} formulas resolved {repeat} times: "
+            f"{total_parsed:.3f}s parsed, {total_compiled:.3f}s compiled "
+            f"({speedup:.1f}x faster)"
+        )
@@ -9,7 +9,21 @@ from baserow.core.utils import Progress
 class Command(BaseCommand):
     help = "Calculate the storage usage of every workspace"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--only-changed",
+            action="store_true",
+            help="Only calculate the storage usage of the workspaces that might have "
+            "changed since the last calculation.",
+        )
+
     def handle(self, *args, **options):
+        workspace_ids = None
+        if options["only_changed"]:
+            workspace_ids = (
+                UsageHandler.get_workspace_ids_needing_storage_usage_update()
+            )
+
         progress_total = 1000
 
         def create_progress_and_update_bar(progress_bar):
@@ -25,7 +39,8 @@ class Command(BaseCommand):
 
         with tqdm(total=progress_total) as progress_bar:
             workspaces_updated = UsageHandler.calculate_storage_usage(
-                progress_builder=create_progress_and_update_bar(progress_bar)
+                progress_builder=create_progress_and_update_bar(progress_bar),
+                workspace_ids=workspace_ids,
             )
 
         self.stdout.write(
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.13 on 2026-10-18 09:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0088_remove_blacklistedtoken_user"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WorkspaceStorageUsageUpdate",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("timestamp", models.DateTimeField(auto_now=True)),
+                (
+                    "workspace",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="storage_usage_update",
+                        to="core.workspace",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -32,6 +32,7 @@ from .mixins import (
 )
 from .notifications.models import Notification
 from .services.models import Service
+from .usage.models import WorkspaceStorageUsageUpdate
 
 __all__ = [
     "Settings",
@@ -52,6 +53,7 @@ __all__ = [
     "Service",
     "Notification",
     "BlacklistedToken",
+    "WorkspaceStorageUsageUpdate",
 ]
 
 
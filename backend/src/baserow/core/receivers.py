@@ -0,0 +1,56 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from celery.signals import task_postrun, task_prerun
+
+from .context import (
+    invalidate_permission_checks_cache,
+    start_permission_checks_cache,
+    stop_permission_checks_cache,
+)
+from .models import Settings, Workspace, WorkspaceUser
+from .signals import application_created, permissions_updated
+from .usage.handler import UsageHandler
+
+User = get_user_model()
+
+
+@task_prerun.connect
+def start_permission_checks_cache_before_task(**kwargs):
+    start_permission_checks_cache()
+
+
+@task_postrun.connect
+def stop_permission_checks_cache_after_task(**kwargs):
+    stop_permission_checks_cache()
+
+
+def invalidate_permission_checks_cache_receiver(sender, **kwargs):
+    """
+    Makes sure that the permissions checked later in the same request or task are
+    evaluated again after a change that can affect them.
+    """
+
+    invalidate_permission_checks_cache()
+
+
+def connect_to_signals_to_invalidate_permission_checks_cache(models):
+    for model in models:
+        post_save.connect(invalidate_permission_checks_cache_receiver, sender=model)
+        post_delete.connect(invalidate_permission_checks_cache_receiver, sender=model)
+
+
+connect_to_signals_to_invalidate_permission_checks_cache(
+    [User, Workspace, WorkspaceUser, Settings]
+)
+permissions_updated.connect(invalidate_permission_checks_cache_receiver)
+
+
+@receiver(application_created)
+def mark_workspace_for_storage_usage_update_on_application_created(
+    sender, application, **kwargs
+):
+    # Duplicated, imported or restored applications can contain files.
+    if application.workspace_id is not None:
+        UsageHandler.mark_workspace_for_storage_usage_update(application.workspace_id)
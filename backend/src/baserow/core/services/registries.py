@@ -1,6 +1,6 @@
 from abc import ABC
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Type, TypeVar
 from zipfile import ZipFile
 
 from django.contrib.auth.models import AbstractUser
@@ -165,6 +165,33 @@ class ServiceType(
 
         return {}
 
+    def formula_generator(self, service: ServiceSubClass) -> Generator[str, None, None]:
+        """
+        Yields the formulas of the service which are resolved when it's dispatched.
+        It's for example used to find out which other data sources a data source
+        depends on.
+
+        :param service: The service instance we want the formulas of.
+        :return: A generator of formulas.
+        """
+
+        yield from []
+
+    def get_dispatch_cache_versions(
+        self, service: ServiceSubClass
+    ) -> Optional[List[Any]]:
+        """
+        Returns the current versions of the data the dispatch result of the service
+        is computed from. If returned, the result can be cached and shared between
+        the dispatches which resolve the same formulas, until one of the versions
+        changes. `None` means that the result can't be cached.
+
+        :param service: The service instance we want the data versions of.
+        :return: The data versions or None.
+        """
+
+        return None
+
     def dispatch_transform(
         self,
         data: Any,
@@ -109,6 +109,10 @@ class TrashHandler(metaclass=baserow_trace_methods(tracer)):
 
             trash_item_type.trash(trash_item, requesting_user, trash_entry)
 
+            from baserow.core.usage.handler import UsageHandler
+
+            UsageHandler.mark_workspace_for_storage_usage_update(workspace.id)
+
             return trash_entry
 
     @classmethod
@@ -172,6 +176,12 @@ class TrashHandler(metaclass=baserow_trace_methods(tracer)):
             restore_type = trash_item_type_registry.get_by_model(trash_item)
             restore_type.restore(trash_item, trash_entry)
 
+            from baserow.core.usage.handler import UsageHandler
+
+            UsageHandler.mark_workspace_for_storage_usage_update(
+                trash_entry.workspace_id
+            )
+
     @staticmethod
     def get_trash_structure(user: User) -> Dict[str, Any]:
         """
@@ -1,36 +1,114 @@
-from typing import Optional
-
-from django.db.models import F, OuterRef, PositiveIntegerField, Subquery, Sum
+import uuid
+from datetime import timedelta
+from typing import List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F, OuterRef, PositiveIntegerField, Q, Subquery, Sum
 from django.db.models.functions import Coalesce
 from django.utils import timezone
 
+from loguru import logger
+
 from baserow.contrib.database.table.models import Table
 from baserow.core.models import Workspace
+from baserow.core.usage.models import WorkspaceStorageUsageUpdate
 from baserow.core.usage.registries import workspace_storage_usage_item_registry
 from baserow.core.utils import ChildProgressBuilder, grouper
 
+# How long the progress of an incremental calculation is kept, which must be longer
+# than the time it takes to calculate all the chunks.
+STORAGE_USAGE_PROGRESS_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def get_storage_usage_progress_cache_key(run_id: str) -> str:
+    return f"storage_usage_progress_{run_id}"
+
 
 class UsageHandler:
+    @classmethod
+    def mark_workspace_for_storage_usage_update(cls, workspace_id: int):
+        """
+        Marks the storage usage of the workspace as outdated, so that it's
+        recalculated during the next incremental calculation. This must be called
+        when a change which can affect the storage usage isn't tracked by one of the
+        storage usage items. The marker is inserted when the current transaction
+        commits, so that concurrent transactions don't wait for each other.
+
+        :param workspace_id: The id of the workspace that has changed.
+        """
+
+        transaction.on_commit(
+            lambda: WorkspaceStorageUsageUpdate.objects.bulk_create(
+                [WorkspaceStorageUsageUpdate(workspace_id=workspace_id)],
+                ignore_conflicts=True,
+            )
+        )
+
+    @classmethod
+    def get_workspace_ids_needing_storage_usage_update(cls) -> List[int]:
+        """
+        Returns the ids of the workspaces which storage usage might have changed
+        since it was last calculated. Those are the workspaces that have been
+        marked, the ones with changes tracked by the storage usage items, the ones
+        that have never been calculated, and the ones which haven't been calculated
+        for `BASEROW_STORAGE_USAGE_FULL_RECALCULATION_DAYS`, so that any change
+        which hasn't been tracked is eventually taken into account.
+
+        :return: The sorted ids of the workspaces that must be recalculated.
+        """
+
+        stale_before = timezone.now() - timedelta(
+            days=settings.BASEROW_STORAGE_USAGE_FULL_RECALCULATION_DAYS
+        )
+        workspaces_condition = (
+            Q(storage_usage_update__isnull=False)
+            | Q(storage_usage_updated_at__isnull=True)
+            | Q(storage_usage_updated_at__lt=stale_before)
+        )
+        for item in workspace_storage_usage_item_registry.get_all():
+            workspace_ids = item.get_workspace_ids_with_pending_changes()
+            if workspace_ids is not None:
+                workspaces_condition |= Q(id__in=workspace_ids)
+
+        return list(
+            Workspace.objects.filter(workspaces_condition, template__isnull=True)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+
     @classmethod
     def calculate_storage_usage(
         cls,
         progress_builder: Optional[ChildProgressBuilder] = None,
+        workspace_ids: Optional[List[int]] = None,
     ) -> int:
         """
         Calculates the storage usage of every workspace.
 
         :param progress_builder: An optional progress builder that can be used to
             indicate the progress of the calculation.
+        :param workspace_ids: If provided, only the storage usage of these
+            workspaces is calculated.
         :return: The amount of workspaces that have been updated.
         """
 
         count, chunk_size = 0, 256
         qs = Workspace.objects.filter(template__isnull=True)
+        if workspace_ids is not None:
+            qs = qs.filter(id__in=workspace_ids)
         workspaces_queryset = qs.iterator(chunk_size=chunk_size)
 
         progress = ChildProgressBuilder.build(progress_builder, child_total=qs.count())
 
         for workspaces in grouper(chunk_size, workspaces_queryset):
+            # The markers are removed before the calculation, so that the changes
+            # made while it's running are picked up by the next one.
+            WorkspaceStorageUsageUpdate.objects.filter(
+                workspace_id__in=[workspace.id for workspace in workspaces]
+            ).delete()
+
             now = timezone.now()
             for workspace in workspaces:
                 usage_in_megabytes = 0
@@ -48,6 +126,68 @@ class UsageHandler:
 
         return count
 
+    @classmethod
+    def calculate_storage_usage_incrementally(
+        cls,
+        progress_builder: Optional[ChildProgressBuilder] = None,
+        chunk_size: int = 256,
+    ) -> int:
+        """
+        Calculates the storage usage of the workspaces that might have changed since
+        the last calculation. The workspaces are split in chunks which are
+        calculated in parallel by the workers.
+
+        :param progress_builder: An optional progress builder that can be used to
+            indicate the progress of the dispatching.
+        :param chunk_size: The number of workspaces calculated by a single task.
+        :return: The amount of workspaces that will be updated.
+        """
+
+        from baserow.core.usage.tasks import calculate_workspaces_storage_usage
+
+        workspace_ids = cls.get_workspace_ids_needing_storage_usage_update()
+        chunks = list(grouper(chunk_size, workspace_ids))
+        progress = ChildProgressBuilder.build(progress_builder, child_total=len(chunks))
+
+        run_id = str(uuid.uuid4())
+        cache.set(
+            get_storage_usage_progress_cache_key(run_id),
+            0,
+            timeout=STORAGE_USAGE_PROGRESS_CACHE_TIMEOUT,
+        )
+        for chunk in chunks:
+            calculate_workspaces_storage_usage.delay(
+                list(chunk), run_id=run_id, total=len(workspace_ids)
+            )
+            progress.increment()
+
+        return len(workspace_ids)
+
+    @classmethod
+    def report_storage_usage_progress(cls, run_id: str, updated: int, total: int):
+        """
+        Logs how many workspaces of an incremental calculation have been updated so
+        far. Called by every chunk of the calculation when it's finished.
+
+        :param run_id: The id of the incremental calculation.
+        :param updated: The amount of workspaces updated by the chunk.
+        :param total: The total amount of workspaces of the calculation.
+        """
+
+        try:
+            done = cache.incr(get_storage_usage_progress_cache_key(run_id), updated)
+        except ValueError:
+            # The key expired, so the progress can't be reported anymore.
+            return
+
+        logger.info(
+            "Calculated the storage usage of {done} of {total} workspaces.",
+            done=done,
+            total=total,
+        )
+        if done >= total:
+            cache.delete(get_storage_usage_progress_cache_key(run_id))
+
     @classmethod
     def get_workspace_row_count_annotation(cls, outer_ref_name: str = "id") -> Coalesce:
         """
@@ -0,0 +1,22 @@
+from django.db import models
+
+
+class WorkspaceStorageUsageUpdate(models.Model):
+    """
+    This table maintains an entry for each workspace where a change that can affect
+    the storage usage has been made, outside of the tables which are already tracked
+    by the `TableUsageUpdate` entries. For example, when a file is set as the cover
+    image of a form view, or when an application is created or trashed.
+
+    The entry is created with a conflict-free insert, so that concurrent requests
+    don't have to lock a shared row. It's removed when the storage usage of the
+    workspace is calculated again, so that only the workspaces that have changed
+    since the previous calculation have to be recalculated.
+    """
+
+    workspace = models.OneToOneField(
+        "core.Workspace",
+        on_delete=models.CASCADE,
+        related_name="storage_usage_update",
+    )
+    timestamp = models.DateTimeField(auto_now=True)
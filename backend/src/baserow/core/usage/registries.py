@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Optional
+
+from django.db.models import QuerySet
 
 from baserow.core.registry import Instance, Registry
 
@@ -23,6 +26,19 @@ class WorkspaceStorageUsageItemType(Instance, ABC):
 
         pass
 
+    def get_workspace_ids_with_pending_changes(self) -> Optional[QuerySet]:
+        """
+        Returns the ids of the workspaces where this item has tracked changes that
+        can affect the storage usage since the last calculation. The changes which
+        aren't tracked by the item itself must be marked with
+        `UsageHandler.mark_workspace_for_storage_usage_update`.
+
+        :return: A queryset of workspace ids, or None if the item doesn't track any
+            changes.
+        """
+
+        return None
+
 
 class WorkspaceStorageUsageItemTypeRegistry(Registry):
     """
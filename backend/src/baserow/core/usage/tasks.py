@@ -1,3 +1,5 @@
+from typing import List, Optional
+
 from django.conf import settings
 
 from baserow.config.celery import app
@@ -8,13 +10,35 @@ from baserow.core.handler import CoreHandler
 def run_calculate_storage():
     """
     Runs the calculate storage job to keep track of how many mb of memory has been used
-    via files by a group
+    via files by a group. Only the workspaces that might have changed since the last
+    run are calculated, in parallel chunks.
     """
 
     from baserow.core.usage.handler import UsageHandler
 
     if CoreHandler().get_settings().track_workspace_usage:
-        UsageHandler.calculate_storage_usage()
+        UsageHandler.calculate_storage_usage_incrementally()
+
+
+@app.task(queue=settings.BASEROW_GROUP_STORAGE_USAGE_QUEUE)
+def calculate_workspaces_storage_usage(
+    workspace_ids: List[int], run_id: Optional[str] = None, total: int = 0
+):
+    """
+    Calculates the storage usage of a chunk of workspaces of an incremental
+    calculation.
+
+    :param workspace_ids: The ids of the workspaces that must be calculated.
+    :param run_id: The id of the incremental calculation, used to report the
+        progress.
+    :param total: The total amount of workspaces of the incremental calculation.
+    """
+
+    from baserow.core.usage.handler import UsageHandler
+
+    updated = UsageHandler.calculate_storage_usage(workspace_ids=workspace_ids)
+    if run_id is not None:
+        UsageHandler.report_storage_usage_progress(run_id, updated, total)
 
 
 @app.on_after_finalize.connect
@@ -6,6 +6,10 @@ from django.urls import is_valid_path
 
 from rest_framework import status
 
+from baserow.core.context import (
+    start_permission_checks_cache,
+    stop_permission_checks_cache,
+)
 from baserow.core.handler import CoreHandler
 from baserow.throttling import ConcurrentUserRequestsThrottle
 
@@ -85,17 +89,20 @@ class ConcurrentUserRequestsMiddleware:
 class ClearContextMiddleware:
     """
     This middleware is used to clear the context after the response has been returned.
-    Such context can be used i.e. to store the current workspace id
+    Such context can be used i.e. to store the current workspace id or the results of
+    the permission checks done during the request.
     """
 
     def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
         self.get_response = get_response
 
     def __call__(self, request: HttpRequest) -> HttpResponse:
+        start_permission_checks_cache()
         try:
             response = self.get_response(request)
         finally:
             # Make sure that the context is cleared after the response has been
             # returned regardless of any exceptions that might have been raised.
+            stop_permission_checks_cache()
             CoreHandler().clear_context()
         return response
@@ -1,7 +1,4 @@
-import json
-
-from django.core.files.base import ContentFile
-
+from baserow.contrib.database.file_import.data_file import write_data_file
 from baserow.contrib.database.file_import.models import FileImportJob
 
 data = [["test-1"]]
@@ -36,7 +33,9 @@ class FileImportFixtures:
         else:
             data = kwargs.pop("data")
 
-        data_file = kwargs.get("data_file", ContentFile(json.dumps(data)))
+        data_file = kwargs.pop("data_file", None)
+        if data_file is None:
+            data_file = write_data_file(data)
 
         job = FileImportJob.objects.create(**kwargs)
 
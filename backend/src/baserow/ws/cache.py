@@ -0,0 +1,101 @@
+from typing import List
+
+from django.core.cache import cache
+
+from baserow.core.cache import get_cache_version, increment_cache_version
+
+# The permitted users are invalidated with a version key when the membership or the
+# roles of the workspace change. This timeout limits how long the other changes
+# that can affect the permissions, like a license change, can take to be picked up.
+PERMITTED_USERS_CACHE_TIMEOUT = 60 * 10
+
+
+def _get_permitted_users_version_cache_key(workspace_id: int) -> str:
+    return f"ws_permitted_users_version__{workspace_id}"
+
+
+def _get_permitted_users_cache_key(
+    workspace_id: int, operation_type: str, scope_name: str, scope_id: int
+) -> str:
+    return (
+        f"ws_permitted_users__{workspace_id}_{operation_type}_{scope_name}_{scope_id}"
+    )
+
+
+def get_permitted_user_ids(
+    workspace_id: int, operation_type: str, scope_name: str, scope_id: int
+) -> List[int]:
+    """
+    Returns the ids of the users of the workspace which are permitted to perform the
+    operation on the scope. The result is cached until the membership or the roles
+    of the workspace change, so that broadcasting several messages with the same
+    audience only checks the permissions once.
+
+    :param workspace_id: The workspace the users are in.
+    :param operation_type: The operation that should be checked for.
+    :param scope_name: The name of the scope that the operation is executed on.
+    :param scope_id: The id of the scope instance.
+    :return: The ids of the permitted users.
+    """
+
+    from baserow.core.handler import CoreHandler
+    from baserow.core.mixins import TrashableModelMixin
+    from baserow.core.models import Workspace, WorkspaceUser
+    from baserow.core.registries import object_scope_type_registry
+
+    version = get_cache_version(_get_permitted_users_version_cache_key(workspace_id))
+    cache_key = _get_permitted_users_cache_key(
+        workspace_id, operation_type, scope_name, scope_id
+    )
+    cached_value = cache.get(cache_key)
+    if cached_value is not None and cached_value["version"] == version:
+        return cached_value["value"]
+
+    workspace = Workspace.objects.get(id=workspace_id)
+
+    users_in_workspace = [
+        workspace_user.user
+        for workspace_user in WorkspaceUser.objects.filter(
+            workspace=workspace
+        ).select_related("user")
+    ]
+
+    scope_type = object_scope_type_registry.get(scope_name)
+    scope_model_class = scope_type.model_class
+
+    objects = (
+        scope_model_class.objects_and_trash
+        if issubclass(scope_model_class, TrashableModelMixin)
+        else scope_model_class.objects
+    )
+
+    scope = objects.get(id=scope_id)
+
+    user_ids = [
+        u.id
+        for u in CoreHandler().check_permission_for_multiple_actors(
+            users_in_workspace,
+            operation_type,
+            workspace,
+            context=scope,
+        )
+    ]
+
+    cache.set(
+        cache_key,
+        {"version": version, "value": user_ids},
+        timeout=PERMITTED_USERS_CACHE_TIMEOUT,
+    )
+    return user_ids
+
+
+def clear_permitted_users_cache(workspace_id: int):
+    """
+    Invalidates the cached permitted users of all the operations and scopes of the
+    workspace. Must be called when the membership or the roles of the workspace
+    change.
+
+    :param workspace_id: The id of the workspace in which the permissions changed.
+    """
+
+    increment_cache_version(_get_permitted_users_version_cache_key(workspace_id))
@@ -330,6 +330,26 @@ class CoreConsumer(AsyncJsonWebsocketConsumer):
                     }
                     await self._remove_page_scope(content, send_confirmation=True)
 
+    def _get_payload_for_subscribed_pages(self, payload: dict) -> dict:
+        """
+        Returns the payload as it must be sent to this connection, given the
+        parameters of the pages it's subscribed to.
+
+        :param payload: The payload broadcast to one of the groups of the connection.
+        :return: The payload to send.
+        """
+
+        for page_scope in self.scope.get("pages") or []:
+            try:
+                page_type = page_registry.get(page_scope.page_type)
+            except page_registry.does_not_exist_exception_class:
+                continue
+
+            payload = page_type.get_payload_for_subscriber(
+                payload, **page_scope.page_parameters
+            )
+        return payload
+
     # Event handlers
 
     async def force_disconnect_users(self, event):
@@ -421,7 +441,28 @@ class CoreConsumer(AsyncJsonWebsocketConsumer):
             return
 
         if not ignore_web_socket_id or ignore_web_socket_id != web_socket_id:
-            await self.send_json(payload)
+            await self.send_json(self._get_payload_for_subscribed_pages(payload))
+
+    async def broadcast_batch_to_group(self, event):
+        """
+        Sends the payloads of the batch that must not be ignored for this web socket
+        as a single `batch` message.
+
+        :param event: The event containing the messages, each with a payload and the
+            web socket id that must be ignored.
+        :type event: dict
+        """
+
+        web_socket_id = self.scope["web_socket_id"]
+        payloads = [
+            self._get_payload_for_subscribed_pages(message["payload"])
+            for message in event["messages"]
+            if not message["ignore_web_socket_id"]
+            or message["ignore_web_socket_id"] != web_socket_id
+        ]
+
+        if payloads:
+            await self.send_json({"type": "batch", "messages": payloads})
 
     async def users_removed_from_permission_group(self, event):
         """
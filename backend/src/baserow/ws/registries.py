@@ -78,6 +78,24 @@ class PageType(Instance):
 
         return None
 
+    def get_payload_for_subscriber(self, payload, **kwargs):
+        """
+        Returns the payload as it must be sent to a connection that is subscribed to
+        the page with the provided parameters. This can be used to send another
+        version of a message to the connections that asked for it with an optional
+        parameter when subscribing. By default, the payload is sent as is.
+
+        :param payload: The payload broadcast to one of the groups the connection is
+            in.
+        :type payload: dict
+        :param kwargs: The additional parameters the connection subscribed with.
+        :type kwargs: dict
+        :return: The payload that must be sent to the connection.
+        :rtype: dict
+        """
+
+        return payload
+
     def broadcast(
         self, payload, ignore_web_socket_id=None, exclude_user_ids=None, **kwargs
     ):
@@ -1,5 +1,6 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from baserow.api.applications.serializers import (
@@ -18,7 +19,7 @@ from baserow.api.workspaces.serializers import (
 from baserow.core import signals
 from baserow.core.db import specific_iterator
 from baserow.core.handler import CoreHandler
-from baserow.core.models import Application, WorkspaceUser
+from baserow.core.models import Application, Workspace, WorkspaceUser
 from baserow.core.operations import (
     ListApplicationsWorkspaceOperationType,
     ReadApplicationOperationType,
@@ -27,6 +28,7 @@ from baserow.core.registries import object_scope_type_registry
 from baserow.core.user import signals as user_signals
 from baserow.core.utils import generate_hash
 
+from .cache import clear_permitted_users_cache
 from .tasks import (
     broadcast_application_created,
     broadcast_to_group,
@@ -382,3 +384,18 @@ def user_password_changed(sender, user, ignore_web_socket_id=None, **kwargs):
             [ignore_web_socket_id],
         )
     )
+
+
+@receiver(post_save, sender=WorkspaceUser)
+@receiver(post_delete, sender=WorkspaceUser)
+def clear_permitted_users_cache_when_workspace_user_changed(
+    sender, instance: WorkspaceUser, **kwargs
+):
+    clear_permitted_users_cache(instance.workspace_id)
+
+
+@receiver(signals.permissions_updated)
+def clear_permitted_users_cache_when_permissions_updated(
+    sender, workspace: Workspace, **kwargs
+):
+    clear_permitted_users_cache(workspace.id)
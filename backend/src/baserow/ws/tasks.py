@@ -118,42 +118,48 @@ def broadcast_to_permitted_users(
     :return:
     """
 
-    from baserow.core.handler import CoreHandler
-    from baserow.core.mixins import TrashableModelMixin
-    from baserow.core.models import Workspace, WorkspaceUser
-    from baserow.core.registries import object_scope_type_registry
+    from baserow.ws.cache import get_permitted_user_ids
 
-    workspace = Workspace.objects.get(id=workspace_id)
+    user_ids = get_permitted_user_ids(
+        workspace_id, operation_type, scope_name, scope_id
+    )
 
-    users_in_workspace = [
-        workspace_user.user
-        for workspace_user in WorkspaceUser.objects.filter(
-            workspace=workspace
-        ).select_related("user")
-    ]
+    broadcast_to_users(user_ids, payload, ignore_web_socket_id=ignore_web_socket_id)
 
-    scope_type = object_scope_type_registry.get(scope_name)
-    scope_model_class = scope_type.model_class
 
-    objects = (
-        scope_model_class.objects_and_trash
-        if issubclass(scope_model_class, TrashableModelMixin)
-        else scope_model_class.objects
-    )
+@app.task(bind=True)
+def broadcast_multiple_to_permitted_users(
+    self,
+    workspace_id: int,
+    operation_type: str,
+    scope_name: str,
+    scope_id: int,
+    payloads: List[Dict[str, any]],
+    ignore_web_socket_id: Optional[int] = None,
+):
+    """
+    This task will broadcast multiple websocket messages, in order, to all the users
+    that are permitted to perform the operation provided. The permitted users are
+    only resolved once for all the payloads.
+
+    :param workspace_id: The workspace the users are in
+    :param operation_type: The operation that should be checked for
+    :param scope_name: The name of the scope that the operation is executed on
+    :param scope_id: The id of the scope instance
+    :param payloads: The messages being sent
+    :param ignore_web_socket_id: An optional web socket id which will not be sent the
+        payloads if provided. This is normally the web socket id that has originally
+        made the change request.
+    """
 
-    scope = objects.get(id=scope_id)
+    from baserow.ws.cache import get_permitted_user_ids
 
-    user_ids = [
-        u.id
-        for u in CoreHandler().check_permission_for_multiple_actors(
-            users_in_workspace,
-            operation_type,
-            workspace,
-            context=scope,
-        )
-    ]
+    user_ids = get_permitted_user_ids(
+        workspace_id, operation_type, scope_name, scope_id
+    )
 
-    broadcast_to_users(user_ids, payload, ignore_web_socket_id=ignore_web_socket_id)
+    for payload in payloads:
+        broadcast_to_users(user_ids, payload, ignore_web_socket_id=ignore_web_socket_id)
 
 
 @app.task(bind=True)
@@ -228,6 +234,32 @@ def broadcast_to_channel_group(
     )
 
 
+@app.task(bind=True)
+def broadcast_batch_to_channel_group(
+    self, channel_group_name: str, messages: List[Dict[str, Any]]
+):
+    """
+    Broadcasts multiple payloads to all the users within the channel group at once.
+    Every connection receives a single `batch` message containing the payloads, in
+    order, except the ones that must be ignored for its web socket id.
+
+    :param channel_group_name: The name of the channel group where the payloads must
+        be broadcast to.
+    :param messages: A list of dicts containing the `payload` and the
+        `ignore_web_socket_id` of every message.
+    """
+
+    from asgiref.sync import async_to_sync
+    from channels.layers import get_channel_layer
+
+    channel_layer = get_channel_layer()
+    async_to_sync(send_message_to_channel_group)(
+        channel_layer,
+        channel_group_name,
+        {"type": "broadcast_batch_to_group", "messages": messages},
+    )
+
+
 @app.task(bind=True)
 def broadcast_to_group(self, workspace_id, payload, ignore_web_socket_id=None):
     """
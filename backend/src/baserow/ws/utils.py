@@ -0,0 +1,144 @@
+import threading
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from django.db import transaction
+
+from baserow.ws.tasks import (
+    broadcast_multiple_to_permitted_users,
+    broadcast_to_permitted_users,
+)
+
+# The workspace id, operation type, scope name, scope id and ignored web socket id
+# of a broadcast to the permitted users.
+PermittedUsersAudience = Tuple[int, str, str, int, Optional[str]]
+PayloadBuilder = Callable[[], Dict[str, Any]]
+
+_local = threading.local()
+
+
+class OnCommitCallback:
+    """
+    Registers a function with `transaction.on_commit`. Django drops the callbacks
+    registered in a savepoint or a transaction that is rolled back, so only a weak
+    reference to the registered callback is kept. It tells whether Django will still
+    call it.
+    """
+
+    def __init__(self, func: Callable[[], None]):
+        self.called = False
+
+        def callback():
+            self.called = True
+            func()
+
+        self._callback = weakref.ref(callback)
+        transaction.on_commit(callback)
+
+    @property
+    def pending(self) -> bool:
+        return not self.called and self._callback() is not None
+
+    @property
+    def discarded(self) -> bool:
+        return not self.called and self._callback() is None
+
+
+class BroadcastBuffer:
+    """
+    The broadcasts to the permitted users made during the current transaction. They
+    are all sent by a single flush, which is registered when the first broadcast is
+    buffered.
+    """
+
+    def __init__(self):
+        self.broadcasts: List[
+            Tuple[PermittedUsersAudience, PayloadBuilder, OnCommitCallback]
+        ] = []
+        self.flush: Optional[OnCommitCallback] = None
+
+    @property
+    def flush_registered(self) -> bool:
+        return self.flush is not None and self.flush.pending
+
+    @property
+    def rolled_back(self) -> bool:
+        return self.flush is not None and self.flush.discarded
+
+
+def _get_broadcast_buffer() -> BroadcastBuffer:
+    buffer = getattr(_local, "broadcast_buffer", None)
+    # The flush of a transaction that was rolled back never runs, so the broadcasts
+    # buffered during it are dropped.
+    if buffer is None or buffer.rolled_back:
+        buffer = BroadcastBuffer()
+        _local.broadcast_buffer = buffer
+    return buffer
+
+
+def _send_buffered_broadcasts(buffer: BroadcastBuffer):
+    if getattr(_local, "broadcast_buffer", None) is buffer:
+        _local.broadcast_buffer = None
+
+    payloads_by_audience: Dict[PermittedUsersAudience, List[Dict[str, Any]]] = {}
+    for audience, build_payload, callback in buffer.broadcasts:
+        # The broadcasts made in a savepoint that was rolled back are not sent.
+        if not callback.discarded:
+            payloads_by_audience.setdefault(audience, []).append(build_payload())
+
+    for audience, payloads in payloads_by_audience.items():
+        *scope, ignore_web_socket_id = audience
+        if len(payloads) == 1:
+            broadcast_to_permitted_users.delay(
+                *scope, payloads[0], ignore_web_socket_id
+            )
+        else:
+            broadcast_multiple_to_permitted_users.delay(
+                *scope, payloads, ignore_web_socket_id
+            )
+
+
+def broadcast_to_permitted_users_on_commit(
+    workspace_id: int,
+    operation_type: str,
+    scope_name: str,
+    scope_id: int,
+    build_payload: PayloadBuilder,
+    ignore_web_socket_id: Optional[str] = None,
+):
+    """
+    Broadcasts the payload to the users permitted to perform the operation on the
+    scope when the current transaction commits. All the payloads of the transaction
+    that share the same audience are sent by a single
+    `broadcast_multiple_to_permitted_users` task, so that a burst of changes, like
+    the field changes forcing a refresh of the same table, resolves the permitted
+    users and starts a task only once.
+
+    :param workspace_id: The workspace the users are in.
+    :param operation_type: The operation that should be checked for.
+    :param scope_name: The name of the scope that the operation is executed on.
+    :param scope_id: The id of the scope instance.
+    :param build_payload: A function returning the message to send. It's called
+        when the transaction commits.
+    :param ignore_web_socket_id: An optional web socket id which will not be sent
+        the payload. This is normally the web socket id that has originally made the
+        change request.
+    """
+
+    audience = (
+        workspace_id,
+        operation_type,
+        scope_name,
+        scope_id,
+        ignore_web_socket_id,
+    )
+
+    buffer = _get_broadcast_buffer()
+    # Django only drops this noop callback if the savepoint the broadcast is made in
+    # is rolled back, which is how the flush knows the broadcast must not be sent.
+    buffer.broadcasts.append((audience, build_payload, OnCommitCallback(lambda: None)))
+
+    if not transaction.get_connection().in_atomic_block:
+        _send_buffered_broadcasts(buffer)
+    elif not buffer.flush_registered:
+        buffer.flush = OnCommitCallback(lambda: _send_buffered_broadcasts(buffer))
@@ -1,16 +1,34 @@
 from decimal import Decimal
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from baserow.contrib.builder.data_sources.builder_dispatch_context import (
+    BuilderDispatchContext,
+)
 from baserow.contrib.builder.data_sources.exceptions import DataSourceDoesNotExist
-from baserow.contrib.builder.data_sources.handler import DataSourceHandler
+from baserow.contrib.builder.data_sources.handler import (
+    DataSourceHandler,
+    data_source_dispatch_executor,
+    get_data_source_ids_in_formula,
+)
 from baserow.contrib.builder.data_sources.models import DataSource
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.integrations.local_baserow.models import (
     LocalBaserowGetRow,
     LocalBaserowListRows,
 )
+from baserow.core.context import (
+    get_context,
+    get_current_workspace_id,
+    get_permission_checks_cache,
+    set_current_workspace_id,
+    start_permission_checks_cache,
+    stop_permission_checks_cache,
+)
 from baserow.core.exceptions import CannotCalculateIntermediateOrder
+from baserow.core.handler import CoreHandler
 from baserow.core.services.registries import service_type_registry
 
 
@@ -243,6 +261,293 @@ def test_dispatch_data_sources(data_fixture):
     assert isinstance(result[data_source3.id], Exception)
 
 
+def test_get_data_source_ids_in_formula():
+    assert get_data_source_ids_in_formula("") == set()
+    assert get_data_source_ids_in_formula("'data_source'") == set()
+    assert get_data_source_ids_in_formula("get('page_parameter.id')") == set()
+    assert get_data_source_ids_in_formula("get('data_source") == set()
+    assert get_data_source_ids_in_formula("get('data_source.1.field_1')") == {1}
+    assert get_data_source_ids_in_formula(
+        "concat(get('data_source.1.field_1'), "
+        "get(\"data_source_context.2.field_3\")) + get('data_source.3')"
+    ) == {1, 2, 3}
+    assert (
+        get_data_source_ids_in_formula(
+            "get(concat('data_source.', get('page_parameter.id')))"
+        )
+        == set()
+    )
+
+
+@pytest.mark.django_db
+def test_get_data_source_dispatch_levels(data_fixture):
+    page = data_fixture.create_builder_page()
+    data_source_1 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page, row_id="1"
+    )
+    data_source_2 = data_fixture.create_builder_local_baserow_list_rows_data_source(
+        page=page, search_query=f"get('data_source.{data_source_1.id}.field_1')"
+    )
+    data_source_3 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page, row_id="2"
+    )
+    data_source_4 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page, row_id=f"get('data_source.{data_source_2.id}.0.id')"
+    )
+    data_source_5 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page
+    )
+    data_source_6 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page, row_id=f"get('data_source.{data_source_5.id}.id')"
+    )
+    data_source_5.service.row_id = f"get('data_source.{data_source_6.id}.id')"
+    data_source_5.service.save()
+
+    data_sources = DataSourceHandler().get_data_sources(page)
+    levels = DataSourceHandler().get_data_source_dispatch_levels(data_sources)
+
+    assert [[d.id for d in level] for level in levels] == [
+        [data_source_1.id, data_source_3.id],
+        [data_source_2.id],
+        [data_source_4.id],
+        [data_source_5.id, data_source_6.id],
+    ]
+
+
+@pytest.mark.django_db
+def test_get_data_source_dispatch_levels_uses_the_prefetched_services(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user, columns=[("Name", "text")], rows=[]
+    )
+    page = data_fixture.create_builder_page(user=user)
+    data_source_1 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page, table=table, row_id="1"
+    )
+    for index in range(3):
+        data_source = data_fixture.create_builder_local_baserow_list_rows_data_source(
+            page=page, table=table
+        )
+        data_fixture.create_local_baserow_table_service_filter(
+            service=data_source.service,
+            field=fields[0],
+            value=f"get('data_source.{data_source_1.id}.id')",
+            value_is_formula=True,
+            order=0,
+        )
+
+    data_sources = DataSourceHandler().get_data_sources(page)
+    with django_assert_num_queries(0):
+        levels = DataSourceHandler().get_data_source_dispatch_levels(data_sources)
+
+    assert [len(level) for level in levels] == [1, 3]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_dispatch_data_sources_concurrently(data_fixture):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user,
+        columns=[("Name", "text")],
+        rows=[["BMW"], ["Audi"], ["Volkswagen"]],
+    )
+    builder = data_fixture.create_builder_application(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        user=user, application=builder
+    )
+    page = data_fixture.create_builder_page(user=user, builder=builder)
+    data_source_1 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page, integration=integration, table=table, row_id=str(rows[0].id)
+    )
+    data_source_2 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page, integration=integration, table=table, row_id=str(rows[2].id)
+    )
+    data_source_3 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page,
+        integration=integration,
+        table=table,
+        row_id=f"get('data_source.{data_source_1.id}.id') + 1",
+    )
+    data_source_4 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page, integration=integration, table=table, row_id="'invalid'"
+    )
+
+    data_sources = DataSourceHandler().get_data_sources(page)
+    dispatch_context = BuilderDispatchContext(MagicMock(), page)
+
+    with patch.object(
+        data_source_dispatch_executor,
+        "submit",
+        wraps=data_source_dispatch_executor.submit,
+    ) as submit:
+        result = DataSourceHandler().dispatch_data_sources(
+            data_sources, dispatch_context
+        )
+
+    assert submit.call_count == 3
+    assert result[data_source_1.id][fields[0].db_column] == "BMW"
+    assert result[data_source_2.id][fields[0].db_column] == "Volkswagen"
+    assert result[data_source_3.id][fields[0].db_column] == "Audi"
+    assert isinstance(result[data_source_4.id], Exception)
+    assert dispatch_context.cache["data_source_contents"] == {
+        data_source_1.id: result[data_source_1.id],
+        data_source_2.id: result[data_source_2.id],
+        data_source_3.id: result[data_source_3.id],
+    }
+
+
+@pytest.mark.django_db(transaction=True)
+def test_dispatch_data_sources_concurrently_with_the_context_of_the_request(
+    data_fixture, settings
+):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user,
+        columns=[("Name", "text")],
+        rows=[["BMW"], ["Audi"]],
+    )
+    builder = data_fixture.create_builder_application(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        user=user, application=builder
+    )
+    page = data_fixture.create_builder_page(user=user, builder=builder)
+    for row in rows:
+        data_fixture.create_builder_local_baserow_get_row_data_source(
+            page=page, integration=integration, table=table, row_id=str(row.id)
+        )
+    data_sources = DataSourceHandler().get_data_sources(page)
+
+    contexts_in_threads = []
+    dispatch_data_source_isolated = DataSourceHandler._dispatch_data_source_isolated
+
+    def dispatch_data_source_isolated_recording_context(self, *args):
+        contexts_in_threads.append(get_context())
+        return dispatch_data_source_isolated(self, *args)
+
+    set_current_workspace_id(builder.workspace_id)
+    start_permission_checks_cache()
+    permission_checks_cache = get_permission_checks_cache()
+    try:
+        with patch.object(
+            DataSourceHandler,
+            "_dispatch_data_source_isolated",
+            dispatch_data_source_isolated_recording_context,
+        ):
+            DataSourceHandler().dispatch_data_sources(
+                data_sources, BuilderDispatchContext(MagicMock(), page)
+            )
+    finally:
+        stop_permission_checks_cache()
+        CoreHandler().clear_context()
+
+    assert contexts_in_threads == [
+        (builder.workspace_id, permission_checks_cache)
+    ] * len(data_sources)
+
+    # The pooled threads don't keep the context for the next request.
+    futures = [
+        data_source_dispatch_executor.submit(get_context)
+        for _ in range(settings.BASEROW_BUILDER_DATA_SOURCES_DISPATCH_MAX_WORKERS)
+    ]
+    assert [future.result() for future in futures] == [(None, None)] * len(futures)
+    assert get_current_workspace_id() is None
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("published", [True, False])
+def test_dispatch_data_source_results_cache(data_fixture, settings, published):
+    settings.BASEROW_BUILDER_DATA_SOURCES_CACHE_TIMEOUT = 60
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user,
+        columns=[("Name", "text")],
+        rows=[["BMW"], ["Audi"]],
+    )
+    builder = data_fixture.create_builder_application(
+        workspace=None if published else table.database.workspace
+    )
+    integration = data_fixture.create_local_baserow_integration(
+        user=user, application=builder
+    )
+    page = data_fixture.create_builder_page(builder=builder)
+    data_source = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page,
+        integration=integration,
+        table=table,
+        row_id="get('page_parameter.id')",
+    )
+    name = fields[0].db_column
+
+    def dispatch(row_id):
+        request = MagicMock()
+        request.data = {"page_parameter": {"id": row_id}}
+        return DataSourceHandler().dispatch_data_source(
+            data_source, BuilderDispatchContext(request, page)
+        )
+
+    assert dispatch(rows[0].id)[name] == "BMW"
+    assert dispatch(rows[1].id)[name] == "Audi"
+
+    # Changing the row without sending a signal only shows up when the results
+    # aren't cached.
+    table.get_model().objects.filter(id=rows[0].id).update(**{name: "Mini"})
+    assert dispatch(rows[0].id)[name] == ("BMW" if published else "Mini")
+
+    RowHandler().update_row_by_id(user, table, rows[1].id, {name: "Seat"})
+    assert dispatch(rows[0].id)[name] == "Mini"
+    assert dispatch(rows[1].id)[name] == "Seat"
+
+    settings.BASEROW_BUILDER_DATA_SOURCES_CACHE_TTL_ONLY = True
+    assert dispatch(rows[1].id)[name] == "Seat"
+    RowHandler().update_row_by_id(user, table, rows[1].id, {name: "Fiat"})
+    assert dispatch(rows[1].id)[name] == ("Seat" if published else "Fiat")
+
+
+@pytest.mark.django_db
+def test_dispatch_data_source_results_cache_with_lookup_field(data_fixture, settings):
+    settings.BASEROW_BUILDER_DATA_SOURCES_CACHE_TIMEOUT = 60
+    user = data_fixture.create_user()
+    table_a, table_b, link_field = data_fixture.create_two_linked_tables(user=user)
+    primary_b = table_b.field_set.get(primary=True)
+    lookup_field = FieldHandler().create_field(
+        user,
+        table_a,
+        "lookup",
+        name="lookup",
+        through_field_id=link_field.id,
+        target_field_id=primary_b.id,
+    )
+    row_b = RowHandler().create_row(user, table_b, {primary_b.db_column: "BMW"})
+    row_a = RowHandler().create_row(
+        user, table_a, {link_field.db_column: [row_b.id]}
+    )
+    builder = data_fixture.create_builder_application(workspace=None)
+    integration = data_fixture.create_local_baserow_integration(
+        user=user, application=builder
+    )
+    page = data_fixture.create_builder_page(builder=builder)
+    data_source = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page, integration=integration, table=table_a, row_id=str(row_a.id)
+    )
+
+    def dispatch_lookup_values():
+        result = DataSourceHandler().dispatch_data_source(
+            data_source, BuilderDispatchContext(MagicMock(), page)
+        )
+        return [value["value"] for value in result[lookup_field.db_column]]
+
+    assert dispatch_lookup_values() == ["BMW"]
+
+    # Only the rows of the other table are updated, which changes the values of the
+    # lookup field.
+    RowHandler().update_row_by_id(
+        user, table_b, row_b.id, {primary_b.db_column: "Audi"}
+    )
+    assert dispatch_lookup_values() == ["Audi"]
+
+
 @pytest.mark.django_db
 def test_update_data_source_invalid_values(data_fixture):
     data_source = data_fixture.create_builder_local_baserow_get_row_data_source()
@@ -1,9 +1,12 @@
 import json
 
+from django.test.utils import override_settings
+
 import pytest
 from rest_framework import serializers
 
 from baserow.contrib.database.api.rows.serializers import (
+    FastRowSerializerMixin,
     RowSerializer,
     get_example_row_serializer_class,
     get_row_serializer_class,
@@ -430,3 +433,79 @@ def test_remap_serialized_row_to_user_field_names(data_fixture):
         "Link": [{"id": 1, "value": "Lookup 1"}],
         "Test 1": "Test value",
     }
+
+
+@pytest.mark.django_db
+def test_get_row_serializer_class_is_cached_per_model(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table, name="Text")
+    model = table.get_model()
+
+    serializer_class = get_row_serializer_class(
+        model, RowSerializer, is_response=True, field_ids=[text_field.id]
+    )
+    assert serializer_class is get_row_serializer_class(
+        model, RowSerializer, is_response=True, field_ids={text_field.id}
+    )
+    assert serializer_class is not get_row_serializer_class(
+        model, RowSerializer, is_response=True
+    )
+    assert serializer_class is not get_row_serializer_class(
+        model, RowSerializer, is_response=True, user_field_names=True
+    )
+    assert get_row_serializer_class(
+        model, field_kwargs={text_field.db_column: {"help_text": "Text"}}
+    ) is not get_row_serializer_class(
+        model, field_kwargs={text_field.db_column: {"help_text": "Text"}}
+    )
+
+    data_fixture.create_number_field(table=table, name="Number")
+    new_model = table.get_model()
+    new_serializer_class = get_row_serializer_class(
+        new_model, RowSerializer, is_response=True
+    )
+    assert new_serializer_class is not get_row_serializer_class(
+        model, RowSerializer, is_response=True
+    )
+    assert (
+        "Number"
+        not in get_row_serializer_class(
+            model, RowSerializer, is_response=True, user_field_names=True
+        )().fields
+    )
+    assert (
+        "Number"
+        in get_row_serializer_class(
+            new_model, RowSerializer, is_response=True, user_field_names=True
+        )().fields
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("user_field_names", [True, False])
+def test_fast_row_serialization_is_identical(data_fixture, user_field_names):
+    table, user, row, blank_row, context = setup_interesting_test_table(data_fixture)
+    model = table.get_model()
+    rows = model.objects.all().enhance_by_fields().order_by("id")
+
+    with override_settings(BASEROW_FAST_ROW_SERIALIZATION=False):
+        serializer_class = get_row_serializer_class(
+            model, RowSerializer, is_response=True, user_field_names=user_field_names
+        )
+    assert not issubclass(serializer_class, FastRowSerializerMixin)
+
+    with override_settings(BASEROW_FAST_ROW_SERIALIZATION=True):
+        fast_serializer_class = get_row_serializer_class(
+            model, RowSerializer, is_response=True, user_field_names=user_field_names
+        )
+        validation_serializer_class = get_row_serializer_class(model)
+
+    assert issubclass(fast_serializer_class, FastRowSerializerMixin)
+    assert fast_serializer_class.row_value_converters
+    assert not issubclass(validation_serializer_class, FastRowSerializerMixin)
+
+    assert fast_serializer_class(rows, many=True).data == (
+        serializer_class(rows, many=True).data
+    )
+    assert fast_serializer_class(row).data == serializer_class(row).data
+    assert fast_serializer_class(blank_row).data == serializer_class(blank_row).data
@@ -3179,3 +3179,50 @@ def test_list_row_history_endpoint_is_paginated(data_fixture, api_client):
             },
         ],
     }
+
+
+@pytest.mark.django_db
+def test_list_rows_with_keyset_pagination(api_client, data_fixture, settings):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    field_1 = data_fixture.create_text_field(name="Name", table=table, primary=True)
+    field_2 = data_fixture.create_date_field(name="Date", table=table)
+
+    model = table.get_model()
+    for name, date in [
+        ("b", "2024-01-02"),
+        ("a", None),
+        ("b", "2024-01-01"),
+        (None, "2024-01-01"),
+        ("a", "2024-01-03"),
+    ]:
+        model.objects.create(
+            **{f"field_{field_1.id}": name, f"field_{field_2.id}": date}
+        )
+
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+    for order_by in [None, f"-field_{field_1.id},field_{field_2.id}"]:
+        params = {"order_by": order_by} if order_by else {}
+        response = api_client.get(url, params, HTTP_AUTHORIZATION=f"JWT {jwt_token}")
+        expected_ids = [row["id"] for row in response.json()["results"]]
+
+        ids, cursor = [], ""
+        while cursor is not None:
+            response = api_client.get(
+                url,
+                {**params, "cursor": cursor, "size": 2},
+                HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+            )
+            assert response.status_code == HTTP_200_OK
+            ids += [row["id"] for row in response.json()["results"]]
+            cursor = response.json()["next_cursor"]
+
+        assert ids == expected_ids
+
+    response = api_client.get(
+        url,
+        {"cursor": "", "size": settings.ROW_PAGE_SIZE_LIMIT + 1},
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_PAGE_SIZE_LIMIT"
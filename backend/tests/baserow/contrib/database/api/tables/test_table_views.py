@@ -1,4 +1,3 @@
-import json
 from unittest.mock import patch
 
 from django.db import connection
@@ -14,6 +13,7 @@ from rest_framework.status import (
     HTTP_404_NOT_FOUND,
 )
 
+from baserow.contrib.database.file_import.data_file import ImportDataFile
 from baserow.contrib.database.file_import.models import FileImportJob
 from baserow.contrib.database.table.models import Table
 from baserow.test_utils.helpers import (
@@ -192,14 +192,13 @@ def test_create_table_with_data(
     assert job.database == database
 
     with patch_filefield_storage():
-        with job.data_file.open("r") as fin:
-            data = json.load(fin)
-            assert data == [
-                ["A", "B", "C", "D"],
-                ["1-1", "1-2", "1-3", "1-4", "1-5"],
-                ["2-1", "2-2", "2-3"],
-                ["3-1", "3-2"],
-            ]
+        data = list(ImportDataFile(job.data_file))
+        assert data == [
+            ["A", "B", "C", "D"],
+            ["1-1", "1-2", "1-3", "1-4", "1-5"],
+            ["2-1", "2-2", "2-3"],
+            ["3-1", "3-2"],
+        ]
 
 
 @pytest.mark.django_db(transaction=True)
@@ -3,7 +3,9 @@ from decimal import Decimal
 from typing import Any, Dict, List
 
 from django.core.cache import cache
+from django.db import connection
 from django.shortcuts import reverse
+from django.test.utils import CaptureQueriesContext
 
 import pytest
 from pytest_unordered import unordered
@@ -209,6 +211,156 @@ def test_list_rows(api_client, data_fixture):
     assert response.status_code == HTTP_200_OK
 
 
+@pytest.mark.django_db
+def test_list_rows_with_keyset_pagination(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="Color")
+    number_field = data_fixture.create_number_field(table=table, name="Horsepower")
+    grid = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_sort(view=grid, field=text_field, order="DESC")
+    data_fixture.create_view_sort(view=grid, field=number_field, order="ASC")
+
+    RowHandler().create_rows(
+        user,
+        table,
+        [
+            {text_field.db_column: color, number_field.db_column: number}
+            for color, number in [
+                ("Green", 10),
+                (None, 5),
+                ("Orange", None),
+                ("Orange", 1),
+                ("Green", 10),
+                (None, None),
+                ("Purple", 3),
+            ]
+        ],
+    )
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    response = api_client.get(url, HTTP_AUTHORIZATION=f"JWT {token}")
+    expected_ids = [row["id"] for row in response.json()["results"]]
+
+    ids, cursor, pages = [], "", 0
+    while cursor is not None:
+        response = api_client.get(
+            url, {"cursor": cursor, "size": 2}, HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+        assert response.status_code == HTTP_200_OK
+        response_json = response.json()
+        assert "count" not in response_json
+        ids += [row["id"] for row in response_json["results"]]
+        cursor = response_json["next_cursor"]
+        pages += 1
+
+    assert ids == expected_ids
+    assert pages == 4
+
+    response = api_client.get(
+        url,
+        {"cursor": "", "size": 2, "count_mode": "exact"},
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    response_json = response.json()
+    assert response_json["count"] == 7
+    assert f"cursor={response_json['next_cursor']}" in response_json["next"]
+
+    response = api_client.get(
+        url, {"cursor": "", "count_mode": "estimate"}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_200_OK
+    assert isinstance(response.json()["count"], int)
+
+    response = api_client.get(
+        url, {"cursor": "", "count_mode": "wrong"}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_COUNT_MODE"
+
+    response = api_client.get(
+        url, {"cursor": "invalid"}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_CURSOR"
+
+    # A cursor can't be used if the sorting of the view changes.
+    response = api_client.get(
+        url, {"cursor": "", "size": 2}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    cursor = response.json()["next_cursor"]
+    response = api_client.get(
+        url,
+        {"cursor": cursor, "order_by": f"field_{number_field.id}"},
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_CURSOR"
+
+
+@pytest.mark.django_db
+def test_list_rows_with_keyset_pagination_uses_row_value_comparison(
+    api_client, data_fixture
+):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    grid = data_fixture.create_grid_view(table=table)
+    RowHandler().create_rows(user, table, [{} for _ in range(5)])
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    response = api_client.get(
+        url, {"cursor": "", "size": 2}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    cursor = response.json()["next_cursor"]
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.get(
+            url, {"cursor": cursor, "size": 2}, HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+    assert response.status_code == HTTP_200_OK
+    assert [row["id"] for row in response.json()["results"]] == [3, 4]
+
+    # The `order` and `id` columns can't be null, so the seek predicate must be a
+    # single row value comparison that can use the `(order, id)` index.
+    seek_queries = [q["sql"] for q in ctx.captured_queries if "ROW(" in q["sql"]]
+    assert len(seek_queries) == 1
+    assert " OR " not in seek_queries[0]
+
+
+@pytest.mark.django_db
+def test_list_rows_public_with_keyset_pagination(api_client, data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="Color")
+    grid = data_fixture.create_grid_view(table=table, public=True)
+    data_fixture.create_view_sort(view=grid, field=text_field, order="ASC")
+    RowHandler().create_rows(
+        user,
+        table,
+        [
+            {text_field.db_column: color}
+            for color in ["Green", None, "Orange", "Green", None]
+        ],
+    )
+
+    url = reverse("api:database:views:grid:public_rows", kwargs={"slug": grid.slug})
+    expected_ids = [row["id"] for row in api_client.get(url).json()["results"]]
+
+    ids, cursor = [], ""
+    while cursor is not None:
+        response = api_client.get(url, {"cursor": cursor, "size": 2})
+        assert response.status_code == HTTP_200_OK
+        response_json = response.json()
+        ids += [row["id"] for row in response_json["results"]]
+        cursor = response_json["next_cursor"]
+
+    assert ids == expected_ids
+
+    response = api_client.get(url, {"cursor": "invalid"})
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_CURSOR"
+
+
 @pytest.mark.django_db
 def test_list_rows_with_group_by(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token(
@@ -960,11 +1112,13 @@ def test_view_aggregations(api_client, data_fixture):
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": None,
         "version": 1,
+        "state": {"sum": None, "count": 0},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") is None
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 0,
         "version": 1,
+        "state": {"count": 0},
     }
     assert (
         cache.get(f"aggregation_version__{grid.id}_{boolean_field.db_column}") is None
@@ -1062,11 +1216,13 @@ def test_view_aggregations(api_client, data_fixture):
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": 1210.0,
         "version": 4,
+        "state": {"sum": Decimal(1210), "count": 3},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 4
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 2,
         "version": 6,
+        "state": {"count": 2},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{boolean_field.db_column}") == 6
 
@@ -1115,10 +1271,12 @@ def test_view_aggregations(api_client, data_fixture):
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1210),
         "version": 4,
+        "state": {"sum": Decimal(1210), "count": 3},
     }
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 2,
         "version": 6,
+        "state": {"count": 2},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 5
     assert cache.get(f"aggregation_version__{grid.id}_{boolean_field.db_column}") == 7
@@ -1139,10 +1297,12 @@ def test_view_aggregations(api_client, data_fixture):
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1200),
         "version": 5,
+        "state": {"sum": Decimal(1200), "count": 1},
     }
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 1,
         "version": 7,
+        "state": {"count": 1},
     }
 
     # Let's update the filter
@@ -1587,6 +1747,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1111),
         "version": 5,
+        "state": {"sum": Decimal(1111), "count": 4},
     }
     assert (
         cache.get(
@@ -1602,10 +1763,11 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1111),
         "version": 5,
+        "state": {"sum": Decimal(1111), "count": 4},
     }
     assert cache.get(
         f"aggregation_value__{grid2.id}_{sum_formula_on_lookup_field.db_column}"
-    ) == {"value": None, "version": 5}
+    ) == {"value": None, "version": 5, "state": {"sum": None, "count": 0}}
 
     cache.set(
         f"aggregation_value__{grid2.id}_{sum_formula_on_lookup_field.db_column}",
@@ -1626,6 +1788,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1111),
         "version": 5,
+        "state": {"sum": Decimal(1111), "count": 4},
     }
 
     check_table_2_aggregation_values(
@@ -1635,12 +1798,14 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1111),
         "version": 5,
+        "state": {"sum": Decimal(1111), "count": 4},
     }
     assert cache.get(
         f"aggregation_value__{grid2.id}_{sum_formula_on_lookup_field.db_column}"
     ) == {
         "value": Decimal(2221),
         "version": 9,
+        "state": {"sum": Decimal(2221), "count": 4},
     }
 
     update_value_of_table1(row2, 10000)
@@ -1648,6 +1813,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1111),
         "version": 5,
+        "state": {"sum": Decimal(1111), "count": 4},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 6
     assert cache.get(
@@ -1655,6 +1821,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     ) == {
         "value": Decimal(2221),
         "version": 9,
+        "state": {"sum": Decimal(2221), "count": 4},
     }
     assert (
         cache.get(
@@ -1680,6 +1847,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal("1111"),
         "version": 5,
+        "state": {"sum": Decimal(1111), "count": 4},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 7
 
@@ -1698,6 +1866,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal("1111"),
         "version": 5,
+        "state": {"sum": Decimal(1111), "count": 4},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 7
     assert cache.get(
@@ -1705,6 +1874,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     ) == {
         "value": Decimal(22001),
         "version": 11,
+        "state": {"sum": Decimal(22001), "count": 4},
     }
 
     # Restore delete row
@@ -1738,6 +1908,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     ) == {
         "value": Decimal(22201),
         "version": 12,
+        "state": {"sum": Decimal(22201), "count": 4},
     }
 
     # Update number field
@@ -1768,6 +1939,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     ) == {
         "value": Decimal(22201),
         "version": 13,
+        "state": {"sum": Decimal(22201), "count": 4},
     }
 
     # Delete number field
@@ -1785,6 +1957,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     ) == {
         "value": Decimal(22201),
         "version": 13,
+        "state": {"sum": Decimal(22201), "count": 4},
     }
     assert (
         cache.get(
@@ -1801,6 +1974,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     ) == {
         "value": Decimal(22201),
         "version": 13,
+        "state": {"sum": Decimal(22201), "count": 4},
     }
     assert (
         cache.get(
@@ -1837,6 +2011,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     ) == {
         "value": Decimal(22201),
         "version": 13,
+        "state": {"sum": Decimal(22201), "count": 4},
     }
     assert (
         cache.get(
@@ -2099,11 +2274,13 @@ def test_public_view_aggregations(api_client, data_fixture):
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": None,
         "version": 1,
+        "state": {"sum": None, "count": 0},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") is None
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 0,
         "version": 1,
+        "state": {"count": 0},
     }
     assert (
         cache.get(f"aggregation_version__{grid.id}_{boolean_field.db_column}") is None
@@ -2199,11 +2376,13 @@ def test_public_view_aggregations(api_client, data_fixture):
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": 1210.0,
         "version": 4,
+        "state": {"sum": Decimal(1210), "count": 3},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 4
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 2,
         "version": 6,
+        "state": {"count": 2},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{boolean_field.db_column}") == 6
 
@@ -2250,10 +2429,12 @@ def test_public_view_aggregations(api_client, data_fixture):
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1210),
         "version": 4,
+        "state": {"sum": Decimal(1210), "count": 3},
     }
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 2,
         "version": 6,
+        "state": {"count": 2},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 5
     assert cache.get(f"aggregation_version__{grid.id}_{boolean_field.db_column}") == 7
@@ -2273,10 +2454,12 @@ def test_public_view_aggregations(api_client, data_fixture):
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1200),
         "version": 5,
+        "state": {"sum": Decimal(1200), "count": 1},
     }
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 1,
         "version": 7,
+        "state": {"count": 1},
     }
 
     # Let's update the filter
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timezone
 from io import BytesIO
 from typing import List
@@ -21,6 +22,7 @@ from baserow.contrib.database.export.exceptions import (
     TableOnlyExportUnsupported,
     ViewUnsupportedForExporterType,
 )
+from baserow.contrib.database.export.file_writer import PaginatedExportJobFileWriter
 from baserow.contrib.database.export.handler import ExportHandler
 from baserow.contrib.database.export.models import (
     EXPORT_JOB_CANCELLED_STATUS,
@@ -238,7 +240,7 @@ def test_can_export_every_interesting_different_field_to_csv(
         "02/01/2021 13:00,01/02/2021 12:00,01/02/2021,02/01/2021 12:00,02/01/2021,02/01/2021 13:00,"
         "user@example.com,user@example.com,,,,,,,,,,,,,,,,,,,test FORMULA,1,True,33.3333333333,"
         "1d 0:00,2020-01-01,,,label (https://google.com),https://google.com,,0,0.000,"
-        "0:00,0:00,,00000000-0000-4000-8000-000000000002,1,,\r\n"
+        "0:00,0:00,,00000000-0000-4000-8000-000000000002,1,False,\r\n"
         "2,text,long_text,https://www.google.com,test@example.com,-1,1,-1.2,1.2,3,True,"
         "02/01/2020 01:23,02/01/2020,01/02/2020 01:23,01/02/2020,01/02/2020 02:23,"
         "01/02/2020 02:23,01/02/2021 12:00,01/02/2021,02/01/2021 12:00,02/01/2021,"
@@ -921,3 +923,159 @@ def test_csv_is_escaped(storage_mock, data_fixture):
     bom = "\ufeff"
     expected = bom + "id,text_field\r\n1,'=1+2\r\n"
     assert contents == expected
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("workers", [0, 1, 3])
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_rows_are_serialized_in_order_in_chunks(
+    storage_mock, workers, data_fixture, settings
+):
+    settings.BASEROW_EXPORT_CHUNK_SIZE = 2
+    settings.BASEROW_EXPORT_SERIALIZATION_WORKERS = workers
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text", primary=True)
+    # A multiple select field can't be exported with COPY, so the rows are serialized
+    # in Python.
+    multiple_select_field = data_fixture.create_multiple_select_field(
+        table=table, name="options"
+    )
+    option = data_fixture.create_select_option(field=multiple_select_field, value="A")
+    grid_view = data_fixture.create_grid_view(table=table)
+    RowHandler().create_rows(
+        user,
+        table,
+        [
+            {
+                text_field.db_column: f"row {i}",
+                multiple_select_field.db_column: [option.id],
+            }
+            for i in range(7)
+        ],
+    )
+
+    with patch(
+        "baserow.contrib.database.export.file_writer.ThreadPoolExecutor.submit",
+        autospec=True,
+        side_effect=ThreadPoolExecutor.submit,
+    ) as submit_mock:
+        job, contents = run_export_job_with_mock_storage(
+            table, grid_view, storage_mock, user
+        )
+
+    assert submit_mock.call_count == (4 if workers else 0)
+    assert job.progress_percentage == 100
+    assert contents == "\ufeffid,text,options\r\n" + "".join(
+        f"{i + 1},row {i},A\r\n" for i in range(7)
+    )
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_csv_export_streams_the_rows_from_the_database_if_possible(
+    storage_mock, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text", primary=True)
+    number_field = data_fixture.create_number_field(
+        table=table, name="number", number_negative=True, number_decimal_places=1
+    )
+    boolean_field = data_fixture.create_boolean_field(table=table, name="boolean")
+    grid_view = data_fixture.create_grid_view(table=table)
+    RowHandler().create_rows(
+        user,
+        table,
+        [
+            {text_field.db_column: 'a,b "c"', number_field.db_column: "-1.5"},
+            {text_field.db_column: "line\nbreak", boolean_field.db_column: True},
+            {text_field.db_column: "@x|y"},
+            {text_field.db_column: "ü"},
+            {text_field.db_column: ""},
+        ],
+    )
+    expected = (
+        "id,text,number,boolean\r\n"
+        '1,"a,b ""c""",-1.5,False\r\n'
+        '2,"line\nbreak",,True\r\n'
+        "3,'@x\\|y,,False\r\n"
+        "4,ü,,False\r\n"
+        "5,,,False\r\n"
+    )
+
+    with patch(
+        "baserow.contrib.database.export.file_writer.PaginatedExportJobFileWriter"
+        ".write_csv_rows_with_copy",
+        autospec=True,
+        side_effect=PaginatedExportJobFileWriter.write_csv_rows_with_copy,
+    ) as copy_mock:
+        job, contents = run_export_job_with_mock_storage(
+            table, grid_view, storage_mock, user
+        )
+    assert copy_mock.call_count == 1
+    assert job.progress_percentage == 100
+    assert contents == "\ufeff" + expected
+
+    _, contents = run_export_job_with_mock_storage(
+        table,
+        grid_view,
+        storage_mock,
+        user,
+        {"exporter_type": "csv", "export_charset": "iso-8859-1"},
+    )
+    assert contents == expected
+
+    # The value of a link row field can't be computed by the database, so the rows
+    # are serialized in Python.
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="link", link_row_table=table
+    )
+    with patch(
+        "baserow.contrib.database.export.file_writer.PaginatedExportJobFileWriter"
+        ".write_csv_rows_with_copy",
+    ) as copy_mock:
+        _, contents = run_export_job_with_mock_storage(
+            table, grid_view, storage_mock, user
+        )
+    assert copy_mock.call_count == 0
+    assert contents == (
+        "\ufeffid,text,number,boolean,link\r\n"
+        '1,"a,b ""c""",-1.5,False,\r\n'
+        '2,"line\nbreak",,True,\r\n'
+        "3,'@x\\|y,,False,\r\n"
+        "4,ü,,False,\r\n"
+        "5,,,False,\r\n"
+    )
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_csv_export_of_password_field_streamed_from_the_database(
+    storage_mock, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text", primary=True)
+    password_field = data_fixture.create_password_field(table=table, name="password")
+    grid_view = data_fixture.create_grid_view(table=table)
+    RowHandler().create_rows(
+        user,
+        table,
+        [
+            {text_field.db_column: "set", password_field.db_column: "secret"},
+            {text_field.db_column: "empty"},
+        ],
+    )
+
+    with patch(
+        "baserow.contrib.database.export.file_writer.PaginatedExportJobFileWriter"
+        ".write_csv_rows_with_copy",
+        autospec=True,
+        side_effect=PaginatedExportJobFileWriter.write_csv_rows_with_copy,
+    ) as copy_mock:
+        _, contents = run_export_job_with_mock_storage(
+            table, grid_view, storage_mock, user
+        )
+    assert copy_mock.call_count == 1
+    assert contents == "\ufeffid,text,password\r\n1,set,True\r\n2,empty,False\r\n"
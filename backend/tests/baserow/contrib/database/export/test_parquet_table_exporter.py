@@ -0,0 +1,161 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from io import BytesIO
+from unittest.mock import patch
+
+import pytest
+
+from baserow.contrib.database.export.handler import ExportHandler
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.views.handler import ViewHandler
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def run_export_job_with_mock_storage(table, view, storage_mock, user, exporter_type):
+    stub_file = BytesIO()
+    storage_mock.open.return_value = stub_file
+    close = stub_file.close
+    stub_file.close = lambda: None
+    handler = ExportHandler()
+    job = handler.create_pending_export_job(
+        user, table, view, {"exporter_type": exporter_type}
+    )
+    handler.run_export_job(job)
+    contents = stub_file.getvalue()
+    close()
+    return job, contents
+
+
+def read_export(contents, exporter_type):
+    if exporter_type == "parquet":
+        return pq.read_table(pa.BufferReader(contents))
+    return pa.ipc.open_file(pa.BufferReader(contents)).read_all()
+
+
+def setup_table(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text", primary=True)
+    number_field = data_fixture.create_number_field(
+        table=table, name="number", number_decimal_places=2, number_negative=True
+    )
+    boolean_field = data_fixture.create_boolean_field(table=table, name="boolean")
+    date_field = data_fixture.create_date_field(
+        table=table, name="date", date_include_time=False
+    )
+    datetime_field = data_fixture.create_date_field(
+        table=table, name="datetime", date_include_time=True
+    )
+    single_select_field = data_fixture.create_single_select_field(
+        table=table, name="select"
+    )
+    option = data_fixture.create_select_option(field=single_select_field, value="A")
+    link_table = data_fixture.create_database_table(database=table.database)
+    data_fixture.create_text_field(table=link_table, name="name", primary=True)
+    link_field = data_fixture.create_link_row_field(
+        table=table, name="link", link_row_table=link_table
+    )
+    linked_rows = RowHandler().create_rows(user, link_table, [{}, {}])
+
+    RowHandler().create_rows(
+        user,
+        table,
+        [
+            {
+                text_field.db_column: "b",
+                number_field.db_column: "-1.25",
+                boolean_field.db_column: True,
+                date_field.db_column: "2020-02-01",
+                datetime_field.db_column: "2020-02-01T01:23:00Z",
+                single_select_field.db_column: option.id,
+                link_field.db_column: [linked_rows[0].id, linked_rows[1].id],
+            },
+            {text_field.db_column: "a"},
+        ],
+    )
+    return user, table, text_field
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("exporter_type", ["parquet", "arrow"])
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_columnar_export_has_typed_columns(storage_mock, exporter_type, data_fixture):
+    user, table, _ = setup_table(data_fixture)
+
+    job, contents = run_export_job_with_mock_storage(
+        table, None, storage_mock, user, exporter_type
+    )
+    assert job.exported_file_name.endswith(f".{exporter_type}")
+    exported = read_export(contents, exporter_type)
+
+    assert exported.schema.names == [
+        "id",
+        "text",
+        "number",
+        "boolean",
+        "date",
+        "datetime",
+        "select",
+        "link",
+    ]
+    assert exported.schema.field("id").type == pa.int64()
+    assert exported.schema.field("text").type == pa.string()
+    assert pa.types.is_decimal(exported.schema.field("number").type)
+    assert exported.schema.field("boolean").type == pa.bool_()
+    assert exported.schema.field("date").type == pa.date32()
+    assert exported.schema.field("datetime").type == pa.timestamp("us", tz="UTC")
+    assert exported.schema.field("select").type == pa.string()
+    assert exported.schema.field("link").type == pa.list_(pa.int64())
+    assert exported.to_pylist() == [
+        {
+            "id": 1,
+            "text": "b",
+            "number": Decimal("-1.25"),
+            "boolean": True,
+            "date": date(2020, 2, 1),
+            "datetime": datetime(2020, 2, 1, 1, 23, tzinfo=timezone.utc),
+            "select": "A",
+            "link": [1, 2],
+        },
+        {
+            "id": 2,
+            "text": "a",
+            "number": None,
+            "boolean": False,
+            "date": None,
+            "datetime": None,
+            "select": None,
+            "link": [],
+        },
+    ]
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_parquet_export_of_view_applies_filters_and_sorts(
+    storage_mock, data_fixture, settings
+):
+    settings.BASEROW_EXPORT_CHUNK_SIZE = 1
+    user, table, text_field = setup_table(data_fixture)
+    RowHandler().create_rows(user, table, [{text_field.db_column: "c"}])
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=text_field, type="not_equal", value="b"
+    )
+    data_fixture.create_view_sort(view=grid_view, field=text_field, order="DESC")
+    ViewHandler().update_field_options(
+        view=grid_view,
+        field_options={
+            field.id: {"hidden": field.id != text_field.id}
+            for field in table.field_set.all()
+        },
+    )
+
+    _, contents = run_export_job_with_mock_storage(
+        table, grid_view, storage_mock, user, "parquet"
+    )
+    exported = read_export(contents, "parquet")
+
+    assert exported.to_pylist() == [{"id": 3, "text": "c"}, {"id": 2, "text": "a"}]
@@ -6,6 +6,8 @@ import pytest
 
 from baserow.contrib.database.fields.dependencies.update_collector import (
     FieldUpdateCollector,
+    HopReport,
+    RowScopedUpdatePlanner,
 )
 from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.handler import FieldHandler
@@ -402,3 +404,155 @@ def test_update_statements_only_update_rows_where_values_change(data_fixture):
     # Only row_4 and row_5 should be updated, the others already have the value "a"
     assert execute_update_statement(func_update_statement) == 2
     assert_all_rows_have_value("a")
+
+
+@pytest.mark.django_db
+def test_update_statements_for_the_same_table_at_the_same_level_are_fused(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    first_table = data_fixture.create_database_table(database=database)
+    second_table = data_fixture.create_database_table(database=database)
+    first_table_primary_field = data_fixture.create_text_field(
+        name="primary", primary=True, table=first_table
+    )
+    data_fixture.create_text_field(name="primary", primary=True, table=second_table)
+    # noinspection PyTypeChecker
+    link_a: LinkRowField = FieldHandler().create_field(
+        user=user,
+        table=first_table,
+        type_name="link_row",
+        link_row_table=second_table,
+        name="link_a",
+    )
+    # noinspection PyTypeChecker
+    link_b: LinkRowField = FieldHandler().create_field(
+        user=user,
+        table=first_table,
+        type_name="link_row",
+        link_row_table=second_table,
+        name="link_b",
+    )
+    first_table_model = first_table.get_model(attribute_names=True)
+    second_table_model = second_table.get_model(attribute_names=True)
+
+    second_table_a_row = second_table_model.objects.create(primary="a")
+    second_table_b_row = second_table_model.objects.create(primary="b")
+
+    first_table_1_row = first_table_model.objects.create(primary="1")
+    first_table_2_row = first_table_model.objects.create(primary="2")
+    first_table_3_row = first_table_model.objects.create(primary="3")
+    link_a_name = first_table_model._field_objects[link_a.id]["name"]
+    link_b_name = first_table_model._field_objects[link_b.id]["name"]
+    getattr(first_table_1_row, link_a_name).add(second_table_a_row.id)
+    getattr(first_table_2_row, link_b_name).add(second_table_a_row.id)
+    getattr(first_table_3_row, link_a_name).add(second_table_b_row.id)
+
+    field_cache = FieldCache()
+    update_collector = FieldUpdateCollector(
+        second_table, starting_row_ids=[second_table_a_row.id]
+    )
+    for link_row_field in [link_a, link_b]:
+        update_collector.add_field_with_pending_update_statement(
+            first_table_primary_field,
+            Value("other"),
+            via_path_to_starting_table=[link_row_field],
+        )
+    # Cache the models so we are only asserting about the update queries
+    field_cache.cache_model(first_table.get_model())
+    field_cache.cache_model(second_table.get_model())
+    # The first table is reached via two different paths, but both updates are
+    # at the same level of the plan, so only one update is expected.
+    with django_assert_num_queries(1):
+        update_collector.apply_updates(field_cache)
+
+    first_table_1_row.refresh_from_db()
+    first_table_2_row.refresh_from_db()
+    first_table_3_row.refresh_from_db()
+    assert first_table_1_row.primary == "other"
+    assert first_table_2_row.primary == "other"
+    assert first_table_3_row.primary == "3"
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("temp_table_threshold", [5000, 0])
+def test_row_scoped_updates_only_carry_the_changed_rows_to_the_next_hop(
+    data_fixture, settings, temp_table_threshold
+):
+    settings.ROW_SCOPED_FORMULA_UPDATES = True
+    settings.ROW_SCOPED_FORMULA_UPDATES_TEMP_TABLE_THRESHOLD = temp_table_threshold
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    starting_table = data_fixture.create_database_table(database=database)
+    first_table = data_fixture.create_database_table(database=database)
+    second_table = data_fixture.create_database_table(database=database)
+    data_fixture.create_text_field(name="primary", primary=True, table=starting_table)
+    first_table_primary_field = data_fixture.create_text_field(
+        name="primary", primary=True, table=first_table
+    )
+    second_table_primary_field = data_fixture.create_text_field(
+        name="primary", primary=True, table=second_table
+    )
+    first_link_row_field = FieldHandler().create_field(
+        user=user,
+        table=first_table,
+        type_name="link_row",
+        link_row_table=starting_table,
+        name="link",
+    )
+    second_link_row_field = FieldHandler().create_field(
+        user=user,
+        table=second_table,
+        type_name="link_row",
+        link_row_table=first_table,
+        name="link",
+    )
+    starting_table_model = starting_table.get_model(attribute_names=True)
+    first_table_model = first_table.get_model(attribute_names=True)
+    second_table_model = second_table.get_model(attribute_names=True)
+
+    starting_row = starting_table_model.objects.create(primary="s")
+    first_table_unchanged_row = first_table_model.objects.create(primary="other")
+    first_table_changed_row = first_table_model.objects.create(primary="1")
+    first_table_unchanged_row.link.add(starting_row.id)
+    first_table_changed_row.link.add(starting_row.id)
+    second_table_1_row = second_table_model.objects.create(primary="1")
+    second_table_2_row = second_table_model.objects.create(primary="2")
+    second_table_1_row.link.add(first_table_unchanged_row.id)
+    second_table_2_row.link.add(first_table_changed_row.id)
+
+    update_collector = FieldUpdateCollector(
+        starting_table, starting_row_ids=[starting_row.id]
+    )
+    update_collector.add_field_with_pending_update_statement(
+        first_table_primary_field,
+        Value("other"),
+        via_path_to_starting_table=[first_link_row_field],
+    )
+    update_collector.add_field_with_pending_update_statement(
+        second_table_primary_field,
+        Value("changed"),
+        via_path_to_starting_table=[first_link_row_field, second_link_row_field],
+    )
+    planner = RowScopedUpdatePlanner(update_collector._update_statement_collector)
+    with patch(
+        "baserow.contrib.database.fields.dependencies.update_collector"
+        ".RowScopedUpdatePlanner",
+        return_value=planner,
+    ):
+        update_collector.apply_updates(FieldCache())
+
+    first_table_changed_row.refresh_from_db()
+    second_table_1_row.refresh_from_db()
+    second_table_2_row.refresh_from_db()
+    assert first_table_changed_row.primary == "other"
+    # The first row of the second table is only linked to a row of which the value
+    # didn't change, so it isn't updated.
+    assert second_table_1_row.primary == "1"
+    assert second_table_2_row.primary == "changed"
+    assert planner.hop_reports == [
+        HopReport(0, starting_table.id, 1, 0),
+        HopReport(1, first_table.id, 2, 1),
+        HopReport(2, second_table.id, 1, 1),
+    ]
@@ -1,5 +1,7 @@
-from datetime import datetime, timezone
+import time
+from datetime import date, datetime, timezone
 
+from django.core.cache import cache
 from django.test import override_settings
 from django.utils import timezone as django_timezone
 
@@ -9,6 +11,9 @@ from freezegun import freeze_time
 from baserow.contrib.database.fields.field_types import FormulaFieldType
 from baserow.contrib.database.fields.tasks import (
     delete_mentions_marked_for_deletion,
+    get_periodic_update_completed_now_key,
+    get_periodic_update_lock_key,
+    run_periodic_field_type_update_per_workspace,
     run_periodic_fields_updates,
 )
 from baserow.contrib.database.rows.handler import RowHandler
@@ -377,6 +382,105 @@ def test_run_periodic_field_type_doesnt_update_trashed_workspace(data_fixture):
         assert FormulaFieldType().get_fields_needing_periodic_update().count() == 0
 
 
+@pytest.mark.django_db
+def test_run_periodic_fields_updates_skips_today_fields_on_the_same_day(
+    data_fixture,
+):
+    workspace = data_fixture.create_workspace()
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    with freeze_time("2023-02-27 10:00"):
+        today_field = data_fixture.create_formula_field(table=table, formula="today()")
+        now_field = data_fixture.create_formula_field(
+            table=table, formula="now()", date_include_time=True
+        )
+        row = table.get_model().objects.create()
+        # The first update can't be skipped, because the previous one is unknown.
+        run_periodic_fields_updates(workspace_id=workspace.id)
+
+    table_model = table.get_model()
+    # Changes the value directly to detect if the field has been updated.
+    table_model.objects.update(**{today_field.db_column: date(2000, 1, 1)})
+
+    with freeze_time("2023-02-27 23:50"):
+        run_periodic_fields_updates(workspace_id=workspace.id)
+
+    row = table_model.objects.get(id=row.id)
+    assert getattr(row, today_field.db_column) == date(2000, 1, 1)
+    assert getattr(row, now_field.db_column) == datetime(
+        2023, 2, 27, 23, 50, tzinfo=timezone.utc
+    )
+
+    with freeze_time("2023-02-28 00:00"):
+        run_periodic_fields_updates(workspace_id=workspace.id)
+
+    row = table_model.objects.get(id=row.id)
+    assert getattr(row, today_field.db_column) == date(2023, 2, 28)
+    assert getattr(row, now_field.db_column) == datetime(
+        2023, 2, 28, tzinfo=timezone.utc
+    )
+
+
+@pytest.mark.django_db
+def test_run_periodic_field_type_update_per_workspace_skips_locked_workspace(
+    data_fixture,
+):
+    workspace = data_fixture.create_workspace()
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    with freeze_time("2023-02-27 10:00"):
+        field = data_fixture.create_formula_field(
+            table=table, formula="now()", date_include_time=True
+        )
+        row = table.get_model().objects.create()
+
+    lock_key = get_periodic_update_lock_key(FormulaFieldType.type, workspace.id)
+    cache.set(lock_key, 1)
+    try:
+        with freeze_time("2023-02-27 10:30"):
+            run_periodic_field_type_update_per_workspace(
+                FormulaFieldType.type, workspace.id
+            )
+    finally:
+        cache.delete(lock_key)
+
+    row.refresh_from_db()
+    assert getattr(row, field.db_column) == datetime(
+        2023, 2, 27, 10, 0, tzinfo=timezone.utc
+    )
+
+
+@pytest.mark.django_db
+def test_run_periodic_field_type_update_per_workspace_stops_after_deadline(
+    data_fixture,
+):
+    workspace = data_fixture.create_workspace()
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    with freeze_time("2023-02-27 10:00"):
+        field = data_fixture.create_formula_field(
+            table=table, formula="now()", date_include_time=True
+        )
+        row = table.get_model().objects.create()
+
+    with freeze_time("2023-02-27 10:30"):
+        deadline = time.time() - 1
+        run_periodic_field_type_update_per_workspace(
+            FormulaFieldType.type, workspace.id, deadline=deadline
+        )
+
+    row.refresh_from_db()
+    assert getattr(row, field.db_column) == datetime(
+        2023, 2, 27, 10, 0, tzinfo=timezone.utc
+    )
+    assert (
+        cache.get(
+            get_periodic_update_completed_now_key(FormulaFieldType.type, workspace.id)
+        )
+        is None
+    )
+
+
 @override_settings(STALE_MENTIONS_CLEANUP_INTERVAL_MINUTES=60)
 @pytest.mark.django_db
 def test_run_delete_mentions_marked_for_deletion(data_fixture):
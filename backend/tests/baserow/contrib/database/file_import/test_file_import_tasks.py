@@ -1,4 +1,7 @@
+import json
+
 from django.conf import settings
+from django.core.files.base import ContentFile
 from django.test.utils import override_settings
 from django.utils import timezone
 
@@ -15,6 +18,7 @@ from baserow.contrib.database.fields.exceptions import (
 )
 from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.models import SelectOption, TextField
+from baserow.contrib.database.file_import.data_file import ImportDataFile
 from baserow.contrib.database.rows.exceptions import ReportMaxErrorCountExceeded
 from baserow.contrib.database.table.exceptions import (
     InitialTableDataDuplicateName,
@@ -499,6 +503,53 @@ def test_run_file_import_test_chunk(data_fixture, patch_filefield_storage):
     assert job.progress_percentage == 100
 
 
+@pytest.mark.django_db(transaction=True)
+def test_run_file_import_task_with_legacy_json_data_file(
+    data_fixture, patch_filefield_storage
+):
+    data = [["A", "B"], ["1-1", "1-2"], ["2-1"]]
+
+    with patch_filefield_storage():
+        job = data_fixture.create_file_import_job(
+            data=data, data_file=ContentFile(json.dumps(data))
+        )
+        run_async_job(job.id)
+
+    job.refresh_from_db()
+
+    assert job.state == JOB_FINISHED
+    assert [field.name for field in TextField.objects.filter(table=job.table)] == [
+        "A",
+        "B",
+    ]
+    model = job.table.get_model(attribute_names=True)
+    assert [(row.a, row.b) for row in model.objects.all()] == [
+        ("1-1", "1-2"),
+        ("2-1", None),
+    ]
+
+
+@pytest.mark.django_db
+def test_file_import_data_file_is_read_line_by_line(
+    data_fixture, patch_filefield_storage
+):
+    data = [["a", "ü"], ["b", 1, None]]
+
+    with patch_filefield_storage():
+        job = data_fixture.create_file_import_job(data=data)
+
+        with job.data_file.open("rb") as file:
+            lines = file.read().splitlines()
+        assert json.loads(lines[0]) == {"format": "ndjson", "row_count": 2}
+        assert [json.loads(line) for line in lines[1:]] == data
+
+        data_file = ImportDataFile(job.data_file)
+        assert len(data_file) == 2
+        # Every iteration reads the file again.
+        assert list(data_file) == data
+        assert list(data_file) == data
+
+
 @pytest.mark.django_db()
 def test_run_file_import_limit(data_fixture, patch_filefield_storage):
     row_count = 2000
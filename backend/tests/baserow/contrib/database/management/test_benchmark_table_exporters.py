@@ -0,0 +1,31 @@
+from django.core.management import call_command
+
+import pytest
+
+
+@pytest.mark.django_db
+def test_benchmark_table_exporters_reports_rows_per_second(data_fixture, capsys):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table, primary=True)
+    grid_view = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    model.objects.bulk_create([model() for _ in range(5)])
+
+    call_command("benchmark_table_exporters", table.id, "--workers", "0")
+    captured = capsys.readouterr()
+    assert "csv: 5 rows exported in" in captured.out
+    assert "rows/sec" in captured.out
+
+    call_command(
+        "benchmark_table_exporters",
+        table.id,
+        "--view-id",
+        str(grid_view.id),
+        "--exporter-types",
+        "csv",
+        "--chunk-size",
+        "2",
+    )
+    captured = capsys.readouterr()
+    assert captured.out.startswith("csv: 5 rows exported in")
@@ -12,6 +12,7 @@ from baserow.contrib.database.rows.registries import (
     change_row_history_registry,
 )
 from baserow.core.action.registries import action_type_registry
+from baserow.core.db import get_monthly_partition_name, get_monthly_partitions
 
 
 @pytest.mark.django_db
@@ -362,3 +363,89 @@ def test_row_history_not_recorded_with_retention_zero_days(settings, data_fixtur
     )
 
     assert RowHistory.objects.count() == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.row_history
+def test_row_history_only_stores_changed_items_of_long_list_values(
+    settings, data_fixture
+):
+    settings.BASEROW_ROW_HISTORY_COMPACT_LIST_VALUES_THRESHOLD = 3
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(user=user, database=database)
+    linked_table = data_fixture.create_database_table(user=user, database=database)
+    primary_field = data_fixture.create_text_field(table=linked_table, primary=True)
+    link_field = data_fixture.create_link_row_field(
+        table=table, link_row_table=linked_table
+    )
+
+    row_handler = RowHandler()
+    linked_rows = [
+        row_handler.create_row(user, linked_table, {primary_field.id: f"Linked {i}"})
+        for i in range(4)
+    ]
+    linked_row_ids = [linked_row.id for linked_row in linked_rows]
+    row = row_handler.create_row(user, table, {link_field.id: linked_row_ids[:1]})
+
+    # Short lists are stored entirely.
+    UpdateRowsActionType.do(
+        user, table, [{"id": row.id, link_field.db_column: linked_row_ids[:2]}]
+    )
+    # Long lists only store the removed and added items.
+    UpdateRowsActionType.do(
+        user, table, [{"id": row.id, link_field.db_column: linked_row_ids[1:]}]
+    )
+
+    short_entry, long_entry = RowHistory.objects.order_by("id")
+    assert short_entry.before_values == {link_field.db_column: linked_row_ids[:1]}
+    assert short_entry.after_values == {link_field.db_column: linked_row_ids[:2]}
+
+    assert long_entry.before_values == {link_field.db_column: linked_row_ids[:1]}
+    assert long_entry.after_values == {link_field.db_column: linked_row_ids[2:]}
+    assert long_entry.fields_metadata[link_field.db_column]["linked_rows"] == {
+        str(linked_row.id): {"value": linked_row_name}
+        for linked_row, linked_row_name in [
+            (linked_rows[0], "Linked 0"),
+            (linked_rows[2], "Linked 2"),
+            (linked_rows[3], "Linked 3"),
+        ]
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.row_history
+def test_row_history_partitions_are_dropped_when_expired(data_fixture):
+    table = data_fixture.create_database_table()
+    table_name = RowHistory._meta.db_table
+    month = datetime(2090, 3, 1, tzinfo=timezone.utc)
+
+    with freeze_time("2090-03-15 12:00"):
+        RowHistoryHandler.create_upcoming_partitions(months_ahead=0)
+
+    assert get_monthly_partitions(table_name)[month] == get_monthly_partition_name(
+        table_name, month
+    )
+
+    common_params = {
+        "table": table,
+        "row_id": 1,
+        "action_uuid": "uuid",
+        "action_command_type": "cmd",
+        "action_type": "type",
+        "field_names": [],
+        "fields_metadata": {},
+        "before_values": {},
+        "after_values": {},
+    }
+    RowHistory.objects.bulk_create(
+        [
+            RowHistory(**common_params, action_timestamp=month),
+            RowHistory(**common_params, action_timestamp=datetime(2090, 4, 2)),
+        ]
+    )
+
+    RowHistoryHandler.delete_entries_older_than(datetime(2090, 4, 1))
+
+    assert month not in get_monthly_partitions(table_name)
+    assert RowHistory.objects.count() == 1
@@ -13,8 +13,10 @@ from baserow.contrib.database.api.utils import (
     extract_field_ids_from_string,
     get_include_exclude_fields,
 )
+from baserow.contrib.database.rows.error_report import RowErrorReport
 from baserow.contrib.database.rows.exceptions import RowDoesNotExist
 from baserow.contrib.database.rows.handler import RowHandler
+from baserow.core.db import bulk_create_with_copy
 from baserow.core.exceptions import UserNotInWorkspace
 from baserow.core.trash.handler import TrashHandler
 
@@ -990,7 +992,7 @@ def test_import_rows(
     model = table.get_model()
     assert model.objects.count() == 4
 
-    # create_rows_by_batch put the send_realtime_update to False
+    # import_rows_in_batches put the send_realtime_update to False
     # for the rows_created signal anyway, but this time the
     # table_updated signal is called and broadcast_to_permitted_users
     assert mocked_rows_created.call_count == 2
@@ -1019,6 +1021,113 @@ def test_import_rows(
     assert sorted(report.keys()) == sorted([1, 2])
 
 
+class SizedRowsIterable:
+    def __init__(self, rows):
+        self.rows = rows
+        self.read_rows = 0
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        for row in self.rows:
+            self.read_rows += 1
+            yield row
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.rows.handler.BATCH_SIZE", 2)
+def test_import_rows_in_batches_streams_the_data(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table, name="Name", order=1)
+    data_fixture.create_number_field(table=table, name="Speed", order=2)
+    data = SizedRowsIterable(
+        [["Tesla", 240], ["Panda", "bad"], ["Giulietta", 210, "extra"], ["Mini", 1]]
+    )
+    error_report = RowErrorReport()
+
+    batches = RowHandler().import_rows_in_batches(user, table, data, error_report)
+
+    # Only the rows of the first batch are read before they're created.
+    assert len(next(batches)) == 1
+    assert data.read_rows == 2
+    assert len(next(batches)) == 1
+    assert data.read_rows == 4
+    with pytest.raises(StopIteration):
+        next(batches)
+
+    assert sorted(error_report.to_dict().keys()) == [1, 2]
+    model = table.get_model(attribute_names=True)
+    assert [row.name for row in model.objects.all()] == ["Tesla", "Mini"]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("import_rows_with_copy", [True, False])
+def test_import_rows_with_copy(data_fixture, settings, import_rows_with_copy):
+    settings.BASEROW_IMPORT_ROWS_WITH_COPY = import_rows_with_copy
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table, name="Name", order=1)
+    data_fixture.create_number_field(
+        table=table, name="Speed", order=2, number_decimal_places=1
+    )
+    data_fixture.create_boolean_field(table=table, name="Fast", order=3)
+    data_fixture.create_date_field(table=table, name="Built", order=4)
+    select = data_fixture.create_single_select_field(table=table, name="Type", order=5)
+    option = data_fixture.create_select_option(field=select, value="Sport")
+    data_fixture.create_uuid_field(table=table, name="UUID", order=6)
+    data_fixture.create_created_on_field(table=table, name="Created", order=7)
+    handler = RowHandler()
+    assert handler.can_insert_rows_with_copy(table.get_model())
+
+    with patch(
+        "baserow.contrib.database.rows.handler.bulk_create_with_copy",
+        wraps=bulk_create_with_copy,
+    ) as bulk_create_with_copy_mock:
+        created_rows, report = handler.import_rows(
+            user,
+            table,
+            [
+                ["Tab\tand\nnew line \\N", "240.5", True, "2020-01-02", option.id],
+                [None, None, False, None, None],
+                ["Panda", "bad"],
+            ],
+        )
+
+    assert bulk_create_with_copy_mock.called == import_rows_with_copy
+    assert list(report.keys()) == [2]
+    assert [row.id for row in created_rows] == [1, 2]
+
+    model = table.get_model(attribute_names=True)
+    row_1, row_2 = model.objects.order_by("id")
+    assert row_1.name == "Tab\tand\nnew line \\N"
+    assert row_1.speed == Decimal("240.5")
+    assert row_1.fast is True
+    assert str(row_1.built) == "2020-01-02"
+    assert row_1.type_id == option.id
+    assert row_1.uuid is not None
+    assert row_1.created is not None
+    assert row_1.created_by_id == user.id
+    assert row_2.name is None
+    assert row_2.speed is None
+    assert row_2.fast is False
+    assert row_2.uuid != row_1.uuid
+    assert row_2.order > row_1.order
+
+    # New rows still get the next id after the rows inserted with COPY.
+    assert handler.create_row(user, table).id == 3
+
+
+@pytest.mark.django_db
+def test_cant_import_rows_with_copy_in_table_with_formula(data_fixture):
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table, name="Name")
+    data_fixture.create_formula_field(table=table, name="Upper", formula="upper('a')")
+
+    assert not RowHandler().can_insert_rows_with_copy(table.get_model())
+
+
 @pytest.mark.django_db
 @patch("baserow.contrib.database.rows.signals.rows_updated.send")
 @patch("baserow.contrib.database.rows.signals.before_rows_update.send")
@@ -1,12 +1,16 @@
 from unittest.mock import Mock, patch
 
-from django.db import connection
+from django.core.cache import cache
+from django.db import connection, transaction
 from django.test.utils import override_settings
 
 import pytest
 
 from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.search.handler import SearchHandler, SearchModes
+from baserow.contrib.database.search.tasks import flush_debounced_tsvector_update
+from baserow.contrib.database.table.handler import TableHandler
 from baserow.core.trash.handler import TrashHandler
 
 
@@ -402,3 +406,82 @@ def test_split_update_into_chunks_until_all_background_done(data_fixture):
     assert rows[2].needs_background_update is False
     assert getattr(rows[3], field.tsv_db_column) == "'4':2 'test':1"
     assert rows[3].needs_background_update is False
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.search.tasks.flush_debounced_tsvector_update")
+def test_schedule_debounced_tsvector_update_coalesces_changes(
+    mocked_task, data_fixture
+):
+    table = data_fixture.create_database_table()
+
+    with override_settings(TSV_UPDATE_DEBOUNCE_SECONDS=5):
+        for _ in range(3):
+            SearchHandler.schedule_debounced_tsvector_update(table.id)
+
+    mocked_task.apply_async.assert_called_once_with((table.id,), countdown=5)
+    assert cache.get(SearchHandler.get_debounced_update_changes_key(table.id)) == 3
+
+    with patch(
+        "baserow.contrib.database.search.handler.SearchHandler"
+        ".update_tsvector_columns_locked"
+    ) as mocked_update:
+        SearchHandler.flush_debounced_tsvector_update(table)
+    mocked_update.assert_called_once_with(
+        table, update_tsvectors_for_changed_rows_only=True
+    )
+    assert cache.get(SearchHandler.get_debounced_update_scheduled_key(table.id)) is None
+    assert cache.get(SearchHandler.get_debounced_update_changes_key(table.id)) is None
+
+    # A change after the flush must schedule a new update.
+    with override_settings(TSV_UPDATE_DEBOUNCE_SECONDS=5):
+        SearchHandler.schedule_debounced_tsvector_update(table.id)
+    assert mocked_task.apply_async.call_count == 2
+    SearchHandler.flush_debounced_tsvector_update(table)
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.search.handler.tsvector_update_tables_pending")
+@patch(
+    "baserow.contrib.database.search.tasks.flush_debounced_tsvector_update.apply_async"
+)
+def test_debounced_tsvector_update_of_deleted_table_clears_its_keys(
+    mocked_apply_async, mocked_tables_pending, data_fixture
+):
+    table = data_fixture.create_database_table()
+    table_id = table.id
+
+    with override_settings(TSV_UPDATE_DEBOUNCE_SECONDS=5):
+        SearchHandler.schedule_debounced_tsvector_update(table_id)
+    mocked_tables_pending.add.assert_called_once_with(1)
+
+    table.delete()
+    flush_debounced_tsvector_update(table_id)
+    mocked_apply_async.assert_called_once_with((table_id,), countdown=5)
+
+    assert cache.get(SearchHandler.get_debounced_update_scheduled_key(table_id)) is None
+    assert cache.get(SearchHandler.get_debounced_update_changes_key(table_id)) is None
+    mocked_tables_pending.add.assert_called_with(-1)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_debounced_tsvector_update_updates_all_changed_rows(
+    data_fixture, enable_singleton_testing
+):
+    with transaction.atomic():
+        user = data_fixture.create_user()
+        database = data_fixture.create_database_application(user=user)
+        table = TableHandler().create_table_and_fields(
+            user=user,
+            database=database,
+            name=data_fixture.fake.name(),
+            fields=[("Name", "text", {})],
+        )
+        field = table.field_set.get(name="Name")
+        RowHandler().create_rows(
+            user, table, [{field.db_column: "Jeff"}, {field.db_column: "Jeffrey"}]
+        )
+
+    model = table.get_model()
+    assert model.objects.all().pg_search("Jeff").count() == 2
+    assert not model.objects.filter(needs_background_update=True).exists()
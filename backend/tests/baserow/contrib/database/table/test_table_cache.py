@@ -3,7 +3,15 @@ from django.test.utils import override_settings
 import pytest
 
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.table.cache import get_cached_model_field_attrs
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.table.cache import (
+    GeneratedModelLRUCache,
+    generated_model_lru_cache,
+    get_cached_model_field_attrs,
+    get_table_data_version,
+)
+from baserow.contrib.database.table.models import Table
+from baserow.contrib.database.views.handler import ViewHandler
 from baserow.core.trash.handler import TrashHandler
 
 
@@ -204,3 +212,198 @@ def test_deleting_field_invalidates_tables_model_cache(data_fixture):
 
     table.refresh_from_db()
     assert get_cached_model_field_attrs(table) is None
+
+
+@pytest.mark.django_db
+def test_generated_model_is_reused_from_memory_until_table_version_changes(
+    data_fixture, django_assert_num_queries
+):
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table, name="text")
+
+    model = table.get_model()
+    stats = generated_model_lru_cache.stats()
+
+    # Only the version of the table must be checked to reuse the model.
+    with django_assert_num_queries(1):
+        assert table.get_model()._meta.concrete_model is model
+
+    assert generated_model_lru_cache.stats()["hits"] == stats["hits"] + 1
+
+    data_fixture.create_text_field(table=table, name="other")
+    new_model = table.get_model()
+    assert new_model._meta.concrete_model is not model
+    assert len(new_model._field_objects) == 2
+    assert generated_model_lru_cache.stats()["misses"] == stats["misses"] + 1
+
+
+@pytest.mark.django_db
+def test_reused_generated_model_references_the_table_of_the_caller(data_fixture):
+    table = data_fixture.create_database_table()
+    model = table.get_model()
+
+    other_table_instance = Table.objects.get(id=table.id)
+    other_model = other_table_instance.get_model()
+    assert other_model._meta.concrete_model is model
+    assert other_model.baserow_table is other_table_instance
+    assert other_model.objects.model.baserow_table is other_table_instance
+
+    # The models checked out by the other callers aren't affected.
+    assert model.baserow_table is table
+    assert table.get_model().baserow_table is table
+    assert other_model.baserow_table is other_table_instance
+
+
+@pytest.mark.django_db
+def test_reused_generated_model_does_not_share_field_instances(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table, name="text")
+    model = table.get_model()
+
+    field = model._field_objects[text_field.id]["field"]
+    field.cached_by_previous_request = True
+
+    reused_model = Table.objects.get(id=table.id).get_model()
+    assert reused_model._meta.concrete_model is model
+    reused_field = reused_model._field_objects[text_field.id]["field"]
+    assert reused_field is not field
+    assert reused_field.id == text_field.id
+    assert not hasattr(reused_field, "cached_by_previous_request")
+    assert reused_model.get_fields()[0] is reused_field
+    assert model._field_objects[text_field.id]["field"] is field
+
+
+@pytest.mark.django_db
+def test_reused_generated_model_can_query_rows(data_fixture):
+    table_a, table_b, link_field = data_fixture.create_two_linked_tables()
+    row_b = table_b.get_model().objects.create()
+
+    model = table_a.get_model()
+    reused_model = table_a.get_model()
+    assert reused_model._meta.proxy
+    assert reused_model._meta.db_table == model._meta.db_table
+
+    row = reused_model.objects.create()
+    getattr(row, link_field.db_column).set([row_b.id])
+
+    row = reused_model.objects.get(id=row.id)
+    assert isinstance(row, reused_model)
+    assert [r.id for r in getattr(row, link_field.db_column).all()] == [row_b.id]
+    assert model.objects.get(id=row.id).id == row.id
+
+
+@pytest.mark.django_db
+def test_generated_model_is_not_reused_when_related_table_changes(data_fixture):
+    table_a, table_b, link_field = data_fixture.create_two_linked_tables()
+
+    model_a = table_a.get_model()
+    assert table_a.get_model()._meta.concrete_model is model_a
+
+    # Another process changing the related table can't clear the memory of this one,
+    # so the version of the related table must be checked.
+    Table.objects.filter(id=table_b.id).update(version="changed_elsewhere")
+    assert table_a.get_model()._meta.concrete_model is not model_a
+
+
+@pytest.mark.django_db
+def test_generated_model_is_not_reused_for_a_different_variant(data_fixture):
+    table = data_fixture.create_database_table()
+
+    model = table.get_model()
+    assert table.get_model(force_add_tsvectors=True)._meta.concrete_model is not model
+    assert table.get_model(field_ids=[])._meta.concrete_model is not model
+    assert table.get_model(attribute_names=True)._meta.concrete_model is not model
+    assert table.get_model()._meta.concrete_model is model
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_DISABLE_MODEL_CACHE=True)
+def test_generated_model_is_not_reused_when_model_cache_is_disabled(data_fixture):
+    table = data_fixture.create_database_table()
+
+    model = table.get_model()
+    assert table.get_model()._meta.concrete_model is not model
+
+
+@pytest.mark.django_db
+def test_generated_model_lru_cache_evicts_by_count_and_size(data_fixture):
+    table_a = data_fixture.create_database_table()
+    table_b = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table_a)
+
+    model_a = table_a.get_model(use_cache=False)
+    model_b = table_b.get_model(use_cache=False)
+
+    cache = GeneratedModelLRUCache(max_models=1, max_size=1000)
+    cache.set(table_a, None, model_a)
+    cache.set(table_b, None, model_b)
+    assert len(cache) == 1
+    assert cache.get(table_a, None) is None
+    assert cache.get(table_b, None) is model_b
+    assert cache.stats()["evictions"] == 1
+
+    cache = GeneratedModelLRUCache(max_models=10, max_size=1)
+    cache.set(table_b, None, model_b)
+    assert len(cache) == 0
+    assert cache.size == 0
+
+    cache = GeneratedModelLRUCache(max_models=10, max_size=1000)
+    cache.set(table_a, None, model_a)
+    cache.set(table_b, None, model_b)
+    cache.invalidate(table_a.id)
+    assert len(cache) == 1
+    assert cache.get(table_a, None) is None
+
+
+@pytest.mark.django_db
+def test_table_data_version_changes_when_the_table_changes(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    other_table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    view = data_fixture.create_grid_view(table=table)
+
+    other_table_version = get_table_data_version(other_table.id)
+
+    version = get_table_data_version(table.id)
+    row = RowHandler().create_row(user, table, {})
+    assert get_table_data_version(table.id) != version
+
+    version = get_table_data_version(table.id)
+    RowHandler().update_row_by_id(user, table, row.id, {field.db_column: "a"})
+    assert get_table_data_version(table.id) != version
+
+    version = get_table_data_version(table.id)
+    FieldHandler().update_field(user, field, name="Renamed")
+    assert get_table_data_version(table.id) != version
+
+    version = get_table_data_version(table.id)
+    ViewHandler().create_filter(user, view, field, "equal", "a")
+    assert get_table_data_version(table.id) != version
+
+    version = get_table_data_version(table.id)
+    ViewHandler().create_sort(user, view, field, "ASC")
+    assert get_table_data_version(table.id) != version
+
+    assert get_table_data_version(other_table.id) == other_table_version
+
+
+@pytest.mark.django_db
+def test_table_data_version_changes_when_a_dependant_table_changes(data_fixture):
+    user = data_fixture.create_user()
+    table_a, table_b, link_field = data_fixture.create_two_linked_tables(user=user)
+    primary_b = table_b.field_set.get(primary=True)
+    FieldHandler().create_field(
+        user,
+        table_a,
+        "lookup",
+        name="lookup",
+        through_field_id=link_field.id,
+        target_field_id=primary_b.id,
+    )
+    row_b = RowHandler().create_row(user, table_b, {primary_b.db_column: "a"})
+    RowHandler().create_row(user, table_a, {link_field.db_column: [row_b.id]})
+
+    version = get_table_data_version(table_a.id)
+    RowHandler().update_row_by_id(user, table_b, row_b.id, {primary_b.db_column: "b"})
+    assert get_table_data_version(table_a.id) != version
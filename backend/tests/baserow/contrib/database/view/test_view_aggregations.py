@@ -1,13 +1,21 @@
 import random
 from decimal import Decimal
 
+from django.core.cache import cache
+from django.db import connection
+
 import pytest
 
 from baserow.contrib.database.fields.exceptions import FieldNotInTable
 from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.views.exceptions import FieldAggregationNotSupported
 from baserow.contrib.database.views.handler import ViewHandler
-from baserow.contrib.database.views.registries import view_aggregation_type_registry
+from baserow.contrib.database.views.registries import (
+    view_aggregation_type_registry,
+    view_type_registry,
+)
+from baserow.contrib.database.views.view_aggregations import _divide_numeric
 from baserow.core.trash.handler import TrashHandler
 from baserow.test_utils.helpers import setup_interesting_test_table
 
@@ -467,3 +475,220 @@ def test_aggregation_is_updated_when_view_is_trashed(data_fixture):
         user, grid_view_one
     )
     assert field.db_column not in aggregations_restored_view
+
+
+@pytest.mark.django_db
+def test_view_aggregations_are_maintained_incrementally(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    number_field = data_fixture.create_number_field(
+        table=table, number_decimal_places=2
+    )
+    rating_field = data_fixture.create_rating_field(table=table)
+    filtered_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=filtered_view, field=text_field, type="contains", value="a"
+    )
+    view = data_fixture.create_grid_view(table=table)
+
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=filtered_view,
+        field_options={
+            text_field.id: {"aggregation_raw_type": "empty_count"},
+            number_field.id: {"aggregation_raw_type": "sum"},
+            rating_field.id: {"aggregation_raw_type": "average"},
+        },
+    )
+    view_handler.update_field_options(
+        view=view,
+        field_options={
+            text_field.id: {"aggregation_raw_type": "not_empty_count"},
+            number_field.id: {"aggregation_raw_type": "average"},
+            rating_field.id: {"aggregation_raw_type": "max"},
+        },
+    )
+
+    grid_view_type = view_type_registry.get("grid")
+    row_handler = RowHandler()
+    model = table.get_model()
+    rows = row_handler.create_rows(
+        user,
+        table,
+        [
+            {text_field.db_column: "a", number_field.db_column: "1.50"},
+            {text_field.db_column: "ab", rating_field.db_column: 3},
+            {text_field.db_column: "b", number_field.db_column: "2.25"},
+            {rating_field.db_column: 5},
+        ],
+        model=model,
+    )
+
+    def assert_aggregations(view, expected_to_compute):
+        aggregations = grid_view_type.get_aggregations(view)
+        _, need_computation = view_handler._get_aggregations_to_compute(
+            view, aggregations
+        )
+        assert set(need_computation.keys()) == expected_to_compute
+        cached_values = view_handler.get_view_field_aggregations(user, view)
+        assert cached_values == view_handler.get_field_aggregations(
+            user, view, aggregations
+        )
+        return cached_values
+
+    all_columns = {text_field.db_column, number_field.db_column, rating_field.db_column}
+    assert_aggregations(filtered_view, all_columns)
+    assert_aggregations(view, all_columns)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.create_rows(
+            user,
+            table,
+            [{text_field.db_column: "abc", number_field.db_column: "0.25"}],
+            model=model,
+        )
+    assert assert_aggregations(filtered_view, set()) == {
+        text_field.db_column: 0,
+        number_field.db_column: Decimal("1.75"),
+        rating_field.db_column: 1.0,
+    }
+    assert assert_aggregations(view, set()) == {
+        text_field.db_column: 4,
+        number_field.db_column: Decimal("1.3333333333333333"),
+        rating_field.db_column: 5,
+    }
+
+    # The row leaves the filtered view and the maximum rating doesn't change. Only
+    # the aggregations of the updated fields are maintained incrementally.
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.update_rows(
+            user,
+            table,
+            [
+                {
+                    "id": rows[1].id,
+                    text_field.db_column: "b",
+                    rating_field.db_column: 4,
+                }
+            ],
+            model=model,
+        )
+    assert_aggregations(filtered_view, {number_field.db_column})
+    assert (
+        assert_aggregations(view, {number_field.db_column})[rating_field.db_column] == 5
+    )
+
+    # The row holding the maximum rating is deleted, so the maximum is unknown and
+    # must be recomputed.
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.delete_rows(user, table, [rows[3].id], model=model)
+    assert_aggregations(filtered_view, set())
+    assert (
+        assert_aggregations(view, {rating_field.db_column})[rating_field.db_column] == 4
+    )
+
+
+@pytest.mark.django_db
+def test_view_aggregations_depending_on_other_rows_are_not_incremental(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table, primary=True)
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="link", link_row_table=table
+    )
+    lookup_field = FieldHandler().create_field(
+        user,
+        table,
+        "formula",
+        name="lookup",
+        formula=f"sum(lookup('{link_field.name}', '{number_field.name}'))",
+    )
+    view = data_fixture.create_grid_view(table=table)
+
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=view,
+        field_options={
+            number_field.id: {"aggregation_raw_type": "sum"},
+            link_field.id: {"aggregation_raw_type": "empty_count"},
+            lookup_field.id: {"aggregation_raw_type": "sum"},
+        },
+    )
+
+    row_handler = RowHandler()
+    model = table.get_model()
+    row = row_handler.create_row(user, table, {number_field.db_column: 1}, model)
+    view_handler.get_view_field_aggregations(user, view)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.create_row(
+            user,
+            table,
+            {number_field.db_column: 2, link_field.db_column: [row.id]},
+            model,
+        )
+
+    aggregations = view_type_registry.get("grid").get_aggregations(view)
+    _, need_computation = view_handler._get_aggregations_to_compute(view, aggregations)
+    assert set(need_computation.keys()) == {
+        link_field.db_column,
+        lookup_field.db_column,
+    }
+    assert view_handler.get_view_field_aggregations(
+        user, view
+    ) == view_handler.get_field_aggregations(user, view, aggregations)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "dividend,divisor",
+    [
+        (1, 3),
+        (2, 3),
+        (5, 2),
+        (-5, 2),
+        (0, 7),
+        (99999, 7),
+        (Decimal("0.00"), 3),
+        (Decimal("1.5"), 2),
+        (Decimal("-7.25"), 3),
+        (Decimal("0.0001"), 3),
+        (Decimal("123456789.123"), 9),
+        (10**20, 3),
+    ],
+)
+def test_divide_numeric_is_the_same_as_postgresql(dividend, divisor):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT %s::numeric / %s::numeric", [dividend, divisor])
+        expected = cursor.fetchone()[0]
+
+    result = _divide_numeric(dividend, divisor)
+    assert result == expected
+    assert str(result) == str(expected)
+
+
+@pytest.mark.django_db
+def test_register_incremental_aggregations_views_doesnt_overwrite_other_views(
+    data_fixture,
+):
+    table = data_fixture.create_database_table()
+    view_1 = data_fixture.create_grid_view(table=table)
+    view_2 = data_fixture.create_grid_view(table=table)
+    view_handler = ViewHandler()
+
+    view_handler._register_incremental_aggregations_view(view_1)
+    view_handler._register_incremental_aggregations_view(view_2)
+    view_handler._register_incremental_aggregations_view(view_1)
+
+    assert cache.get(
+        view_handler._get_incremental_aggregations_table_cache_key(table.id)
+    )
+    for view in [view_1, view_2]:
+        assert cache.get(
+            view_handler._get_incremental_aggregations_view_cache_key(view.id)
+        )
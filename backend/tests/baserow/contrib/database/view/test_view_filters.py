@@ -348,6 +348,23 @@ def test_not_equal_filter_type(data_fixture):
     assert handler.apply_filters(grid_view, model.objects.all()).count() == 3
 
 
+@pytest.mark.django_db
+def test_contains_filter_type_uses_a_trigram_indexable_predicate(data_fixture):
+    table = data_fixture.create_database_table()
+    grid_view = data_fixture.create_grid_view(table=table)
+    text_field = data_fixture.create_text_field(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=text_field, type="contains", value="50%_\\"
+    )
+    model = table.get_model()
+    model.objects.create(**{text_field.db_column: "Not 50%_\\ sure"})
+    model.objects.create(**{text_field.db_column: "Not 50 sure"})
+
+    queryset = ViewHandler().apply_filters(grid_view, model.objects.all())
+    assert f'"{text_field.db_column}"::text ILIKE' in str(queryset.query)
+    assert queryset.count() == 1
+
+
 @pytest.mark.django_db
 def test_contains_filter_type(data_fixture):
     user = data_fixture.create_user()
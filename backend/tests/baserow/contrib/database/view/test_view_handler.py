@@ -45,6 +45,7 @@ from baserow.contrib.database.views.exceptions import (
 from baserow.contrib.database.views.filters import AdHocFilters
 from baserow.contrib.database.views.handler import (
     PublicViewRows,
+    TrigramIndexingHandler,
     ViewHandler,
     ViewIndexingHandler,
 )
@@ -4294,3 +4295,94 @@ def test_get_queryset_apply_sorts(data_fixture):
 
     row_ids = [row.id for row in rows]
     assert row_ids == [row_3.id, row_2.id, row_1.id]
+
+
+@pytest.mark.django_db
+def test_field_needs_trigram_index(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+
+    assert not TrigramIndexingHandler.field_needs_index(text_field)
+
+    data_fixture.create_view_filter(
+        view=grid_view, field=text_field, type="equal", value="a"
+    )
+    assert not TrigramIndexingHandler.field_needs_index(text_field)
+
+    data_fixture.create_view_filter(
+        view=grid_view, field=text_field, type="contains_not", value="a"
+    )
+    data_fixture.create_view_filter(
+        view=grid_view, field=number_field, type="contains", value="1"
+    )
+    assert TrigramIndexingHandler.field_needs_index(text_field)
+    # The contains filter of a number field doesn't filter the column as text.
+    assert not TrigramIndexingHandler.field_needs_index(number_field)
+
+
+@override_settings(TRIGRAM_INDEX_ENABLED=True)
+@pytest.mark.django_db
+@patch("baserow.contrib.database.views.tasks.update_field_trigram_index.delay")
+def test_changing_contains_filters_schedules_trigram_index_updates(
+    mock_update, data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    other_text_field = data_fixture.create_text_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    handler = ViewHandler()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        view_filter = handler.create_filter(
+            user, grid_view, text_field, "contains", "a"
+        )
+    mock_update.assert_called_once_with(text_field.id)
+
+    mock_update.reset_mock()
+    with django_capture_on_commit_callbacks(execute=True):
+        handler.update_filter(user, view_filter, field=other_text_field)
+    assert sorted(call.args[0] for call in mock_update.call_args_list) == sorted(
+        [text_field.id, other_text_field.id]
+    )
+
+    mock_update.reset_mock()
+    with django_capture_on_commit_callbacks(execute=True):
+        handler.delete_filter(user, view_filter)
+    mock_update.assert_called_once_with(other_text_field.id)
+
+
+@pytest.mark.django_db
+def test_trigram_index_is_created_and_removed(data_fixture):
+    if not TrigramIndexingHandler.pg_trgm_extension_available():
+        pytest.skip("The pg_trgm extension is not available.")
+
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    index_name = TrigramIndexingHandler.get_index_name(text_field)
+
+    data_fixture.create_view_filter(
+        view=grid_view, field=text_field, type="contains", value="abc"
+    )
+    TrigramIndexingHandler.update_index(text_field)
+    assert ViewIndexingHandler.does_index_exist(index_name)
+
+    # The index must be removed before the type of the column is changed.
+    FieldHandler().update_field(user, text_field, new_type_name="number")
+    assert not ViewIndexingHandler.does_index_exist(index_name)
+
+    FieldHandler().update_field(user, text_field, new_type_name="text")
+    view_filter = data_fixture.create_view_filter(
+        view=grid_view, field=text_field, type="contains", value="abc"
+    )
+    TrigramIndexingHandler.update_index(text_field)
+    assert ViewIndexingHandler.does_index_exist(index_name)
+
+    view_filter.delete()
+    TrigramIndexingHandler.update_index(text_field)
+    assert not ViewIndexingHandler.does_index_exist(index_name)
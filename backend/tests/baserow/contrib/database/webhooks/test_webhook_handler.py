@@ -83,6 +83,37 @@ def test_find_webhooks_to_call(data_fixture):
     assert webhook_5.id in webhook_ids
 
 
+@pytest.mark.django_db
+def test_table_has_webhooks_to_call(data_fixture, django_assert_num_queries):
+    table = data_fixture.create_database_table()
+    handler = WebhookHandler()
+
+    assert not handler.table_has_webhooks_to_call(table.id, "rows.created")
+    with django_assert_num_queries(0):
+        assert not handler.table_has_webhooks_to_call(table.id, "rows.updated")
+
+    webhook = data_fixture.create_table_webhook(
+        table=table, include_all_events=False, events=["rows.created"]
+    )
+    assert handler.table_has_webhooks_to_call(table.id, "rows.created")
+    assert not handler.table_has_webhooks_to_call(table.id, "rows.updated")
+
+    webhook.include_all_events = True
+    webhook.save()
+    assert handler.table_has_webhooks_to_call(table.id, "rows.updated")
+    assert not handler.table_has_webhooks_to_call(table.id, "row.updated")
+
+    webhook.active = False
+    webhook.save()
+    assert not handler.table_has_webhooks_to_call(table.id, "rows.created")
+
+    webhook.active = True
+    webhook.save()
+    assert handler.table_has_webhooks_to_call(table.id, "rows.created")
+    webhook.delete()
+    assert not handler.table_has_webhooks_to_call(table.id, "rows.created")
+
+
 @pytest.mark.django_db
 def test_find_webhooks_to_call_deprecated_event_types(data_fixture):
     table_1 = data_fixture.create_database_table()
@@ -71,6 +71,41 @@ def test_table_page_broadcast(mock_broadcast_to_channel_group):
     assert args[0][2] == ignore_web_socket_id
 
 
+@pytest.mark.websockets
+def test_table_page_get_payload_for_subscriber():
+    table_page = page_registry.get("table")
+    payload = {
+        "type": "rows_updated",
+        "table_id": 22,
+        "rows_before_update": [{"id": 1, "order": "1", "field_1": "a", "field_2": 1}],
+        "rows": [{"id": 1, "order": "1", "field_1": "b", "field_2": 1}],
+        "metadata": {1: {"row_id": 1}},
+    }
+
+    assert table_page.get_payload_for_subscriber(payload, table_id=22) == payload
+    assert (
+        table_page.get_payload_for_subscriber(payload, table_id=23, row_deltas=True)
+        == payload
+    )
+    assert table_page.get_payload_for_subscriber(
+        payload, table_id=22, row_deltas=True
+    ) == {
+        "type": "rows_fields_updated",
+        "table_id": 22,
+        "rows_before_update": [{"id": 1, "order": "1", "field_1": "a"}],
+        "rows": [{"id": 1, "order": "1", "field_1": "b"}],
+        "metadata": {1: {"row_id": 1}},
+    }
+
+    other_payload = {"type": "rows_deleted", "table_id": 22, "row_ids": [1]}
+    assert (
+        table_page.get_payload_for_subscriber(
+            other_payload, table_id=22, row_deltas=True
+        )
+        == other_payload
+    )
+
+
 # PublicViewPageType
 
 
@@ -0,0 +1,198 @@
+from unittest.mock import patch
+
+import pytest
+from fakeredis import FakeRedis, FakeServer
+
+from baserow.contrib.database.ws.rows.coalescing import (
+    CoalescingRowMessagesBroadcaster,
+    coalesce_row_messages,
+)
+
+
+def updated_message(row_id, before, after, ignore_web_socket_id=None):
+    return {
+        "payload": {
+            "type": "rows_updated",
+            "table_id": 1,
+            "rows_before_update": [{"id": row_id, **before}],
+            "rows": [{"id": row_id, **after}],
+            "metadata": {},
+        },
+        "ignore_web_socket_id": ignore_web_socket_id,
+    }
+
+
+@pytest.fixture
+def fake_redis():
+    server = FakeServer()
+    with patch(
+        "baserow.contrib.database.ws.rows.coalescing.get_redis_connection",
+        lambda *args, **kwargs: FakeRedis(server=server),
+    ):
+        yield
+
+
+def test_coalesce_row_messages_collapses_updates_of_the_same_row():
+    messages = coalesce_row_messages(
+        [
+            updated_message(1, {"field_1": "a"}, {"field_1": "b"}),
+            updated_message(2, {"field_1": "x"}, {"field_1": "y"}),
+            updated_message(1, {"field_1": "b", "field_2": 1}, {"field_1": "c"}),
+            updated_message(1, {"field_1": "c"}, {"field_1": "d"}, "web_socket"),
+        ]
+    )
+
+    assert len(messages) == 2
+    assert messages[0]["payload"]["rows_before_update"] == [
+        {"id": 1, "field_1": "a", "field_2": 1},
+        {"id": 2, "field_1": "x"},
+    ]
+    assert messages[0]["payload"]["rows"] == [
+        {"id": 1, "field_1": "c"},
+        {"id": 2, "field_1": "y"},
+    ]
+    # The update of another web socket can't be merged because it must not be sent
+    # to that web socket.
+    assert messages[1]["ignore_web_socket_id"] == "web_socket"
+
+
+def test_coalesce_row_messages_keeps_the_order_of_different_types():
+    created = {
+        "payload": {
+            "type": "rows_created",
+            "table_id": 1,
+            "rows": [{"id": 1}],
+            "metadata": {},
+            "before_row_id": None,
+        },
+        "ignore_web_socket_id": None,
+    }
+    deleted = {
+        "payload": {
+            "type": "rows_deleted",
+            "table_id": 1,
+            "row_ids": [1],
+            "rows": [{"id": 1}],
+        },
+        "ignore_web_socket_id": None,
+    }
+
+    messages = coalesce_row_messages(
+        [created, updated_message(1, {}, {"field_1": "a"}), deleted]
+    )
+
+    assert [message["payload"]["type"] for message in messages] == [
+        "rows_created",
+        "rows_updated",
+        "rows_deleted",
+    ]
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.ws.rows.coalescing.broadcast_batch_to_channel_group")
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.contrib.database.ws.rows.tasks.flush_coalesced_row_messages")
+def test_row_messages_are_coalesced_within_the_window(
+    mock_flush_task,
+    mock_broadcast_to_channel_group,
+    mock_broadcast_batch,
+    settings,
+    fake_redis,
+):
+    settings.REALTIME_ROW_MESSAGES_COALESCE_SECONDS = 10
+    broadcaster = CoalescingRowMessagesBroadcaster
+
+    for message in [
+        updated_message(1, {"field_1": "a"}, {"field_1": "b"}),
+        updated_message(1, {"field_1": "b"}, {"field_1": "c"}),
+        updated_message(1, {"field_1": "c"}, {"field_1": "d"}, "web_socket"),
+    ]:
+        broadcaster.broadcast(1, message["payload"], message["ignore_web_socket_id"])
+
+    # The first message is sent right away, the others wait for the flush.
+    mock_broadcast_to_channel_group.delay.assert_called_once()
+    mock_flush_task.apply_async.assert_called_once_with((1,), countdown=10)
+
+    broadcaster.flush(1)
+
+    # The buffered messages are sent by the flush task itself, not by another task
+    # which could run after a message sent once the window is closed.
+    mock_broadcast_batch.delay.assert_not_called()
+    mock_broadcast_batch.assert_called_once()
+    group_name, messages = mock_broadcast_batch.call_args[0]
+    assert group_name == "table-1"
+    assert [message["ignore_web_socket_id"] for message in messages] == [
+        None,
+        "web_socket",
+    ]
+    assert messages[0]["payload"]["rows"] == [{"id": 1, "field_1": "c"}]
+
+    # The window is closed by the flush, so the next message is sent right away.
+    broadcaster.broadcast(1, updated_message(1, {}, {})["payload"])
+    assert mock_broadcast_to_channel_group.delay.call_count == 2
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.ws.rows.coalescing.broadcast_to_channel_group")
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.contrib.database.ws.rows.tasks.flush_coalesced_row_messages")
+def test_messages_buffered_during_a_flush_keep_the_window_open(
+    mock_flush_task,
+    mock_broadcast_to_channel_group,
+    mock_send,
+    settings,
+    fake_redis,
+):
+    settings.REALTIME_ROW_MESSAGES_COALESCE_SECONDS = 10
+    broadcaster = CoalescingRowMessagesBroadcaster
+
+    for row_id in [1, 2, 3]:
+        broadcaster.broadcast(1, updated_message(row_id, {}, {})["payload"])
+
+    def broadcast_while_sending(*args):
+        broadcaster.broadcast(1, updated_message(4, {}, {})["payload"])
+
+    mock_send.side_effect = broadcast_while_sending
+    broadcaster.flush(1)
+
+    # The message broadcast while sending is buffered for the next flush instead of
+    # being sent right away, because the window stays open.
+    mock_broadcast_to_channel_group.delay.assert_called_once()
+    assert mock_flush_task.apply_async.call_count == 2
+
+    mock_send.side_effect = None
+    broadcaster.flush(1)
+    group_name, payload, _ = mock_send.call_args[0]
+    assert payload["rows"] == [{"id": 4}]
+
+    broadcaster.broadcast(1, updated_message(5, {}, {})["payload"])
+    assert mock_broadcast_to_channel_group.delay.call_count == 2
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.ws.rows.coalescing.broadcast_to_channel_group")
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.contrib.database.ws.rows.tasks.flush_coalesced_row_messages")
+def test_too_many_coalesced_rows_force_a_table_refresh(
+    mock_flush_task,
+    mock_broadcast_to_channel_group,
+    mock_send,
+    data_fixture,
+    settings,
+    fake_redis,
+):
+    settings.REALTIME_ROW_MESSAGES_COALESCE_SECONDS = 10
+    settings.REALTIME_ROW_MESSAGES_COALESCE_MAX_ROWS = 1
+    table = data_fixture.create_database_table()
+    broadcaster = CoalescingRowMessagesBroadcaster
+
+    for row_id in [1, 2, 3]:
+        broadcaster.broadcast(table.id, updated_message(row_id, {}, {})["payload"])
+    broadcaster.flush(table.id)
+
+    assert mock_broadcast_to_channel_group.delay.call_count == 1
+    mock_send.assert_called_once()
+    group_name, payload, *_ = mock_send.call_args[0]
+    assert group_name == f"table-{table.id}"
+    assert payload["type"] == "table_updated"
+    assert payload["force_table_refresh"] is True
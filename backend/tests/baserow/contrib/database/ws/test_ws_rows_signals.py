@@ -15,6 +15,7 @@ from baserow.contrib.database.rows.registries import (
     RowMetadataType,
     row_metadata_registry,
 )
+from baserow.contrib.database.ws.rows.signals import RealtimeRowMessages
 from baserow.test_utils.helpers import AnyInt, register_instance_temporarily
 
 
@@ -132,6 +133,56 @@ def test_row_updated(mock_broadcast_to_channel_group, data_fixture):
     assert args[0][1]["metadata"] == {}
 
 
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+def test_rows_fields_updated_only_contains_the_changed_values(
+    mock_broadcast_to_channel_group, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table, name="Text")
+    field_2 = data_fixture.create_text_field(table=table, name="Other")
+    formula = data_fixture.create_formula_field(
+        table=table, name="Upper", formula="upper(field('Text'))"
+    )
+    other_formula = data_fixture.create_formula_field(
+        table=table, name="Other upper", formula="upper(field('Other'))"
+    )
+    row = RowHandler().create_row(
+        user=user, table=table, values={f"field_{field_2.id}": "b"}
+    )
+
+    RowHandler().update_row_by_id(
+        user=user, table=table, row_id=row.id, values={f"field_{field.id}": "a"}
+    )
+
+    payload = mock_broadcast_to_channel_group.delay.call_args[0][1]
+    assert payload["type"] == "rows_updated"
+    assert payload["rows"][0][f"field_{field_2.id}"] == "b"
+    assert payload["rows"][0][f"field_{other_formula.id}"] == "B"
+
+    rows_fields_updated = RealtimeRowMessages.rows_fields_updated(payload)
+    assert rows_fields_updated["type"] == "rows_fields_updated"
+    assert rows_fields_updated["table_id"] == table.id
+    assert rows_fields_updated["metadata"] == payload["metadata"]
+    assert rows_fields_updated["rows_before_update"] == [
+        {
+            "id": row.id,
+            "order": "1.00000000000000000000",
+            f"field_{field.id}": None,
+            f"field_{formula.id}": "",
+        }
+    ]
+    assert rows_fields_updated["rows"] == [
+        {
+            "id": row.id,
+            "order": "1.00000000000000000000",
+            f"field_{field.id}": "a",
+            f"field_{formula.id}": "A",
+        }
+    ]
+
+
 @pytest.mark.django_db(transaction=True)
 @patch("baserow.ws.registries.broadcast_to_channel_group")
 def test_row_updated_with_metadata(mock_broadcast_to_channel_group, data_fixture):
@@ -1,5 +1,7 @@
 from unittest.mock import patch
 
+from django.db import transaction
+
 import pytest
 
 from baserow.contrib.database.table.handler import TableHandler
@@ -7,7 +9,7 @@ from baserow.core.utils import generate_hash
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.contrib.database.ws.table.signals.broadcast_to_permitted_users")
+@patch("baserow.ws.utils.broadcast_to_permitted_users")
 def test_table_created(mock_broadcast_to_permitted_users, data_fixture):
     user = data_fixture.create_user()
     database = data_fixture.create_database_application(user=user)
@@ -20,7 +22,7 @@ def test_table_created(mock_broadcast_to_permitted_users, data_fixture):
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.contrib.database.ws.table.signals.broadcast_to_permitted_users")
+@patch("baserow.ws.utils.broadcast_to_permitted_users")
 def test_table_updated(mock_broadcast_to_permitted_users, data_fixture):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -33,6 +35,72 @@ def test_table_updated(mock_broadcast_to_permitted_users, data_fixture):
     assert args[0][4]["table"]["id"] == table.id
 
 
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.ws.utils.broadcast_multiple_to_permitted_users")
+@patch("baserow.ws.utils.broadcast_to_permitted_users")
+def test_table_updated_burst_is_sent_by_one_task(
+    mock_broadcast_to_permitted_users,
+    mock_broadcast_multiple_to_permitted_users,
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    other_table = data_fixture.create_database_table(
+        user=user, database=table.database
+    )
+
+    with transaction.atomic():
+        table = TableHandler().update_table(user=user, table=table, name="First")
+        try:
+            with transaction.atomic():
+                TableHandler().update_table(user=user, table=other_table, name="X")
+                raise ValueError("Rolled back")
+        except ValueError:
+            pass
+        table = TableHandler().update_table(user=user, table=table, name="Second")
+
+    mock_broadcast_to_permitted_users.delay.assert_not_called()
+    mock_broadcast_multiple_to_permitted_users.delay.assert_called_once()
+    args = mock_broadcast_multiple_to_permitted_users.delay.call_args
+    assert args[0][3] == table.id
+    assert [payload["type"] for payload in args[0][4]] == [
+        "table_updated",
+        "table_updated",
+    ]
+    assert [payload["table_id"] for payload in args[0][4]] == [table.id, table.id]
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.ws.utils.broadcast_multiple_to_permitted_users")
+@patch("baserow.ws.utils.broadcast_to_permitted_users")
+def test_table_updated_in_a_rolled_back_transaction_is_not_sent(
+    mock_broadcast_to_permitted_users,
+    mock_broadcast_multiple_to_permitted_users,
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+
+    try:
+        with transaction.atomic():
+            TableHandler().update_table(user=user, table=table, name="First")
+            raise ValueError("Rolled back")
+    except ValueError:
+        pass
+
+    mock_broadcast_to_permitted_users.delay.assert_not_called()
+
+    # The broadcasts of the next transaction are still sent when it commits.
+    with transaction.atomic():
+        table = TableHandler().update_table(user=user, table=table, name="Second")
+
+    mock_broadcast_multiple_to_permitted_users.delay.assert_not_called()
+    mock_broadcast_to_permitted_users.delay.assert_called_once()
+    args = mock_broadcast_to_permitted_users.delay.call_args
+    assert args[0][4]["type"] == "table_updated"
+    assert args[0][4]["table"]["name"] == "Second"
+
+
 @pytest.mark.django_db(transaction=True)
 @patch("baserow.contrib.database.ws.table.signals.broadcast_to_group")
 def test_tables_reordered(mock_broadcast_to_channel_group, data_fixture):
@@ -50,7 +118,7 @@ def test_tables_reordered(mock_broadcast_to_channel_group, data_fixture):
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.contrib.database.ws.table.signals.broadcast_to_permitted_users")
+@patch("baserow.ws.utils.broadcast_to_permitted_users")
 def test_table_deleted(mock_broadcast_to_permitted_users, data_fixture):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
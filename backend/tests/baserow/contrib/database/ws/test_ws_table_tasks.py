@@ -63,6 +63,7 @@ async def test_unsubscribe_user_from_tables_and_rows_when_removed_from_workspace
         "page": "table",
         "parameters": {
             "table_id": table_1.id,
+            "row_deltas": None,
         },
         "type": "page_discard",
     }
@@ -0,0 +1,18 @@
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+import pytest
+
+
+def test_benchmark_runtime_formulas_reports_the_speedup(capsys):
+    call_command("benchmark_runtime_formulas", "--repeat", "2")
+
+    captured = capsys.readouterr()
+    assert "get('a') + get('b'): " in captured.out
+    assert "formulas resolved 2 times" in captured.out
+    assert "x faster" in captured.out
+
+
+def test_benchmark_runtime_formulas_fails_if_the_cases_cant_be_loaded(tmp_path):
+    with pytest.raises(CommandError):
+        call_command("benchmark_runtime_formulas", "--cases", str(tmp_path / "none"))
@@ -9,6 +9,11 @@ import pytest
 
 from baserow.contrib.database.models import Database
 from baserow.contrib.database.operations import ListTablesDatabaseTableOperationType
+from baserow.core.context import (
+    get_permission_checks_cache,
+    start_permission_checks_cache,
+    stop_permission_checks_cache,
+)
 from baserow.core.exceptions import (
     PermissionDenied,
     UserInvalidWorkspacePermissionsError,
@@ -1234,3 +1239,111 @@ def test_all_scope_types_query_methods():
 
         for parent in scope_type.get_parent_scopes():
             assert isinstance(scope_type.get_filter_for_scope_type(parent, []), Q)
+
+
+@pytest.fixture
+def permission_checks_cache():
+    start_permission_checks_cache()
+    try:
+        yield get_permission_checks_cache()
+    finally:
+        stop_permission_checks_cache()
+
+
+@pytest.mark.django_db
+def test_check_permissions_are_cached_in_the_scope(
+    data_fixture, permission_checks_cache, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    check = PermissionCheck(user, UpdateWorkspaceOperationType.type, workspace)
+
+    assert CoreHandler().check_permissions(
+        user, UpdateWorkspaceOperationType.type, workspace=workspace, context=workspace
+    )
+    assert permission_checks_cache.hits == 0
+
+    with django_assert_num_queries(0):
+        assert CoreHandler().check_permissions(
+            user,
+            UpdateWorkspaceOperationType.type,
+            workspace=workspace,
+            context=workspace,
+        )
+        assert CoreHandler().check_multiple_permissions(
+            [check], workspace=workspace
+        ) == {check: True}
+    assert permission_checks_cache.hits == 2
+
+    # The result also depends on the include_trash argument.
+    CoreHandler().check_multiple_permissions(
+        [check], workspace=workspace, include_trash=True
+    )
+    assert permission_checks_cache.hits == 2
+
+
+@pytest.mark.django_db
+def test_cached_permission_checks_are_invalidated_when_membership_changes(
+    data_fixture, permission_checks_cache
+):
+    admin = data_fixture.create_user()
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=admin, members=[user])
+    check = PermissionCheck(user, UpdateWorkspaceOperationType.type, workspace)
+
+    assert CoreHandler().check_multiple_permissions([check], workspace=workspace) == {
+        check: False
+    }
+
+    workspace_user = workspace.workspaceuser_set.get(user=user)
+    CoreHandler().force_update_workspace_user(None, workspace_user, permissions="ADMIN")
+
+    assert CoreHandler().check_multiple_permissions([check], workspace=workspace) == {
+        check: True
+    }
+
+    CoreHandler().delete_workspace_user(admin, workspace_user)
+
+    assert CoreHandler().check_multiple_permissions([check], workspace=workspace) == {
+        check: False
+    }
+    assert permission_checks_cache.hits == 0
+
+
+@pytest.mark.django_db
+def test_check_permissions_are_not_cached_outside_a_scope(data_fixture):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+
+    assert get_permission_checks_cache() is None
+
+    start_permission_checks_cache()
+    start_permission_checks_cache()
+    cache = get_permission_checks_cache()
+    CoreHandler().check_permissions(
+        user, UpdateWorkspaceOperationType.type, workspace=workspace, context=workspace
+    )
+    # Ending a nested scope keeps the cache of the outer scope.
+    assert stop_permission_checks_cache() is None
+    assert get_permission_checks_cache() is cache
+    assert len(cache.results) == 1
+    assert stop_permission_checks_cache() is cache
+    assert get_permission_checks_cache() is None
+
+
+@pytest.mark.django_db
+def test_permission_checks_of_anonymous_users_are_cached(data_fixture):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    handler = CoreHandler()
+
+    for actor in [None, AnonymousUser(), user]:
+        check = PermissionCheck(actor, UpdateWorkspaceOperationType.type, workspace)
+        assert handler._get_permission_check_cache_key(check, workspace, False) == (
+            check,
+            workspace,
+            False,
+        )
+
+    check = PermissionCheck(object(), UpdateWorkspaceOperationType.type, workspace)
+    assert handler._get_permission_check_cache_key(check, workspace, False) is None
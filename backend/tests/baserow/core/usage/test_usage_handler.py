@@ -0,0 +1,121 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+import pytest
+
+from baserow.core.models import WorkspaceStorageUsageUpdate
+from baserow.core.trash.handler import TrashHandler
+from baserow.core.usage.handler import UsageHandler
+from baserow.core.usage.registries import USAGE_UNIT_MB
+
+
+@pytest.mark.django_db
+def test_get_workspace_ids_needing_storage_usage_update(data_fixture):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    data_fixture.create_database_table(user=user, database=database)
+    unchanged_workspace = data_fixture.create_workspace(user=user)
+
+    # Workspaces that have never been calculated are always included.
+    assert UsageHandler.get_workspace_ids_needing_storage_usage_update() == [
+        workspace.id,
+        unchanged_workspace.id,
+    ]
+
+    UsageHandler.calculate_storage_usage()
+    assert UsageHandler.get_workspace_ids_needing_storage_usage_update() == []
+
+    # A new table doesn't have any usage yet.
+    data_fixture.create_database_table(user=user, database=database)
+    assert UsageHandler.get_workspace_ids_needing_storage_usage_update() == [
+        workspace.id
+    ]
+
+    UsageHandler.calculate_storage_usage(workspace_ids=[workspace.id])
+    assert UsageHandler.get_workspace_ids_needing_storage_usage_update() == []
+
+    WorkspaceStorageUsageUpdate.objects.create(workspace=unchanged_workspace)
+    assert UsageHandler.get_workspace_ids_needing_storage_usage_update() == [
+        unchanged_workspace.id
+    ]
+
+    UsageHandler.calculate_storage_usage(workspace_ids=[unchanged_workspace.id])
+    assert not WorkspaceStorageUsageUpdate.objects.exists()
+
+    # Workspaces which haven't been calculated for a while are included in case a
+    # change wasn't tracked.
+    unchanged_workspace.storage_usage_updated_at = timezone.now() - timedelta(days=30)
+    unchanged_workspace.save()
+    assert UsageHandler.get_workspace_ids_needing_storage_usage_update() == [
+        unchanged_workspace.id
+    ]
+
+
+@pytest.mark.django_db
+def test_trashing_marks_workspace_for_storage_usage_update(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(user=user, database=database)
+    UsageHandler.calculate_storage_usage()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        TrashHandler.trash(user, workspace, database, table)
+
+    assert UsageHandler.get_workspace_ids_needing_storage_usage_update() == [
+        workspace.id
+    ]
+
+
+@pytest.mark.django_db
+def test_updating_form_view_cover_image_marks_workspace_for_storage_usage_update(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(user=user, database=database)
+    form_view = data_fixture.create_form_view(table=table)
+    UsageHandler.calculate_storage_usage()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        ViewHandler().update_view(user, form_view, name="Renamed")
+    assert UsageHandler.get_workspace_ids_needing_storage_usage_update() == []
+
+    cover_image = data_fixture.create_user_file(is_image=True, size=2 * USAGE_UNIT_MB)
+    with django_capture_on_commit_callbacks(execute=True):
+        ViewHandler().update_view(user, form_view, cover_image=cover_image)
+    assert UsageHandler.get_workspace_ids_needing_storage_usage_update() == [
+        workspace.id
+    ]
+
+
+@pytest.mark.django_db
+def test_calculate_storage_usage_incrementally(data_fixture):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(user=user, database=database)
+    cover_image = data_fixture.create_user_file(is_image=True, size=2 * USAGE_UNIT_MB)
+    data_fixture.create_form_view(table=table, cover_image=cover_image)
+    other_workspace = data_fixture.create_workspace(user=user)
+    template_workspace = data_fixture.create_workspace()
+    data_fixture.create_template(workspace=template_workspace)
+
+    # The chunks are calculated by the tasks, which run eagerly in the tests.
+    assert UsageHandler.calculate_storage_usage_incrementally(chunk_size=1) == 2
+
+    workspace.refresh_from_db()
+    other_workspace.refresh_from_db()
+    template_workspace.refresh_from_db()
+    assert workspace.storage_usage == 2
+    assert other_workspace.storage_usage == 0
+    assert template_workspace.storage_usage is None
+
+    assert UsageHandler.calculate_storage_usage_incrementally() == 0
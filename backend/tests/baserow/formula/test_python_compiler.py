@@ -0,0 +1,61 @@
+import pytest
+
+from baserow.core.formula import compile_formula, resolve_formula
+from baserow.core.formula.parser.exceptions import (
+    BaserowFormulaSyntaxError,
+    FieldByIdReferencesAreDeprecated,
+)
+from baserow.core.formula.parser.parser import get_parse_tree_for_formula
+from baserow.core.formula.parser.python_compiler import BaserowPythonCompiler
+from baserow.core.formula.registries import formula_runtime_function_registry
+from baserow.test_utils.helpers import load_test_cases
+
+TEST_DATA = load_test_cases("formula_runtime_cases")
+
+VALID_FORMULA_TESTS = TEST_DATA["VALID_FORMULA_TESTS"]
+INVALID_FORMULA_TESTS = TEST_DATA["INVALID_FORMULA_TESTS"]
+
+
+@pytest.mark.parametrize("test_data", VALID_FORMULA_TESTS)
+def test_valid_compiled_formulas(test_data):
+    compiled = BaserowPythonCompiler(formula_runtime_function_registry).visit(
+        get_parse_tree_for_formula(test_data["formula"])
+    )
+
+    # A compiled formula can be evaluated many times.
+    assert compiled(test_data["context"]) == test_data["result"]
+    assert compiled(test_data["context"]) == test_data["result"]
+
+
+@pytest.mark.parametrize("test_data", INVALID_FORMULA_TESTS)
+def test_invalid_compiled_formulas(test_data):
+    with pytest.raises(Exception):
+        resolve_formula(
+            test_data["formula"],
+            formula_runtime_function_registry,
+            test_data["context"],
+        )
+
+
+def test_compiled_formula_raises_errors_in_evaluation_order():
+    with pytest.raises(BaserowFormulaSyntaxError):
+        resolve_formula(
+            "notExistingFunction(1,2,3)", formula_runtime_function_registry, {}
+        )
+
+    # The arguments are evaluated before the function is looked up.
+    with pytest.raises(FieldByIdReferencesAreDeprecated):
+        resolve_formula(
+            "notExistingFunction(field_by_id(1))", formula_runtime_function_registry, {}
+        )
+
+
+def test_resolve_formula_reuses_the_compiled_formula():
+    compile_formula.cache_clear()
+
+    assert resolve_formula("get('a')", formula_runtime_function_registry, {"a": 1}) == 1
+    assert resolve_formula("get('a')", formula_runtime_function_registry, {"a": 2}) == 2
+
+    cache_info = compile_formula.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
@@ -0,0 +1,84 @@
+from threading import Barrier
+from time import perf_counter
+from unittest.mock import MagicMock
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+import pytest
+
+from baserow.contrib.builder.data_sources.builder_dispatch_context import (
+    BuilderDispatchContext,
+)
+from baserow.contrib.builder.data_sources.handler import (
+    DataSourceHandler,
+    data_source_dispatch_executor,
+)
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.disabled_in_ci
+# You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
+# intellij by editing the run config for this test and adding --run-disabled-in-ci -s
+# to additional args.
+def test_dispatching_many_independent_data_sources(data_fixture, settings):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user,
+        columns=[("Name", "text")],
+        rows=[[f"Row {i}"] for i in range(1000)],
+    )
+    builder = data_fixture.create_builder_application(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        user=user, application=builder
+    )
+    page = data_fixture.create_builder_page(user=user, builder=builder)
+    for i in range(8):
+        data_fixture.create_builder_local_baserow_list_rows_data_source(
+            page=page,
+            integration=integration,
+            table=table,
+            search_query=f"'Row {i}'",
+        )
+
+    num_dispatches = 20
+    max_workers = settings.BASEROW_BUILDER_DATA_SOURCES_DISPATCH_MAX_WORKERS
+    opened_connections = []
+
+    def count_connection(**kwargs):
+        opened_connections.append(kwargs["connection"])
+
+    def close_worker_connections(barrier):
+        barrier.wait()
+        connections.close_all()
+
+    connection_created.connect(count_connection)
+    try:
+        for workers, conn_max_age in [(1, 0), (max_workers, 0), (max_workers, 60)]:
+            settings.BASEROW_BUILDER_DATA_SOURCES_DISPATCH_MAX_WORKERS = workers
+            connections.settings["default"]["CONN_MAX_AGE"] = conn_max_age
+            opened_connections.clear()
+            start = perf_counter()
+            for _ in range(num_dispatches):
+                data_sources = DataSourceHandler().get_data_sources(page)
+                DataSourceHandler().dispatch_data_sources(
+                    data_sources, BuilderDispatchContext(MagicMock(), page)
+                )
+            duration = perf_counter() - start
+            print(
+                f"{workers} worker(s), CONN_MAX_AGE={conn_max_age}: "
+                f"{duration / num_dispatches * 1000:.1f}ms per page dispatch, "
+                f"{len(opened_connections)} connection(s) opened"
+            )
+    finally:
+        connection_created.disconnect(count_connection)
+        connections.settings["default"]["CONN_MAX_AGE"] = 0
+        # Every worker thread closes its connection, otherwise the test database
+        # can't be dropped.
+        barrier = Barrier(max_workers)
+        futures = [
+            data_source_dispatch_executor.submit(close_worker_connections, barrier)
+            for _ in range(max_workers)
+        ]
+        for future in futures:
+            future.result()
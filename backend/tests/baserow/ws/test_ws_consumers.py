@@ -457,3 +457,74 @@ async def test_core_consumer_broadcast_to_group(
         mock_send_json.assert_called_once_with(event["payload"])
     else:
         mock_send_json.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_core_consumer_broadcast_batch_to_group():
+    consumer = CoreConsumer()
+    consumer.scope = {"web_socket_id": "web_socket_id", "user": Mock(id=1)}
+    consumer.send_json = AsyncMock()
+    event = {
+        "messages": [
+            {"payload": {"type": "first"}, "ignore_web_socket_id": None},
+            {"payload": {"type": "second"}, "ignore_web_socket_id": "web_socket_id"},
+            {"payload": {"type": "third"}, "ignore_web_socket_id": "other"},
+        ]
+    }
+
+    await consumer.broadcast_batch_to_group(event)
+
+    consumer.send_json.assert_called_once_with(
+        {"type": "batch", "messages": [{"type": "first"}, {"type": "third"}]}
+    )
+
+    consumer.send_json.reset_mock()
+    await consumer.broadcast_batch_to_group({"messages": [event["messages"][1]]})
+    consumer.send_json.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.websockets
+async def test_core_consumer_broadcast_to_group_sends_the_payload_for_the_pages():
+    consumer = CoreConsumer()
+    pages = SubscribedPages()
+    pages.add(
+        PageScope(
+            page_type="table", page_parameters={"table_id": 1, "row_deltas": True}
+        )
+    )
+    consumer.scope = {
+        "web_socket_id": "web_socket_id",
+        "user": Mock(id=1),
+        "pages": pages,
+    }
+    consumer.send_json = AsyncMock()
+    payload = {
+        "type": "rows_updated",
+        "table_id": 1,
+        "rows_before_update": [{"id": 1, "order": "1", "field_1": "a", "field_2": "b"}],
+        "rows": [{"id": 1, "order": "1", "field_1": "c", "field_2": "b"}],
+        "metadata": {},
+    }
+
+    await consumer.broadcast_to_group(
+        {"payload": payload, "ignore_web_socket_id": None}
+    )
+    consumer.send_json.assert_called_once_with(
+        {
+            "type": "rows_fields_updated",
+            "table_id": 1,
+            "rows_before_update": [{"id": 1, "order": "1", "field_1": "a"}],
+            "rows": [{"id": 1, "order": "1", "field_1": "c"}],
+            "metadata": {},
+        }
+    )
+
+    consumer.send_json.reset_mock()
+    await consumer.broadcast_batch_to_group(
+        {"messages": [{"payload": payload, "ignore_web_socket_id": None}]}
+    )
+    assert (
+        consumer.send_json.call_args[0][0]["messages"][0]["type"]
+        == "rows_fields_updated"
+    )
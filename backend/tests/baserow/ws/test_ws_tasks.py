@@ -1,10 +1,19 @@
+from unittest.mock import call, patch
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 import pytest
 from asgiref.sync import sync_to_async
 from channels.db import database_sync_to_async
 from channels.testing import WebsocketCommunicator
 
 from baserow.config.asgi import application
+from baserow.core.handler import CoreHandler
+from baserow.core.object_scopes import WorkspaceObjectScopeType
+from baserow.core.operations import UpdateWorkspaceOperationType
 from baserow.ws.tasks import (
+    broadcast_multiple_to_permitted_users,
     broadcast_to_channel_group,
     broadcast_to_group,
     broadcast_to_groups,
@@ -507,3 +516,43 @@ async def test_broadcast_to_users_individual_payloads(data_fixture):
 
     await communicator_1.disconnect()
     await communicator_2.disconnect()
+
+
+@pytest.mark.django_db
+@patch("baserow.ws.tasks.broadcast_to_users")
+def test_broadcast_multiple_to_permitted_users(mock_broadcast_to_users, data_fixture):
+    admin = data_fixture.create_user()
+    member = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=admin, members=[member])
+    args = (
+        workspace.id,
+        UpdateWorkspaceOperationType.type,
+        WorkspaceObjectScopeType.type,
+        workspace.id,
+    )
+
+    broadcast_multiple_to_permitted_users(
+        *args, [{"type": "first"}, {"type": "second"}], "web_socket_id"
+    )
+    assert mock_broadcast_to_users.call_args_list == [
+        call([admin.id], {"type": "first"}, ignore_web_socket_id="web_socket_id"),
+        call([admin.id], {"type": "second"}, ignore_web_socket_id="web_socket_id"),
+    ]
+
+    # The permitted users are cached for the next broadcasts.
+    mock_broadcast_to_users.reset_mock()
+    with CaptureQueriesContext(connection) as captured:
+        broadcast_multiple_to_permitted_users(*args, [{"type": "third"}])
+    assert len(captured.captured_queries) == 0
+    mock_broadcast_to_users.assert_called_once_with(
+        [admin.id], {"type": "third"}, ignore_web_socket_id=None
+    )
+
+    # Changing the permissions of a member invalidates the cache.
+    mock_broadcast_to_users.reset_mock()
+    CoreHandler().force_update_workspace_user(
+        None, workspace.workspaceuser_set.get(user=member), permissions="ADMIN"
+    )
+    broadcast_multiple_to_permitted_users(*args, [{"type": "fourth"}])
+    user_ids, payload = mock_broadcast_to_users.call_args.args
+    assert sorted(user_ids) == sorted([admin.id, member.id])
@@ -196,6 +196,14 @@ class BaserowEnterpriseConfig(AppConfig):
 
         connect_to_post_delete_signals_to_cascade_deletion_to_role_assignments()
 
+        from baserow_enterprise.role.receivers import (
+            connect_to_signals_to_clear_roles_per_scope_cache,
+            connect_to_signals_to_invalidate_permission_checks_cache_on_role_changes,
+        )
+
+        connect_to_signals_to_invalidate_permission_checks_cache_on_role_changes()
+        connect_to_signals_to_clear_roles_per_scope_cache()
+
         # The signals must always be imported last because they use the registries
         # which need to be filled first.
         import baserow_enterprise.audit_log.signals  # noqa: F
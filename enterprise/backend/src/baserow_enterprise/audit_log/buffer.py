@@ -0,0 +1,188 @@
+"""
+Buffers the audit log entries of a request or a Celery task, so that they're written
+with a single `bulk_create` once the response has been sent or the task has finished,
+instead of one insert per action inside the transaction of the action.
+
+An entry is only added to the buffer when the transaction of the action commits, so
+the entries of the actions which are rolled back, also when only a savepoint is
+rolled back, are never written.
+
+The actions are already committed when their entries are written, so the entries
+must not be lost if writing them fails. They're then handed to a Celery task which
+retries writing them, or written one by one if the task can't be enqueued. The
+entries still buffered when the process exits are written by an `atexit` handler.
+"""
+
+import atexit
+import json
+import threading
+from functools import partial
+from typing import Any, Dict, List
+
+from django.conf import settings
+from django.db import transaction
+
+from asgiref.local import Local
+from loguru import logger
+
+from baserow.core.encoders import JSONEncoderSupportingDataClasses
+from baserow.core.utils import exception_capturer
+
+from .models import AuditLogEntry
+
+_thread_locals = Local()
+
+# The buffers of all the scopes of the process, so that their entries can be written
+# when the process exits before the scopes end.
+_active_buffers: Dict[int, List[AuditLogEntry]] = {}
+_active_buffers_lock = threading.Lock()
+
+
+def start_buffering_audit_log_entries():
+    """
+    Starts buffering the committed audit log entries in the current scope. Scopes can
+    be nested, for example when a Celery task runs eagerly during a request, in which
+    case the buffer is only written when the outermost scope ends.
+    """
+
+    depth = getattr(_thread_locals, "depth", 0)
+    if depth == 0:
+        entries = []
+        _thread_locals.entries = entries
+        with _active_buffers_lock:
+            _active_buffers[id(entries)] = entries
+    _thread_locals.depth = depth + 1
+
+
+def stop_buffering_audit_log_entries():
+    """
+    Ends the current buffering scope, and writes the buffered entries if it's the
+    outermost scope.
+    """
+
+    depth = getattr(_thread_locals, "depth", 0)
+    if depth > 1:
+        _thread_locals.depth = depth - 1
+        return
+
+    entries = getattr(_thread_locals, "entries", None)
+    flush_audit_log_entries()
+    _thread_locals.depth = 0
+    _thread_locals.entries = None
+    if entries is not None:
+        with _active_buffers_lock:
+            _active_buffers.pop(id(entries), None)
+
+
+def add_audit_log_entry_after_commit(entry: AuditLogEntry):
+    """
+    Writes the unsaved entry when the current transaction commits. The entry is
+    buffered if a buffering scope is active, otherwise it's written right away.
+
+    :param entry: The unsaved audit log entry.
+    """
+
+    transaction.on_commit(partial(_add_committed_audit_log_entry, entry))
+
+
+def _add_committed_audit_log_entry(entry: AuditLogEntry):
+    entries = getattr(_thread_locals, "entries", None)
+    if entries is None:
+        _write_audit_log_entries([entry])
+        return
+
+    entries.append(entry)
+    if len(entries) >= settings.BASEROW_ENTERPRISE_AUDIT_LOG_WRITE_BATCH_SIZE:
+        flush_audit_log_entries()
+
+
+def flush_audit_log_entries():
+    """
+    Writes the entries buffered in the current scope.
+    """
+
+    entries = getattr(_thread_locals, "entries", None)
+    if entries:
+        # The buffer is emptied in place, because it's also referenced by the
+        # active buffers of the process.
+        entries_to_write = entries[:]
+        entries.clear()
+        _write_audit_log_entries(entries_to_write)
+
+
+@atexit.register
+def _flush_active_buffers():
+    with _active_buffers_lock:
+        buffers = list(_active_buffers.values())
+        _active_buffers.clear()
+
+    for entries in buffers:
+        if entries:
+            entries_to_write = entries[:]
+            entries.clear()
+            _write_audit_log_entries(entries_to_write)
+
+
+def serialize_audit_log_entries(entries: List[AuditLogEntry]) -> List[Dict[str, Any]]:
+    """
+    Serializes unsaved audit log entries, so that they can be passed to a Celery
+    task.
+
+    :param entries: The unsaved audit log entries.
+    :return: The JSON serializable field values of the entries.
+    """
+
+    return json.loads(
+        json.dumps(
+            [
+                {
+                    field.attname: getattr(entry, field.attname)
+                    for field in AuditLogEntry._meta.concrete_fields
+                    if not field.primary_key
+                }
+                for entry in entries
+            ],
+            cls=JSONEncoderSupportingDataClasses,
+        )
+    )
+
+
+def _write_audit_log_entries(entries: List[AuditLogEntry]):
+    # The actions are already committed at this point, so failing to write their
+    # entries must not make the request or the task fail, but the entries must
+    # still be written.
+    try:
+        AuditLogEntry.objects.bulk_create(
+            entries, batch_size=settings.BASEROW_ENTERPRISE_AUDIT_LOG_WRITE_BATCH_SIZE
+        )
+    except Exception as e:
+        exception_capturer(e)
+        logger.warning(
+            f"Failed to write {len(entries)} audit log entries, retrying in the "
+            f"background: {e}"
+        )
+        _retry_writing_audit_log_entries(entries)
+
+
+def _retry_writing_audit_log_entries(entries: List[AuditLogEntry]):
+    from .tasks import write_audit_log_entries
+
+    try:
+        write_audit_log_entries.delay(serialize_audit_log_entries(entries))
+        return
+    except Exception as e:
+        exception_capturer(e)
+        logger.warning(
+            f"Failed to enqueue the writing of {len(entries)} audit log entries, "
+            f"writing them one by one: {e}"
+        )
+
+    for entry in entries:
+        try:
+            entry.save()
+        except Exception as e:
+            exception_capturer(e)
+            logger.error(
+                f"Failed to write the audit log entry "
+                f"{serialize_audit_log_entries([entry])[0]}: {e}"
+            )
@@ -1,13 +1,19 @@
 from datetime import datetime
 from typing import Any, Dict, Optional, Type
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 
 from baserow.api.sessions import get_user_remote_addr_ip
 from baserow.core.action.registries import ActionType
 from baserow.core.action.signals import ActionCommandType
+from baserow.core.db import (
+    create_upcoming_monthly_partitions,
+    drop_monthly_partitions_before,
+)
 from baserow.core.models import Workspace
 
+from .buffer import add_audit_log_entry_after_commit
 from .models import AuditLogEntry
 
 
@@ -27,7 +33,9 @@ class AuditLogHandler:
         """
         Creates a new audit log entry for the given user, workspace and event
         type. The kwargs will be stored as JSON in the data field of the audit
-        log entry.
+        log entry. If `BASEROW_ENTERPRISE_AUDIT_LOG_BUFFERED_WRITES` is enabled, the
+        entry is only written after the transaction of the action commits, together
+        with the other entries of the request or the task.
 
         :param user: The user that performed the action.
         :param action_type: The type of the action that should be logged.
@@ -41,6 +49,8 @@ class AuditLogHandler:
             is sent so it can be used to identify other resources created at the
             same time (i.e. row_history entries).
         :param workspace: The workspace that the action was performed on.
+        :return: The audit log entry, which isn't saved yet if the writes are
+            buffered.
         """
 
         workspace_id, workspace_name = None, None
@@ -50,7 +60,7 @@ class AuditLogHandler:
 
         ip_address = get_user_remote_addr_ip(user)
 
-        return AuditLogEntry.objects.create(
+        entry = AuditLogEntry(
             user_id=user.id,
             user_email=user.email,
             workspace_id=workspace_id,
@@ -65,13 +75,35 @@ class AuditLogHandler:
             original_action_context_descr=action_type.description.context,
             ip_address=ip_address,
         )
+        if settings.BASEROW_ENTERPRISE_AUDIT_LOG_BUFFERED_WRITES:
+            add_audit_log_entry_after_commit(entry)
+        else:
+            entry.save()
+        return entry
+
+    @classmethod
+    def create_upcoming_partitions(cls, months_ahead: int = 2):
+        """
+        Makes sure that the partitions of the audit log entries table exist for the
+        current month and the given number of months after it.
+
+        :param months_ahead: The number of months after the current one for which
+            the partitions must be created.
+        """
+
+        create_upcoming_monthly_partitions(
+            AuditLogEntry._meta.db_table, "action_timestamp", months_ahead
+        )
 
     @classmethod
     def delete_entries_older_than(cls, cutoff: datetime):
         """
         Deletes all audit log entries that are older than the given number of days.
+        The monthly partitions which only contain older entries are dropped at once,
+        so only the remaining entries have to be deleted one by one.
 
         :param cutoff: The date and time before which all entries will be deleted.
         """
 
+        drop_monthly_partitions_before(AuditLogEntry._meta.db_table, cutoff)
         AuditLogEntry.objects.filter(action_timestamp__lt=cutoff).delete()
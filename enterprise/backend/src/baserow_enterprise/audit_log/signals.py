@@ -2,12 +2,16 @@ from datetime import datetime
 from typing import Any, Dict, Optional, Type
 
 from django.contrib.auth.models import AbstractUser
+from django.core.signals import request_finished, request_started
 from django.dispatch import receiver
 
+from celery.signals import task_postrun, task_prerun
+
 from baserow.core.action.registries import ActionType
 from baserow.core.action.signals import ActionCommandType, action_done
 from baserow.core.models import Workspace
 
+from .buffer import start_buffering_audit_log_entries, stop_buffering_audit_log_entries
 from .handler import AuditLogHandler
 
 
@@ -33,3 +37,16 @@ def log_action(
         workspace=workspace,
         **kwargs,
     )
+
+
+@receiver(request_started)
+@task_prerun.connect
+def start_buffering_audit_log_entries_before_request_or_task(**kwargs):
+    start_buffering_audit_log_entries()
+
+
+# The buffered entries are written after the response has been sent to the client.
+@receiver(request_finished)
+@task_postrun.connect
+def stop_buffering_audit_log_entries_after_request_or_task(**kwargs):
+    stop_buffering_audit_log_entries()
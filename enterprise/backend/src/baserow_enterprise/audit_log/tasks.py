@@ -1,4 +1,5 @@
 from datetime import datetime, time, timedelta
+from typing import Any, Dict, List
 
 from django.conf import settings
 from django.utils import timezone
@@ -6,11 +7,36 @@ from django.utils import timezone
 from baserow.config.celery import app
 
 
+@app.task(
+    bind=True,
+    queue="export",
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    max_retries=settings.BASEROW_ENTERPRISE_AUDIT_LOG_WRITE_MAX_RETRIES,
+)
+def write_audit_log_entries(self, serialized_entries: List[Dict[str, Any]]):
+    """
+    Writes the audit log entries which couldn't be written when the request or the
+    task that created them ended. The task is retried with an exponential backoff
+    until they're written.
+
+    :param serialized_entries: The entries serialized with
+        `serialize_audit_log_entries`.
+    """
+
+    from .models import AuditLogEntry
+
+    AuditLogEntry.objects.bulk_create(
+        [AuditLogEntry(**values) for values in serialized_entries],
+        batch_size=settings.BASEROW_ENTERPRISE_AUDIT_LOG_WRITE_BATCH_SIZE,
+    )
+
+
 @app.task(bind=True, queue="export")
 def clean_up_audit_log_entries(self):
     """
-    Execute job cleanup for each job types if they need to cleanup something like files
-    or old jobs.
+    Deletes the audit log entries older than the retention period, and creates the
+    partitions of the upcoming months.
     """
 
     from .handler import AuditLogHandler
@@ -20,6 +46,7 @@ def clean_up_audit_log_entries(self):
     )
     entries_older_than = datetime.combine(timezone.now() - older_than_days, time.min)
     AuditLogHandler.delete_entries_older_than(entries_older_than)
+    AuditLogHandler.create_upcoming_partitions()
 
 
 @app.on_after_finalize.connect
@@ -1,6 +1,6 @@
 import os
 
-from baserow.config.settings.utils import enum_member_by_value
+from baserow.config.settings.utils import enum_member_by_value, str_to_bool
 from baserow_enterprise.secure_file_serve.constants import SecureFileServePermission
 
 
@@ -24,6 +24,20 @@ def setup(settings):
         os.getenv("BASEROW_ENTERPRISE_AUDIT_LOG_RETENTION_DAYS", "") or 365
     )
 
+    # When enabled, the audit log entries are written after the transaction of the
+    # action commits, in batches of the entries of the same request or task.
+    settings.BASEROW_ENTERPRISE_AUDIT_LOG_BUFFERED_WRITES = str_to_bool(
+        os.getenv("BASEROW_ENTERPRISE_AUDIT_LOG_BUFFERED_WRITES", "true")
+    )
+    settings.BASEROW_ENTERPRISE_AUDIT_LOG_WRITE_BATCH_SIZE = int(
+        os.getenv("BASEROW_ENTERPRISE_AUDIT_LOG_WRITE_BATCH_SIZE", "") or 100
+    )
+    # The number of times writing the audit log entries is retried in the background
+    # if they couldn't be written after the request or task.
+    settings.BASEROW_ENTERPRISE_AUDIT_LOG_WRITE_MAX_RETRIES = int(
+        os.getenv("BASEROW_ENTERPRISE_AUDIT_LOG_WRITE_MAX_RETRIES", "") or 10
+    )
+
     # Set this to True to enable users to login with auth providers different than
     # the one they were originally created with.
     settings.BASEROW_ALLOW_MULTIPLE_SSO_PROVIDERS_FOR_SAME_ACCOUNT = bool(
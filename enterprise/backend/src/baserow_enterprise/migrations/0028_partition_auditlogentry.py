@@ -0,0 +1,178 @@
+from django.db import migrations
+
+# Converts the audit log entry table into a table which is range partitioned by month
+# on the `action_timestamp`, so that the entries older than the retention period can
+# be removed by dropping entire partitions. To avoid copying all the existing
+# entries, the existing table becomes the partition containing everything up to the
+# end of its last month, and is named after that month so that it's dropped once all
+# of its entries are expired. A partitioned table can't have an identity column, so
+# the `id` gets its default from a regular sequence, and the primary key must
+# contain the partition key. The installations created before Django 4.1 have a
+# `serial` instead of an identity `id`, of which the sequence is kept.
+partition_audit_log_entries_sql = """
+DO $$
+DECLARE
+    legacy_end timestamp;
+    legacy_name text;
+    next_id integer;
+    id_sequence text;
+    partition_start timestamp;
+BEGIN
+    SELECT
+        GREATEST(
+            date_trunc('month', now() AT TIME ZONE 'UTC'),
+            date_trunc('month', max(action_timestamp) AT TIME ZONE 'UTC')
+        ) + interval '1 month',
+        COALESCE(max(id), 0) + 1
+    INTO legacy_end, next_id
+    FROM baserow_enterprise_auditlogentry;
+    legacy_name := 'baserow_enterprise_auditlogentry_'
+        || to_char(legacy_end - interval '1 month', '"y"YYYY"m"MM');
+
+    IF EXISTS (
+        SELECT 1 FROM pg_attribute
+        WHERE attrelid = 'baserow_enterprise_auditlogentry'::regclass
+        AND attname = 'id'
+        AND attidentity != ''
+    ) THEN
+        ALTER TABLE baserow_enterprise_auditlogentry ALTER COLUMN id DROP IDENTITY;
+    ELSE
+        id_sequence := pg_get_serial_sequence('baserow_enterprise_auditlogentry', 'id');
+        ALTER TABLE baserow_enterprise_auditlogentry ALTER COLUMN id DROP DEFAULT;
+    END IF;
+    EXECUTE format(
+        'ALTER TABLE baserow_enterprise_auditlogentry RENAME TO %I', legacy_name
+    );
+    EXECUTE format(
+        'ALTER TABLE %I DROP CONSTRAINT baserow_enterprise_auditlogentry_pkey, '
+        'ADD CONSTRAINT %I PRIMARY KEY (id, action_timestamp)',
+        legacy_name,
+        legacy_name || '_pkey'
+    );
+    EXECUTE format(
+        'ALTER INDEX baserow_ent_action__8db5d6_idx RENAME TO %I',
+        legacy_name || '_action_idx'
+    );
+
+    EXECUTE format(
+        'CREATE TABLE baserow_enterprise_auditlogentry '
+        '(LIKE %I INCLUDING CONSTRAINTS) PARTITION BY RANGE (action_timestamp)',
+        legacy_name
+    );
+    IF id_sequence IS NULL THEN
+        CREATE SEQUENCE baserow_enterprise_auditlogentry_id_seq AS integer;
+        PERFORM setval('baserow_enterprise_auditlogentry_id_seq', next_id, false);
+    ELSIF id_sequence::regclass::text != 'baserow_enterprise_auditlogentry_id_seq'
+    THEN
+        EXECUTE format(
+            'ALTER SEQUENCE %s RENAME TO baserow_enterprise_auditlogentry_id_seq',
+            id_sequence
+        );
+    END IF;
+    ALTER SEQUENCE baserow_enterprise_auditlogentry_id_seq
+        OWNED BY baserow_enterprise_auditlogentry.id;
+    ALTER TABLE baserow_enterprise_auditlogentry ALTER COLUMN id
+        SET DEFAULT nextval('baserow_enterprise_auditlogentry_id_seq');
+    ALTER TABLE baserow_enterprise_auditlogentry
+        ADD CONSTRAINT baserow_enterprise_auditlogentry_pkey
+        PRIMARY KEY (id, action_timestamp);
+    CREATE INDEX baserow_ent_action__8db5d6_idx ON baserow_enterprise_auditlogentry
+        (action_timestamp DESC, user_id, workspace_id, action_type);
+
+    EXECUTE format(
+        'ALTER TABLE baserow_enterprise_auditlogentry ATTACH PARTITION %I '
+        'FOR VALUES FROM (MINVALUE) TO (%L)',
+        legacy_name,
+        legacy_end AT TIME ZONE 'UTC'
+    );
+    CREATE TABLE baserow_enterprise_auditlogentry_default
+        PARTITION OF baserow_enterprise_auditlogentry DEFAULT;
+    FOR partition_start IN
+        SELECT generate_series(
+            legacy_end, legacy_end + interval '1 month', interval '1 month'
+        )
+    LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF baserow_enterprise_auditlogentry '
+            'FOR VALUES FROM (%L) TO (%L)',
+            'baserow_enterprise_auditlogentry_'
+                || to_char(partition_start, '"y"YYYY"m"MM'),
+            partition_start AT TIME ZONE 'UTC',
+            (partition_start + interval '1 month') AT TIME ZONE 'UTC'
+        );
+    END LOOP;
+END $$;
+"""
+
+# Converts the partitioned table back into a regular table. The partition made from
+# the original table is detached and becomes the table again, so only the entries of
+# the other partitions are copied into it. If it has already been dropped because
+# all of its entries expired, an empty table is created instead. The `id` becomes an
+# identity column, like Django creates it.
+unpartition_audit_log_entries_sql = """
+DO $$
+DECLARE
+    legacy_name text;
+    next_id integer;
+BEGIN
+    SELECT COALESCE(max(id), 0) + 1 INTO next_id
+    FROM baserow_enterprise_auditlogentry;
+    SELECT child.relname INTO legacy_name FROM pg_inherits
+    JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+    WHERE pg_inherits.inhparent = 'baserow_enterprise_auditlogentry'::regclass
+    AND pg_get_expr(child.relpartbound, child.oid) LIKE 'FOR VALUES FROM (MINVALUE)%';
+
+    IF legacy_name IS NULL THEN
+        legacy_name := 'baserow_enterprise_auditlogentry_legacy';
+        EXECUTE format(
+            'CREATE TABLE %I '
+            '(LIKE baserow_enterprise_auditlogentry INCLUDING CONSTRAINTS)',
+            legacy_name
+        );
+    ELSE
+        EXECUTE format(
+            'ALTER TABLE baserow_enterprise_auditlogentry DETACH PARTITION %I',
+            legacy_name
+        );
+        EXECUTE format(
+            'ALTER TABLE %I DROP CONSTRAINT %I',
+            legacy_name,
+            legacy_name || '_pkey'
+        );
+        EXECUTE format('DROP INDEX IF EXISTS %I', legacy_name || '_action_idx');
+    END IF;
+    EXECUTE format(
+        'INSERT INTO %I SELECT * FROM baserow_enterprise_auditlogentry',
+        legacy_name
+    );
+    DROP TABLE baserow_enterprise_auditlogentry;
+    EXECUTE format(
+        'ALTER TABLE %I RENAME TO baserow_enterprise_auditlogentry', legacy_name
+    );
+
+    ALTER TABLE baserow_enterprise_auditlogentry
+        ADD CONSTRAINT baserow_enterprise_auditlogentry_pkey PRIMARY KEY (id);
+    ALTER TABLE baserow_enterprise_auditlogentry ALTER COLUMN id
+        ADD GENERATED BY DEFAULT AS IDENTITY;
+    PERFORM setval(
+        pg_get_serial_sequence('baserow_enterprise_auditlogentry', 'id'),
+        next_id,
+        false
+    );
+    CREATE INDEX baserow_ent_action__8db5d6_idx ON baserow_enterprise_auditlogentry
+        (action_timestamp DESC, user_id, workspace_id, action_type);
+END $$;
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("baserow_enterprise", "0027_migrate_auth_form_style"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            partition_audit_log_entries_sql,
+            reverse_sql=unpartition_audit_log_entries_sql,
+        ),
+    ]
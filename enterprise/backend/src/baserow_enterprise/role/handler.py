@@ -4,10 +4,12 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.db.models import Case, IntegerField, Q, QuerySet, Value, When
 
 from baserow_premium.license.handler import LicenseHandler
 
+from baserow.core.cache import get_cache_version, increment_cache_version
 from baserow.core.exceptions import PermissionDenied
 from baserow.core.handler import CoreHandler
 from baserow.core.mixins import TrashableModelMixin
@@ -46,6 +48,10 @@ from .types import NewRoleAssignment
 
 User = get_user_model()
 
+# The roles per scope are invalidated with a version key, this timeout only makes
+# sure that the roles of inactive actors don't stay in the cache forever.
+ROLES_PER_SCOPE_CACHE_TIMEOUT = 60 * 60 * 24
+
 
 class RoleAssignmentHandler:
     def _get_role_assignments_for_valid_subjects_qs(self) -> QuerySet:
@@ -295,7 +301,9 @@ class RoleAssignmentHandler:
     ) -> Dict[Subject, Tuple[ScopeObject, List[Role]]]:
         """
         Returns the role assignments for for all given actors who are all of the
-        actor_subject_type.
+        actor_subject_type. The roles per scope of each actor are cached until a role
+        assignment, a team or a workspace user of the workspace changes, so only the
+        scope objects must be fetched if the roles are in the cache.
 
         :param workspace: The workspace in which we want the role assignments for.
         :param actor_subject_type: The type of the actors.
@@ -305,6 +313,88 @@ class RoleAssignmentHandler:
             the object hierarchy, the earlier the tuple is in the list.
         """
 
+        version = get_cache_version(
+            self._get_roles_per_scope_version_cache_key(workspace.id)
+        )
+        cache_keys = {
+            actor.id: self._get_roles_per_scope_cache_key(
+                workspace.id, actor_subject_type, actor.id, include_trash
+            )
+            for actor in actors
+        }
+        cached = cache.get_many(list(cache_keys.values()))
+
+        role_ids_per_scope_by_actor_id = {}
+        for actor_id, cache_key in cache_keys.items():
+            cached_value = cached.get(cache_key)
+            if cached_value is not None and cached_value["version"] == version:
+                role_ids_per_scope_by_actor_id[actor_id] = cached_value["value"]
+
+        actors_to_compute = [
+            actor for actor in actors if actor.id not in role_ids_per_scope_by_actor_id
+        ]
+        if actors_to_compute:
+            computed = self._get_role_ids_per_scope_for_actors(
+                workspace, actor_subject_type, actors_to_compute, include_trash
+            )
+            cache.set_many(
+                {
+                    cache_keys[actor_id]: {"version": version, "value": value}
+                    for actor_id, value in computed.items()
+                },
+                timeout=ROLES_PER_SCOPE_CACHE_TIMEOUT,
+            )
+            role_ids_per_scope_by_actor_id.update(computed)
+
+        workspace_scope_param = (
+            ContentType.objects.get_for_model(Workspace).id,
+            workspace.id,
+        )
+
+        # Query the scopes type by type
+        scopes_to_query = defaultdict(set)
+        for role_ids_per_scope in role_ids_per_scope_by_actor_id.values():
+            for scope_param, _ in role_ids_per_scope:
+                if scope_param != workspace_scope_param:
+                    scopes_to_query[scope_param[0]].add(scope_param[1])
+
+        scope_cache = {workspace_scope_param: workspace}
+        for content_type_id, content_ids in scopes_to_query.items():
+            for scope in self.get_scopes(content_type_id, content_ids):
+                scope_cache[(content_type_id, scope.id)] = scope
+
+        # Finally replace scope_params by real scope
+        roles_per_scope_per_user = defaultdict(list)
+        for actor in actors:
+            for scope_param, role_ids in role_ids_per_scope_by_actor_id[actor.id]:
+                if scope_param not in scope_cache:
+                    # The scope has been deleted after the roles were cached.
+                    continue
+                roles_per_scope_per_user[actor].append(
+                    (
+                        scope_cache[scope_param],
+                        [self.get_role_by_id(role_id) for role_id in role_ids],
+                    )
+                )
+
+        return roles_per_scope_per_user
+
+    def _get_role_ids_per_scope_for_actors(
+        self,
+        workspace: Workspace,
+        actor_subject_type: SubjectType,
+        actors: List[Subject],
+        include_trash=False,
+    ) -> Dict[int, List[Tuple[Tuple[int, int], List[int]]]]:
+        """
+        Computes the roles per scope of the given actors from the role assignments of
+        the actors and of their teams.
+
+        :return: A dict with the actor id as key and a list of
+            ((scope content type id, scope id), list[role id]) as value, sorted like
+            the result of `get_roles_per_scope_for_actors`.
+        """
+
         content_types = ContentType.objects.get_for_models(
             actor_subject_type.model_class, Team, Workspace
         )
@@ -392,9 +482,6 @@ class RoleAssignmentHandler:
         # Track the latest role priority for each scope of each subject
         priorities_by_scope_per_actor_id = defaultdict(dict)
 
-        # Keep a list of scope params to query later
-        scopes_to_query = defaultdict(set)
-
         roles_by_scope = defaultdict(lambda: {workspace_scope_param: []})
 
         for role_assignment in role_assignments:
@@ -403,8 +490,6 @@ class RoleAssignmentHandler:
             role_assignment_priority = role_assignment.role_priority
             subject_id = role_assignment.subject_id
 
-            scopes_to_query[role_assignment.scope_type_id].add(role_assignment.scope_id)
-
             # Is it a simple actor or a team?
             # If it's a team we need to iterate over all the actor that are
             # subject of the team
@@ -467,19 +552,41 @@ class RoleAssignmentHandler:
                         workspace_level_role
                     ]
 
-        # Populate scope cache by querying all scopes type by type
-        scope_cache = {workspace_scope_param: workspace}
-        for content_type_id, content_ids in scopes_to_query.items():
-            for scope in self.get_scopes(content_type_id, content_ids):
-                scope_cache[(content_type_id, scope.id)] = scope
+        return {
+            actor.id: [
+                (scope_param, [role.id for role in roles])
+                for scope_param, roles in roles_by_scope[actor.id].items()
+            ]
+            for actor in actors
+        }
 
-        # Finally replace scope_params by real scope
-        roles_per_scope_per_user = defaultdict(list)
-        for actor in actors:
-            for key, value in roles_by_scope[actor.id].items():
-                roles_per_scope_per_user[actor].append((scope_cache[key], value))
+    def _get_roles_per_scope_version_cache_key(self, workspace_id: int) -> str:
+        return f"enterprise_roles_per_scope_version__{workspace_id}"
 
-        return roles_per_scope_per_user
+    def _get_roles_per_scope_cache_key(
+        self,
+        workspace_id: int,
+        actor_subject_type: SubjectType,
+        actor_id: int,
+        include_trash: bool,
+    ) -> str:
+        return (
+            f"enterprise_roles_per_scope__{workspace_id}_{actor_subject_type.type}_"
+            f"{actor_id}_{include_trash}"
+        )
+
+    def clear_roles_per_scope_cache(self, workspace_id: int):
+        """
+        Invalidates the cached roles per scope of all the actors of the workspace.
+        Must be called when a role assignment, a team, a team subject or a workspace
+        user of the workspace changes.
+
+        :param workspace_id: The id of the workspace in which the roles changed.
+        """
+
+        increment_cache_version(
+            self._get_roles_per_scope_version_cache_key(workspace_id)
+        )
 
     def get_computed_roles(
         self, roles_per_scopes, context: Any, cache: Optional[Dict] = None
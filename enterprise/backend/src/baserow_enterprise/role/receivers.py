@@ -1,22 +1,25 @@
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from baserow.core.models import Workspace, WorkspaceUser
 from baserow.core.registries import subject_type_registry
 from baserow.core.signals import permissions_updated, workspace_user_updated
 from baserow.core.types import Subject
+from baserow.ws.cache import clear_permitted_users_cache
 from baserow.ws.tasks import broadcast_to_users
 from baserow_enterprise.signals import (
     role_assignment_created,
     role_assignment_deleted,
     role_assignment_updated,
+    team_created,
     team_deleted,
     team_restored,
+    team_updated,
 )
-from baserow_enterprise.teams.models import Team
+from baserow_enterprise.teams.models import Team, TeamSubject
 
 User = get_user_model()
 
@@ -129,3 +132,72 @@ def connect_to_post_delete_signals_to_cascade_deletion_to_role_assignments():
     for role_assignable_object_type in ROLE_ASSIGNABLE_OBJECT_MAP.keys():
         scope_type = object_scope_type_registry.get(role_assignable_object_type)
         post_delete.connect(cascade_scope_delete, scope_type.model_class)
+
+
+def connect_to_signals_to_invalidate_permission_checks_cache_on_role_changes():
+    """
+    Connect to the signals of the models the roles are computed from, so that the
+    permissions checked later in the same request or task are evaluated again when
+    a role assignment or a team changes. The subjects of a team are bulk created,
+    which doesn't send the model signals, so the team signals are used as well.
+    """
+
+    from baserow.core.receivers import (
+        connect_to_signals_to_invalidate_permission_checks_cache,
+        invalidate_permission_checks_cache_receiver,
+    )
+    from baserow_enterprise.role.models import RoleAssignment
+
+    connect_to_signals_to_invalidate_permission_checks_cache(
+        [RoleAssignment, Team, TeamSubject]
+    )
+    for signal in [team_created, team_updated]:
+        signal.connect(invalidate_permission_checks_cache_receiver)
+
+
+def clear_roles_per_scope_cache_on_change(sender, instance, **kwargs):
+    """
+    Invalidates the cached roles per scope and permitted users of the workspace of
+    the changed role assignment, team, team subject or workspace user.
+    """
+
+    from .handler import RoleAssignmentHandler
+
+    if isinstance(instance, TeamSubject):
+        workspace_id = (
+            Team.objects_and_trash.filter(id=instance.team_id)
+            .values_list("workspace_id", flat=True)
+            .first()
+        )
+    else:
+        workspace_id = instance.workspace_id
+
+    if workspace_id is not None:
+        RoleAssignmentHandler().clear_roles_per_scope_cache(workspace_id)
+        clear_permitted_users_cache(workspace_id)
+
+
+def clear_roles_per_scope_cache_on_team_change(sender, team: Team, **kwargs):
+    from .handler import RoleAssignmentHandler
+
+    RoleAssignmentHandler().clear_roles_per_scope_cache(team.workspace_id)
+    clear_permitted_users_cache(team.workspace_id)
+
+
+def connect_to_signals_to_clear_roles_per_scope_cache():
+    """
+    Connect to the signals of the models the roles per scope are computed from.
+    Trashing or restoring a team saves it, so the cache is invalidated as well. The
+    subjects of a team are bulk created, which doesn't send the model signals, so
+    the team signals are used as well.
+    """
+
+    from baserow.core.models import WorkspaceUser
+    from baserow_enterprise.role.models import RoleAssignment
+
+    for model in [RoleAssignment, Team, TeamSubject, WorkspaceUser]:
+        post_save.connect(clear_roles_per_scope_cache_on_change, sender=model)
+        post_delete.connect(clear_roles_per_scope_cache_on_change, sender=model)
+
+    for signal in [team_created, team_updated]:
+        signal.connect(clear_roles_per_scope_cache_on_team_change)
@@ -1,14 +1,23 @@
-from datetime import datetime
+from datetime import datetime, timezone
+from unittest.mock import patch
 
+from django.db import connection, transaction
 from django.test.utils import override_settings
 
 import pytest
 from freezegun import freeze_time
+from psycopg2 import sql
 
 from baserow.core.action.handler import ActionHandler
 from baserow.core.actions import CreateWorkspaceActionType
+from baserow.core.db import get_monthly_partition_name, get_monthly_partitions
+from baserow_enterprise.audit_log.buffer import (
+    start_buffering_audit_log_entries,
+    stop_buffering_audit_log_entries,
+)
 from baserow_enterprise.audit_log.handler import AuditLogHandler
 from baserow_enterprise.audit_log.models import AuditLogEntry
+from baserow_enterprise.audit_log.tasks import write_audit_log_entries
 
 
 @pytest.mark.django_db
@@ -72,3 +81,154 @@ def test_audit_log_handler_add_entries_for_undone_redone_actions(
 
     ActionHandler.redo(user, [CreateWorkspaceActionType.scope()], session_id)
     assert AuditLogEntry.objects.count() == 3
+
+
+@pytest.mark.django_db
+@override_settings(DEBUG=True, BASEROW_ENTERPRISE_AUDIT_LOG_BUFFERED_WRITES=True)
+def test_buffered_audit_log_entries_are_written_together_after_commit(
+    enterprise_data_fixture, synced_roles, django_capture_on_commit_callbacks
+):
+    user = enterprise_data_fixture.create_user()
+
+    start_buffering_audit_log_entries()
+    try:
+        with django_capture_on_commit_callbacks(execute=True):
+            CreateWorkspaceActionType.do(user, "workspace 1")
+            CreateWorkspaceActionType.do(user, "workspace 2")
+
+        assert AuditLogEntry.objects.count() == 0
+    finally:
+        with patch.object(
+            AuditLogEntry.objects,
+            "bulk_create",
+            wraps=AuditLogEntry.objects.bulk_create,
+        ) as bulk_create:
+            stop_buffering_audit_log_entries()
+
+    bulk_create.assert_called_once()
+    assert AuditLogEntry.objects.count() == 2
+
+
+@pytest.mark.django_db
+@override_settings(DEBUG=True, BASEROW_ENTERPRISE_AUDIT_LOG_BUFFERED_WRITES=True)
+@patch("baserow_enterprise.audit_log.tasks.write_audit_log_entries.delay")
+def test_buffered_audit_log_entries_are_retried_in_the_background_if_write_fails(
+    mock_delay, enterprise_data_fixture, synced_roles, django_capture_on_commit_callbacks
+):
+    user = enterprise_data_fixture.create_user()
+
+    start_buffering_audit_log_entries()
+    try:
+        with django_capture_on_commit_callbacks(execute=True):
+            CreateWorkspaceActionType.do(user, "workspace 1")
+            CreateWorkspaceActionType.do(user, "workspace 2")
+    finally:
+        with patch.object(
+            AuditLogEntry.objects, "bulk_create", side_effect=Exception("Failed")
+        ):
+            stop_buffering_audit_log_entries()
+
+    assert AuditLogEntry.objects.count() == 0
+    mock_delay.assert_called_once()
+    serialized_entries = mock_delay.call_args.args[0]
+    assert [e["action_params"]["workspace_name"] for e in serialized_entries] == [
+        "workspace 1",
+        "workspace 2",
+    ]
+
+    write_audit_log_entries(serialized_entries)
+    entries = AuditLogEntry.objects.order_by("id")
+    assert [e.action_params["workspace_name"] for e in entries] == [
+        "workspace 1",
+        "workspace 2",
+    ]
+    assert entries[0].user_id == user.id
+    assert entries[0].action_type == CreateWorkspaceActionType.type
+
+
+@pytest.mark.django_db
+@override_settings(DEBUG=True, BASEROW_ENTERPRISE_AUDIT_LOG_BUFFERED_WRITES=True)
+@patch(
+    "baserow_enterprise.audit_log.tasks.write_audit_log_entries.delay",
+    side_effect=Exception("Broker unavailable"),
+)
+def test_buffered_audit_log_entries_are_written_one_by_one_if_retry_fails(
+    mock_delay, enterprise_data_fixture, synced_roles, django_capture_on_commit_callbacks
+):
+    user = enterprise_data_fixture.create_user()
+
+    start_buffering_audit_log_entries()
+    try:
+        with django_capture_on_commit_callbacks(execute=True):
+            CreateWorkspaceActionType.do(user, "workspace 1")
+            CreateWorkspaceActionType.do(user, "workspace 2")
+    finally:
+        with patch.object(
+            AuditLogEntry.objects, "bulk_create", side_effect=Exception("Failed")
+        ):
+            stop_buffering_audit_log_entries()
+
+    mock_delay.assert_called_once()
+    assert AuditLogEntry.objects.count() == 2
+
+
+@pytest.mark.django_db
+@override_settings(DEBUG=True, BASEROW_ENTERPRISE_AUDIT_LOG_BUFFERED_WRITES=True)
+def test_buffered_audit_log_entries_of_rolled_back_actions_are_not_written(
+    enterprise_data_fixture, synced_roles, django_capture_on_commit_callbacks
+):
+    user = enterprise_data_fixture.create_user()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        CreateWorkspaceActionType.do(user, "workspace 1")
+        try:
+            with transaction.atomic():
+                CreateWorkspaceActionType.do(user, "workspace 2")
+                raise ValueError()
+        except ValueError:
+            pass
+
+        # Nothing is written before the transaction commits.
+        assert AuditLogEntry.objects.count() == 0
+
+    assert list(
+        AuditLogEntry.objects.values_list("action_params__workspace_name", flat=True)
+    ) == ["workspace 1"]
+
+
+@pytest.mark.django_db
+@override_settings(DEBUG=True)
+def test_audit_log_partitions_can_be_created_and_dropped(
+    enterprise_data_fixture, synced_roles
+):
+    user = enterprise_data_fixture.create_user()
+    month = datetime(2090, 3, 1, tzinfo=timezone.utc)
+    table_name = AuditLogEntry._meta.db_table
+    partition_name = get_monthly_partition_name(table_name, month)
+
+    with freeze_time("2090-03-15 12:00:00"):
+        CreateWorkspaceActionType.do(user, "workspace 1")
+        assert month not in get_monthly_partitions(table_name)
+
+        # The entry is written to the default partition until the partition of the
+        # month exists, and it's moved when the partition is created.
+        AuditLogHandler.create_upcoming_partitions(months_ahead=1)
+
+    partitions = get_monthly_partitions(table_name)
+    assert partitions[month] == partition_name
+    assert datetime(2090, 4, 1, tzinfo=timezone.utc) in partitions
+    with connection.cursor() as cursor:
+        cursor.execute(
+            sql.SQL("SELECT count(*) FROM {partition}").format(
+                partition=sql.Identifier(partition_name)
+            )
+        )
+        assert cursor.fetchone()[0] == 1
+
+    AuditLogHandler.delete_entries_older_than(datetime(2090, 3, 10))
+    assert AuditLogEntry.objects.count() == 1
+    assert month in get_monthly_partitions(table_name)
+
+    AuditLogHandler.delete_entries_older_than(datetime(2090, 4, 2))
+    assert AuditLogEntry.objects.count() == 0
+    assert month not in get_monthly_partitions(table_name)
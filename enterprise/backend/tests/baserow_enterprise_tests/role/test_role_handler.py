@@ -946,6 +946,68 @@ def test_get_roles_per_scope_trashed_teams(data_fixture, enterprise_data_fixture
     ]
 
 
+@pytest.mark.django_db
+def test_get_roles_per_scope_is_cached(data_fixture, enterprise_data_fixture):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    admin_role = Role.objects.get(uid="ADMIN")
+
+    assert RoleAssignmentHandler().get_roles_per_scope(workspace, user) == [
+        (workspace, [admin_role]),
+    ]
+
+    with CaptureQueriesContext(connection) as captured:
+        assert RoleAssignmentHandler().get_roles_per_scope(workspace, user) == [
+            (workspace, [admin_role]),
+        ]
+    assert len(captured.captured_queries) == 0
+
+
+@pytest.mark.django_db
+def test_get_roles_per_scope_cache_is_invalidated_when_roles_change(
+    data_fixture, enterprise_data_fixture
+):
+    admin = data_fixture.create_user()
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=admin, members=[user])
+    database = data_fixture.create_database_application(workspace=workspace)
+    team = enterprise_data_fixture.create_team(workspace=workspace)
+    admin_role = Role.objects.get(uid="ADMIN")
+    builder_role = Role.objects.get(uid="BUILDER")
+    viewer_role = Role.objects.get(uid="VIEWER")
+
+    assert RoleAssignmentHandler().get_roles_per_scope(workspace, user) == [
+        (workspace, [builder_role]),
+    ]
+
+    RoleAssignmentHandler().assign_role(user, workspace, viewer_role)
+    assert RoleAssignmentHandler().get_roles_per_scope(workspace, user) == [
+        (workspace, [viewer_role]),
+    ]
+
+    RoleAssignmentHandler().assign_role(team, workspace, admin_role, scope=database)
+    enterprise_data_fixture.create_subject(team, user)
+    assert RoleAssignmentHandler().get_roles_per_scope(workspace, user) == [
+        (workspace, [viewer_role]),
+        (database, [admin_role]),
+    ]
+
+    team.trashed = True
+    team.save()
+    assert RoleAssignmentHandler().get_roles_per_scope(workspace, user) == [
+        (workspace, [viewer_role]),
+    ]
+
+    # The cached roles of the other workspaces are not affected.
+    other_workspace = data_fixture.create_workspace(user=user)
+    with CaptureQueriesContext(connection) as captured:
+        RoleAssignmentHandler().clear_roles_per_scope_cache(other_workspace.id)
+        assert RoleAssignmentHandler().get_roles_per_scope(workspace, user) == [
+            (workspace, [viewer_role]),
+        ]
+    assert len(captured.captured_queries) == 0
+
+
 @pytest.mark.disabled_in_ci
 # You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
 # intellij by editing the run config for this test and adding --run-disabled-in-ci -s
@@ -497,6 +497,7 @@ async def test_unsubscribe_user_from_tables_and_rows_when_role_updated(data_fixt
         "page": "table",
         "parameters": {
             "table_id": table_1.id,
+            "row_deltas": None,
         },
         "type": "page_discard",
     }
@@ -589,6 +590,7 @@ async def test_unsubscribe_user_from_tables_and_rows_when_team_trashed(
         "page": "table",
         "parameters": {
             "table_id": table_1.id,
+            "row_deltas": None,
         },
         "type": "page_discard",
     }
@@ -48,18 +48,22 @@ class JSONQuerysetSerializer(QuerysetSerializer):
 
         file_writer.write("[\n", encoding=export_charset)
 
-        def write_row(row, last_row):
+        def serialize_row(row):
             data = {}
             for field_serializer in self.field_serializers:
                 _, field_name, field_csv_value = field_serializer(row)
                 field_name = get_unique_name(data, field_name, separator=" ")
                 data[field_name] = field_csv_value
 
-            file_writer.write(json.dumps(data, indent=4), encoding=export_charset)
-            if not last_row:
-                file_writer.write(",\n", encoding=export_charset)
+            return json.dumps(data, indent=4)
 
-        file_writer.write_rows(self.queryset, write_row)
+        def serialize_chunk(rows, first_chunk):
+            chunk = ",\n".join(serialize_row(row) for row in rows)
+            if not first_chunk:
+                chunk = ",\n" + chunk
+            return chunk.encode(export_charset)
+
+        file_writer.write_serialized_rows(self.queryset, serialize_chunk)
         file_writer.write("\n]\n", encoding=export_charset)
 
 
@@ -109,7 +113,7 @@ class XMLQuerysetSerializer(QuerysetSerializer):
             encoding=export_charset,
         )
 
-        def write_row(row, _):
+        def serialize_row(row):
             data = OrderedDict()
             for field_serializer in self.field_serializers:
                 _, field_name, field_xml_value = field_serializer(row)
@@ -122,9 +126,12 @@ class XMLQuerysetSerializer(QuerysetSerializer):
             row_xml = to_xml(
                 {"row": data},
             )
-            file_writer.write(row_xml + "\n", encoding=export_charset)
+            return row_xml + "\n"
+
+        def serialize_chunk(rows, _):
+            return "".join(serialize_row(row) for row in rows).encode(export_charset)
 
-        file_writer.write_rows(self.queryset, write_row)
+        file_writer.write_serialized_rows(self.queryset, serialize_chunk)
         file_writer.write("</rows>\n", encoding=export_charset)
 
 
@@ -1,3 +1,4 @@
+import json
 from datetime import timezone
 from io import BytesIO
 from unittest.mock import patch
@@ -293,6 +294,41 @@ def test_if_duplicate_field_names_json_export(storage_mock, premium_data_fixture
     )
 
 
+@pytest.mark.django_db
+@override_settings(DEBUG=True)
+@pytest.mark.parametrize("exporter_type", ["json", "xml"])
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_rows_are_exported_in_chunks(
+    storage_mock, exporter_type, premium_data_fixture, settings
+):
+    settings.BASEROW_EXPORT_CHUNK_SIZE = 2
+    settings.BASEROW_EXPORT_SERIALIZATION_WORKERS = 2
+    user = premium_data_fixture.create_user(has_active_premium_license=True)
+    database = premium_data_fixture.create_database_application(user=user)
+    table = premium_data_fixture.create_database_table(database=database)
+    text_field = premium_data_fixture.create_text_field(table=table, name="name")
+    RowHandler().create_rows(
+        user, table, [{text_field.db_column: f"row {i}"} for i in range(5)]
+    )
+    job, contents = run_export_job_with_mock_storage(
+        table, None, storage_mock, user, {"exporter_type": exporter_type}
+    )
+
+    assert job.progress_percentage == 100
+    if exporter_type == "json":
+        assert json.loads(contents) == [
+            {"id": i + 1, "name": f"row {i}"} for i in range(5)
+        ]
+    else:
+        assert contents == (
+            '<?xml version="1.0" encoding="utf-8" ?>\n<rows>\n'
+            + "".join(
+                f"<row><id>{i + 1}</id><name>row {i}</name></row>\n" for i in range(5)
+            )
+            + "</rows>\n"
+        )
+
+
 @pytest.mark.django_db
 @override_settings(DEBUG=True)
 @patch("baserow.contrib.database.export.handler.default_storage")
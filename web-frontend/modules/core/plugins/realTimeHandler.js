@@ -239,6 +239,16 @@ export class RealTimeHandler {
       this.authenticationSuccess = data.success
     })
 
+    // Multiple messages can be sent at once, for example when the backend coalesces
+    // many row changes of a table. They're handled one by one in order.
+    this.registerEvent('batch', async (context, data) => {
+      for (const message of data.messages) {
+        if (Object.prototype.hasOwnProperty.call(this.events, message.type)) {
+          await this.events[message.type](context, message)
+        }
+      }
+    })
+
     this.registerEvent('user_data_updated', ({ store }, data) => {
       store.dispatch('auth/forceUpdateUserData', data.user_data)
     })
@@ -113,3 +113,37 @@ export class CSVTableExporterType extends TableExporterType {
     return [GridViewType.getType()]
   }
 }
+
+export class ParquetTableExporterType extends TableExporterType {
+  static getType() {
+    return 'parquet'
+  }
+
+  getIconClass() {
+    return 'baserow-icon-file-code'
+  }
+
+  getName() {
+    const { i18n } = this.app
+    return i18n.t('exporterType.parquet')
+  }
+
+  getCanExportTable() {
+    return true
+  }
+
+  getSupportedViews() {
+    return [GridViewType.getType()]
+  }
+}
+
+export class ArrowTableExporterType extends ParquetTableExporterType {
+  static getType() {
+    return 'arrow'
+  }
+
+  getName() {
+    const { i18n } = this.app
+    return i18n.t('exporterType.arrow')
+  }
+}
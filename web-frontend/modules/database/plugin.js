@@ -127,7 +127,11 @@ import rowModalNavigationStore from '@baserow/modules/database/store/rowModalNav
 import rowHistoryStore from '@baserow/modules/database/store/rowHistory'
 
 import { registerRealtimeEvents } from '@baserow/modules/database/realtime'
-import { CSVTableExporterType } from '@baserow/modules/database/exporterTypes'
+import {
+  ArrowTableExporterType,
+  CSVTableExporterType,
+  ParquetTableExporterType,
+} from '@baserow/modules/database/exporterTypes'
 import {
   BaserowAdd,
   BaserowAnd,
@@ -541,6 +545,8 @@ export default (context) => {
   app.$registry.register('importer', new JSONImporterType(context))
   app.$registry.register('settings', new APITokenSettingsType(context))
   app.$registry.register('exporter', new CSVTableExporterType(context))
+  app.$registry.register('exporter', new ParquetTableExporterType(context))
+  app.$registry.register('exporter', new ArrowTableExporterType(context))
   app.$registry.register(
     'webhookEvent',
     new RowsCreatedWebhookEventType(context)